@@ -5,6 +5,7 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import sqlite3
+from contextlib import closing
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
@@ -53,13 +54,17 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Database connection
+DB_PRAGMAS = """
+    PRAGMA mmap_size=1073741824;
+    PRAGMA temp_store=MEMORY;
+"""
+
 def safe_query(query):
     """Safe database query with connection handling"""
     try:
-        conn = sqlite3.connect('amazon_india_analytics.db', check_same_thread=False)
-        result = pd.read_sql_query(query, conn)
-        conn.close()
-        return result
+        with closing(sqlite3.connect('amazon_india_analytics.db', check_same_thread=False)) as conn:
+            conn.executescript(DB_PRAGMAS)  # memory-mapped reads, in-memory temp tables
+            return pd.read_sql_query(query, conn)
     except Exception as e:
         st.error(f"Database error: {e}")
         return pd.DataFrame()
@@ -87,6 +92,15 @@ def load_dashboard_data():
         st.session_state.customers = customers
         st.session_state.time_dimension = time_dimension
         st.session_state.product_catalog = product_catalog
+        
+        # Running (sum, count) totals so KPI means are O(1) on every render
+        st.session_state.revenue_sum = float(transactions['final_amount_inr'].sum())
+        st.session_state.revenue_count = int(transactions['final_amount_inr'].count())
+        delivery_days = pd.to_numeric(transactions.get('delivery_days', pd.Series(dtype=float)), errors='coerce')
+        st.session_state.delivery_sum = float(delivery_days.sum())
+        st.session_state.delivery_count = int(delivery_days.count())
+        st.session_state.rating_sum = float(transactions['customer_rating'].sum())
+        st.session_state.rating_count = int(transactions['customer_rating'].count())
         st.session_state.dashboard_data_loaded = True
         
         return True
@@ -94,4827 +108,4836 @@ def load_dashboard_data():
         st.error(f"Error loading dashboard data: {e}")
         return False
 
-def render_dashboard(dashboard_id):
-    """Render individual dashboard based on selection"""
+def running_mean(name):
+    """Mean of a column from the running totals kept in session state"""
+    count = st.session_state[f'{name}_count']
+    return st.session_state[f'{name}_sum'] / count if count else float('nan')
+
+# Q1: Executive Summary Dashboard - FIXED
+def render_q1():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("📊 Q1: Executive Summary Dashboard")
+    st.markdown("Key business metrics with year-over-year comparisons and trend indicators")
+    st.markdown('</div>', unsafe_allow_html=True)
     
-    # Q1: Executive Summary Dashboard - FIXED
-    if dashboard_id == "Q1":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("📊 Q1: Executive Summary Dashboard")
-        st.markdown("Key business metrics with year-over-year comparisons and trend indicators")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Key Metrics
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        total_revenue = st.session_state.transactions['final_amount_inr'].sum()
-        total_customers = len(st.session_state.customers)
-        total_products = len(st.session_state.products)
-        avg_order_value = st.session_state.transactions['final_amount_inr'].mean()
-        total_orders = len(st.session_state.transactions)
-        
-        # Calculate growth rates (simulated)
-        revenue_growth = 15.2
-        customer_growth = 8.7
-        aov_growth = 5.3
-        product_growth = 12.1
-        order_growth = 18.5
-        
-        with col1:
-            st.metric("Total Revenue", f"₹{total_revenue/1e9:.2f}B", f"{revenue_growth}%")
-        with col2:
-            st.metric("Active Customers", f"{total_customers:,}", f"{customer_growth}%")
-        with col3:
-            st.metric("Avg Order Value", f"₹{avg_order_value:.0f}", f"{aov_growth}%")
-        with col4:
-            st.metric("Total Products", f"{total_products:,}", f"{product_growth}%")
-        with col5:
-            st.metric("Total Orders", f"{total_orders:,}", f"{order_growth}%")
-        
-        # Revenue Trend
-        st.subheader("📈 Revenue Trend (2015-2025)")
-        yearly_revenue = st.session_state.transactions.groupby('order_year')['final_amount_inr'].sum().reset_index()
-        fig = px.line(yearly_revenue, x='order_year', y='final_amount_inr', 
-                     title='Yearly Revenue Growth', markers=True)
-        fig.update_layout(xaxis_title='Year', yaxis_title='Revenue (₹)')
+    # Key Metrics
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    total_revenue = st.session_state.transactions['final_amount_inr'].sum()
+    total_customers = len(st.session_state.customers)
+    total_products = len(st.session_state.products)
+    avg_order_value = st.session_state.transactions['final_amount_inr'].mean()
+    total_orders = len(st.session_state.transactions)
+    
+    # Calculate growth rates (simulated)
+    revenue_growth = 15.2
+    customer_growth = 8.7
+    aov_growth = 5.3
+    product_growth = 12.1
+    order_growth = 18.5
+    
+    with col1:
+        st.metric("Total Revenue", f"₹{total_revenue/1e9:.2f}B", f"{revenue_growth}%")
+    with col2:
+        st.metric("Active Customers", f"{total_customers:,}", f"{customer_growth}%")
+    with col3:
+        st.metric("Avg Order Value", f"₹{avg_order_value:.0f}", f"{aov_growth}%")
+    with col4:
+        st.metric("Total Products", f"{total_products:,}", f"{product_growth}%")
+    with col5:
+        st.metric("Total Orders", f"{total_orders:,}", f"{order_growth}%")
+    
+    # Revenue Trend
+    st.subheader("📈 Revenue Trend (2015-2025)")
+    yearly_revenue = st.session_state.transactions.groupby('order_year')['final_amount_inr'].sum().reset_index()
+    fig = px.line(yearly_revenue, x='order_year', y='final_amount_inr', 
+                 title='Yearly Revenue Growth', markers=True)
+    fig.update_layout(xaxis_title='Year', yaxis_title='Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Top Categories
+    st.subheader("🏆 Top Performing Categories")
+    category_revenue = st.session_state.transactions.groupby('category')['final_amount_inr'].sum().nlargest(10).reset_index()
+    fig = px.bar(category_revenue, x='category', y='final_amount_inr',
+                title='Top 10 Categories by Revenue', color='final_amount_inr')
+    fig.update_layout(xaxis_title='Category', yaxis_title='Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Customer Metrics
+    st.subheader("👥 Customer Performance")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        avg_customer_lifetime = st.session_state.customers['customer_lifetime_days'].mean()
+        st.metric("Avg Customer Lifetime", f"{avg_customer_lifetime:.0f} days")
+    
+    with col2:
+        prime_members = st.session_state.customers['is_prime_member'].value_counts().get('Yes', 0)
+        st.metric("Prime Members", f"{prime_members:,}")
+    
+    with col3:
+        avg_rating = st.session_state.transactions['customer_rating'].mean()
+        st.metric("Avg Customer Rating", f"{avg_rating:.1f} ⭐")
+
+# Q2: Real-time Business Performance Monitor - FIXED
+def render_q2():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🔴 Q2: Real-time Business Performance Monitor")
+    st.markdown("Current month performance vs targets with alerts for underperformance")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Current Month Metrics
+    current_data = st.session_state.transactions.copy()
+    current_data['order_date'] = pd.to_datetime(current_data['order_date'])
+    current_month = current_data[current_data['order_date'].dt.month == datetime.now().month]
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    current_revenue = current_month['final_amount_inr'].sum()
+    current_orders = len(current_month)
+    current_customers = current_month['customer_id'].nunique()
+    current_aov = current_month['final_amount_inr'].mean()
+    
+    # Targets (hypothetical)
+    revenue_target = 50000000
+    orders_target = 5000
+    customers_target = 3000
+    aov_target = 1200
+    
+    with col1:
+        revenue_status = "✅" if current_revenue >= revenue_target else "❌"
+        st.metric("Monthly Revenue", f"₹{current_revenue:,.0f}", 
+                 f"{revenue_status} Target: ₹{revenue_target:,.0f}")
+    
+    with col2:
+        orders_status = "✅" if current_orders >= orders_target else "❌"
+        st.metric("Monthly Orders", f"{current_orders:,}", 
+                 f"{orders_status} Target: {orders_target:,}")
+    
+    with col3:
+        customers_status = "✅" if current_customers >= customers_target else "❌"
+        st.metric("New Customers", f"{current_customers:,}", 
+                 f"{customers_status} Target: {customers_target:,}")
+    
+    with col4:
+        aov_status = "✅" if current_aov >= aov_target else "❌"
+        st.metric("Avg Order Value", f"₹{current_aov:.0f}", 
+                 f"{aov_status} Target: ₹{aov_target:.0f}")
+    
+    # Revenue Run Rate
+    st.subheader("💰 Revenue Run Rate")
+    daily_revenue = current_month.groupby(current_month['order_date'].dt.day)['final_amount_inr'].sum()
+    daily_revenue_df = daily_revenue.reset_index()
+    daily_revenue_df.columns = ['day', 'revenue']
+    
+    fig = px.line(daily_revenue_df, x='day', y='revenue',
+                 title='Daily Revenue Trend - Current Month', markers=True)
+    fig.update_layout(xaxis_title='Day of Month', yaxis_title='Daily Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Customer Acquisition Metrics
+    st.subheader("🎯 Customer Acquisition Metrics")
+    customer_acquisition = current_month.groupby('order_date').agg({
+        'customer_id': 'nunique',
+        'final_amount_inr': 'sum'
+    }).reset_index()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.bar(customer_acquisition, x='order_date', y='customer_id',
+                    title='Daily New Customers')
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        fig = px.scatter(current_month, x='order_date', y='final_amount_inr',
+                       color='category', title='Order Value Distribution')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Alerts Panel
+    st.subheader("🚨 Performance Alerts")
+    if current_revenue < revenue_target * 0.8:
+        st.error("🔴 Revenue significantly below target! Consider promotional campaigns.")
+    if current_customers < customers_target * 0.7:
+        st.warning("🟡 Customer acquisition below target! Review marketing strategies.")
+    if current_aov < aov_target * 0.9:
+        st.info("🔵 Average order value below target! Implement upselling strategies.")
+    if current_orders < orders_target * 0.75:
+        st.error("🔴 Order volume critically low! Check inventory and promotions.")
+
+# Q3: Strategic Overview Dashboard - FIXED
+def render_q3():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🎯 Q3: Strategic Overview Dashboard")
+    st.markdown("Market share analysis, competitive positioning, and business health indicators")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Market Share by Category
+    st.subheader("📊 Market Share Analysis")
+    category_share = st.session_state.transactions.groupby('category').agg({
+        'final_amount_inr': 'sum',
+        'customer_id': 'nunique'
+    }).reset_index()
+    category_share['market_share'] = (category_share['final_amount_inr'] / category_share['final_amount_inr'].sum()) * 100
+    
+    fig = px.pie(category_share, values='market_share', names='category', 
+                title='Market Share by Category')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Competitive Positioning
+    st.subheader("⚔️ Competitive Positioning")
+    
+    # Brand performance analysis
+    brand_performance = st.session_state.transactions.groupby('brand').agg({
+        'final_amount_inr': 'sum',
+        'customer_id': 'nunique',
+        'customer_rating': 'mean'
+    }).nlargest(10, 'final_amount_inr').reset_index()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.bar(brand_performance, x='brand', y='final_amount_inr',
+                    title='Top 10 Brands by Revenue', color='final_amount_inr')
         fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Top Categories
-        st.subheader("🏆 Top Performing Categories")
-        category_revenue = st.session_state.transactions.groupby('category')['final_amount_inr'].sum().nlargest(10).reset_index()
-        fig = px.bar(category_revenue, x='category', y='final_amount_inr',
-                    title='Top 10 Categories by Revenue', color='final_amount_inr')
-        fig.update_layout(xaxis_title='Category', yaxis_title='Revenue (₹)')
+    with col2:
+        fig = px.scatter(brand_performance, x='customer_id', y='final_amount_inr',
+                       size='customer_rating', color='brand',
+                       title='Brand Positioning: Customers vs Revenue')
         fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Customer Metrics
-        st.subheader("👥 Customer Performance")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            avg_customer_lifetime = st.session_state.customers['customer_lifetime_days'].mean()
-            st.metric("Avg Customer Lifetime", f"{avg_customer_lifetime:.0f} days")
-        
-        with col2:
-            prime_members = st.session_state.customers['is_prime_member'].value_counts().get('Yes', 0)
-            st.metric("Prime Members", f"{prime_members:,}")
-        
-        with col3:
-            avg_rating = st.session_state.transactions['customer_rating'].mean()
-            st.metric("Avg Customer Rating", f"{avg_rating:.1f} ⭐")
+    
+    # Geographic Expansion
+    st.subheader("🗺️ Geographic Performance")
+    state_performance = st.session_state.transactions.groupby('customer_state').agg({
+        'final_amount_inr': 'sum',
+        'customer_id': 'nunique'
+    }).nlargest(10, 'final_amount_inr')
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.bar(state_performance, y='final_amount_inr', 
+                    title='Top 10 States by Revenue')
+        fig.update_xaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        fig = px.bar(state_performance, y='customer_id', 
+                    title='Customer Distribution by State')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Business Health Indicators
+    st.subheader("❤️ Business Health Metrics")
+    
+    # Calculate actual metrics
+    customer_growth_rate = 12.3
+    revenue_growth_rate = 15.8
+    order_growth_rate = 18.5
+    retention_rate = 67.2
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Customer Growth Rate", f"{customer_growth_rate}%", "Healthy")
+    with col2:
+        st.metric("Revenue Growth Rate", f"{revenue_growth_rate}%", "Excellent")
+    with col3:
+        st.metric("Order Growth Rate", f"{order_growth_rate}%", "Excellent")
+    with col4:
+        st.metric("Retention Rate", f"{retention_rate}%", "Good")
+    
+    # Strategic Insights
+    st.subheader("💡 Strategic Insights")
+    insights = [
+        "🚀 **High Growth**: Electronics and Fashion categories showing 25%+ YoY growth",
+        "🎯 **Opportunity**: Tier 2 cities represent 45% growth potential",
+        "💰 **Efficiency**: Prime members generate 3.2x higher lifetime value",
+        "📈 **Trend**: Mobile commerce growing at 35% quarterly rate"
+    ]
+    
+    for insight in insights:
+        st.info(insight)
 
-    # Q2: Real-time Business Performance Monitor - FIXED
-    elif dashboard_id == "Q2":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🔴 Q2: Real-time Business Performance Monitor")
-        st.markdown("Current month performance vs targets with alerts for underperformance")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Current Month Metrics
-        current_data = st.session_state.transactions.copy()
-        current_data['order_date'] = pd.to_datetime(current_data['order_date'])
-        current_month = current_data[current_data['order_date'].dt.month == datetime.now().month]
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        current_revenue = current_month['final_amount_inr'].sum()
-        current_orders = len(current_month)
-        current_customers = current_month['customer_id'].nunique()
-        current_aov = current_month['final_amount_inr'].mean()
-        
-        # Targets (hypothetical)
-        revenue_target = 50000000
-        orders_target = 5000
-        customers_target = 3000
-        aov_target = 1200
-        
-        with col1:
-            revenue_status = "✅" if current_revenue >= revenue_target else "❌"
-            st.metric("Monthly Revenue", f"₹{current_revenue:,.0f}", 
-                     f"{revenue_status} Target: ₹{revenue_target:,.0f}")
-        
-        with col2:
-            orders_status = "✅" if current_orders >= orders_target else "❌"
-            st.metric("Monthly Orders", f"{current_orders:,}", 
-                     f"{orders_status} Target: {orders_target:,}")
-        
-        with col3:
-            customers_status = "✅" if current_customers >= customers_target else "❌"
-            st.metric("New Customers", f"{current_customers:,}", 
-                     f"{customers_status} Target: {customers_target:,}")
-        
-        with col4:
-            aov_status = "✅" if current_aov >= aov_target else "❌"
-            st.metric("Avg Order Value", f"₹{current_aov:.0f}", 
-                     f"{aov_status} Target: ₹{aov_target:.0f}")
-        
-        # Revenue Run Rate
-        st.subheader("💰 Revenue Run Rate")
-        daily_revenue = current_month.groupby(current_month['order_date'].dt.day)['final_amount_inr'].sum()
-        daily_revenue_df = daily_revenue.reset_index()
-        daily_revenue_df.columns = ['day', 'revenue']
+# Q4: Financial Performance Dashboard - FIXED
+def render_q4():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("💰 Q4: Financial Performance Dashboard")
+    st.markdown("Revenue breakdown, profit margin analysis, and cost structure visualization")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Revenue Breakdown - FIXED TREEMAP
+    st.subheader("📈 Revenue Breakdown by Category")
+    
+    # Get category revenue data
+    category_revenue = st.session_state.transactions.groupby('category').agg({
+        'final_amount_inr': 'sum',
+        'original_price_inr': 'sum',
+        'discount_percent': 'mean',
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    # Rename columns for clarity
+    category_revenue.columns = ['category', 'total_revenue', 'total_original_price', 'avg_discount', 'order_count']
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        # FIXED TREEMAP - Proper structure
+        fig = px.treemap(
+            category_revenue,
+            path=['category'],
+            values='total_revenue',
+            title='Revenue Distribution by Category',
+            color='total_revenue',
+            color_continuous_scale='Blues'
+        )
+        fig.update_traces(
+            textinfo="label+value+percent parent",
+            hovertemplate='<b>%{label}</b><br>Revenue: ₹%{value:,.0f}<br>Market Share: %{percentParent:.1%}'
+        )
+        st.plotly_chart(fig, use_container_width=True)
         
-        fig = px.line(daily_revenue_df, x='day', y='revenue',
-                     title='Daily Revenue Trend - Current Month', markers=True)
-        fig.update_layout(xaxis_title='Day of Month', yaxis_title='Daily Revenue (₹)')
+    with col2:
+        # Top categories bar chart
+        top_categories = category_revenue.nlargest(8, 'total_revenue')
+        fig = px.bar(
+            top_categories, 
+            x='category', 
+            y='total_revenue',
+            title='Top 8 Categories by Revenue',
+            color='total_revenue',
+            color_continuous_scale='Viridis'
+        )
+        fig.update_layout(
+            xaxis_title='Category',
+            yaxis_title='Total Revenue (₹)',
+            showlegend=False
+        )
         fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Customer Acquisition Metrics
-        st.subheader("🎯 Customer Acquisition Metrics")
-        customer_acquisition = current_month.groupby('order_date').agg({
-            'customer_id': 'nunique',
-            'final_amount_inr': 'sum'
-        }).reset_index()
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            fig = px.bar(customer_acquisition, x='order_date', y='customer_id',
-                        title='Daily New Customers')
-            st.plotly_chart(fig, use_container_width=True)
-        with col2:
-            fig = px.scatter(current_month, x='order_date', y='final_amount_inr',
-                           color='category', title='Order Value Distribution')
+    
+    # Display category revenue table
+    st.subheader("📊 Category Revenue Details")
+    display_table = category_revenue[['category', 'total_revenue', 'order_count', 'avg_discount']].copy()
+    display_table['total_revenue'] = display_table['total_revenue'].round(2)
+    display_table['avg_discount'] = (display_table['avg_discount']).round(1)
+    display_table = display_table.sort_values('total_revenue', ascending=False)
+    
+    st.dataframe(
+        display_table.style.format({
+            'total_revenue': '₹{:,.2f}',
+            'avg_discount': '{:.1f}%'
+        }),
+        use_container_width=True
+    )
+    
+    # Profit Margin Analysis
+    st.subheader("📈 Margin Analysis")
+    margin_data = st.session_state.transactions.copy()
+    margin_data['profit_margin'] = (
+        (margin_data['final_amount_inr'] - margin_data['delivery_charges']) / 
+        margin_data['final_amount_inr'] * 100
+    ).clip(0, 100)
+    
+    category_margin = margin_data.groupby('category')['profit_margin'].mean().reset_index()
+    
+    fig = px.bar(
+        category_margin, 
+        x='category', 
+        y='profit_margin',
+        title='Average Profit Margin by Category',
+        color='profit_margin',
+        color_continuous_scale='RdYlGn'
+    )
+    fig.update_layout(
+        xaxis_title='Category',
+        yaxis_title='Profit Margin (%)',
+        showlegend=False
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Cost Structure Analysis
+    st.subheader("🏗️ Cost Structure Analysis")
+    
+    total_revenue = st.session_state.transactions['final_amount_inr'].sum()
+    total_delivery = st.session_state.transactions['delivery_charges'].sum()
+    total_discount_amount = (
+        st.session_state.transactions['original_price_inr'] - 
+        st.session_state.transactions['discounted_price_inr']
+    ).sum()
+    net_amount = total_revenue - total_delivery - total_discount_amount
+    
+    cost_data = pd.DataFrame({
+        'Component': ['Gross Revenue', 'Delivery Costs', 'Discounts Given', 'Net Revenue'],
+        'Amount': [total_revenue, total_delivery, total_discount_amount, net_amount],
+        'Type': ['Revenue', 'Cost', 'Cost', 'Revenue']
+    })
+    
+    fig = px.pie(
+        cost_data, 
+        values='Amount', 
+        names='Component',
+        title='Revenue and Cost Distribution',
+        color='Type',
+        color_discrete_map={'Revenue': '#00CC96', 'Cost': '#EF553B'}
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Financial Ratios
+    st.subheader("📐 Key Financial Ratios")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    delivery_cost_ratio = (total_delivery / total_revenue) * 100
+    discount_ratio = (total_discount_amount / total_revenue) * 100
+    net_margin = (net_amount / total_revenue) * 100
+    avg_discount = st.session_state.transactions['discount_percent'].mean()
+    
+    with col1:
+        st.metric("Delivery Cost Ratio", f"{delivery_cost_ratio:.1f}%")
+    with col2:
+        st.metric("Discount Ratio", f"{discount_ratio:.1f}%")
+    with col3:
+        st.metric("Net Margin", f"{net_margin:.1f}%")
+    with col4:
+        st.metric("Avg Discount %", f"{avg_discount:.1f}%")
+
+# Q5: Growth Analytics Dashboard - FIXED
+def render_q5():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🚀 Q5: Growth Analytics Dashboard")
+    st.markdown("Customer growth, market penetration, and strategic initiative performance")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Customer Growth Over Time
+    st.subheader("👥 Customer Growth Analysis")
+    customer_growth = st.session_state.customers.copy()
+    customer_growth['first_order_date'] = pd.to_datetime(customer_growth['first_order_date'])
+    customer_growth['acquisition_year'] = customer_growth['first_order_date'].dt.year
+    
+    yearly_customers = customer_growth.groupby('acquisition_year').size().reset_index(name='new_customers')
+    fig = px.line(yearly_customers, x='acquisition_year', y='new_customers',
+                 title='New Customer Acquisition by Year', markers=True)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Market Penetration by State
+    st.subheader("🗺️ Market Penetration Analysis")
+    state_penetration = st.session_state.transactions.groupby('customer_state').agg({
+        'customer_id': 'nunique',
+        'final_amount_inr': 'sum'
+    }).reset_index()
+    
+    fig = px.scatter(state_penetration, x='customer_id', y='final_amount_inr',
+                    size='final_amount_inr', color='customer_state',
+                    title='Market Penetration: Customers vs Revenue by State')
+    fig.update_xaxes(title='Number of Customers')
+    fig.update_yaxes(title='Total Revenue (₹)', tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Product Portfolio Expansion
+    st.subheader("📦 Product Portfolio Growth")
+    product_growth = st.session_state.products.groupby('launch_year').size().reset_index(name='new_products')
+    fig = px.bar(product_growth, x='launch_year', y='new_products',
+                title='New Product Launches by Year')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Strategic Initiative Performance
+    st.subheader("🎯 Strategic Initiative Performance")
+    
+    # Prime membership impact
+    prime_analysis = st.session_state.transactions.groupby('is_prime_member').agg({
+        'final_amount_inr': 'sum',
+        'customer_id': 'nunique',
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if not prime_analysis.empty:
+            prime_analysis['member_type'] = prime_analysis['is_prime_member'].map({'Yes': 'Prime', 'No': 'Non-Prime'})
+            fig = px.pie(prime_analysis, values='final_amount_inr', names='member_type',
+                        title='Revenue Share: Prime vs Non-Prime')
             st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Customer retention by acquisition year
+        retention_data = customer_growth.groupby('acquisition_year').agg({
+            'customer_lifetime_days': 'mean',
+            'total_orders': 'mean'
+        }).reset_index()
         
-        # Alerts Panel
-        st.subheader("🚨 Performance Alerts")
-        if current_revenue < revenue_target * 0.8:
-            st.error("🔴 Revenue significantly below target! Consider promotional campaigns.")
-        if current_customers < customers_target * 0.7:
-            st.warning("🟡 Customer acquisition below target! Review marketing strategies.")
-        if current_aov < aov_target * 0.9:
-            st.info("🔵 Average order value below target! Implement upselling strategies.")
-        if current_orders < orders_target * 0.75:
-            st.error("🔴 Order volume critically low! Check inventory and promotions.")
+        fig = px.line(retention_data, x='acquisition_year', y='customer_lifetime_days',
+                     title='Average Customer Lifetime by Cohort', markers=True)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Growth Metrics Summary
+    st.subheader("📊 Growth Metrics Summary")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        customer_growth_rate = 12.3
+        st.metric("Customer Growth Rate", f"{customer_growth_rate}%")
+    
+    with col2:
+        revenue_growth_rate = 15.8
+        st.metric("Revenue Growth Rate", f"{revenue_growth_rate}%")
+    
+    with col3:
+        market_penetration = 67.5
+        st.metric("Market Penetration", f"{market_penetration}%")
+    
+    with col4:
+        product_expansion = 23.4
+        st.metric("Product Expansion", f"{product_expansion}%")
 
-    # Q3: Strategic Overview Dashboard - FIXED
-    elif dashboard_id == "Q3":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🎯 Q3: Strategic Overview Dashboard")
-        st.markdown("Market share analysis, competitive positioning, and business health indicators")
-        st.markdown('</div>', unsafe_allow_html=True)
+# Q6: Revenue Trend Analysis Dashboard - FIXED
+def render_q6():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("📈 Q6: Revenue Trend Analysis Dashboard")
+    st.markdown("Monthly/quarterly/yearly revenue patterns with seasonal variations")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Time period selection
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        time_granularity = st.selectbox("Time Granularity", 
+                                      ["Monthly", "Quarterly", "Yearly"])
+    with col2:
+        start_year = st.selectbox("Start Year", range(2015, 2026), index=0)
+    with col3:
+        end_year = st.selectbox("End Year", range(2015, 2026), index=10)
+    
+    # Filter data based on selection
+    filtered_data = st.session_state.transactions[
+        (st.session_state.transactions['order_year'] >= start_year) & 
+        (st.session_state.transactions['order_year'] <= end_year)
+    ]
+    
+    if time_granularity == "Monthly":
+        trend_data = filtered_data.groupby(['order_year', 'order_month'])['final_amount_inr'].sum().reset_index()
+        trend_data['period'] = trend_data['order_year'].astype(str) + '-' + trend_data['order_month'].astype(str).str.zfill(2)
+        x_col = 'period'
+    elif time_granularity == "Quarterly":
+        trend_data = filtered_data.groupby(['order_year', 'order_quarter'])['final_amount_inr'].sum().reset_index()
+        trend_data['period'] = trend_data['order_year'].astype(str) + '-Q' + trend_data['order_quarter'].astype(str)
+        x_col = 'period'
+    else:  # Yearly
+        trend_data = filtered_data.groupby('order_year')['final_amount_inr'].sum().reset_index()
+        x_col = 'order_year'
+    
+    # Revenue Trend Chart
+    fig = px.line(trend_data, x=x_col, y='final_amount_inr',
+                 title=f'Revenue Trend ({time_granularity})', markers=True)
+    fig.update_layout(xaxis_title='Period', yaxis_title='Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Seasonal Analysis
+    st.subheader("🌞 Seasonal Variations")
+    monthly_pattern = filtered_data.groupby('order_month')['final_amount_inr'].mean().reset_index()
+    fig = px.line(monthly_pattern, x='order_month', y='final_amount_inr',
+                 title='Average Monthly Revenue Pattern', markers=True)
+    fig.update_layout(xaxis_title='Month', yaxis_title='Average Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Growth Rate Analysis
+    st.subheader("📊 Growth Rate Analysis")
+    if time_granularity == "Yearly":
+        trend_data['growth_rate'] = trend_data['final_amount_inr'].pct_change() * 100
+        fig = px.bar(trend_data, x='order_year', y='growth_rate',
+                    title='Year-over-Year Growth Rate')
+        fig.update_layout(xaxis_title='Year', yaxis_title='Growth Rate (%)')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Revenue Forecasting (Simple)
+    st.subheader("🔮 Revenue Forecasting")
+    if len(trend_data) > 1:
+        # Simple linear trend for demonstration
+        x = np.arange(len(trend_data))
+        y = trend_data['final_amount_inr'].values
+        z = np.polyfit(x, y, 1)
+        p = np.poly1d(z)
+        
+        future_periods = 3
+        future_x = np.arange(len(trend_data), len(trend_data) + future_periods)
+        forecast = p(future_x)
         
-        # Market Share by Category
-        st.subheader("📊 Market Share Analysis")
-        category_share = st.session_state.transactions.groupby('category').agg({
+        forecast_df = pd.DataFrame({
+            'period': [f'Future {i+1}' for i in range(future_periods)],
+            'revenue': forecast
+        })
+        
+        fig = px.line(trend_data, x=x_col, y='final_amount_inr', 
+                     title='Revenue Trend with Forecast')
+        fig.add_scatter(x=forecast_df['period'], y=forecast_df['revenue'], 
+                      mode='lines', name='Forecast', line=dict(dash='dash'))
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+
+# Q7: Category Performance Dashboard - FIXED
+def render_q7():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🏪 Q7: Category Performance Dashboard")
+    st.markdown("Revenue contribution, growth trends, and category-wise profitability")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Category Selection for Drill-down
+    categories = st.session_state.transactions['category'].unique()
+    selected_category = st.selectbox("Select Category for Detailed Analysis", categories)
+    
+    # Overall Category Performance
+    st.subheader("📈 Overall Category Performance")
+    category_performance = st.session_state.transactions.groupby('category').agg({
+        'final_amount_inr': ['sum', 'count'],
+        'customer_rating': 'mean',
+        'discount_percent': 'mean'
+    }).round(2)
+    
+    category_performance.columns = ['total_revenue', 'order_count', 'avg_rating', 'avg_discount']
+    category_performance = category_performance.reset_index()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.bar(category_performance.nlargest(10, 'total_revenue'), 
+                    x='category', y='total_revenue',
+                    title='Top 10 Categories by Revenue', color='total_revenue')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        fig = px.scatter(category_performance, x='order_count', y='total_revenue',
+                        size='avg_rating', color='category',
+                        title='Category Performance: Orders vs Revenue')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Selected Category Drill-down
+    st.subheader(f"🔍 Detailed Analysis: {selected_category}")
+    category_data = st.session_state.transactions[st.session_state.transactions['category'] == selected_category]
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        # Subcategory performance
+        subcategory_perf = category_data.groupby('subcategory')['final_amount_inr'].sum().nlargest(10).reset_index()
+        fig = px.pie(subcategory_perf, values='final_amount_inr', names='subcategory',
+                    title=f'Subcategory Distribution - {selected_category}')
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        # Monthly trend for selected category
+        monthly_trend = category_data.groupby(['order_year', 'order_month'])['final_amount_inr'].sum().reset_index()
+        monthly_trend['period'] = monthly_trend['order_year'].astype(str) + '-' + monthly_trend['order_month'].astype(str).str.zfill(2)
+        fig = px.line(monthly_trend, x='period', y='final_amount_inr',
+                     title=f'Monthly Trend - {selected_category}')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Category Growth Trends
+    st.subheader("📊 Category Growth Over Time")
+    category_growth = st.session_state.transactions.groupby(['order_year', 'category'])['final_amount_inr'].sum().reset_index()
+    top_categories = category_growth.groupby('category')['final_amount_inr'].sum().nlargest(5).index
+    filtered_growth = category_growth[category_growth['category'].isin(top_categories)]
+    
+    fig = px.line(filtered_growth, x='order_year', y='final_amount_inr', color='category',
+                 title='Revenue Growth of Top 5 Categories Over Time')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Profitability Analysis
+    st.subheader("💰 Category Profitability")
+    margin_data = st.session_state.transactions.copy()
+    margin_data['profit_margin'] = (
+        (margin_data['final_amount_inr'] - margin_data['delivery_charges']) / 
+        margin_data['final_amount_inr'] * 100
+    ).clip(0, 100)
+    
+    category_margin = margin_data.groupby('category')['profit_margin'].mean().reset_index()
+    fig = px.bar(category_margin, x='category', y='profit_margin',
+                title='Average Profit Margin by Category', color='profit_margin')
+    fig.update_layout(yaxis_title='Profit Margin (%)')
+    st.plotly_chart(fig, use_container_width=True)
+
+# Q8: Geographic Revenue Analysis - FIXED
+def render_q8():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🗺️ Q8: Geographic Revenue Analysis")
+    st.markdown("State-wise and city-wise performance with interactive maps")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # State-wise Performance
+    st.subheader("🏛️ State-wise Revenue Performance")
+    state_revenue = st.session_state.transactions.groupby('customer_state').agg({
+        'final_amount_inr': 'sum',
+        'customer_id': 'nunique',
+        'transaction_id': 'count'
+    }).reset_index()
+    state_revenue.columns = ['state', 'revenue', 'customers', 'orders']
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.bar(state_revenue.nlargest(15, 'revenue'), 
+                    x='state', y='revenue',
+                    title='Top 15 States by Revenue')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        fig = px.scatter(state_revenue, x='customers', y='revenue',
+                        size='orders', color='state',
+                        title='State Performance: Customers vs Revenue')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # City-wise Performance
+    st.subheader("🏙️ City-wise Revenue Performance")
+    city_revenue = st.session_state.transactions.groupby(['customer_city', 'customer_state']).agg({
+        'final_amount_inr': 'sum',
+        'customer_id': 'nunique'
+    }).reset_index()
+    city_revenue.columns = ['city', 'state', 'revenue', 'customers']
+    
+    top_cities = city_revenue.nlargest(20, 'revenue')
+    fig = px.bar(top_cities, x='city', y='revenue', color='state',
+                title='Top 20 Cities by Revenue')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # FIXED: Customer Tier Analysis
+    st.subheader("👑 Customer Tier Analysis")
+    
+    # Check if customer_tier column exists and has data
+    if 'customer_tier' in st.session_state.transactions.columns:
+        tier_performance = st.session_state.transactions.groupby('customer_tier').agg({
             'final_amount_inr': 'sum',
-            'customer_id': 'nunique'
+            'customer_id': 'nunique',
+            'transaction_id': 'count',
+            'customer_rating': 'mean',
+            'discount_percent': 'mean'
         }).reset_index()
-        category_share['market_share'] = (category_share['final_amount_inr'] / category_share['final_amount_inr'].sum()) * 100
         
-        fig = px.pie(category_share, values='market_share', names='category', 
-                    title='Market Share by Category')
-        st.plotly_chart(fig, use_container_width=True)
+        tier_performance.columns = ['customer_tier', 'total_revenue', 'unique_customers', 'total_orders', 'avg_rating', 'avg_discount']
         
-        # Competitive Positioning
-        st.subheader("⚔️ Competitive Positioning")
+        # Remove any empty or null tiers
+        tier_performance = tier_performance[tier_performance['customer_tier'].notna() & (tier_performance['customer_tier'] != '')]
         
-        # Brand performance analysis
-        brand_performance = st.session_state.transactions.groupby('brand').agg({
+        if not tier_performance.empty:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Revenue by tier
+                fig = px.pie(tier_performance, values='total_revenue', names='customer_tier',
+                            title='Revenue Distribution by Customer Tier',
+                            hover_data=['unique_customers'])
+                fig.update_traces(
+                    textinfo='percent+label',
+                    hovertemplate='<b>%{label}</b><br>Revenue: ₹%{value:,.0f}<br>Customers: %{customdata[0]:,}'
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                # Customer distribution by tier
+                fig = px.bar(tier_performance, x='customer_tier', y='unique_customers',
+                            title='Customer Distribution by Tier',
+                            color='total_revenue',
+                            color_continuous_scale='Viridis')
+                fig.update_layout(xaxis_title='Customer Tier', yaxis_title='Number of Customers')
+                st.plotly_chart(fig, use_container_width=True)
+            
+            # Tier Performance Metrics
+            st.subheader("📊 Tier Performance Metrics")
+            
+            # Calculate additional metrics
+            tier_performance['revenue_per_customer'] = tier_performance['total_revenue'] / tier_performance['unique_customers']
+            tier_performance['orders_per_customer'] = tier_performance['total_orders'] / tier_performance['unique_customers']
+            tier_performance['avg_order_value'] = tier_performance['total_revenue'] / tier_performance['total_orders']
+            
+            # Display performance table
+            display_tier_table = tier_performance[[
+                'customer_tier', 'unique_customers', 'total_orders', 'total_revenue',
+                'revenue_per_customer', 'orders_per_customer', 'avg_order_value', 'avg_rating'
+            ]].copy()
+            
+            display_tier_table = display_tier_table.round({
+                'revenue_per_customer': 2,
+                'orders_per_customer': 2,
+                'avg_order_value': 2,
+                'avg_rating': 2
+            })
+            
+            st.dataframe(
+                display_tier_table.style.format({
+                    'total_revenue': '₹{:,.2f}',
+                    'revenue_per_customer': '₹{:,.2f}',
+                    'avg_order_value': '₹{:,.2f}',
+                    'avg_rating': '{:.2f} ⭐'
+                }),
+                use_container_width=True
+            )
+        else:
+            st.warning("No customer tier data available for analysis.")
+    else:
+        st.warning("Customer tier data not available in the dataset.")
+    
+    # Market Penetration Opportunities
+    st.subheader("🎯 Market Penetration Opportunities")
+    
+    # Identify states with high revenue per customer (mature markets)
+    state_revenue['revenue_per_customer'] = state_revenue['revenue'] / state_revenue['customers']
+    mature_markets = state_revenue.nlargest(5, 'revenue_per_customer')
+    growth_markets = state_revenue.nsmallest(5, 'revenue_per_customer')
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write("🏆 Mature Markets (High Revenue/Customer)")
+        mature_display = mature_markets[['state', 'revenue_per_customer', 'customers']].round(2)
+        mature_display['revenue_per_customer'] = mature_display['revenue_per_customer'].apply(lambda x: f'₹{x:,.0f}')
+        st.dataframe(mature_display, use_container_width=True)
+    with col2:
+        st.write("🚀 Growth Opportunities (Low Revenue/Customer)")
+        growth_display = growth_markets[['state', 'revenue_per_customer', 'customers']].round(2)
+        growth_display['revenue_per_customer'] = growth_display['revenue_per_customer'].apply(lambda x: f'₹{x:,.0f}')
+        st.dataframe(growth_display, use_container_width=True)
+
+# Q9: Festival Sales Analytics Dashboard - FIXED
+def render_q9():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🎪 Q9: Festival Sales Analytics Dashboard")
+    st.markdown("Festival period performance, campaign effectiveness, and promotional impact")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Festival Performance Overview
+    st.subheader("📊 Festival Performance Overview")
+    festival_data = st.session_state.transactions[st.session_state.transactions['is_festival_sale'] == 'Yes']
+    
+    if not festival_data.empty:
+        festival_performance = festival_data.groupby('festival_name').agg({
             'final_amount_inr': 'sum',
+            'transaction_id': 'count',
             'customer_id': 'nunique',
-            'customer_rating': 'mean'
-        }).nlargest(10, 'final_amount_inr').reset_index()
+            'discount_percent': 'mean'
+        }).reset_index()
+        festival_performance.columns = ['festival', 'revenue', 'orders', 'customers', 'avg_discount']
         
         col1, col2 = st.columns(2)
         with col1:
-            fig = px.bar(brand_performance, x='brand', y='final_amount_inr',
-                        title='Top 10 Brands by Revenue', color='final_amount_inr')
+            fig = px.bar(festival_performance, x='festival', y='revenue',
+                        title='Revenue by Festival', color='revenue')
             fig.update_yaxes(tickprefix='₹')
             st.plotly_chart(fig, use_container_width=True)
         with col2:
-            fig = px.scatter(brand_performance, x='customer_id', y='final_amount_inr',
-                           size='customer_rating', color='brand',
-                           title='Brand Positioning: Customers vs Revenue')
-            fig.update_yaxes(tickprefix='₹')
+            fig = px.bar(festival_performance, x='festival', y='orders',
+                        title='Orders by Festival', color='orders')
             st.plotly_chart(fig, use_container_width=True)
-        
-        # Geographic Expansion
-        st.subheader("🗺️ Geographic Performance")
-        state_performance = st.session_state.transactions.groupby('customer_state').agg({
-            'final_amount_inr': 'sum',
-            'customer_id': 'nunique'
-        }).nlargest(10, 'final_amount_inr')
+    else:
+        st.info("No festival data available in the current sample.")
+    
+    # Festival vs Non-Festival Comparison
+    st.subheader("⚖️ Festival vs Regular Day Performance")
+    
+    # Calculate daily averages
+    daily_performance = st.session_state.transactions.groupby('order_date').agg({
+        'final_amount_inr': 'sum',
+        'transaction_id': 'count',
+        'is_festival_sale': 'first'
+    }).reset_index()
+    
+    if 'is_festival_sale' in daily_performance.columns:
+        festival_avg = daily_performance[daily_performance['is_festival_sale'] == 'Yes']['final_amount_inr'].mean()
+        regular_avg = daily_performance[daily_performance['is_festival_sale'] == 'No']['final_amount_inr'].mean()
+        
+        comparison_data = pd.DataFrame({
+            'Period': ['Festival Days', 'Regular Days'],
+            'Average Daily Revenue': [festival_avg, regular_avg],
+            'Revenue Multiplier': [festival_avg/regular_avg, 1]
+        })
         
         col1, col2 = st.columns(2)
         with col1:
-            fig = px.bar(state_performance, y='final_amount_inr', 
-                        title='Top 10 States by Revenue')
-            fig.update_xaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        with col2:
-            fig = px.bar(state_performance, y='customer_id', 
-                        title='Customer Distribution by State')
+            fig = px.bar(comparison_data, x='Period', y='Average Daily Revenue',
+                        title='Average Daily Revenue: Festival vs Regular')
+            fig.update_yaxes(tickprefix='₹')
             st.plotly_chart(fig, use_container_width=True)
-        
-        # Business Health Indicators
-        st.subheader("❤️ Business Health Metrics")
-        
-        # Calculate actual metrics
-        customer_growth_rate = 12.3
-        revenue_growth_rate = 15.8
-        order_growth_rate = 18.5
-        retention_rate = 67.2
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Customer Growth Rate", f"{customer_growth_rate}%", "Healthy")
         with col2:
-            st.metric("Revenue Growth Rate", f"{revenue_growth_rate}%", "Excellent")
-        with col3:
-            st.metric("Order Growth Rate", f"{order_growth_rate}%", "Excellent")
-        with col4:
-            st.metric("Retention Rate", f"{retention_rate}%", "Good")
-        
-        # Strategic Insights
-        st.subheader("💡 Strategic Insights")
-        insights = [
-            "🚀 **High Growth**: Electronics and Fashion categories showing 25%+ YoY growth",
-            "🎯 **Opportunity**: Tier 2 cities represent 45% growth potential",
-            "💰 **Efficiency**: Prime members generate 3.2x higher lifetime value",
-            "📈 **Trend**: Mobile commerce growing at 35% quarterly rate"
-        ]
-        
-        for insight in insights:
-            st.info(insight)
-
-    # Q4: Financial Performance Dashboard - FIXED
-    elif dashboard_id == "Q4":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("💰 Q4: Financial Performance Dashboard")
-        st.markdown("Revenue breakdown, profit margin analysis, and cost structure visualization")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Revenue Breakdown - FIXED TREEMAP
-        st.subheader("📈 Revenue Breakdown by Category")
-        
-        # Get category revenue data
-        category_revenue = st.session_state.transactions.groupby('category').agg({
+            st.metric("Festival Revenue Multiplier", f"{festival_avg/regular_avg:.1f}x")
+            st.metric("Revenue Increase during Festivals", f"{(festival_avg-regular_avg)/regular_avg*100:.1f}%")
+    
+    # Campaign Effectiveness
+    st.subheader("🎯 Campaign Effectiveness Analysis")
+    
+    if not festival_data.empty:
+        discount_impact = festival_data.groupby('discount_percent').agg({
             'final_amount_inr': 'sum',
-            'original_price_inr': 'sum',
-            'discount_percent': 'mean',
             'transaction_id': 'count'
         }).reset_index()
         
-        # Rename columns for clarity
-        category_revenue.columns = ['category', 'total_revenue', 'total_original_price', 'avg_discount', 'order_count']
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            # FIXED TREEMAP - Proper structure
-            fig = px.treemap(
-                category_revenue,
-                path=['category'],
-                values='total_revenue',
-                title='Revenue Distribution by Category',
-                color='total_revenue',
-                color_continuous_scale='Blues'
-            )
-            fig.update_traces(
-                textinfo="label+value+percent parent",
-                hovertemplate='<b>%{label}</b><br>Revenue: ₹%{value:,.0f}<br>Market Share: %{percentParent:.1%}'
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-        with col2:
-            # Top categories bar chart
-            top_categories = category_revenue.nlargest(8, 'total_revenue')
-            fig = px.bar(
-                top_categories, 
-                x='category', 
-                y='total_revenue',
-                title='Top 8 Categories by Revenue',
-                color='total_revenue',
-                color_continuous_scale='Viridis'
-            )
-            fig.update_layout(
-                xaxis_title='Category',
-                yaxis_title='Total Revenue (₹)',
-                showlegend=False
-            )
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Display category revenue table
-        st.subheader("📊 Category Revenue Details")
-        display_table = category_revenue[['category', 'total_revenue', 'order_count', 'avg_discount']].copy()
-        display_table['total_revenue'] = display_table['total_revenue'].round(2)
-        display_table['avg_discount'] = (display_table['avg_discount']).round(1)
-        display_table = display_table.sort_values('total_revenue', ascending=False)
-        
-        st.dataframe(
-            display_table.style.format({
-                'total_revenue': '₹{:,.2f}',
-                'avg_discount': '{:.1f}%'
-            }),
-            use_container_width=True
-        )
-        
-        # Profit Margin Analysis
-        st.subheader("📈 Margin Analysis")
-        margin_data = st.session_state.transactions.copy()
-        margin_data['profit_margin'] = (
-            (margin_data['final_amount_inr'] - margin_data['delivery_charges']) / 
-            margin_data['final_amount_inr'] * 100
-        ).clip(0, 100)
-        
-        category_margin = margin_data.groupby('category')['profit_margin'].mean().reset_index()
-        
-        fig = px.bar(
-            category_margin, 
-            x='category', 
-            y='profit_margin',
-            title='Average Profit Margin by Category',
-            color='profit_margin',
-            color_continuous_scale='RdYlGn'
-        )
-        fig.update_layout(
-            xaxis_title='Category',
-            yaxis_title='Profit Margin (%)',
-            showlegend=False
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Cost Structure Analysis
-        st.subheader("🏗️ Cost Structure Analysis")
-        
-        total_revenue = st.session_state.transactions['final_amount_inr'].sum()
-        total_delivery = st.session_state.transactions['delivery_charges'].sum()
-        total_discount_amount = (
-            st.session_state.transactions['original_price_inr'] - 
-            st.session_state.transactions['discounted_price_inr']
-        ).sum()
-        net_amount = total_revenue - total_delivery - total_discount_amount
-        
-        cost_data = pd.DataFrame({
-            'Component': ['Gross Revenue', 'Delivery Costs', 'Discounts Given', 'Net Revenue'],
-            'Amount': [total_revenue, total_delivery, total_discount_amount, net_amount],
-            'Type': ['Revenue', 'Cost', 'Cost', 'Revenue']
-        })
-        
-        fig = px.pie(
-            cost_data, 
-            values='Amount', 
-            names='Component',
-            title='Revenue and Cost Distribution',
-            color='Type',
-            color_discrete_map={'Revenue': '#00CC96', 'Cost': '#EF553B'}
-        )
+        fig = px.scatter(discount_impact, x='discount_percent', y='final_amount_inr',
+                       size='transaction_id', title='Discount Effectiveness during Festivals',
+                       labels={'discount_percent': 'Discount %', 'final_amount_inr': 'Total Revenue'})
+        fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Financial Ratios
-        st.subheader("📐 Key Financial Ratios")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        delivery_cost_ratio = (total_delivery / total_revenue) * 100
-        discount_ratio = (total_discount_amount / total_revenue) * 100
-        net_margin = (net_amount / total_revenue) * 100
-        avg_discount = st.session_state.transactions['discount_percent'].mean()
-        
-        with col1:
-            st.metric("Delivery Cost Ratio", f"{delivery_cost_ratio:.1f}%")
-        with col2:
-            st.metric("Discount Ratio", f"{discount_ratio:.1f}%")
-        with col3:
-            st.metric("Net Margin", f"{net_margin:.1f}%")
-        with col4:
-            st.metric("Avg Discount %", f"{avg_discount:.1f}%")
+    
+    # Seasonal Revenue Optimization Insights
+    st.subheader("💡 Seasonal Optimization Insights")
+    
+    insights = [
+        "🎯 **Diwali Season**: Generates 3.2x higher revenue than average days",
+        "📱 **Electronics Boost**: Mobile & Electronics see 4.5x growth during festival sales",
+        "👥 **Customer Acquisition**: New customer acquisition increases by 185% during Prime Day",
+        "💰 **Optimal Discounts**: 25-35% discount range for maximum revenue impact",
+        "🚚 **Delivery Uptake**: Premium delivery options see 220% uptake during festivals",
+        "🛍️ **Category Strategy**: Fashion and Home categories perform best with bundle offers"
+    ]
+    
+    for insight in insights:
+        st.success(insight)
 
-    # Q5: Growth Analytics Dashboard - FIXED
-    elif dashboard_id == "Q5":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🚀 Q5: Growth Analytics Dashboard")
-        st.markdown("Customer growth, market penetration, and strategic initiative performance")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Customer Growth Over Time
-        st.subheader("👥 Customer Growth Analysis")
-        customer_growth = st.session_state.customers.copy()
-        customer_growth['first_order_date'] = pd.to_datetime(customer_growth['first_order_date'])
-        customer_growth['acquisition_year'] = customer_growth['first_order_date'].dt.year
-        
-        yearly_customers = customer_growth.groupby('acquisition_year').size().reset_index(name='new_customers')
-        fig = px.line(yearly_customers, x='acquisition_year', y='new_customers',
-                     title='New Customer Acquisition by Year', markers=True)
+# Q10: Price Optimization Dashboard - FIXED
+def render_q10():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("💰 Q10: Price Optimization Dashboard")
+    st.markdown("Price elasticity, discount effectiveness, and competitive pricing analysis")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Price Elasticity Analysis
+    st.subheader("📊 Price Elasticity Analysis")
+    
+    # Analyze relationship between price and quantity sold
+    price_demand_data = st.session_state.transactions.groupby(['category', 'original_price_inr']).agg({
+        'quantity': 'sum',
+        'final_amount_inr': 'sum',
+        'discount_percent': 'mean',
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    # Filter out extreme outliers for better visualization
+    price_demand_clean = price_demand_data[
+        (price_demand_data['original_price_inr'] > 0) & 
+        (price_demand_data['original_price_inr'] < price_demand_data['original_price_inr'].quantile(0.95))
+    ]
+    
+    fig = px.scatter(price_demand_clean, x='original_price_inr', y='quantity',
+                    size='final_amount_inr', color='category',
+                    title='Price vs Demand Relationship',
+                    hover_data=['discount_percent', 'final_amount_inr'],
+                    labels={
+                        'original_price_inr': 'Original Price (₹)',
+                        'quantity': 'Total Quantity Sold',
+                        'final_amount_inr': 'Total Revenue'
+                    })
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Discount Effectiveness
+    st.subheader("🎯 Discount Effectiveness Analysis")
+    
+    # Create discount ranges for better analysis
+    discount_ranges = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+    discount_labels = ['0-10%', '10-20%', '20-30%', '30-40%', '40-50%', '50-60%', '60-70%', '70-80%', '80-90%', '90-100%']
+    
+    discount_effectiveness = st.session_state.transactions.copy()
+    discount_effectiveness['discount_range'] = pd.cut(
+        discount_effectiveness['discount_percent'], 
+        bins=discount_ranges, 
+        labels=discount_labels,
+        include_lowest=True
+    )
+    
+    discount_analysis = discount_effectiveness.groupby('discount_range').agg({
+        'quantity': 'sum',
+        'final_amount_inr': 'sum',
+        'transaction_id': 'count',
+        'customer_rating': 'mean'
+    }).reset_index()
+    
+    discount_analysis['avg_revenue_per_order'] = discount_analysis['final_amount_inr'] / discount_analysis['transaction_id']
+    discount_analysis['conversion_rate'] = (discount_analysis['transaction_id'] / len(discount_effectiveness)) * 100
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.bar(discount_analysis, x='discount_range', y='quantity',
+                    title='Sales Volume by Discount Range',
+                    color='quantity',
+                    color_continuous_scale='Blues')
+        fig.update_layout(xaxis_title='Discount Range', yaxis_title='Total Quantity Sold')
         st.plotly_chart(fig, use_container_width=True)
         
-        # Market Penetration by State
-        st.subheader("🗺️ Market Penetration Analysis")
-        state_penetration = st.session_state.transactions.groupby('customer_state').agg({
-            'customer_id': 'nunique',
-            'final_amount_inr': 'sum'
-        }).reset_index()
-        
-        fig = px.scatter(state_penetration, x='customer_id', y='final_amount_inr',
-                        size='final_amount_inr', color='customer_state',
-                        title='Market Penetration: Customers vs Revenue by State')
-        fig.update_xaxes(title='Number of Customers')
-        fig.update_yaxes(title='Total Revenue (₹)', tickprefix='₹')
+    with col2:
+        fig = px.bar(discount_analysis, x='discount_range', y='final_amount_inr',
+                    title='Total Revenue by Discount Range',
+                    color='final_amount_inr',
+                    color_continuous_scale='Greens')
+        fig.update_layout(xaxis_title='Discount Range', yaxis_title='Total Revenue (₹)')
+        fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Product Portfolio Expansion
-        st.subheader("📦 Product Portfolio Growth")
-        product_growth = st.session_state.products.groupby('launch_year').size().reset_index(name='new_products')
-        fig = px.bar(product_growth, x='launch_year', y='new_products',
-                    title='New Product Launches by Year')
+    
+    # FIXED: Revenue Impact Analysis
+    st.subheader("📈 Revenue Impact Analysis")
+    
+    # Calculate key metrics by discount range
+    revenue_impact = discount_analysis.copy()
+    
+    # Calculate percentage of total revenue for each discount range
+    total_revenue_all = revenue_impact['final_amount_inr'].sum()
+    revenue_impact['revenue_share'] = (revenue_impact['final_amount_inr'] / total_revenue_all) * 100
+    revenue_impact['order_share'] = (revenue_impact['transaction_id'] / revenue_impact['transaction_id'].sum()) * 100
+    
+    # Create comprehensive revenue impact visualization
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Revenue share by discount range
+        fig = px.pie(revenue_impact, values='revenue_share', names='discount_range',
+                    title='Revenue Distribution by Discount Range',
+                    hover_data=['final_amount_inr'])
+        fig.update_traces(
+            textinfo='percent+label',
+            hovertemplate='<b>%{label}</b><br>Revenue Share: %{percent}<br>Total Revenue: ₹%{customdata[0]:,.0f}'
+        )
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Strategic Initiative Performance
-        st.subheader("🎯 Strategic Initiative Performance")
-        
-        # Prime membership impact
-        prime_analysis = st.session_state.transactions.groupby('is_prime_member').agg({
-            'final_amount_inr': 'sum',
-            'customer_id': 'nunique',
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            if not prime_analysis.empty:
-                prime_analysis['member_type'] = prime_analysis['is_prime_member'].map({'Yes': 'Prime', 'No': 'Non-Prime'})
-                fig = px.pie(prime_analysis, values='final_amount_inr', names='member_type',
-                            title='Revenue Share: Prime vs Non-Prime')
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Customer retention by acquisition year
-            retention_data = customer_growth.groupby('acquisition_year').agg({
-                'customer_lifetime_days': 'mean',
-                'total_orders': 'mean'
-            }).reset_index()
-            
-            fig = px.line(retention_data, x='acquisition_year', y='customer_lifetime_days',
-                         title='Average Customer Lifetime by Cohort', markers=True)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Growth Metrics Summary
-        st.subheader("📊 Growth Metrics Summary")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            customer_growth_rate = 12.3
-            st.metric("Customer Growth Rate", f"{customer_growth_rate}%")
-        
-        with col2:
-            revenue_growth_rate = 15.8
-            st.metric("Revenue Growth Rate", f"{revenue_growth_rate}%")
-        
-        with col3:
-            market_penetration = 67.5
-            st.metric("Market Penetration", f"{market_penetration}%")
-        
-        with col4:
-            product_expansion = 23.4
-            st.metric("Product Expansion", f"{product_expansion}%")
-
-    # Q6: Revenue Trend Analysis Dashboard - FIXED
-    elif dashboard_id == "Q6":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("📈 Q6: Revenue Trend Analysis Dashboard")
-        st.markdown("Monthly/quarterly/yearly revenue patterns with seasonal variations")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Time period selection
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            time_granularity = st.selectbox("Time Granularity", 
-                                          ["Monthly", "Quarterly", "Yearly"])
-        with col2:
-            start_year = st.selectbox("Start Year", range(2015, 2026), index=0)
-        with col3:
-            end_year = st.selectbox("End Year", range(2015, 2026), index=10)
-        
-        # Filter data based on selection
-        filtered_data = st.session_state.transactions[
-            (st.session_state.transactions['order_year'] >= start_year) & 
-            (st.session_state.transactions['order_year'] <= end_year)
-        ]
-        
-        if time_granularity == "Monthly":
-            trend_data = filtered_data.groupby(['order_year', 'order_month'])['final_amount_inr'].sum().reset_index()
-            trend_data['period'] = trend_data['order_year'].astype(str) + '-' + trend_data['order_month'].astype(str).str.zfill(2)
-            x_col = 'period'
-        elif time_granularity == "Quarterly":
-            trend_data = filtered_data.groupby(['order_year', 'order_quarter'])['final_amount_inr'].sum().reset_index()
-            trend_data['period'] = trend_data['order_year'].astype(str) + '-Q' + trend_data['order_quarter'].astype(str)
-            x_col = 'period'
-        else:  # Yearly
-            trend_data = filtered_data.groupby('order_year')['final_amount_inr'].sum().reset_index()
-            x_col = 'order_year'
-        
-        # Revenue Trend Chart
-        fig = px.line(trend_data, x=x_col, y='final_amount_inr',
-                     title=f'Revenue Trend ({time_granularity})', markers=True)
-        fig.update_layout(xaxis_title='Period', yaxis_title='Revenue (₹)')
+    
+    with col2:
+        # Efficiency analysis: Revenue per discount percentage
+        revenue_impact['revenue_per_discount_point'] = revenue_impact['final_amount_inr'] / revenue_impact['transaction_id']
+        
+        fig = px.scatter(revenue_impact, x='discount_range', y='avg_revenue_per_order',
+                        size='transaction_id', color='customer_rating',
+                        title='Revenue Efficiency by Discount Range',
+                        hover_data=['quantity', 'conversion_rate'],
+                        labels={
+                            'avg_revenue_per_order': 'Avg Revenue per Order (₹)',
+                            'customer_rating': 'Avg Customer Rating',
+                            'transaction_id': 'Number of Orders'
+                        })
         fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
+    
+    # Detailed Revenue Impact Metrics
+    st.subheader("📊 Detailed Discount Performance Metrics")
+    
+    # Calculate additional business metrics
+    revenue_impact['profitability_score'] = (
+        (revenue_impact['avg_revenue_per_order'] * 0.4) +  # Revenue weight
+        (revenue_impact['customer_rating'] * 0.3) +        # Customer satisfaction weight
+        (revenue_impact['conversion_rate'] * 0.3)          # Conversion weight
+    )
+    
+    # Display performance metrics table
+    metrics_table = revenue_impact[[
+        'discount_range', 'transaction_id', 'final_amount_inr', 
+        'avg_revenue_per_order', 'customer_rating', 'conversion_rate', 'profitability_score'
+    ]].copy()
+    
+    metrics_table.columns = [
+        'Discount Range', 'Orders', 'Total Revenue', 
+        'Avg Revenue/Order', 'Avg Rating', 'Conversion Rate', 'Profitability Score'
+    ]
+    
+    # Format the table
+    metrics_table = metrics_table.round({
+        'Avg Revenue/Order': 2,
+        'Avg Rating': 2,
+        'Conversion Rate': 2,
+        'Profitability Score': 2
+    })
+    
+    st.dataframe(
+        metrics_table.style.format({
+            'Total Revenue': '₹{:,.0f}',
+            'Avg Revenue/Order': '₹{:,.2f}',
+            'Conversion Rate': '{:.2f}%',
+            'Profitability Score': '{:.2f}'
+        }),
+        use_container_width=True
+    )
+    
+    # Optimal Discount Range Identification
+    st.subheader("🎯 Optimal Discount Strategy Insights")
+    
+    # Find optimal ranges
+    max_revenue_range = revenue_impact.loc[revenue_impact['final_amount_inr'].idxmax(), 'discount_range']
+    max_efficiency_range = revenue_impact.loc[revenue_impact['avg_revenue_per_order'].idxmax(), 'discount_range']
+    max_profitability_range = revenue_impact.loc[revenue_impact['profitability_score'].idxmax(), 'discount_range']
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            "Highest Revenue Generator", 
+            f"{max_revenue_range} Discount",
+            f"₹{revenue_impact['final_amount_inr'].max():,.0f}"
+        )
+    
+    with col2:
+        st.metric(
+            "Most Efficient Range", 
+            f"{max_efficiency_range} Discount",
+            f"₹{revenue_impact['avg_revenue_per_order'].max():.0f}/order"
+        )
+    
+    with col3:
+        st.metric(
+            "Most Profitable Range", 
+            f"{max_profitability_range} Discount",
+            f"Score: {revenue_impact['profitability_score'].max():.2f}"
+        )
+    
+    # Competitive Pricing Analysis
+    st.subheader("⚔️ Competitive Pricing Analysis")
+    
+    # Price distribution by category and brand
+    pricing_analysis = st.session_state.transactions.groupby(['category', 'brand']).agg({
+        'original_price_inr': ['min', 'max', 'mean', 'median'],
+        'discount_percent': 'mean',
+        'transaction_id': 'count'
+    }).round(2).reset_index()
+    
+    pricing_analysis.columns = ['category', 'brand', 'min_price', 'max_price', 'avg_price', 'median_price', 'avg_discount', 'transactions']
+    
+    # Filter for meaningful analysis (brands with sufficient transactions)
+    significant_brands = pricing_analysis[pricing_analysis['transactions'] > 100]
+    
+    if not significant_brands.empty:
+        category_select = st.selectbox("Select Category for Pricing Analysis", 
+                                     significant_brands['category'].unique())
         
-        # Seasonal Analysis
-        st.subheader("🌞 Seasonal Variations")
-        monthly_pattern = filtered_data.groupby('order_month')['final_amount_inr'].mean().reset_index()
-        fig = px.line(monthly_pattern, x='order_month', y='final_amount_inr',
-                     title='Average Monthly Revenue Pattern', markers=True)
-        fig.update_layout(xaxis_title='Month', yaxis_title='Average Revenue (₹)')
+        category_pricing = significant_brands[significant_brands['category'] == category_select]
+        
+        fig = px.box(category_pricing, y='avg_price', title=f'Price Distribution - {category_select}')
         fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Growth Rate Analysis
-        st.subheader("📊 Growth Rate Analysis")
-        if time_granularity == "Yearly":
-            trend_data['growth_rate'] = trend_data['final_amount_inr'].pct_change() * 100
-            fig = px.bar(trend_data, x='order_year', y='growth_rate',
-                        title='Year-over-Year Growth Rate')
-            fig.update_layout(xaxis_title='Year', yaxis_title='Growth Rate (%)')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Revenue Forecasting (Simple)
-        st.subheader("🔮 Revenue Forecasting")
-        if len(trend_data) > 1:
-            # Simple linear trend for demonstration
-            x = np.arange(len(trend_data))
-            y = trend_data['final_amount_inr'].values
-            z = np.polyfit(x, y, 1)
-            p = np.poly1d(z)
+    else:
+        st.info("Insufficient data for competitive pricing analysis.")
+    
+    # Pricing Recommendations
+    st.subheader("💡 Pricing Strategy Recommendations")
+    
+    # Dynamic recommendations based on analysis
+    optimal_discount = revenue_impact.loc[revenue_impact['profitability_score'].idxmax(), 'discount_range']
+    
+    recommendations = [
+        f"🎯 **Optimal Discount Strategy**: Focus on {optimal_discount} range for maximum profitability",
+        "📱 **Electronics**: Implement flash sales with 25-35% discounts for high-volume products",
+        "👕 **Fashion**: Use tiered pricing with 15-25% discounts for seasonal collections",
+        "🏠 **Home & Kitchen**: Bundle pricing with 25-35% discounts performs best",
+        "📚 **Books**: Maintain competitive pricing with 10-20% strategic discounts",
+        f"🚀 **Growth Strategy**: {max_revenue_range} discounts drive highest overall revenue",
+        "💎 **Premium Products**: Minimal discounts (0-15%) maintain brand value perception"
+    ]
+    
+    for rec in recommendations:
+        st.success(rec)
+ 
+# Q11: Customer Segmentation Dashboard - OPTIMIZED VERSION
+def render_q11():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("👥 Q11: Customer Segmentation Dashboard")
+    st.markdown("RFM analysis, behavioral segmentation, lifetime value analysis with targeted marketing recommendations")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Add progress bar and status
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    
+    # RFM Analysis - OPTIMIZED
+    st.subheader("📊 RFM Customer Segmentation")
+    
+    status_text.text("Loading customer data...")
+    progress_bar.progress(10)
+    
+    # Use pre-calculated RFM data if available, otherwise calculate efficiently
+    try:
+        # Check if RFM data already exists in customers table
+        if all(col in st.session_state.customers.columns for col in ['recency_segment', 'spending_segment']):
+            st.info("✅ Using pre-calculated customer segments")
+            rfm_data = st.session_state.customers.copy()
             
-            future_periods = 3
-            future_x = np.arange(len(trend_data), len(trend_data) + future_periods)
-            forecast = p(future_x)
+            # Map existing segments to RFM
+            segment_mapping = {
+                'Active (<30 days)': 'Champions',
+                'Warm (30-90 days)': 'Loyal Customers', 
+                'Inactive (>90 days)': 'At Risk'
+            }
+            rfm_data['segment'] = rfm_data['recency_segment'].map(segment_mapping).fillna('Potential Loyalists')
             
-            forecast_df = pd.DataFrame({
-                'period': [f'Future {i+1}' for i in range(future_periods)],
-                'revenue': forecast
-            })
+        else:
+            # OPTIMIZED RFM Calculation
+            status_text.text("Calculating RFM segments...")
+            progress_bar.progress(30)
             
-            fig = px.line(trend_data, x=x_col, y='final_amount_inr', 
-                         title='Revenue Trend with Forecast')
-            fig.add_scatter(x=forecast_df['period'], y=forecast_df['revenue'], 
-                          mode='lines', name='Forecast', line=dict(dash='dash'))
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-
-    # Q7: Category Performance Dashboard - FIXED
-    elif dashboard_id == "Q7":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🏪 Q7: Category Performance Dashboard")
-        st.markdown("Revenue contribution, growth trends, and category-wise profitability")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Category Selection for Drill-down
-        categories = st.session_state.transactions['category'].unique()
-        selected_category = st.selectbox("Select Category for Detailed Analysis", categories)
-        
-        # Overall Category Performance
-        st.subheader("📈 Overall Category Performance")
-        category_performance = st.session_state.transactions.groupby('category').agg({
-            'final_amount_inr': ['sum', 'count'],
-            'customer_rating': 'mean',
-            'discount_percent': 'mean'
-        }).round(2)
-        
-        category_performance.columns = ['total_revenue', 'order_count', 'avg_rating', 'avg_discount']
-        category_performance = category_performance.reset_index()
-        
+            rfm_data = st.session_state.customers.copy()
+            
+            # Use efficient quantile calculation with error handling
+            def safe_quantile_cut(data, q, labels):
+                try:
+                    # Remove NaN values and ensure sufficient data
+                    clean_data = data.dropna()
+                    if len(clean_data) < len(labels):
+                        # If not enough data points, use equal bins
+                        return pd.cut(data, bins=len(labels), labels=labels, duplicates='drop')
+                    return pd.qcut(clean_data, q=q, labels=labels, duplicates='drop')
+                except:
+                    # Fallback to simple binning
+                    return pd.cut(data, bins=len(labels), labels=labels, duplicates='drop')
+            
+            # Recency Score (days since last order - lower is better)
+            status_text.text("Calculating recency scores...")
+            rfm_data['recency_score'] = safe_quantile_cut(
+                rfm_data['days_since_last_order'], 
+                q=5, 
+                labels=[5, 4, 3, 2, 1]
+            )
+            
+            progress_bar.progress(50)
+            status_text.text("Calculating frequency scores...")
+            
+            # Frequency Score (total orders - higher is better)
+            rfm_data['frequency_score'] = safe_quantile_cut(
+                rfm_data['total_orders'], 
+                q=5, 
+                labels=[1, 2, 3, 4, 5]
+            )
+            
+            progress_bar.progress(70)
+            status_text.text("Calculating monetary scores...")
+            
+            # Monetary Score (total spent - higher is better)
+            rfm_data['monetary_score'] = safe_quantile_cut(
+                rfm_data['total_spent'], 
+                q=5, 
+                labels=[1, 2, 3, 4, 5]
+            )
+            
+            # Convert scores to numeric safely
+            for col in ['recency_score', 'frequency_score', 'monetary_score']:
+                rfm_data[col] = pd.to_numeric(rfm_data[col], errors='coerce').fillna(3)  # Default to middle value
+            
+            progress_bar.progress(85)
+            status_text.text("Creating customer segments...")
+            
+            # Calculate RFM score
+            rfm_data['rfm_score'] = (
+                rfm_data['recency_score'] + 
+                rfm_data['frequency_score'] + 
+                rfm_data['monetary_score']
+            )
+            
+            # Create RFM segments with error handling
+            def get_rfm_segment(row):
+                try:
+                    if pd.isna(row['rfm_score']):
+                        return 'Unknown'
+                    elif row['rfm_score'] >= 13:
+                        return 'Champions'
+                    elif row['rfm_score'] >= 10:
+                        return 'Loyal Customers'
+                    elif row['rfm_score'] >= 8:
+                        return 'Potential Loyalists'
+                    elif row['rfm_score'] >= 6:
+                        return 'At Risk'
+                    else:
+                        return 'Lost Customers'
+                except:
+                    return 'Unknown'
+            
+            rfm_data['segment'] = rfm_data.apply(get_rfm_segment, axis=1)
+            
+    except Exception as e:
+        st.error(f"Error in RFM calculation: {e}")
+        # Fallback to simple segmentation
+        rfm_data = st.session_state.customers.copy()
+        rfm_data['segment'] = 'Loyal Customers'  # Default segment
+    
+    progress_bar.progress(100)
+    status_text.text("✅ RFM analysis completed!")
+    
+    # Clear progress indicators
+    progress_bar.empty()
+    status_text.empty()
+    
+    # RFM Segmentation Visualization - Only show if we have meaningful data
+    valid_segments = rfm_data[rfm_data['segment'] != 'Unknown']
+    
+    if len(valid_segments) > 0:
         col1, col2 = st.columns(2)
-        with col1:
-            fig = px.bar(category_performance.nlargest(10, 'total_revenue'), 
-                        x='category', y='total_revenue',
-                        title='Top 10 Categories by Revenue', color='total_revenue')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        with col2:
-            fig = px.scatter(category_performance, x='order_count', y='total_revenue',
-                            size='avg_rating', color='category',
-                            title='Category Performance: Orders vs Revenue')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
         
-        # Selected Category Drill-down
-        st.subheader(f"🔍 Detailed Analysis: {selected_category}")
-        category_data = st.session_state.transactions[st.session_state.transactions['category'] == selected_category]
-        
-        col1, col2 = st.columns(2)
         with col1:
-            # Subcategory performance
-            subcategory_perf = category_data.groupby('subcategory')['final_amount_inr'].sum().nlargest(10).reset_index()
-            fig = px.pie(subcategory_perf, values='final_amount_inr', names='subcategory',
-                        title=f'Subcategory Distribution - {selected_category}')
+            # Segment distribution - with sampling for large datasets
+            if len(valid_segments) > 10000:
+                sample_data = valid_segments.sample(n=10000, random_state=42)
+                st.info(f"📊 Showing sample of 10,000 customers from {len(valid_segments):,} total")
+            else:
+                sample_data = valid_segments
+            
+            segment_counts = sample_data['segment'].value_counts()
+            fig = px.pie(segment_counts, values=segment_counts.values, names=segment_counts.index,
+                        title='Customer RFM Segments Distribution',
+                        color_discrete_sequence=px.colors.qualitative.Set3)
             st.plotly_chart(fig, use_container_width=True)
+        
         with col2:
-            # Monthly trend for selected category
-            monthly_trend = category_data.groupby(['order_year', 'order_month'])['final_amount_inr'].sum().reset_index()
-            monthly_trend['period'] = monthly_trend['order_year'].astype(str) + '-' + monthly_trend['order_month'].astype(str).str.zfill(2)
-            fig = px.line(monthly_trend, x='period', y='final_amount_inr',
-                         title=f'Monthly Trend - {selected_category}')
+            # RFM scatter plot with sampling
+            plot_sample = sample_data.sample(n=min(2000, len(sample_data)), random_state=42)
+            fig = px.scatter(plot_sample, x='total_orders', y='total_spent', 
+                        color='segment', size='avg_order_value',
+                        title='RFM Analysis: Frequency vs Monetary Value',
+                        hover_data=['customer_id', 'days_since_last_order'],
+                        labels={
+                            'total_orders': 'Frequency (Total Orders)',
+                            'total_spent': 'Monetary (Total Spent ₹)',
+                            'segment': 'RFM Segment'
+                        })
             fig.update_yaxes(tickprefix='₹')
             st.plotly_chart(fig, use_container_width=True)
         
-        # Category Growth Trends
-        st.subheader("📊 Category Growth Over Time")
-        category_growth = st.session_state.transactions.groupby(['order_year', 'category'])['final_amount_inr'].sum().reset_index()
-        top_categories = category_growth.groupby('category')['final_amount_inr'].sum().nlargest(5).index
-        filtered_growth = category_growth[category_growth['category'].isin(top_categories)]
+        # Segment Insights - Optimized aggregation
+        st.subheader("📈 RFM Segment Insights")
         
-        fig = px.line(filtered_growth, x='order_year', y='final_amount_inr', color='category',
-                     title='Revenue Growth of Top 5 Categories Over Time')
-        fig.update_yaxes(tickprefix='₹')
-        st.plotly_chart(fig, use_container_width=True)
+        # Use efficient aggregation
+        segment_stats = valid_segments.groupby('segment').agg({
+            'total_spent': ['mean', 'count'],
+            'total_orders': 'mean',
+            'days_since_last_order': 'mean',
+            'avg_order_value': 'mean'
+        }).round(2)
         
-        # Profitability Analysis
-        st.subheader("💰 Category Profitability")
-        margin_data = st.session_state.transactions.copy()
-        margin_data['profit_margin'] = (
-            (margin_data['final_amount_inr'] - margin_data['delivery_charges']) / 
-            margin_data['final_amount_inr'] * 100
-        ).clip(0, 100)
+        segment_stats.columns = ['avg_spending', 'customer_count', 'avg_orders', 'avg_recency_days', 'avg_order_value']
+        segment_stats = segment_stats.reset_index()
         
-        category_margin = margin_data.groupby('category')['profit_margin'].mean().reset_index()
-        fig = px.bar(category_margin, x='category', y='profit_margin',
-                    title='Average Profit Margin by Category', color='profit_margin')
-        fig.update_layout(yaxis_title='Profit Margin (%)')
+        st.dataframe(segment_stats.style.format({
+            'avg_spending': '₹{:,.2f}',
+            'avg_order_value': '₹{:,.2f}'
+        }), use_container_width=True)
+    
+    else:
+        st.warning("No valid customer segments found for analysis.")
+    
+    # Behavioral Segmentation - OPTIMIZED
+    st.subheader("🎯 Behavioral Segmentation")
+    
+    # Use efficient binning
+    behavioral_data = st.session_state.customers.copy()
+    
+    # Create behavioral segments with safe binning
+    try:
+        behavioral_data['behavior_segment'] = pd.cut(
+            behavioral_data['avg_order_value'].fillna(0),
+            bins=[0, 500, 1500, 3000, float('inf')],
+            labels=['Budget', 'Value', 'Premium', 'Luxury']
+        )
+    except:
+        behavioral_data['behavior_segment'] = 'Value'  # Default
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Sample for visualization if dataset is large
+        if len(behavioral_data) > 5000:
+            behavior_sample = behavioral_data.sample(n=5000, random_state=42)
+        else:
+            behavior_sample = behavioral_data
+            
+        behavior_counts = behavior_sample['behavior_segment'].value_counts()
+        fig = px.bar(behavior_counts, x=behavior_counts.index, y=behavior_counts.values,
+                    title='Customer Behavior Segments',
+                    color=behavior_counts.values)
         st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Lifetime Value Analysis with sampling
+        try:
+            if len(behavioral_data) > 5000:
+                clv_sample = behavioral_data.sample(n=5000, random_state=42)
+            else:
+                clv_sample = behavioral_data
+                
+            clv_sample['clv_tier'] = pd.qcut(
+                clv_sample['total_spent'].fillna(0), 
+                4, 
+                labels=['Low CLV', 'Medium CLV', 'High CLV', 'VIP']
+            )
+            clv_dist = clv_sample['clv_tier'].value_counts()
+            fig = px.pie(clv_dist, values=clv_dist.values, names=clv_dist.index,
+                        title='Customer Lifetime Value Distribution')
+            st.plotly_chart(fig, use_container_width=True)
+        except:
+            st.info("Insufficient data for CLV analysis")
+    
+    # Targeted Marketing Recommendations - Only show for segments that exist
+    st.subheader("💡 Targeted Marketing Recommendations")
+    
+    recommendations = {
+        'Champions': [
+            "💎 **Reward Program**: Exclusive VIP benefits and early access",
+            "🎁 **Loyalty Rewards**: Special birthday discounts and anniversary offers",
+            "👑 **Premium Support**: Dedicated customer service line"
+        ],
+        'Loyal Customers': [
+            "⭐ **Upsell Opportunities**: Recommend premium products and bundles",
+            "🔔 **Personalized Communication**: Targeted email campaigns based on purchase history",
+            "📱 **Mobile App Engagement**: Push notifications for new arrivals"
+        ],
+        'Potential Loyalists': [
+            "🚀 **Engagement Campaigns**: Limited-time offers to encourage repeat purchases",
+            "🎯 **Category Expansion**: Suggest complementary product categories",
+            "📧 **Re-engagement Emails**: Cart abandonment and wishlist reminders"
+        ],
+        'At Risk': [
+            "📞 **Win-back Campaigns**: Special reactivation discounts",
+            "💝 **Personal Outreach**: Customer satisfaction surveys",
+            "❓ **Feedback Collection**: Understand reasons for decreased engagement"
+        ],
+        'Lost Customers': [
+            "🔄 **Reactivation Offers**: Significant discounts for returning customers",
+            "📢 **Social Media Targeting**: Lookalike audience campaigns",
+            "🎪 **Event Invitations**: Exclusive webinar or product launch invites"
+        ]
+    }
+    
+    # Only show segments that actually exist in the data
+    existing_segments = rfm_data['segment'].value_counts()
+    
+    for segment, tips in recommendations.items():
+        segment_count = existing_segments.get(segment, 0)
+        if segment_count > 0:
+            with st.expander(f"{segment} - {segment_count:,} customers"):
+                for tip in tips:
+                    st.write(f"• {tip}")
 
-    # Q8: Geographic Revenue Analysis - FIXED
-    elif dashboard_id == "Q8":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🗺️ Q8: Geographic Revenue Analysis")
-        st.markdown("State-wise and city-wise performance with interactive maps")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # State-wise Performance
-        st.subheader("🏛️ State-wise Revenue Performance")
-        state_revenue = st.session_state.transactions.groupby('customer_state').agg({
-            'final_amount_inr': 'sum',
+# Q12: Customer Journey Analytics Dashboard
+def render_q12():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🛣️ Q12: Customer Journey Analytics Dashboard")
+    st.markdown("Acquisition channels, purchase patterns, category transitions from first-time to loyal customers")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Customer Journey Analysis
+    st.subheader("📊 Customer Journey Overview")
+    
+    # Get customer journey data
+    journey_data = st.session_state.transactions.copy()
+    journey_data['order_date'] = pd.to_datetime(journey_data['order_date'])
+    
+    # Customer progression analysis
+    customer_progression = journey_data.groupby('customer_id').agg({
+        'order_date': ['min', 'max', 'count'],
+        'final_amount_inr': 'sum',
+        'category': 'nunique'
+    }).reset_index()
+    
+    customer_progression.columns = ['customer_id', 'first_order', 'last_order', 'order_count', 'total_spent', 'unique_categories']
+    
+    # Journey Metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        avg_orders = customer_progression['order_count'].mean()
+        st.metric("Avg Orders per Customer", f"{avg_orders:.1f}")
+    
+    with col2:
+        multi_category = (customer_progression['unique_categories'] > 1).sum()
+        st.metric("Multi-category Shoppers", f"{multi_category:,}")
+    
+    with col3:
+        repeat_customers = (customer_progression['order_count'] > 1).sum()
+        st.metric("Repeat Customers", f"{repeat_customers:,}")
+    
+    with col4:
+        avg_categories = customer_progression['unique_categories'].mean()
+        st.metric("Avg Categories per Customer", f"{avg_categories:.1f}")
+    
+    # Purchase Frequency Distribution
+    st.subheader("📈 Purchase Frequency Patterns")
+    freq_dist = customer_progression['order_count'].value_counts().sort_index().head(15)
+    fig = px.bar(freq_dist, x=freq_dist.index, y=freq_dist.values,
+                title='Customer Order Frequency Distribution',
+                labels={'x': 'Number of Orders', 'y': 'Number of Customers'})
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Category Transition Analysis
+    st.subheader("🔄 Category Transitions")
+    
+    # Get first and second purchase categories
+    customer_sequence = journey_data.sort_values(['customer_id', 'order_date'])
+    customer_sequence['order_sequence'] = customer_sequence.groupby('customer_id').cumcount() + 1
+    
+    # First purchase categories
+    first_purchase = customer_sequence[customer_sequence['order_sequence'] == 1]
+    first_purchase_cats = first_purchase['category'].value_counts().head(10)
+    
+    # Second purchase categories (for customers with multiple orders)
+    second_purchase = customer_sequence[customer_sequence['order_sequence'] == 2]
+    second_purchase_cats = second_purchase['category'].value_counts().head(10)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(first_purchase_cats, x=first_purchase_cats.index, y=first_purchase_cats.values,
+                    title='Top 10 First Purchase Categories')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.bar(second_purchase_cats, x=second_purchase_cats.index, y=second_purchase_cats.values,
+                    title='Top 10 Second Purchase Categories')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Customer Evolution Analysis
+    st.subheader("📊 Customer Evolution Patterns")
+    
+    # Analyze how customers evolve over time
+    evolution_data = customer_sequence.groupby(['customer_id', 'order_sequence']).agg({
+        'final_amount_inr': 'sum',
+        'category': 'first'
+    }).reset_index()
+    
+    # Average order value by sequence
+    aov_by_sequence = evolution_data.groupby('order_sequence')['final_amount_inr'].mean().reset_index()
+    aov_by_sequence = aov_by_sequence[aov_by_sequence['order_sequence'] <= 10]  # First 10 orders
+    
+    fig = px.line(aov_by_sequence, x='order_sequence', y='final_amount_inr',
+                 title='Average Order Value by Purchase Sequence',
+                 markers=True)
+    fig.update_layout(xaxis_title='Purchase Sequence', yaxis_title='Average Order Value (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Loyalty Development
+    st.subheader("⭐ Loyalty Development Insights")
+    
+    # Time to second purchase
+    multi_order_customers = customer_progression[customer_progression['order_count'] > 1]
+    multi_order_customers['days_to_second_purchase'] = (
+        multi_order_customers['last_order'] - multi_order_customers['first_order']
+    ).dt.days
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        avg_days_to_second = multi_order_customers['days_to_second_purchase'].mean()
+        st.metric("Avg Days to Second Purchase", f"{avg_days_to_second:.1f} days")
+    
+    with col2:
+        loyal_customers = len(multi_order_customers[multi_order_customers['order_count'] >= 3])
+        st.metric("Loyal Customers (3+ orders)", f"{loyal_customers:,}")
+    
+    # Customer Journey Recommendations
+    st.subheader("💡 Customer Journey Optimization")
+    
+    journey_insights = [
+        "🎯 **First Purchase Strategy**: Focus on Electronics and Fashion for customer acquisition",
+        "🔄 **Cross-selling**: 65% of customers buy from multiple categories within first 3 orders",
+        "📈 **Loyalty Building**: Implement rewards for 2nd and 3rd purchases to boost retention",
+        "⏱️ **Engagement Timing**: Most second purchases occur within 45 days of first purchase",
+        "💰 **Value Growth**: Average order value increases by 28% from 1st to 3rd purchase"
+    ]
+    
+    for insight in journey_insights:
+        st.success(insight)
+
+# Q13: Prime Membership Analytics Dashboard
+def render_q13():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("👑 Q13: Prime Membership Analytics Dashboard")
+    st.markdown("Prime vs non-Prime behavior, membership value analysis, retention rates, and Prime-specific insights")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Prime Membership Overview
+    st.subheader("📊 Prime Membership Overview")
+    
+    # Check Prime membership data
+    if 'is_prime_member' in st.session_state.transactions.columns:
+        prime_analysis = st.session_state.transactions.groupby('is_prime_member').agg({
             'customer_id': 'nunique',
-            'transaction_id': 'count'
+            'final_amount_inr': 'sum',
+            'transaction_id': 'count',
+            'customer_rating': 'mean',
+            'discount_percent': 'mean'
         }).reset_index()
-        state_revenue.columns = ['state', 'revenue', 'customers', 'orders']
         
-        col1, col2 = st.columns(2)
-        with col1:
-            fig = px.bar(state_revenue.nlargest(15, 'revenue'), 
-                        x='state', y='revenue',
-                        title='Top 15 States by Revenue')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        with col2:
-            fig = px.scatter(state_revenue, x='customers', y='revenue',
-                            size='orders', color='state',
-                            title='State Performance: Customers vs Revenue')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # City-wise Performance
-        st.subheader("🏙️ City-wise Revenue Performance")
-        city_revenue = st.session_state.transactions.groupby(['customer_city', 'customer_state']).agg({
-            'final_amount_inr': 'sum',
-            'customer_id': 'nunique'
-        }).reset_index()
-        city_revenue.columns = ['city', 'state', 'revenue', 'customers']
-        
-        top_cities = city_revenue.nlargest(20, 'revenue')
-        fig = px.bar(top_cities, x='city', y='revenue', color='state',
-                    title='Top 20 Cities by Revenue')
-        fig.update_yaxes(tickprefix='₹')
-        st.plotly_chart(fig, use_container_width=True)
+        prime_analysis.columns = ['is_prime_member', 'unique_customers', 'total_revenue', 'total_orders', 'avg_rating', 'avg_discount']
         
-        # FIXED: Customer Tier Analysis
-        st.subheader("👑 Customer Tier Analysis")
+        # Filter out unknown values
+        prime_analysis = prime_analysis[prime_analysis['is_prime_member'].isin(['Yes', 'No'])]
         
-        # Check if customer_tier column exists and has data
-        if 'customer_tier' in st.session_state.transactions.columns:
-            tier_performance = st.session_state.transactions.groupby('customer_tier').agg({
-                'final_amount_inr': 'sum',
-                'customer_id': 'nunique',
-                'transaction_id': 'count',
-                'customer_rating': 'mean',
-                'discount_percent': 'mean'
-            }).reset_index()
+        if not prime_analysis.empty:
+            # Key Metrics
+            col1, col2, col3, col4 = st.columns(4)
             
-            tier_performance.columns = ['customer_tier', 'total_revenue', 'unique_customers', 'total_orders', 'avg_rating', 'avg_discount']
+            prime_customers = prime_analysis[prime_analysis['is_prime_member'] == 'Yes']['unique_customers'].iloc[0] if 'Yes' in prime_analysis['is_prime_member'].values else 0
+            non_prime_customers = prime_analysis[prime_analysis['is_prime_member'] == 'No']['unique_customers'].iloc[0] if 'No' in prime_analysis['is_prime_member'].values else 0
+            prime_revenue = prime_analysis[prime_analysis['is_prime_member'] == 'Yes']['total_revenue'].iloc[0] if 'Yes' in prime_analysis['is_prime_member'].values else 0
+            non_prime_revenue = prime_analysis[prime_analysis['is_prime_member'] == 'No']['total_revenue'].iloc[0] if 'No' in prime_analysis['is_prime_member'].values else 0
             
-            # Remove any empty or null tiers
-            tier_performance = tier_performance[tier_performance['customer_tier'].notna() & (tier_performance['customer_tier'] != '')]
+            with col1:
+                st.metric("Prime Members", f"{prime_customers:,}")
+            with col2:
+                st.metric("Non-Prime Members", f"{non_prime_customers:,}")
+            with col3:
+                prime_aov = prime_analysis[prime_analysis['is_prime_member'] == 'Yes']['total_revenue'].iloc[0] / prime_analysis[prime_analysis['is_prime_member'] == 'Yes']['total_orders'].iloc[0] if 'Yes' in prime_analysis['is_prime_member'].values else 0
+                st.metric("Prime AOV", f"₹{prime_aov:.0f}")
+            with col4:
+                non_prime_aov = prime_analysis[prime_analysis['is_prime_member'] == 'No']['total_revenue'].iloc[0] / prime_analysis[prime_analysis['is_prime_member'] == 'No']['total_orders'].iloc[0] if 'No' in prime_analysis['is_prime_member'].values else 0
+                st.metric("Non-Prime AOV", f"₹{non_prime_aov:.0f}")
             
-            if not tier_performance.empty:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Revenue by tier
-                    fig = px.pie(tier_performance, values='total_revenue', names='customer_tier',
-                                title='Revenue Distribution by Customer Tier',
-                                hover_data=['unique_customers'])
-                    fig.update_traces(
-                        textinfo='percent+label',
-                        hovertemplate='<b>%{label}</b><br>Revenue: ₹%{value:,.0f}<br>Customers: %{customdata[0]:,}'
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Customer distribution by tier
-                    fig = px.bar(tier_performance, x='customer_tier', y='unique_customers',
-                                title='Customer Distribution by Tier',
-                                color='total_revenue',
-                                color_continuous_scale='Viridis')
-                    fig.update_layout(xaxis_title='Customer Tier', yaxis_title='Number of Customers')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                # Tier Performance Metrics
-                st.subheader("📊 Tier Performance Metrics")
-                
-                # Calculate additional metrics
-                tier_performance['revenue_per_customer'] = tier_performance['total_revenue'] / tier_performance['unique_customers']
-                tier_performance['orders_per_customer'] = tier_performance['total_orders'] / tier_performance['unique_customers']
-                tier_performance['avg_order_value'] = tier_performance['total_revenue'] / tier_performance['total_orders']
-                
-                # Display performance table
-                display_tier_table = tier_performance[[
-                    'customer_tier', 'unique_customers', 'total_orders', 'total_revenue',
-                    'revenue_per_customer', 'orders_per_customer', 'avg_order_value', 'avg_rating'
-                ]].copy()
-                
-                display_tier_table = display_tier_table.round({
-                    'revenue_per_customer': 2,
-                    'orders_per_customer': 2,
-                    'avg_order_value': 2,
-                    'avg_rating': 2
-                })
-                
-                st.dataframe(
-                    display_tier_table.style.format({
-                        'total_revenue': '₹{:,.2f}',
-                        'revenue_per_customer': '₹{:,.2f}',
-                        'avg_order_value': '₹{:,.2f}',
-                        'avg_rating': '{:.2f} ⭐'
-                    }),
-                    use_container_width=True
-                )
-            else:
-                st.warning("No customer tier data available for analysis.")
-        else:
-            st.warning("Customer tier data not available in the dataset.")
-        
-        # Market Penetration Opportunities
-        st.subheader("🎯 Market Penetration Opportunities")
-        
-        # Identify states with high revenue per customer (mature markets)
-        state_revenue['revenue_per_customer'] = state_revenue['revenue'] / state_revenue['customers']
-        mature_markets = state_revenue.nlargest(5, 'revenue_per_customer')
-        growth_markets = state_revenue.nsmallest(5, 'revenue_per_customer')
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write("🏆 Mature Markets (High Revenue/Customer)")
-            mature_display = mature_markets[['state', 'revenue_per_customer', 'customers']].round(2)
-            mature_display['revenue_per_customer'] = mature_display['revenue_per_customer'].apply(lambda x: f'₹{x:,.0f}')
-            st.dataframe(mature_display, use_container_width=True)
-        with col2:
-            st.write("🚀 Growth Opportunities (Low Revenue/Customer)")
-            growth_display = growth_markets[['state', 'revenue_per_customer', 'customers']].round(2)
-            growth_display['revenue_per_customer'] = growth_display['revenue_per_customer'].apply(lambda x: f'₹{x:,.0f}')
-            st.dataframe(growth_display, use_container_width=True)
-
-    # Q9: Festival Sales Analytics Dashboard - FIXED
-    elif dashboard_id == "Q9":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🎪 Q9: Festival Sales Analytics Dashboard")
-        st.markdown("Festival period performance, campaign effectiveness, and promotional impact")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Festival Performance Overview
-        st.subheader("📊 Festival Performance Overview")
-        festival_data = st.session_state.transactions[st.session_state.transactions['is_festival_sale'] == 'Yes']
-        
-        if not festival_data.empty:
-            festival_performance = festival_data.groupby('festival_name').agg({
-                'final_amount_inr': 'sum',
-                'transaction_id': 'count',
-                'customer_id': 'nunique',
-                'discount_percent': 'mean'
-            }).reset_index()
-            festival_performance.columns = ['festival', 'revenue', 'orders', 'customers', 'avg_discount']
+            # Prime vs Non-Prime Comparison
+            st.subheader("⚖️ Prime vs Non-Prime Comparison")
             
             col1, col2 = st.columns(2)
+            
             with col1:
-                fig = px.bar(festival_performance, x='festival', y='revenue',
-                            title='Revenue by Festival', color='revenue')
-                fig.update_yaxes(tickprefix='₹')
+                # Customer distribution
+                fig = px.pie(prime_analysis, values='unique_customers', names='is_prime_member',
+                            title='Customer Distribution: Prime vs Non-Prime')
                 st.plotly_chart(fig, use_container_width=True)
+            
             with col2:
-                fig = px.bar(festival_performance, x='festival', y='orders',
-                            title='Orders by Festival', color='orders')
+                # Revenue comparison
+                fig = px.bar(prime_analysis, x='is_prime_member', y='total_revenue',
+                            title='Total Revenue: Prime vs Non-Prime',
+                            color='is_prime_member')
+                fig.update_yaxes(tickprefix='₹')
                 st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No festival data available in the current sample.")
-        
-        # Festival vs Non-Festival Comparison
-        st.subheader("⚖️ Festival vs Regular Day Performance")
-        
-        # Calculate daily averages
-        daily_performance = st.session_state.transactions.groupby('order_date').agg({
-            'final_amount_inr': 'sum',
-            'transaction_id': 'count',
-            'is_festival_sale': 'first'
-        }).reset_index()
-        
-        if 'is_festival_sale' in daily_performance.columns:
-            festival_avg = daily_performance[daily_performance['is_festival_sale'] == 'Yes']['final_amount_inr'].mean()
-            regular_avg = daily_performance[daily_performance['is_festival_sale'] == 'No']['final_amount_inr'].mean()
             
-            comparison_data = pd.DataFrame({
-                'Period': ['Festival Days', 'Regular Days'],
-                'Average Daily Revenue': [festival_avg, regular_avg],
-                'Revenue Multiplier': [festival_avg/regular_avg, 1]
-            })
+            # Prime Member Behavior Analysis
+            st.subheader("📈 Prime Member Behavior Analysis")
+            
+            # Category preferences by membership type
+            prime_categories = st.session_state.transactions.groupby(['is_prime_member', 'category']).agg({
+                'final_amount_inr': 'sum',
+                'transaction_id': 'count'
+            }).reset_index()
+            
+            prime_categories = prime_categories[prime_categories['is_prime_member'].isin(['Yes', 'No'])]
+            
+            # Top categories for Prime members
+            prime_top_cats = prime_categories[prime_categories['is_prime_member'] == 'Yes'].nlargest(8, 'final_amount_inr')
+            non_prime_top_cats = prime_categories[prime_categories['is_prime_member'] == 'No'].nlargest(8, 'final_amount_inr')
             
             col1, col2 = st.columns(2)
+            
             with col1:
-                fig = px.bar(comparison_data, x='Period', y='Average Daily Revenue',
-                            title='Average Daily Revenue: Festival vs Regular')
+                fig = px.bar(prime_top_cats, x='category', y='final_amount_inr',
+                            title='Top Categories - Prime Members',
+                            color='final_amount_inr')
                 fig.update_yaxes(tickprefix='₹')
                 st.plotly_chart(fig, use_container_width=True)
+            
             with col2:
-                st.metric("Festival Revenue Multiplier", f"{festival_avg/regular_avg:.1f}x")
-                st.metric("Revenue Increase during Festivals", f"{(festival_avg-regular_avg)/regular_avg*100:.1f}%")
-        
-        # Campaign Effectiveness
-        st.subheader("🎯 Campaign Effectiveness Analysis")
-        
-        if not festival_data.empty:
-            discount_impact = festival_data.groupby('discount_percent').agg({
-                'final_amount_inr': 'sum',
-                'transaction_id': 'count'
-            }).reset_index()
+                fig = px.bar(non_prime_top_cats, x='category', y='final_amount_inr',
+                            title='Top Categories - Non-Prime Members',
+                            color='final_amount_inr')
+                fig.update_yaxes(tickprefix='₹')
+                st.plotly_chart(fig, use_container_width=True)
             
-            fig = px.scatter(discount_impact, x='discount_percent', y='final_amount_inr',
-                           size='transaction_id', title='Discount Effectiveness during Festivals',
-                           labels={'discount_percent': 'Discount %', 'final_amount_inr': 'Total Revenue'})
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Seasonal Revenue Optimization Insights
-        st.subheader("💡 Seasonal Optimization Insights")
-        
-        insights = [
-            "🎯 **Diwali Season**: Generates 3.2x higher revenue than average days",
-            "📱 **Electronics Boost**: Mobile & Electronics see 4.5x growth during festival sales",
-            "👥 **Customer Acquisition**: New customer acquisition increases by 185% during Prime Day",
-            "💰 **Optimal Discounts**: 25-35% discount range for maximum revenue impact",
-            "🚚 **Delivery Uptake**: Premium delivery options see 220% uptake during festivals",
-            "🛍️ **Category Strategy**: Fashion and Home categories perform best with bundle offers"
-        ]
-        
-        for insight in insights:
-            st.success(insight)
+            # Retention Analysis
+            st.subheader("💎 Prime Membership Value Analysis")
+            
+            # Calculate retention metrics
+            prime_customers_data = st.session_state.customers[st.session_state.customers['is_prime_member'] == 'Yes']
+            non_prime_customers_data = st.session_state.customers[st.session_state.customers['is_prime_member'] == 'No']
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                if not prime_customers_data.empty:
+                    prime_retention = prime_customers_data['total_orders'].mean()
+                    st.metric("Avg Orders (Prime)", f"{prime_retention:.1f}")
+            
+            with col2:
+                if not non_prime_customers_data.empty:
+                    non_prime_retention = non_prime_customers_data['total_orders'].mean()
+                    st.metric("Avg Orders (Non-Prime)", f"{non_prime_retention:.1f}")
+            
+            with col3:
+                if not prime_customers_data.empty:
+                    prime_lifetime = prime_customers_data['customer_lifetime_days'].mean()
+                    st.metric("Avg Lifetime (Prime)", f"{prime_lifetime:.0f} days")
+            
+            with col4:
+                if not non_prime_customers_data.empty:
+                    non_prime_lifetime = non_prime_customers_data['customer_lifetime_days'].mean()
+                    st.metric("Avg Lifetime (Non-Prime)", f"{non_prime_lifetime:.0f} days")
+            
+            # Prime-specific Business Insights
+            st.subheader("🎯 Prime-specific Business Insights")
+            
+            insights = [
+                f"💰 **Revenue Impact**: Prime members contribute {prime_revenue/(prime_revenue+non_prime_revenue)*100:.1f}% of total revenue",
+                f"🛒 **Purchase Frequency**: Prime members order {prime_retention/non_prime_retention:.1f}x more frequently",
+                f"⭐ **Customer Satisfaction**: Prime members rate {prime_analysis[prime_analysis['is_prime_member'] == 'Yes']['avg_rating'].iloc[0]:.1f} vs Non-Prime {prime_analysis[prime_analysis['is_prime_member'] == 'No']['avg_rating'].iloc[0]:.1f}",
+                f"📦 **Category Preference**: Prime members favor Electronics and Fashion categories",
+                f"🎯 **Growth Opportunity**: {non_prime_customers/(prime_customers+non_prime_customers)*100:.1f}% of customers are non-Prime conversion targets"
+            ]
+            
+            for insight in insights:
+                st.info(insight)
+        else:
+            st.warning("No Prime membership data available for analysis.")
+    else:
+        st.warning("Prime membership data not available in the dataset.")
 
-    # Q10: Price Optimization Dashboard - FIXED
-    elif dashboard_id == "Q10":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("💰 Q10: Price Optimization Dashboard")
-        st.markdown("Price elasticity, discount effectiveness, and competitive pricing analysis")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Price Elasticity Analysis
-        st.subheader("📊 Price Elasticity Analysis")
-        
-        # Analyze relationship between price and quantity sold
-        price_demand_data = st.session_state.transactions.groupby(['category', 'original_price_inr']).agg({
-            'quantity': 'sum',
-            'final_amount_inr': 'sum',
-            'discount_percent': 'mean',
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        # Filter out extreme outliers for better visualization
-        price_demand_clean = price_demand_data[
-            (price_demand_data['original_price_inr'] > 0) & 
-            (price_demand_data['original_price_inr'] < price_demand_data['original_price_inr'].quantile(0.95))
-        ]
-        
-        fig = px.scatter(price_demand_clean, x='original_price_inr', y='quantity',
-                        size='final_amount_inr', color='category',
-                        title='Price vs Demand Relationship',
-                        hover_data=['discount_percent', 'final_amount_inr'],
-                        labels={
-                            'original_price_inr': 'Original Price (₹)',
-                            'quantity': 'Total Quantity Sold',
-                            'final_amount_inr': 'Total Revenue'
-                        })
+# Q14: Customer Retention Dashboard - FIXED VERSION
+def render_q14():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("💎 Q14: Customer Retention Dashboard")
+    st.markdown("Cohort analysis, churn prediction, retention strategies effectiveness, and customer lifecycle management")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Cohort Analysis - FIXED
+    st.subheader("📊 Customer Cohort Analysis")
+    
+    # Create cohort analysis with proper date handling
+    cohort_data = st.session_state.customers.copy()
+    
+    # Ensure date columns are properly formatted
+    cohort_data['first_order_date'] = pd.to_datetime(cohort_data['first_order_date'], errors='coerce')
+    
+    # Remove rows with invalid dates
+    cohort_data = cohort_data[cohort_data['first_order_date'].notna()]
+    
+    if len(cohort_data) == 0:
+        st.warning("No valid customer data available for cohort analysis.")
+        return
+    
+    cohort_data['acquisition_year'] = cohort_data['first_order_date'].dt.year
+    
+    # Cohort performance by acquisition year
+    yearly_cohorts = cohort_data.groupby('acquisition_year').agg({
+        'customer_id': 'count',
+        'total_spent': 'mean',
+        'total_orders': 'mean',
+        'customer_lifetime_days': 'mean'
+    }).reset_index()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(yearly_cohorts, x='acquisition_year', y='customer_id',
+                    title='Customer Acquisition by Year',
+                    color='customer_id')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.line(yearly_cohorts, x='acquisition_year', y='total_spent',
+                    title='Average Lifetime Value by Cohort',
+                    markers=True)
         fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
+    
+    # Retention Curve Analysis - FIXED VERSION
+    st.subheader("📈 Customer Retention Analysis")
+    
+    try:
+        # Use transactions data for retention analysis
+        retention_data = st.session_state.transactions.copy()
+        retention_data['order_date'] = pd.to_datetime(retention_data['order_date'], errors='coerce')
         
-        # Discount Effectiveness
-        st.subheader("🎯 Discount Effectiveness Analysis")
-        
-        # Create discount ranges for better analysis
-        discount_ranges = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
-        discount_labels = ['0-10%', '10-20%', '20-30%', '30-40%', '40-50%', '50-60%', '60-70%', '70-80%', '80-90%', '90-100%']
-        
-        discount_effectiveness = st.session_state.transactions.copy()
-        discount_effectiveness['discount_range'] = pd.cut(
-            discount_effectiveness['discount_percent'], 
-            bins=discount_ranges, 
-            labels=discount_labels,
-            include_lowest=True
-        )
-        
-        discount_analysis = discount_effectiveness.groupby('discount_range').agg({
-            'quantity': 'sum',
-            'final_amount_inr': 'sum',
-            'transaction_id': 'count',
-            'customer_rating': 'mean'
-        }).reset_index()
-        
-        discount_analysis['avg_revenue_per_order'] = discount_analysis['final_amount_inr'] / discount_analysis['transaction_id']
-        discount_analysis['conversion_rate'] = (discount_analysis['transaction_id'] / len(discount_effectiveness)) * 100
+        # Remove rows with invalid dates
+        retention_data = retention_data[retention_data['order_date'].notna()]
+        retention_data = retention_data[retention_data['customer_id'].notna()]
         
-        col1, col2 = st.columns(2)
-        with col1:
-            fig = px.bar(discount_analysis, x='discount_range', y='quantity',
-                        title='Sales Volume by Discount Range',
-                        color='quantity',
-                        color_continuous_scale='Blues')
-            fig.update_layout(xaxis_title='Discount Range', yaxis_title='Total Quantity Sold')
-            st.plotly_chart(fig, use_container_width=True)
+        if len(retention_data) == 0:
+            st.warning("No valid transaction data available for retention analysis.")
+        else:
+            # Get first purchase date for each customer
+            first_purchase = retention_data.groupby('customer_id')['order_date'].min().reset_index()
+            first_purchase.columns = ['customer_id', 'first_purchase_date']
             
-        with col2:
-            fig = px.bar(discount_analysis, x='discount_range', y='final_amount_inr',
-                        title='Total Revenue by Discount Range',
-                        color='final_amount_inr',
-                        color_continuous_scale='Greens')
-            fig.update_layout(xaxis_title='Discount Range', yaxis_title='Total Revenue (₹)')
-            fig.update_yaxes(tickprefix='₹')
+            # Merge cohort information
+            retention_with_cohort = retention_data.merge(first_purchase, on='customer_id')
+            
+            # Calculate months since first purchase - FIXED METHOD
+            retention_with_cohort['months_since_first_purchase'] = (
+                (retention_with_cohort['order_date'].dt.year - retention_with_cohort['first_purchase_date'].dt.year) * 12 +
+                (retention_with_cohort['order_date'].dt.month - retention_with_cohort['first_purchase_date'].dt.month)
+            )
+            
+            # Create cohort groups by acquisition month
+            retention_with_cohort['cohort_month'] = retention_with_cohort['first_purchase_date'].dt.to_period('M')
+            
+            # Create simplified retention matrix
+            retention_matrix = retention_with_cohort.groupby(['cohort_month', 'months_since_first_purchase']).agg({
+                'customer_id': 'nunique'
+            }).reset_index()
+            
+            # Pivot to create retention matrix
+            retention_pivot = retention_matrix.pivot_table(
+                index='cohort_month',
+                columns='months_since_first_purchase',
+                values='customer_id',
+                aggfunc='sum'
+            ).fillna(0)
+            
+            # Calculate retention rates
+            cohort_sizes = retention_pivot.iloc[:, 0]  # Month 0 (first month)
+            retention_rates = retention_pivot.divide(cohort_sizes, axis=0) * 100
+            
+            # Plot retention heatmap
+            fig = px.imshow(retention_rates, 
+                        title='Customer Retention Rates by Cohort',
+                        color_continuous_scale='Blues',
+                        aspect='auto',
+                        labels=dict(x="Months Since First Purchase", y="Cohort Month", color="Retention Rate (%)"))
             st.plotly_chart(fig, use_container_width=True)
+            
+    except Exception as e:
+        st.error(f"Error in retention analysis: {str(e)}")
+        st.info("Showing simplified retention analysis instead...")
         
-        # FIXED: Revenue Impact Analysis
-        st.subheader("📈 Revenue Impact Analysis")
-        
-        # Calculate key metrics by discount range
-        revenue_impact = discount_analysis.copy()
-        
-        # Calculate percentage of total revenue for each discount range
-        total_revenue_all = revenue_impact['final_amount_inr'].sum()
-        revenue_impact['revenue_share'] = (revenue_impact['final_amount_inr'] / total_revenue_all) * 100
-        revenue_impact['order_share'] = (revenue_impact['transaction_id'] / revenue_impact['transaction_id'].sum()) * 100
+        # Simplified retention analysis as fallback
+        simplified_retention = cohort_data.groupby('acquisition_year').agg({
+            'customer_lifetime_days': 'mean',
+            'total_orders': 'mean'
+        }).reset_index()
         
-        # Create comprehensive revenue impact visualization
         col1, col2 = st.columns(2)
-        
         with col1:
-            # Revenue share by discount range
-            fig = px.pie(revenue_impact, values='revenue_share', names='discount_range',
-                        title='Revenue Distribution by Discount Range',
-                        hover_data=['final_amount_inr'])
-            fig.update_traces(
-                textinfo='percent+label',
-                hovertemplate='<b>%{label}</b><br>Revenue Share: %{percent}<br>Total Revenue: ₹%{customdata[0]:,.0f}'
-            )
+            fig = px.line(simplified_retention, x='acquisition_year', y='customer_lifetime_days',
+                        title='Average Customer Lifetime by Cohort',
+                        markers=True)
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
-            # Efficiency analysis: Revenue per discount percentage
-            revenue_impact['revenue_per_discount_point'] = revenue_impact['final_amount_inr'] / revenue_impact['transaction_id']
-            
-            fig = px.scatter(revenue_impact, x='discount_range', y='avg_revenue_per_order',
-                            size='transaction_id', color='customer_rating',
-                            title='Revenue Efficiency by Discount Range',
-                            hover_data=['quantity', 'conversion_rate'],
-                            labels={
-                                'avg_revenue_per_order': 'Avg Revenue per Order (₹)',
-                                'customer_rating': 'Avg Customer Rating',
-                                'transaction_id': 'Number of Orders'
-                            })
-            fig.update_yaxes(tickprefix='₹')
+            fig = px.line(simplified_retention, x='acquisition_year', y='total_orders',
+                        title='Average Orders per Customer by Cohort',
+                        markers=True)
             st.plotly_chart(fig, use_container_width=True)
-        
-        # Detailed Revenue Impact Metrics
-        st.subheader("📊 Detailed Discount Performance Metrics")
-        
-        # Calculate additional business metrics
-        revenue_impact['profitability_score'] = (
-            (revenue_impact['avg_revenue_per_order'] * 0.4) +  # Revenue weight
-            (revenue_impact['customer_rating'] * 0.3) +        # Customer satisfaction weight
-            (revenue_impact['conversion_rate'] * 0.3)          # Conversion weight
-        )
-        
-        # Display performance metrics table
-        metrics_table = revenue_impact[[
-            'discount_range', 'transaction_id', 'final_amount_inr', 
-            'avg_revenue_per_order', 'customer_rating', 'conversion_rate', 'profitability_score'
-        ]].copy()
-        
-        metrics_table.columns = [
-            'Discount Range', 'Orders', 'Total Revenue', 
-            'Avg Revenue/Order', 'Avg Rating', 'Conversion Rate', 'Profitability Score'
+    
+    # Churn Analysis - FIXED
+    st.subheader("🚨 Churn Prediction & Analysis")
+    
+    # Define churn (90+ days since last order) with proper handling
+    churn_data = st.session_state.customers.copy()
+    
+    # Ensure numeric type for days_since_last_order
+    churn_data['days_since_last_order'] = pd.to_numeric(churn_data['days_since_last_order'], errors='coerce').fillna(365)
+    churn_data['is_churned'] = churn_data['days_since_last_order'] > 90
+    
+    # Churn statistics
+    churn_rate = churn_data['is_churned'].mean() * 100
+    active_customers = len(churn_data[~churn_data['is_churned']])
+    churned_customers = len(churn_data[churn_data['is_churned']])
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Overall Churn Rate", f"{churn_rate:.1f}%")
+    
+    with col2:
+        st.metric("Active Customers", f"{active_customers:,}")
+    
+    with col3:
+        st.metric("Churned Customers", f"{churned_customers:,}")
+    
+    # Churn factors analysis
+    st.subheader("🔍 Churn Risk Factors")
+    
+    # Analyze factors correlated with churn
+    churn_factors = churn_data.groupby('is_churned').agg({
+        'total_orders': 'mean',
+        'avg_order_value': 'mean',
+        'customer_lifetime_days': 'mean',
+        'avg_rating': 'mean'
+    }).reset_index()
+    
+    churn_factors['status'] = churn_factors['is_churned'].map({True: 'Churned', False: 'Active'})
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(churn_factors, x='status', y='total_orders',
+                    title='Average Orders: Active vs Churned')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.bar(churn_factors, x='status', y='avg_order_value',
+                    title='Average Order Value: Active vs Churned')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Customer Lifecycle Management - FIXED
+    st.subheader("🔄 Customer Lifecycle Management")
+    
+    # Segment customers by lifecycle stage with proper handling
+    lifecycle_data = st.session_state.customers.copy()
+    lifecycle_data['days_since_last_order'] = pd.to_numeric(lifecycle_data['days_since_last_order'], errors='coerce').fillna(365)
+    
+    def get_lifecycle_stage(row):
+        days = row['days_since_last_order']
+        if pd.isna(days):
+            return 'Unknown'
+        elif days <= 30:
+            return 'Active'
+        elif days <= 90:
+            return 'Warm'
+        elif days <= 180:
+            return 'Cooling'
+        else:
+            return 'Dormant'
+    
+    lifecycle_data['lifecycle_stage'] = lifecycle_data.apply(get_lifecycle_stage, axis=1)
+    
+    # Lifecycle stage distribution
+    lifecycle_counts = lifecycle_data['lifecycle_stage'].value_counts()
+    fig = px.pie(lifecycle_counts, values=lifecycle_counts.values, names=lifecycle_counts.index,
+                title='Customer Lifecycle Stage Distribution')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Retention Strategy Recommendations
+    st.subheader("💡 Retention Strategy Recommendations")
+    
+    strategies = {
+        'Active': [
+            "🎯 **Upsell Opportunities**: Recommend premium products and bundles",
+            "⭐ **Loyalty Rewards**: Implement points-based reward system",
+            "📱 **Engagement**: Push notifications for new arrivals and deals"
+        ],
+        'Warm': [
+            "📧 **Re-engagement Emails**: Personalized recommendations based on purchase history",
+            "💝 **Special Offers**: Limited-time discounts to encourage purchase",
+            "🔔 **Abandoned Cart Reminders**: Remind about saved items"
+        ],
+        'Cooling': [
+            "📞 **Win-back Campaigns**: Significant discounts for returning customers",
+            "❓ **Feedback Surveys**: Understand reasons for decreased engagement",
+            "🎪 **Event Invitations**: Exclusive webinars or product launches"
+        ],
+        'Dormant': [
+            "🔄 **Reactivation Programs**: Special welcome-back offers",
+            "📢 **Lookalike Campaigns**: Target similar new customers",
+            "💰 **Loyalty Recognition**: Acknowledge past loyalty with special benefits"
         ]
+    }
+    
+    for stage, tips in strategies.items():
+        stage_count = len(lifecycle_data[lifecycle_data['lifecycle_stage'] == stage])
+        if stage_count > 0:
+            with st.expander(f"{stage} Customers - {stage_count:,} users"):
+                for tip in tips:
+                    st.write(f"• {tip}")
+
+# Q15: Demographics & Behavior Dashboard
+def render_q15():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("👨‍👩‍👧‍👦 Q15: Demographics & Behavior Dashboard")
+    st.markdown("Age group preferences, spending patterns, geographic behaviors, and targeted marketing opportunities")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Age Group Analysis
+    st.subheader("📊 Age Group Demographics")
+    
+    # Check if age group data exists
+    if 'customer_age_group' in st.session_state.transactions.columns:
+        age_analysis = st.session_state.transactions.groupby('customer_age_group').agg({
+            'customer_id': 'nunique',
+            'final_amount_inr': 'sum',
+            'transaction_id': 'count',
+            'customer_rating': 'mean'
+        }).reset_index()
         
-        # Format the table
-        metrics_table = metrics_table.round({
-            'Avg Revenue/Order': 2,
-            'Avg Rating': 2,
-            'Conversion Rate': 2,
-            'Profitability Score': 2
-        })
-        
-        st.dataframe(
-            metrics_table.style.format({
-                'Total Revenue': '₹{:,.0f}',
-                'Avg Revenue/Order': '₹{:,.2f}',
-                'Conversion Rate': '{:.2f}%',
-                'Profitability Score': '{:.2f}'
-            }),
-            use_container_width=True
-        )
-        
-        # Optimal Discount Range Identification
-        st.subheader("🎯 Optimal Discount Strategy Insights")
-        
-        # Find optimal ranges
-        max_revenue_range = revenue_impact.loc[revenue_impact['final_amount_inr'].idxmax(), 'discount_range']
-        max_efficiency_range = revenue_impact.loc[revenue_impact['avg_revenue_per_order'].idxmax(), 'discount_range']
-        max_profitability_range = revenue_impact.loc[revenue_impact['profitability_score'].idxmax(), 'discount_range']
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric(
-                "Highest Revenue Generator", 
-                f"{max_revenue_range} Discount",
-                f"₹{revenue_impact['final_amount_inr'].max():,.0f}"
-            )
-        
-        with col2:
-            st.metric(
-                "Most Efficient Range", 
-                f"{max_efficiency_range} Discount",
-                f"₹{revenue_impact['avg_revenue_per_order'].max():.0f}/order"
-            )
-        
-        with col3:
-            st.metric(
-                "Most Profitable Range", 
-                f"{max_profitability_range} Discount",
-                f"Score: {revenue_impact['profitability_score'].max():.2f}"
-            )
+        age_analysis.columns = ['age_group', 'unique_customers', 'total_revenue', 'total_orders', 'avg_rating']
         
-        # Competitive Pricing Analysis
-        st.subheader("⚔️ Competitive Pricing Analysis")
+        # Remove unknown/empty age groups
+        age_analysis = age_analysis[age_analysis['age_group'].notna() & (age_analysis['age_group'] != '')]
         
-        # Price distribution by category and brand
-        pricing_analysis = st.session_state.transactions.groupby(['category', 'brand']).agg({
-            'original_price_inr': ['min', 'max', 'mean', 'median'],
-            'discount_percent': 'mean',
+        if not age_analysis.empty:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Customer distribution by age
+                fig = px.pie(age_analysis, values='unique_customers', names='age_group',
+                            title='Customer Distribution by Age Group')
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                # Revenue by age group
+                fig = px.bar(age_analysis, x='age_group', y='total_revenue',
+                            title='Total Revenue by Age Group',
+                            color='total_revenue')
+                fig.update_yaxes(tickprefix='₹')
+                st.plotly_chart(fig, use_container_width=True)
+            
+            # Age Group Behavior Patterns
+            st.subheader("📈 Age Group Behavior Patterns")
+            
+            # Calculate additional metrics
+            age_analysis['avg_order_value'] = age_analysis['total_revenue'] / age_analysis['total_orders']
+            age_analysis['revenue_per_customer'] = age_analysis['total_revenue'] / age_analysis['unique_customers']
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                fig = px.bar(age_analysis, x='age_group', y='avg_order_value',
+                            title='Average Order Value by Age Group',
+                            color='avg_order_value')
+                fig.update_yaxes(tickprefix='₹')
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                fig = px.bar(age_analysis, x='age_group', y='avg_rating',
+                            title='Customer Satisfaction by Age Group',
+                            color='avg_rating')
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.warning("No age group data available for analysis.")
+    else:
+        st.warning("Age group data not available in the dataset.")
+    
+    # Geographic Behavior Analysis
+    st.subheader("🗺️ Geographic Behavior Patterns")
+    
+    # State-wise spending patterns
+    state_behavior = st.session_state.transactions.groupby('customer_state').agg({
+        'final_amount_inr': 'sum',
+        'customer_id': 'nunique',
+        'transaction_id': 'count',
+        'customer_rating': 'mean'
+    }).reset_index()
+    
+    state_behavior.columns = ['state', 'total_revenue', 'unique_customers', 'total_orders', 'avg_rating']
+    state_behavior['revenue_per_customer'] = state_behavior['total_revenue'] / state_behavior['unique_customers']
+    state_behavior['orders_per_customer'] = state_behavior['total_orders'] / state_behavior['unique_customers']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        top_states_revenue = state_behavior.nlargest(10, 'total_revenue')
+        fig = px.bar(top_states_revenue, x='state', y='total_revenue',
+                    title='Top 10 States by Revenue',
+                    color='total_revenue')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        top_states_engagement = state_behavior.nlargest(10, 'orders_per_customer')
+        fig = px.bar(top_states_engagement, x='state', y='orders_per_customer',
+                    title='Top 10 States by Engagement (Orders/Customer)',
+                    color='orders_per_customer')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Category Preferences by Demographics
+    st.subheader("🏪 Category Preferences Analysis")
+    
+    if 'customer_age_group' in st.session_state.transactions.columns:
+        # Category preferences by age group
+        age_category_pref = st.session_state.transactions.groupby(['customer_age_group', 'category']).agg({
+            'final_amount_inr': 'sum',
             'transaction_id': 'count'
-        }).round(2).reset_index()
+        }).reset_index()
         
-        pricing_analysis.columns = ['category', 'brand', 'min_price', 'max_price', 'avg_price', 'median_price', 'avg_discount', 'transactions']
+        age_category_pref = age_category_pref[age_category_pref['customer_age_group'].notna()]
         
-        # Filter for meaningful analysis (brands with sufficient transactions)
-        significant_brands = pricing_analysis[pricing_analysis['transactions'] > 100]
+        # Let user select age group for detailed view
+        age_groups = age_category_pref['customer_age_group'].unique()
+        selected_age_group = st.selectbox("Select Age Group for Category Analysis", age_groups)
         
-        if not significant_brands.empty:
-            category_select = st.selectbox("Select Category for Pricing Analysis", 
-                                         significant_brands['category'].unique())
-            
-            category_pricing = significant_brands[significant_brands['category'] == category_select]
-            
-            fig = px.box(category_pricing, y='avg_price', title=f'Price Distribution - {category_select}')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Insufficient data for competitive pricing analysis.")
-        
-        # Pricing Recommendations
-        st.subheader("💡 Pricing Strategy Recommendations")
-        
-        # Dynamic recommendations based on analysis
-        optimal_discount = revenue_impact.loc[revenue_impact['profitability_score'].idxmax(), 'discount_range']
-        
-        recommendations = [
-            f"🎯 **Optimal Discount Strategy**: Focus on {optimal_discount} range for maximum profitability",
-            "📱 **Electronics**: Implement flash sales with 25-35% discounts for high-volume products",
-            "👕 **Fashion**: Use tiered pricing with 15-25% discounts for seasonal collections",
-            "🏠 **Home & Kitchen**: Bundle pricing with 25-35% discounts performs best",
-            "📚 **Books**: Maintain competitive pricing with 10-20% strategic discounts",
-            f"🚀 **Growth Strategy**: {max_revenue_range} discounts drive highest overall revenue",
-            "💎 **Premium Products**: Minimal discounts (0-15%) maintain brand value perception"
-        ]
+        age_group_data = age_category_pref[age_category_pref['customer_age_group'] == selected_age_group].nlargest(8, 'final_amount_inr')
         
-        for rec in recommendations:
-            st.success(rec)
- 
-    # Q11: Customer Segmentation Dashboard - OPTIMIZED VERSION
-    elif dashboard_id == "Q11":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("👥 Q11: Customer Segmentation Dashboard")
-        st.markdown("RFM analysis, behavioral segmentation, lifetime value analysis with targeted marketing recommendations")
-        st.markdown('</div>', unsafe_allow_html=True)
+        fig = px.bar(age_group_data, x='category', y='final_amount_inr',
+                    title=f'Top Categories for {selected_age_group} Age Group',
+                    color='final_amount_inr')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Spending Patterns Analysis
+    st.subheader("💰 Spending Patterns Analysis")
+    
+    # Create spending segments
+    spending_data = st.session_state.customers.copy()
+    spending_data['spending_segment'] = pd.cut(spending_data['total_spent'],
+                                             bins=[0, 1000, 5000, 20000, float('inf')],
+                                             labels=['Budget', 'Value', 'Premium', 'Elite'])
+    
+    spending_segment_dist = spending_data['spending_segment'].value_counts()
+    fig = px.pie(spending_segment_dist, values=spending_segment_dist.values, names=spending_segment_dist.index,
+                title='Customer Spending Segment Distribution')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Targeted Marketing Opportunities
+    st.subheader("🎯 Targeted Marketing Opportunities")
+    
+    marketing_insights = [
+        "🎯 **Young Adults (18-25)**: High engagement with Electronics and Fashion - focus on social media campaigns",
+        "💼 **Professionals (26-40)**: Highest spending power - target with premium products and subscription services",
+        "🏠 **Family Focus (41-60)**: Prefer Home & Kitchen categories - bundle offers work best",
+        "👵 **Seniors (60+)**: Value convenience and customer service - emphasize easy returns and support",
+        "🗺️ **Regional Strategy**: Tier 2 cities show highest growth potential - expand localized marketing",
+        "📱 **Mobile-First**: Younger demographics prefer mobile shopping - optimize app experience",
+        "💰 **Value Segments**: Budget shoppers respond well to flash sales and limited-time offers"
+    ]
+    
+    for insight in marketing_insights:
+        st.success(insight)
+
+# Q16: Product Performance Dashboard
+def render_q16():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("📦 Q16: Product Performance Dashboard")
+    st.markdown("Product ranking by revenue, units sold, ratings, return rates with category-wise analysis")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Product Performance Overview
+    st.subheader("📊 Top Performing Products")
+    
+    # Product performance analysis
+    product_performance = st.session_state.transactions.groupby(['product_id', 'product_name', 'category']).agg({
+        'final_amount_inr': 'sum',
+        'quantity': 'sum',
+        'customer_rating': 'mean',
+        'transaction_id': 'count',
+        'return_status': lambda x: (x == 'Returned').sum()
+    }).reset_index()
+    
+    product_performance.columns = ['product_id', 'product_name', 'category', 'total_revenue', 'total_quantity', 'avg_rating', 'total_orders', 'return_count']
+    
+    # Calculate return rate
+    product_performance['return_rate'] = (product_performance['return_count'] / product_performance['total_orders']) * 100
+    product_performance['avg_order_value'] = product_performance['total_revenue'] / product_performance['total_orders']
+    
+    # Top Products by Revenue
+    st.subheader("💰 Top Products by Revenue")
+    top_revenue_products = product_performance.nlargest(10, 'total_revenue')
+    
+    fig = px.bar(top_revenue_products, x='product_name', y='total_revenue',
+                title='Top 10 Products by Revenue',
+                hover_data=['category', 'avg_rating', 'return_rate'],
+                color='total_revenue')
+    fig.update_layout(xaxis_title='Product Name', yaxis_title='Total Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Product Performance Metrics
+    st.subheader("📈 Product Performance Metrics")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        best_selling_product = top_revenue_products.iloc[0]['product_name']
+        st.metric("Best Selling Product", best_selling_product)
+    
+    with col2:
+        highest_rated = product_performance.nlargest(1, 'avg_rating')
+        st.metric("Highest Rated Product", f"{highest_rated['avg_rating'].iloc[0]:.1f} ⭐")
+    
+    with col3:
+        most_units_sold = product_performance.nlargest(1, 'total_quantity')
+        st.metric("Most Units Sold", f"{most_units_sold['total_quantity'].iloc[0]:,}")
+    
+    with col4:
+        lowest_return = product_performance[product_performance['total_orders'] > 10].nsmallest(1, 'return_rate')
+        st.metric("Lowest Return Rate", f"{lowest_return['return_rate'].iloc[0]:.1f}%")
+    
+    # Category-wise Product Analysis
+    st.subheader("🏪 Category-wise Product Performance")
+    
+    category_select = st.selectbox("Select Category for Detailed Analysis", 
+                                 product_performance['category'].unique())
+    
+    category_products = product_performance[product_performance['category'] == category_select]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Top products in category by revenue
+        top_category_products = category_products.nlargest(8, 'total_revenue')
+        fig = px.bar(top_category_products, x='product_name', y='total_revenue',
+                    title=f'Top Products in {category_select}',
+                    color='total_revenue')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Rating vs Return Rate scatter
+        fig = px.scatter(category_products, x='avg_rating', y='return_rate',
+                       size='total_revenue', color='total_quantity',
+                       title=f'Product Quality Analysis: {category_select}',
+                       hover_data=['product_name'],
+                       labels={
+                           'avg_rating': 'Average Rating',
+                           'return_rate': 'Return Rate (%)',
+                           'total_revenue': 'Total Revenue',
+                           'total_quantity': 'Units Sold'
+                       })
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Return Analysis
+    st.subheader("🔄 Product Return Analysis")
+    
+    return_analysis = product_performance[product_performance['total_orders'] > 10]  # Filter for meaningful analysis
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        high_return_products = return_analysis.nlargest(10, 'return_rate')
+        fig = px.bar(high_return_products, x='product_name', y='return_rate',
+                    title='Products with Highest Return Rates',
+                    color='return_rate',
+                    color_continuous_scale='Reds_r')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Return rate distribution
+        fig = px.histogram(return_analysis, x='return_rate', 
+                         title='Distribution of Product Return Rates',
+                         nbins=20)
+        fig.update_layout(xaxis_title='Return Rate (%)', yaxis_title='Number of Products')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Product Lifecycle Tracking
+    st.subheader("📅 Product Lifecycle Analysis")
+    
+    # Merge with product catalog for launch year
+    if hasattr(st.session_state, 'products'):
+        lifecycle_data = product_performance.merge(
+            st.session_state.products[['product_id', 'launch_year']], 
+            on='product_id', 
+            how='left'
+        )
         
-        # Add progress bar and status
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        # Analyze performance by product age
+        current_year = datetime.now().year
+        lifecycle_data['product_age'] = current_year - lifecycle_data['launch_year']
         
-        # RFM Analysis - OPTIMIZED
-        st.subheader("📊 RFM Customer Segmentation")
+        # Performance by product age
+        age_performance = lifecycle_data.groupby('product_age').agg({
+            'total_revenue': 'mean',
+            'avg_rating': 'mean',
+            'return_rate': 'mean'
+        }).reset_index()
         
-        status_text.text("Loading customer data...")
-        progress_bar.progress(10)
+        fig = px.line(age_performance, x='product_age', y='total_revenue',
+                     title='Average Revenue by Product Age',
+                     markers=True)
+        fig.update_layout(xaxis_title='Product Age (Years)', yaxis_title='Average Revenue (₹)')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+
+# Q17: Brand Analytics Dashboard
+def render_q17():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🏷️ Q17: Brand Analytics Dashboard")
+    st.markdown("Brand performance comparison, market share evolution, customer preferences, and competitive positioning")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Brand Performance Overview
+    st.subheader("📊 Top Performing Brands")
+    
+    # Brand performance analysis
+    brand_performance = st.session_state.transactions.groupby('brand').agg({
+        'final_amount_inr': 'sum',
+        'quantity': 'sum',
+        'transaction_id': 'count',
+        'customer_rating': 'mean',
+        'customer_id': 'nunique',
+        'discount_percent': 'mean'
+    }).reset_index()
+    
+    brand_performance.columns = ['brand', 'total_revenue', 'total_quantity', 'total_orders', 'avg_rating', 'unique_customers', 'avg_discount']
+    
+    # Calculate additional metrics
+    brand_performance['revenue_per_order'] = brand_performance['total_revenue'] / brand_performance['total_orders']
+    brand_performance['market_share'] = (brand_performance['total_revenue'] / brand_performance['total_revenue'].sum()) * 100
+    
+    # Top Brands by Revenue
+    st.subheader("💰 Top Brands by Revenue")
+    top_brands_revenue = brand_performance.nlargest(15, 'total_revenue')
+    
+    fig = px.bar(top_brands_revenue, x='brand', y='total_revenue',
+                title='Top 15 Brands by Revenue',
+                hover_data=['market_share', 'avg_rating'],
+                color='total_revenue')
+    fig.update_layout(xaxis_title='Brand', yaxis_title='Total Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Brand Market Share
+    st.subheader("📈 Brand Market Share Analysis")
+    
+    top_10_brands = brand_performance.nlargest(10, 'market_share')
+    others_market_share = 100 - top_10_brands['market_share'].sum()
+    
+    market_share_data = pd.concat([
+        top_10_brands[['brand', 'market_share']],
+        pd.DataFrame({'brand': ['Others'], 'market_share': [others_market_share]})
+    ])
+    
+    fig = px.pie(market_share_data, values='market_share', names='brand',
+                title='Market Share Distribution - Top 10 Brands vs Others')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Brand Performance Metrics
+    st.subheader("📊 Brand Performance Comparison")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        top_revenue_brand = top_brands_revenue.iloc[0]['brand']
+        st.metric("Highest Revenue Brand", top_revenue_brand)
+    
+    with col2:
+        highest_rated_brand = brand_performance.nlargest(1, 'avg_rating')
+        st.metric("Highest Rated Brand", f"{highest_rated_brand['avg_rating'].iloc[0]:.1f} ⭐")
+    
+    with col3:
+        most_popular_brand = brand_performance.nlargest(1, 'unique_customers')
+        st.metric("Most Popular Brand", f"{most_popular_brand['unique_customers'].iloc[0]:,} customers")
+    
+    with col4:
+        best_value_brand = brand_performance.nlargest(1, 'revenue_per_order')
+        st.metric("Highest Value/Order", f"₹{best_value_brand['revenue_per_order'].iloc[0]:.0f}")
+    
+    # Brand Evolution Over Time
+    st.subheader("📅 Brand Performance Trends")
+    
+    # Brand performance over years
+    brand_trends = st.session_state.transactions.groupby(['order_year', 'brand']).agg({
+        'final_amount_inr': 'sum',
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    # Get top 5 brands for trend analysis
+    top_5_brands = brand_performance.nlargest(5, 'total_revenue')['brand'].tolist()
+    brand_trends_filtered = brand_trends[brand_trends['brand'].isin(top_5_brands)]
+    
+    fig = px.line(brand_trends_filtered, x='order_year', y='final_amount_inr', color='brand',
+                 title='Revenue Trends for Top 5 Brands',
+                 markers=True)
+    fig.update_layout(xaxis_title='Year', yaxis_title='Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Competitive Positioning Analysis
+    st.subheader("⚔️ Brand Competitive Positioning")
+    
+    # Brand positioning: Price vs Rating vs Popularity
+    positioning_data = brand_performance[brand_performance['total_orders'] > 100]  # Meaningful brands
+    
+    fig = px.scatter(positioning_data, x='avg_rating', y='revenue_per_order',
+                    size='unique_customers', color='market_share',
+                    hover_name='brand',
+                    title='Brand Positioning: Quality vs Value vs Popularity',
+                    labels={
+                        'avg_rating': 'Customer Rating (Quality)',
+                        'revenue_per_order': 'Revenue per Order (Value)',
+                        'unique_customers': 'Customer Base Size',
+                        'market_share': 'Market Share (%)'
+                    })
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Category-wise Brand Performance
+    st.subheader("🏪 Category-wise Brand Leadership")
+    
+    # Brand performance by category
+    category_brand_perf = st.session_state.transactions.groupby(['category', 'brand']).agg({
+        'final_amount_inr': 'sum',
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    # Find leading brand in each category
+    category_leaders = category_brand_perf.loc[category_brand_perf.groupby('category')['final_amount_inr'].idxmax()]
+    
+    fig = px.bar(category_leaders, x='category', y='final_amount_inr', color='brand',
+                title='Leading Brands by Category',
+                hover_data=['transaction_id'])
+    fig.update_layout(xaxis_title='Category', yaxis_title='Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Brand Strategy Insights
+    st.subheader("💡 Brand Strategy Recommendations")
+    
+    brand_insights = [
+        "🎯 **Market Leadership**: Identify brands with consistent growth and high customer satisfaction",
+        "📈 **Emerging Brands**: Monitor new brands with rapid market share growth",
+        "💰 **Premium Positioning**: Focus on brands with high revenue per order and strong ratings",
+        "👥 **Mass Market**: Leverage popular brands with large customer base for volume growth",
+        "🔄 **Partnership Opportunities**: Identify underperforming brands with potential for collaboration",
+        "📊 **Category Gaps**: Spot categories where no single brand dominates for expansion opportunities"
+    ]
+    
+    for insight in brand_insights:
+        st.info(insight)
+
+# Q18: Inventory Optimization Dashboard
+def render_q18():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("📦 Q18: Inventory Optimization Dashboard")
+    st.markdown("Product demand patterns, seasonal trends, inventory turnover, and demand forecasting")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Demand Patterns Analysis
+    st.subheader("📊 Product Demand Patterns")
+    
+    # Analyze sales trends over time
+    demand_data = st.session_state.transactions.copy()
+    demand_data['order_date'] = pd.to_datetime(demand_data['order_date'])
+    demand_data['order_month'] = demand_data['order_date'].dt.to_period('M').astype(str)
+    
+    # Monthly sales trend
+    monthly_demand = demand_data.groupby('order_month').agg({
+        'final_amount_inr': 'sum',
+        'quantity': 'sum',
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.line(monthly_demand, x='order_month', y='quantity',
+                     title='Monthly Sales Volume Trend',
+                     markers=True)
+        fig.update_layout(xaxis_title='Month', yaxis_title='Units Sold')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.line(monthly_demand, x='order_month', y='final_amount_inr',
+                     title='Monthly Revenue Trend',
+                     markers=True)
+        fig.update_layout(xaxis_title='Month', yaxis_title='Revenue (₹)')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Seasonal Trends Analysis
+    st.subheader("🌞 Seasonal Demand Patterns")
+    
+    # Analyze seasonal patterns
+    seasonal_data = demand_data.copy()
+    seasonal_data['month'] = seasonal_data['order_date'].dt.month
+    seasonal_data['year'] = seasonal_data['order_date'].dt.year
+    
+    seasonal_pattern = seasonal_data.groupby('month').agg({
+        'quantity': 'mean',
+        'final_amount_inr': 'mean'
+    }).reset_index()
+    
+    fig = px.line(seasonal_pattern, x='month', y='quantity',
+                 title='Average Monthly Sales Pattern',
+                 markers=True)
+    fig.update_layout(xaxis_title='Month', yaxis_title='Average Units Sold')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Inventory Turnover Analysis
+    st.subheader("🔄 Inventory Turnover Analysis")
+    
+    # Calculate inventory turnover (simplified)
+    product_turnover = st.session_state.transactions.groupby(['product_id', 'product_name', 'category']).agg({
+        'quantity': 'sum',
+        'transaction_id': 'count',
+        'final_amount_inr': 'sum'
+    }).reset_index()
+    
+    product_turnover.columns = ['product_id', 'product_name', 'category', 'total_quantity', 'total_orders', 'total_revenue']
+    
+    # Assuming inventory data (simplified)
+    # In real scenario, this would come from inventory database
+    product_turnover['avg_inventory'] = product_turnover['total_quantity'] / 6  # Simplified assumption
+    product_turnover['turnover_ratio'] = product_turnover['total_quantity'] / product_turnover['avg_inventory']
+    
+    # High and low turnover products
+    high_turnover = product_turnover.nlargest(10, 'turnover_ratio')
+    low_turnover = product_turnover[product_turnover['total_orders'] > 10].nsmallest(10, 'turnover_ratio')
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(high_turnover, x='product_name', y='turnover_ratio',
+                    title='Top 10 High Turnover Products',
+                    color='turnover_ratio',
+                    hover_data=['category', 'total_quantity'])
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.bar(low_turnover, x='product_name', y='turnover_ratio',
+                    title='Top 10 Low Turnover Products',
+                    color='turnover_ratio',
+                    color_continuous_scale='Reds',
+                    hover_data=['category', 'total_quantity'])
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Demand Forecasting
+    st.subheader("🔮 Demand Forecasting")
+    
+    # Simple demand forecasting using moving averages
+    forecast_data = monthly_demand.copy()
+    forecast_data['order_month'] = pd.to_datetime(forecast_data['order_month'])
+    forecast_data = forecast_data.sort_values('order_month')
+    
+    # Calculate moving averages
+    forecast_data['ma_3month'] = forecast_data['quantity'].rolling(window=3).mean()
+    forecast_data['ma_6month'] = forecast_data['quantity'].rolling(window=6).mean()
+    
+    fig = px.line(forecast_data, x='order_month', y=['quantity', 'ma_3month', 'ma_6month'],
+                 title='Demand Forecasting with Moving Averages',
+                 labels={'value': 'Units Sold', 'variable': 'Metric'})
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Stock-out Risk Analysis
+    st.subheader("🚨 Stock-out Risk Analysis")
+    
+    # Identify products with high demand variability
+    product_variability = st.session_state.transactions.groupby(['product_id', 'product_name']).agg({
+        'quantity': ['sum', 'std', 'mean'],
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    product_variability.columns = ['product_id', 'product_name', 'total_quantity', 'demand_std', 'demand_mean', 'order_count']
+    
+    # Calculate coefficient of variation
+    product_variability['cv'] = (product_variability['demand_std'] / product_variability['demand_mean']).fillna(0)
+    product_variability['stock_out_risk'] = product_variability['cv'] * product_variability['total_quantity']
+    
+    high_risk_products = product_variability.nlargest(10, 'stock_out_risk')
+    
+    fig = px.bar(high_risk_products, x='product_name', y='stock_out_risk',
+                title='Products with Highest Stock-out Risk',
+                color='stock_out_risk',
+                color_continuous_scale='Reds',
+                hover_data=['total_quantity', 'cv'])
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Inventory Optimization Recommendations
+    st.subheader("💡 Inventory Optimization Strategies")
+    
+    strategies = [
+        "🎯 **Fast Movers**: Increase safety stock for high-turnover products with seasonal peaks",
+        "📦 **Slow Movers**: Reduce inventory levels for low-turnover items, implement just-in-time ordering",
+        "🔄 **Seasonal Planning**: Build inventory before festival seasons and major sales events",
+        "📊 **Demand Forecasting**: Use 3-month moving averages for stable products, 6-month for seasonal items",
+        "🚨 **Risk Management**: Monitor high-variability products closely, implement buffer stock",
+        "💰 **ABC Analysis**: Classify products by revenue contribution for prioritized inventory management",
+        "📱 **Automation**: Implement automated reordering for consistent high-demand products"
+    ]
+    
+    for strategy in strategies:
+        st.success(strategy)
+
+# Q19: Product Rating & Review Dashboard
+def render_q19():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("⭐ Q19: Product Rating & Review Dashboard")
+    st.markdown("Rating distributions, review sentiment, correlation with sales, and product quality insights")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Rating Distribution Analysis
+    st.subheader("📊 Rating Distribution Analysis")
+    
+    # Product rating distribution
+    rating_data = st.session_state.transactions.copy()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Product rating distribution
+        product_rating_dist = rating_data['product_rating'].value_counts().sort_index()
+        fig = px.bar(product_rating_dist, x=product_rating_dist.index, y=product_rating_dist.values,
+                    title='Product Rating Distribution',
+                    labels={'x': 'Rating', 'y': 'Number of Ratings'})
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Customer rating distribution
+        customer_rating_dist = rating_data['customer_rating'].value_counts().sort_index()
+        fig = px.bar(customer_rating_dist, x=customer_rating_dist.index, y=customer_rating_dist.values,
+                    title='Customer Rating Distribution',
+                    labels={'x': 'Rating', 'y': 'Number of Ratings'})
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Rating vs Sales Correlation
+    st.subheader("📈 Rating Impact on Sales Performance")
+    
+    # Analyze correlation between ratings and sales
+    rating_sales_corr = rating_data.groupby('product_rating').agg({
+        'final_amount_inr': 'sum',
+        'quantity': 'sum',
+        'transaction_id': 'count',
+        'return_status': lambda x: (x == 'Returned').sum()
+    }).reset_index()
+    
+    rating_sales_corr.columns = ['product_rating', 'total_revenue', 'total_quantity', 'total_orders', 'return_count']
+    rating_sales_corr['return_rate'] = (rating_sales_corr['return_count'] / rating_sales_corr['total_orders']) * 100
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.scatter(rating_sales_corr, x='product_rating', y='total_revenue',
+                       size='total_orders', title='Rating vs Total Revenue',
+                       labels={'product_rating': 'Product Rating', 'total_revenue': 'Total Revenue'})
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.scatter(rating_sales_corr, x='product_rating', y='return_rate',
+                       size='total_orders', title='Rating vs Return Rate',
+                       labels={'product_rating': 'Product Rating', 'return_rate': 'Return Rate (%)'})
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Category-wise Rating Analysis
+    st.subheader("🏪 Category-wise Rating Performance")
+    
+    category_ratings = rating_data.groupby('category').agg({
+        'product_rating': 'mean',
+        'customer_rating': 'mean',
+        'final_amount_inr': 'sum',
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    category_ratings.columns = ['category', 'avg_product_rating', 'avg_customer_rating', 'total_revenue', 'total_orders']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(category_ratings.nlargest(10, 'avg_product_rating'), 
+                    x='category', y='avg_product_rating',
+                    title='Top 10 Categories by Product Rating',
+                    color='avg_product_rating')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.bar(category_ratings.nlargest(10, 'avg_customer_rating'), 
+                    x='category', y='avg_customer_rating',
+                    title='Top 10 Categories by Customer Rating',
+                    color='avg_customer_rating')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Price vs Rating Analysis
+    st.subheader("💰 Price vs Rating Relationship")
+    
+    price_rating_data = rating_data.groupby(['category', 'original_price_inr']).agg({
+        'product_rating': 'mean',
+        'customer_rating': 'mean',
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    price_rating_data = price_rating_data[price_rating_data['transaction_id'] > 10]  # Meaningful samples
+    
+    fig = px.scatter(price_rating_data, x='original_price_inr', y='product_rating',
+                    size='transaction_id', color='category',
+                    title='Price vs Product Rating Relationship',
+                    labels={
+                        'original_price_inr': 'Price (₹)',
+                        'product_rating': 'Average Product Rating'
+                    })
+    fig.update_xaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Review Sentiment Insights
+    st.subheader("😊 Review Sentiment & Quality Insights")
+    
+    # Calculate rating metrics
+    rating_metrics = {
+        'Average Product Rating': f"{rating_data['product_rating'].mean():.2f} ⭐",
+        'Average Customer Rating': f"{rating_data['customer_rating'].mean():.2f} ⭐",
+        'Rating Correlation': f"{rating_data['product_rating'].corr(rating_data['customer_rating']):.3f}",
+        'High-Rated Products (>4.5)': f"{(rating_data['product_rating'] > 4.5).sum():,}",
+        'Low-Rated Products (<3.0)': f"{(rating_data['product_rating'] < 3.0).sum():,}"
+    }
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    metrics_cols = [col1, col2, col3, col4, col5]
+    
+    for (metric, value), col in zip(rating_metrics.items(), metrics_cols):
+        with col:
+            st.metric(metric, value)
+    
+    # Product Quality Recommendations
+    st.subheader("💡 Product Quality & Improvement Insights")
+    
+    quality_insights = [
+        "🎯 **High Performers**: Products with ratings >4.5 have 3.2x higher sales conversion",
+        "⚠️ **Improvement Areas**: Products with ratings <3.0 show 45% higher return rates",
+        "💰 **Premium Perception**: Higher-priced products maintain better ratings with proper quality",
+        "🔄 **Feedback Loop**: Implement systematic review analysis for product improvement",
+        "⭐ **Rating Targets**: Aim for minimum 4.0 rating across all product categories",
+        "📊 **Quality Monitoring**: Track rating trends for early detection of quality issues",
+        "🎁 **Incentivize Reviews**: Encourage reviews for better product visibility and trust"
+    ]
+    
+    for insight in quality_insights:
+        st.info(insight)
+
+# Q20: New Product Launch Dashboard - FIXED
+def render_q20():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🚀 Q20: New Product Launch Dashboard")
+    st.markdown("Launch performance tracking, market acceptance, competitive analysis, and success metrics")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Check if required data is available
+    if not hasattr(st.session_state, 'products') or st.session_state.products.empty:
+        st.warning("⚠️ Product data not available for launch analysis")
+        return
+    
+    # New Product Launch Performance
+    st.subheader("📊 New Product Launch Overview")
+    
+    # Analyze product launches by year - FIXED: Handle missing launch_year
+    launch_analysis = st.session_state.products.copy()
+    
+    # Ensure launch_year exists and is valid
+    if 'launch_year' not in launch_analysis.columns:
+        st.warning("⚠️ Launch year data not available in products dataset")
+        return
+        
+    # Filter out invalid launch years
+    launch_analysis = launch_analysis[launch_analysis['launch_year'].notna()]
+    launch_analysis = launch_analysis[launch_analysis['launch_year'].between(2015, 2025)]
+    
+    if launch_analysis.empty:
+        st.warning("⚠️ No valid launch year data available")
+        return
+        
+    launch_analysis = launch_analysis.groupby('launch_year').agg({
+        'product_id': 'count',
+        'rating': 'mean'
+    }).reset_index()
+    
+    launch_analysis.columns = ['launch_year', 'products_launched', 'avg_rating']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(launch_analysis, x='launch_year', y='products_launched',
+                    title='New Product Launches by Year',
+                    color='products_launched')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.line(launch_analysis, x='launch_year', y='avg_rating',
+                     title='Average Rating of Launched Products by Year',
+                     markers=True)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Launch Success Metrics - FIXED: Better error handling
+    st.subheader("📈 Product Launch Success Metrics")
+    
+    try:
+        # Merge product data with sales data for performance analysis
+        product_performance = st.session_state.transactions.groupby('product_id').agg({
+            'final_amount_inr': 'sum',
+            'quantity': 'sum',
+            'transaction_id': 'count',
+            'customer_rating': 'mean'
+        }).reset_index()
         
-        # Use pre-calculated RFM data if available, otherwise calculate efficiently
-        try:
-            # Check if RFM data already exists in customers table
-            if all(col in st.session_state.customers.columns for col in ['recency_segment', 'spending_segment']):
-                st.info("✅ Using pre-calculated customer segments")
-                rfm_data = st.session_state.customers.copy()
+        # Ensure we have product data to merge
+        if hasattr(st.session_state, 'products'):
+            launch_performance = product_performance.merge(
+                st.session_state.products[['product_id', 'product_name', 'launch_year', 'category']],
+                on='product_id',
+                how='inner'  # Use inner join to only include products with launch data
+            )
+            
+            # Filter out products without launch year
+            launch_performance = launch_performance[launch_performance['launch_year'].notna()]
+            
+            if not launch_performance.empty:
+                # Calculate launch success metrics
+                launch_success = launch_performance.groupby('launch_year').agg({
+                    'final_amount_inr': 'sum',
+                    'quantity': 'sum',
+                    'transaction_id': 'count',
+                    'customer_rating': 'mean',
+                    'product_id': 'nunique'
+                }).reset_index()
                 
-                # Map existing segments to RFM
-                segment_mapping = {
-                    'Active (<30 days)': 'Champions',
-                    'Warm (30-90 days)': 'Loyal Customers', 
-                    'Inactive (>90 days)': 'At Risk'
-                }
-                rfm_data['segment'] = rfm_data['recency_segment'].map(segment_mapping).fillna('Potential Loyalists')
+                launch_success.columns = ['launch_year', 'total_revenue', 'total_quantity', 'total_orders', 'avg_rating', 'unique_products']
+                launch_success['revenue_per_product'] = launch_success['total_revenue'] / launch_success['unique_products']
                 
-            else:
-                # OPTIMIZED RFM Calculation
-                status_text.text("Calculating RFM segments...")
-                progress_bar.progress(30)
+                col1, col2, col3, col4 = st.columns(4)
                 
-                rfm_data = st.session_state.customers.copy()
+                with col1:
+                    best_launch_year = launch_success.nlargest(1, 'total_revenue')
+                    if not best_launch_year.empty:
+                        st.metric("Most Successful Launch Year", f"{best_launch_year['launch_year'].iloc[0]}")
                 
-                # Use efficient quantile calculation with error handling
-                def safe_quantile_cut(data, q, labels):
-                    try:
-                        # Remove NaN values and ensure sufficient data
-                        clean_data = data.dropna()
-                        if len(clean_data) < len(labels):
-                            # If not enough data points, use equal bins
-                            return pd.cut(data, bins=len(labels), labels=labels, duplicates='drop')
-                        return pd.qcut(clean_data, q=q, labels=labels, duplicates='drop')
-                    except:
-                        # Fallback to simple binning
-                        return pd.cut(data, bins=len(labels), labels=labels, duplicates='drop')
+                with col2:
+                    if not best_launch_year.empty:
+                        st.metric("Highest Revenue Year", f"₹{best_launch_year['total_revenue'].iloc[0]/1e6:.1f}M")
                 
-                # Recency Score (days since last order - lower is better)
-                status_text.text("Calculating recency scores...")
-                rfm_data['recency_score'] = safe_quantile_cut(
-                    rfm_data['days_since_last_order'], 
-                    q=5, 
-                    labels=[5, 4, 3, 2, 1]
-                )
+                with col3:
+                    highest_rated_launch = launch_success.nlargest(1, 'avg_rating')
+                    if not highest_rated_launch.empty:
+                        st.metric("Highest Rated Launch Year", f"{highest_rated_launch['avg_rating'].iloc[0]:.1f} ⭐")
                 
-                progress_bar.progress(50)
-                status_text.text("Calculating frequency scores...")
+                with col4:
+                    most_products_launch = launch_success.nlargest(1, 'unique_products')
+                    if not most_products_launch.empty:
+                        st.metric("Most Products Launched", f"{most_products_launch['unique_products'].iloc[0]}")
+            else:
+                st.info("📊 No product launch performance data available")
+        else:
+            st.warning("⚠️ Product catalog data not available")
+            
+    except Exception as e:
+        st.error(f"❌ Error calculating launch metrics: {str(e)}")
+    
+    # Market Acceptance Analysis - FIXED: Better date handling
+    st.subheader("🎯 Market Acceptance Analysis")
+    
+    try:
+        if hasattr(st.session_state, 'products') and hasattr(st.session_state, 'transactions'):
+            # Get first purchase date for each product
+            product_first_sale = st.session_state.transactions.groupby('product_id')['order_date'].min().reset_index()
+            product_first_sale.columns = ['product_id', 'first_sale_date']
+            
+            # Ensure dates are properly formatted
+            product_first_sale['first_sale_date'] = pd.to_datetime(product_first_sale['first_sale_date'], errors='coerce')
+            product_first_sale = product_first_sale.dropna(subset=['first_sale_date'])
+            
+            # Merge with product launch data
+            product_adoption = product_performance.merge(product_first_sale, on='product_id', how='inner')
+            
+            # Ensure we have launch year data
+            if 'launch_year' in st.session_state.products.columns:
+                product_adoption = product_adoption.merge(
+                    st.session_state.products[['product_id', 'launch_year']], 
+                    on='product_id', 
+                    how='inner'
+                )
                 
-                # Frequency Score (total orders - higher is better)
-                rfm_data['frequency_score'] = safe_quantile_cut(
-                    rfm_data['total_orders'], 
-                    q=5, 
-                    labels=[1, 2, 3, 4, 5]
+                # Filter valid data
+                product_adoption = product_adoption[product_adoption['launch_year'].notna()]
+                product_adoption['launch_date'] = pd.to_datetime(
+                    product_adoption['launch_year'].astype(int).astype(str) + '-01-01', 
+                    errors='coerce'
                 )
                 
-                progress_bar.progress(70)
-                status_text.text("Calculating monetary scores...")
+                product_adoption = product_adoption.dropna(subset=['launch_date', 'first_sale_date'])
                 
-                # Monetary Score (total spent - higher is better)
-                rfm_data['monetary_score'] = safe_quantile_cut(
-                    rfm_data['total_spent'], 
-                    q=5, 
-                    labels=[1, 2, 3, 4, 5]
-                )
+                # Calculate days to first sale
+                product_adoption['days_to_first_sale'] = (
+                    product_adoption['first_sale_date'] - product_adoption['launch_date']
+                ).dt.days
                 
-                # Convert scores to numeric safely
-                for col in ['recency_score', 'frequency_score', 'monetary_score']:
-                    rfm_data[col] = pd.to_numeric(rfm_data[col], errors='coerce').fillna(3)  # Default to middle value
+                # Filter reasonable values
+                product_adoption = product_adoption[
+                    (product_adoption['days_to_first_sale'] >= 0) & 
+                    (product_adoption['days_to_first_sale'] <= 365)
+                ]
                 
-                progress_bar.progress(85)
-                status_text.text("Creating customer segments...")
+                if not product_adoption.empty:
+                    # Adoption speed analysis
+                    adoption_speed = product_adoption.groupby('launch_year')['days_to_first_sale'].mean().reset_index()
+                    
+                    fig = px.bar(adoption_speed, x='launch_year', y='days_to_first_sale',
+                                title='Average Days to First Sale by Launch Year',
+                                color='days_to_first_sale',
+                                color_continuous_scale='RdYlGn_r')
+                    fig.update_layout(xaxis_title='Launch Year', yaxis_title='Average Days to First Sale')
+                    st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.info("📊 No adoption speed data available")
+            else:
+                st.warning("⚠️ Launch year data not available")
+        else:
+            st.warning("⚠️ Required data not available for market acceptance analysis")
+            
+    except Exception as e:
+        st.error(f"❌ Error in market acceptance analysis: {str(e)}")
+    
+    # Competitive Analysis for New Launches - FIXED: Better data validation
+    st.subheader("⚔️ Competitive Launch Analysis")
+    
+    try:
+        if hasattr(st.session_state, 'products'):
+            # Ensure we have the merged data
+            if 'launch_performance' in locals() and not launch_performance.empty:
+                category_launch_perf = launch_performance.groupby('category').agg({
+                    'final_amount_inr': 'sum',
+                    'quantity': 'sum',
+                    'customer_rating': 'mean',
+                    'product_id': 'nunique'
+                }).reset_index()
                 
-                # Calculate RFM score
-                rfm_data['rfm_score'] = (
-                    rfm_data['recency_score'] + 
-                    rfm_data['frequency_score'] + 
-                    rfm_data['monetary_score']
-                )
+                category_launch_perf.columns = ['category', 'total_revenue', 'total_quantity', 'avg_rating', 'products_launched']
+                category_launch_perf['success_rate'] = (category_launch_perf['total_revenue'] / category_launch_perf['products_launched'])
                 
-                # Create RFM segments with error handling
-                def get_rfm_segment(row):
-                    try:
-                        if pd.isna(row['rfm_score']):
-                            return 'Unknown'
-                        elif row['rfm_score'] >= 13:
-                            return 'Champions'
-                        elif row['rfm_score'] >= 10:
-                            return 'Loyal Customers'
-                        elif row['rfm_score'] >= 8:
-                            return 'Potential Loyalists'
-                        elif row['rfm_score'] >= 6:
-                            return 'At Risk'
-                        else:
-                            return 'Lost Customers'
-                    except:
-                        return 'Unknown'
+                col1, col2 = st.columns(2)
                 
-                rfm_data['segment'] = rfm_data.apply(get_rfm_segment, axis=1)
+                with col1:
+                    fig = px.bar(category_launch_perf.nlargest(10, 'total_revenue'), 
+                                x='category', y='total_revenue',
+                                title='Top Categories for New Product Revenue',
+                                color='total_revenue')
+                    fig.update_yaxes(tickprefix='₹')
+                    st.plotly_chart(fig, use_container_width=True)
                 
-        except Exception as e:
-            st.error(f"Error in RFM calculation: {e}")
-            # Fallback to simple segmentation
-            rfm_data = st.session_state.customers.copy()
-            rfm_data['segment'] = 'Loyal Customers'  # Default segment
-        
-        progress_bar.progress(100)
-        status_text.text("✅ RFM analysis completed!")
-        
-        # Clear progress indicators
-        progress_bar.empty()
-        status_text.empty()
-        
-        # RFM Segmentation Visualization - Only show if we have meaningful data
-        valid_segments = rfm_data[rfm_data['segment'] != 'Unknown']
-        
-        if len(valid_segments) > 0:
-            col1, col2 = st.columns(2)
+                with col2:
+                    fig = px.bar(category_launch_perf.nlargest(10, 'success_rate'), 
+                                x='category', y='success_rate',
+                                title='Most Successful Categories (Revenue per Product)',
+                                color='success_rate')
+                    fig.update_yaxes(tickprefix='₹')
+                    st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("📊 No category launch performance data available")
+        else:
+            st.warning("⚠️ Product data not available")
             
-            with col1:
-                # Segment distribution - with sampling for large datasets
-                if len(valid_segments) > 10000:
-                    sample_data = valid_segments.sample(n=10000, random_state=42)
-                    st.info(f"📊 Showing sample of 10,000 customers from {len(valid_segments):,} total")
-                else:
-                    sample_data = valid_segments
-                
-                segment_counts = sample_data['segment'].value_counts()
-                fig = px.pie(segment_counts, values=segment_counts.values, names=segment_counts.index,
-                            title='Customer RFM Segments Distribution',
-                            color_discrete_sequence=px.colors.qualitative.Set3)
-                st.plotly_chart(fig, use_container_width=True)
+    except Exception as e:
+        st.error(f"❌ Error in competitive analysis: {str(e)}")
+    
+    # Launch Success Factors - FIXED: Better error handling
+    st.subheader("🔍 Launch Success Factors Analysis")
+    
+    try:
+        if 'launch_performance' in locals() and not launch_performance.empty:
+            # Analyze what makes a successful launch
+            success_factors = launch_performance.copy()
+            success_factors['launch_success'] = success_factors['final_amount_inr'] > success_factors['final_amount_inr'].median()
             
-            with col2:
-                # RFM scatter plot with sampling
-                plot_sample = sample_data.sample(n=min(2000, len(sample_data)), random_state=42)
-                fig = px.scatter(plot_sample, x='total_orders', y='total_spent', 
-                            color='segment', size='avg_order_value',
-                            title='RFM Analysis: Frequency vs Monetary Value',
-                            hover_data=['customer_id', 'days_since_last_order'],
-                            labels={
-                                'total_orders': 'Frequency (Total Orders)',
-                                'total_spent': 'Monetary (Total Spent ₹)',
-                                'segment': 'RFM Segment'
-                            })
-                fig.update_yaxes(tickprefix='₹')
-                st.plotly_chart(fig, use_container_width=True)
+            success_comparison = success_factors.groupby('launch_success').agg({
+                'customer_rating': 'mean',
+                'quantity': 'mean',
+                'final_amount_inr': 'mean'
+            }).reset_index()
             
-            # Segment Insights - Optimized aggregation
-            st.subheader("📈 RFM Segment Insights")
+            success_comparison['status'] = success_comparison['launch_success'].map({True: 'Successful', False: 'Less Successful'})
             
-            # Use efficient aggregation
-            segment_stats = valid_segments.groupby('segment').agg({
-                'total_spent': ['mean', 'count'],
-                'total_orders': 'mean',
-                'days_since_last_order': 'mean',
-                'avg_order_value': 'mean'
-            }).round(2)
+            col1, col2, col3 = st.columns(3)
             
-            segment_stats.columns = ['avg_spending', 'customer_count', 'avg_orders', 'avg_recency_days', 'avg_order_value']
-            segment_stats = segment_stats.reset_index()
+            with col1:
+                if len(success_comparison) >= 2:
+                    rating_diff = (success_comparison[success_comparison['status'] == 'Successful']['customer_rating'].iloc[0] - 
+                                 success_comparison[success_comparison['status'] == 'Less Successful']['customer_rating'].iloc[0])
+                    st.metric("Rating Impact", f"+{rating_diff:.2f} ⭐")
             
-            st.dataframe(segment_stats.style.format({
-                'avg_spending': '₹{:,.2f}',
-                'avg_order_value': '₹{:,.2f}'
-            }), use_container_width=True)
-        
+            with col2:
+                if len(success_comparison) >= 2:
+                    quantity_diff = (success_comparison[success_comparison['status'] == 'Successful']['quantity'].iloc[0] / 
+                                   success_comparison[success_comparison['status'] == 'Less Successful']['quantity'].iloc[0])
+                    st.metric("Sales Volume Multiplier", f"{quantity_diff:.1f}x")
+            
+            with col3:
+                if len(success_comparison) >= 2:
+                    revenue_diff = (success_comparison[success_comparison['status'] == 'Successful']['final_amount_inr'].iloc[0] / 
+                                  success_comparison[success_comparison['status'] == 'Less Successful']['final_amount_inr'].iloc[0])
+                    st.metric("Revenue Multiplier", f"{revenue_diff:.1f}x")
         else:
-            st.warning("No valid customer segments found for analysis.")
-        
-        # Behavioral Segmentation - OPTIMIZED
-        st.subheader("🎯 Behavioral Segmentation")
-        
-        # Use efficient binning
-        behavioral_data = st.session_state.customers.copy()
-        
-        # Create behavioral segments with safe binning
-        try:
-            behavioral_data['behavior_segment'] = pd.cut(
-                behavioral_data['avg_order_value'].fillna(0),
-                bins=[0, 500, 1500, 3000, float('inf')],
-                labels=['Budget', 'Value', 'Premium', 'Luxury']
-            )
-        except:
-            behavioral_data['behavior_segment'] = 'Value'  # Default
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Sample for visualization if dataset is large
-            if len(behavioral_data) > 5000:
-                behavior_sample = behavioral_data.sample(n=5000, random_state=42)
-            else:
-                behavior_sample = behavioral_data
-                
-            behavior_counts = behavior_sample['behavior_segment'].value_counts()
-            fig = px.bar(behavior_counts, x=behavior_counts.index, y=behavior_counts.values,
-                        title='Customer Behavior Segments',
-                        color=behavior_counts.values)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Lifetime Value Analysis with sampling
-            try:
-                if len(behavioral_data) > 5000:
-                    clv_sample = behavioral_data.sample(n=5000, random_state=42)
-                else:
-                    clv_sample = behavioral_data
-                    
-                clv_sample['clv_tier'] = pd.qcut(
-                    clv_sample['total_spent'].fillna(0), 
-                    4, 
-                    labels=['Low CLV', 'Medium CLV', 'High CLV', 'VIP']
-                )
-                clv_dist = clv_sample['clv_tier'].value_counts()
-                fig = px.pie(clv_dist, values=clv_dist.values, names=clv_dist.index,
-                            title='Customer Lifetime Value Distribution')
-                st.plotly_chart(fig, use_container_width=True)
-            except:
-                st.info("Insufficient data for CLV analysis")
-        
-        # Targeted Marketing Recommendations - Only show for segments that exist
-        st.subheader("💡 Targeted Marketing Recommendations")
-        
-        recommendations = {
-            'Champions': [
-                "💎 **Reward Program**: Exclusive VIP benefits and early access",
-                "🎁 **Loyalty Rewards**: Special birthday discounts and anniversary offers",
-                "👑 **Premium Support**: Dedicated customer service line"
-            ],
-            'Loyal Customers': [
-                "⭐ **Upsell Opportunities**: Recommend premium products and bundles",
-                "🔔 **Personalized Communication**: Targeted email campaigns based on purchase history",
-                "📱 **Mobile App Engagement**: Push notifications for new arrivals"
-            ],
-            'Potential Loyalists': [
-                "🚀 **Engagement Campaigns**: Limited-time offers to encourage repeat purchases",
-                "🎯 **Category Expansion**: Suggest complementary product categories",
-                "📧 **Re-engagement Emails**: Cart abandonment and wishlist reminders"
-            ],
-            'At Risk': [
-                "📞 **Win-back Campaigns**: Special reactivation discounts",
-                "💝 **Personal Outreach**: Customer satisfaction surveys",
-                "❓ **Feedback Collection**: Understand reasons for decreased engagement"
-            ],
-            'Lost Customers': [
-                "🔄 **Reactivation Offers**: Significant discounts for returning customers",
-                "📢 **Social Media Targeting**: Lookalike audience campaigns",
-                "🎪 **Event Invitations**: Exclusive webinar or product launch invites"
-            ]
-        }
-        
-        # Only show segments that actually exist in the data
-        existing_segments = rfm_data['segment'].value_counts()
-        
-        for segment, tips in recommendations.items():
-            segment_count = existing_segments.get(segment, 0)
-            if segment_count > 0:
-                with st.expander(f"{segment} - {segment_count:,} customers"):
-                    for tip in tips:
-                        st.write(f"• {tip}")
+            st.info("📊 No success factors data available")
+            
+    except Exception as e:
+        st.error(f"❌ Error in success factors analysis: {str(e)}")
+    
+    # Product Launch Recommendations
+    st.subheader("💡 New Product Launch Strategy")
+    
+    launch_strategies = [
+        "🎯 **Category Focus**: Prioritize Electronics and Fashion categories showing highest success rates",
+        "⭐ **Quality First**: Ensure minimum 4.0 rating target before major marketing push",
+        "📅 **Timing Strategy**: Plan launches before major festival seasons for maximum impact",
+        "📊 **Pre-launch Testing**: Implement limited market testing before full-scale launch",
+        "👥 **Influencer Marketing**: Leverage social media influencers for new product categories",
+        "💰 **Pricing Strategy**: Competitive pricing with initial promotional discounts",
+        "🔄 **Feedback Integration**: Rapid iteration based on early customer feedback",
+        "📈 **Performance Monitoring**: Track key metrics for first 90 days post-launch"
+    ]
+    
+    for strategy in launch_strategies:
+        st.success(strategy)
 
-    # Q12: Customer Journey Analytics Dashboard
-    elif dashboard_id == "Q12":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🛣️ Q12: Customer Journey Analytics Dashboard")
-        st.markdown("Acquisition channels, purchase patterns, category transitions from first-time to loyal customers")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Customer Journey Analysis
-        st.subheader("📊 Customer Journey Overview")
-        
-        # Get customer journey data
-        journey_data = st.session_state.transactions.copy()
-        journey_data['order_date'] = pd.to_datetime(journey_data['order_date'])
-        
-        # Customer progression analysis
-        customer_progression = journey_data.groupby('customer_id').agg({
-            'order_date': ['min', 'max', 'count'],
-            'final_amount_inr': 'sum',
-            'category': 'nunique'
-        }).reset_index()
-        
-        customer_progression.columns = ['customer_id', 'first_order', 'last_order', 'order_count', 'total_spent', 'unique_categories']
-        
-        # Journey Metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            avg_orders = customer_progression['order_count'].mean()
-            st.metric("Avg Orders per Customer", f"{avg_orders:.1f}")
-        
-        with col2:
-            multi_category = (customer_progression['unique_categories'] > 1).sum()
-            st.metric("Multi-category Shoppers", f"{multi_category:,}")
-        
-        with col3:
-            repeat_customers = (customer_progression['order_count'] > 1).sum()
-            st.metric("Repeat Customers", f"{repeat_customers:,}")
-        
-        with col4:
-            avg_categories = customer_progression['unique_categories'].mean()
-            st.metric("Avg Categories per Customer", f"{avg_categories:.1f}")
-        
-        # Purchase Frequency Distribution
-        st.subheader("📈 Purchase Frequency Patterns")
-        freq_dist = customer_progression['order_count'].value_counts().sort_index().head(15)
-        fig = px.bar(freq_dist, x=freq_dist.index, y=freq_dist.values,
-                    title='Customer Order Frequency Distribution',
-                    labels={'x': 'Number of Orders', 'y': 'Number of Customers'})
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Category Transition Analysis
-        st.subheader("🔄 Category Transitions")
-        
-        # Get first and second purchase categories
-        customer_sequence = journey_data.sort_values(['customer_id', 'order_date'])
-        customer_sequence['order_sequence'] = customer_sequence.groupby('customer_id').cumcount() + 1
-        
-        # First purchase categories
-        first_purchase = customer_sequence[customer_sequence['order_sequence'] == 1]
-        first_purchase_cats = first_purchase['category'].value_counts().head(10)
-        
-        # Second purchase categories (for customers with multiple orders)
-        second_purchase = customer_sequence[customer_sequence['order_sequence'] == 2]
-        second_purchase_cats = second_purchase['category'].value_counts().head(10)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(first_purchase_cats, x=first_purchase_cats.index, y=first_purchase_cats.values,
-                        title='Top 10 First Purchase Categories')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.bar(second_purchase_cats, x=second_purchase_cats.index, y=second_purchase_cats.values,
-                        title='Top 10 Second Purchase Categories')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Customer Evolution Analysis
-        st.subheader("📊 Customer Evolution Patterns")
-        
-        # Analyze how customers evolve over time
-        evolution_data = customer_sequence.groupby(['customer_id', 'order_sequence']).agg({
-            'final_amount_inr': 'sum',
-            'category': 'first'
-        }).reset_index()
-        
-        # Average order value by sequence
-        aov_by_sequence = evolution_data.groupby('order_sequence')['final_amount_inr'].mean().reset_index()
-        aov_by_sequence = aov_by_sequence[aov_by_sequence['order_sequence'] <= 10]  # First 10 orders
+# Q21: Delivery Performance Dashboard - FIXED
+def render_q21():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🚚 Q21: Delivery Performance Dashboard")
+    st.markdown("Delivery times, on-time delivery rates, geographic performance variations, and operational efficiency")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Delivery Performance Overview - FIXED: Better data validation
+    st.subheader("📊 Delivery Performance Metrics")
+    
+    delivery_data = st.session_state.transactions.copy()
+    
+    # Filter valid delivery data - FIXED: Better outlier handling
+    if 'delivery_days' not in delivery_data.columns:
+        st.error("❌ Delivery days data not available in the dataset")
+        return
         
-        fig = px.line(aov_by_sequence, x='order_sequence', y='final_amount_inr',
-                     title='Average Order Value by Purchase Sequence',
-                     markers=True)
-        fig.update_layout(xaxis_title='Purchase Sequence', yaxis_title='Average Order Value (₹)')
-        fig.update_yaxes(tickprefix='₹')
+    # Convert to numeric and handle errors
+    delivery_data['delivery_days'] = pd.to_numeric(delivery_data['delivery_days'], errors='coerce')
+    
+    # Remove invalid and extreme outliers
+    delivery_data = delivery_data[
+        (delivery_data['delivery_days'] > 0) & 
+        (delivery_data['delivery_days'] < 30)  # Reasonable delivery window
+    ].dropna(subset=['delivery_days'])
+    
+    if delivery_data.empty:
+        st.warning("⚠️ No valid delivery data available for analysis")
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        avg_delivery_days = delivery_data['delivery_days'].mean()
+        st.metric("Average Delivery Days", f"{avg_delivery_days:.1f} days")
+    
+    with col2:
+        on_time_rate = (delivery_data['delivery_days'] <= 7).mean() * 100
+        st.metric("On-time Delivery Rate", f"{on_time_rate:.1f}%")
+    
+    with col3:
+        express_delivery = (delivery_data['delivery_days'] <= 3).sum()
+        st.metric("Express Deliveries (≤3 days)", f"{express_delivery:,}")
+    
+    with col4:
+        delayed_delivery = (delivery_data['delivery_days'] > 7).sum()
+        st.metric("Delayed Deliveries (>7 days)", f"{delayed_delivery:,}")
+    
+    # Delivery Performance Distribution - FIXED: Better visualization
+    st.subheader("📈 Delivery Days Distribution")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Delivery days histogram with better binning
+        fig = px.histogram(delivery_data, x='delivery_days', 
+                         title='Distribution of Delivery Days',
+                         nbins=15,
+                         color_discrete_sequence=['#FF9900'])
+        fig.update_layout(xaxis_title='Delivery Days', yaxis_title='Number of Orders')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Loyalty Development
-        st.subheader("⭐ Loyalty Development Insights")
-        
-        # Time to second purchase
-        multi_order_customers = customer_progression[customer_progression['order_count'] > 1]
-        multi_order_customers['days_to_second_purchase'] = (
-            multi_order_customers['last_order'] - multi_order_customers['first_order']
-        ).dt.days
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            avg_days_to_second = multi_order_customers['days_to_second_purchase'].mean()
-            st.metric("Avg Days to Second Purchase", f"{avg_days_to_second:.1f} days")
-        
-        with col2:
-            loyal_customers = len(multi_order_customers[multi_order_customers['order_count'] >= 3])
-            st.metric("Loyal Customers (3+ orders)", f"{loyal_customers:,}")
-        
-        # Customer Journey Recommendations
-        st.subheader("💡 Customer Journey Optimization")
-        
-        journey_insights = [
-            "🎯 **First Purchase Strategy**: Focus on Electronics and Fashion for customer acquisition",
-            "🔄 **Cross-selling**: 65% of customers buy from multiple categories within first 3 orders",
-            "📈 **Loyalty Building**: Implement rewards for 2nd and 3rd purchases to boost retention",
-            "⏱️ **Engagement Timing**: Most second purchases occur within 45 days of first purchase",
-            "💰 **Value Growth**: Average order value increases by 28% from 1st to 3rd purchase"
-        ]
-        
-        for insight in journey_insights:
-            st.success(insight)
-
-    # Q13: Prime Membership Analytics Dashboard
-    elif dashboard_id == "Q13":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("👑 Q13: Prime Membership Analytics Dashboard")
-        st.markdown("Prime vs non-Prime behavior, membership value analysis, retention rates, and Prime-specific insights")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Prime Membership Overview
-        st.subheader("📊 Prime Membership Overview")
-        
-        # Check Prime membership data
-        if 'is_prime_member' in st.session_state.transactions.columns:
-            prime_analysis = st.session_state.transactions.groupby('is_prime_member').agg({
-                'customer_id': 'nunique',
-                'final_amount_inr': 'sum',
-                'transaction_id': 'count',
+    
+    with col2:
+        # Delivery performance by delivery type - FIXED: Check column existence
+        if 'delivery_type' in delivery_data.columns:
+            delivery_type_perf = delivery_data.groupby('delivery_type').agg({
+                'delivery_days': 'mean',
                 'customer_rating': 'mean',
-                'discount_percent': 'mean'
+                'transaction_id': 'count'
             }).reset_index()
             
-            prime_analysis.columns = ['is_prime_member', 'unique_customers', 'total_revenue', 'total_orders', 'avg_rating', 'avg_discount']
-            
-            # Filter out unknown values
-            prime_analysis = prime_analysis[prime_analysis['is_prime_member'].isin(['Yes', 'No'])]
+            # Filter out delivery types with insufficient data
+            delivery_type_perf = delivery_type_perf[delivery_type_perf['transaction_id'] > 10]
             
-            if not prime_analysis.empty:
-                # Key Metrics
-                col1, col2, col3, col4 = st.columns(4)
-                
-                prime_customers = prime_analysis[prime_analysis['is_prime_member'] == 'Yes']['unique_customers'].iloc[0] if 'Yes' in prime_analysis['is_prime_member'].values else 0
-                non_prime_customers = prime_analysis[prime_analysis['is_prime_member'] == 'No']['unique_customers'].iloc[0] if 'No' in prime_analysis['is_prime_member'].values else 0
-                prime_revenue = prime_analysis[prime_analysis['is_prime_member'] == 'Yes']['total_revenue'].iloc[0] if 'Yes' in prime_analysis['is_prime_member'].values else 0
-                non_prime_revenue = prime_analysis[prime_analysis['is_prime_member'] == 'No']['total_revenue'].iloc[0] if 'No' in prime_analysis['is_prime_member'].values else 0
-                
-                with col1:
-                    st.metric("Prime Members", f"{prime_customers:,}")
-                with col2:
-                    st.metric("Non-Prime Members", f"{non_prime_customers:,}")
-                with col3:
-                    prime_aov = prime_analysis[prime_analysis['is_prime_member'] == 'Yes']['total_revenue'].iloc[0] / prime_analysis[prime_analysis['is_prime_member'] == 'Yes']['total_orders'].iloc[0] if 'Yes' in prime_analysis['is_prime_member'].values else 0
-                    st.metric("Prime AOV", f"₹{prime_aov:.0f}")
-                with col4:
-                    non_prime_aov = prime_analysis[prime_analysis['is_prime_member'] == 'No']['total_revenue'].iloc[0] / prime_analysis[prime_analysis['is_prime_member'] == 'No']['total_orders'].iloc[0] if 'No' in prime_analysis['is_prime_member'].values else 0
-                    st.metric("Non-Prime AOV", f"₹{non_prime_aov:.0f}")
-                
-                # Prime vs Non-Prime Comparison
-                st.subheader("⚖️ Prime vs Non-Prime Comparison")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Customer distribution
-                    fig = px.pie(prime_analysis, values='unique_customers', names='is_prime_member',
-                                title='Customer Distribution: Prime vs Non-Prime')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Revenue comparison
-                    fig = px.bar(prime_analysis, x='is_prime_member', y='total_revenue',
-                                title='Total Revenue: Prime vs Non-Prime',
-                                color='is_prime_member')
-                    fig.update_yaxes(tickprefix='₹')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                # Prime Member Behavior Analysis
-                st.subheader("📈 Prime Member Behavior Analysis")
-                
-                # Category preferences by membership type
-                prime_categories = st.session_state.transactions.groupby(['is_prime_member', 'category']).agg({
-                    'final_amount_inr': 'sum',
-                    'transaction_id': 'count'
-                }).reset_index()
-                
-                prime_categories = prime_categories[prime_categories['is_prime_member'].isin(['Yes', 'No'])]
-                
-                # Top categories for Prime members
-                prime_top_cats = prime_categories[prime_categories['is_prime_member'] == 'Yes'].nlargest(8, 'final_amount_inr')
-                non_prime_top_cats = prime_categories[prime_categories['is_prime_member'] == 'No'].nlargest(8, 'final_amount_inr')
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    fig = px.bar(prime_top_cats, x='category', y='final_amount_inr',
-                                title='Top Categories - Prime Members',
-                                color='final_amount_inr')
-                    fig.update_yaxes(tickprefix='₹')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    fig = px.bar(non_prime_top_cats, x='category', y='final_amount_inr',
-                                title='Top Categories - Non-Prime Members',
-                                color='final_amount_inr')
-                    fig.update_yaxes(tickprefix='₹')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                # Retention Analysis
-                st.subheader("💎 Prime Membership Value Analysis")
-                
-                # Calculate retention metrics
-                prime_customers_data = st.session_state.customers[st.session_state.customers['is_prime_member'] == 'Yes']
-                non_prime_customers_data = st.session_state.customers[st.session_state.customers['is_prime_member'] == 'No']
-                
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    if not prime_customers_data.empty:
-                        prime_retention = prime_customers_data['total_orders'].mean()
-                        st.metric("Avg Orders (Prime)", f"{prime_retention:.1f}")
-                
-                with col2:
-                    if not non_prime_customers_data.empty:
-                        non_prime_retention = non_prime_customers_data['total_orders'].mean()
-                        st.metric("Avg Orders (Non-Prime)", f"{non_prime_retention:.1f}")
-                
-                with col3:
-                    if not prime_customers_data.empty:
-                        prime_lifetime = prime_customers_data['customer_lifetime_days'].mean()
-                        st.metric("Avg Lifetime (Prime)", f"{prime_lifetime:.0f} days")
-                
-                with col4:
-                    if not non_prime_customers_data.empty:
-                        non_prime_lifetime = non_prime_customers_data['customer_lifetime_days'].mean()
-                        st.metric("Avg Lifetime (Non-Prime)", f"{non_prime_lifetime:.0f} days")
-                
-                # Prime-specific Business Insights
-                st.subheader("🎯 Prime-specific Business Insights")
-                
-                insights = [
-                    f"💰 **Revenue Impact**: Prime members contribute {prime_revenue/(prime_revenue+non_prime_revenue)*100:.1f}% of total revenue",
-                    f"🛒 **Purchase Frequency**: Prime members order {prime_retention/non_prime_retention:.1f}x more frequently",
-                    f"⭐ **Customer Satisfaction**: Prime members rate {prime_analysis[prime_analysis['is_prime_member'] == 'Yes']['avg_rating'].iloc[0]:.1f} vs Non-Prime {prime_analysis[prime_analysis['is_prime_member'] == 'No']['avg_rating'].iloc[0]:.1f}",
-                    f"📦 **Category Preference**: Prime members favor Electronics and Fashion categories",
-                    f"🎯 **Growth Opportunity**: {non_prime_customers/(prime_customers+non_prime_customers)*100:.1f}% of customers are non-Prime conversion targets"
-                ]
-                
-                for insight in insights:
-                    st.info(insight)
+            if not delivery_type_perf.empty:
+                fig = px.bar(delivery_type_perf, x='delivery_type', y='delivery_days',
+                            title='Average Delivery Days by Delivery Type',
+                            color='delivery_days',
+                            hover_data=['customer_rating'])
+                fig.update_layout(xaxis_title='Delivery Type', yaxis_title='Average Delivery Days')
+                st.plotly_chart(fig, use_container_width=True)
             else:
-                st.warning("No Prime membership data available for analysis.")
+                st.info("📊 Insufficient data for delivery type analysis")
         else:
-            st.warning("Prime membership data not available in the dataset.")
-
-    # Q14: Customer Retention Dashboard - FIXED VERSION
-    elif dashboard_id == "Q14":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("💎 Q14: Customer Retention Dashboard")
-        st.markdown("Cohort analysis, churn prediction, retention strategies effectiveness, and customer lifecycle management")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Cohort Analysis - FIXED
-        st.subheader("📊 Customer Cohort Analysis")
-        
-        # Create cohort analysis with proper date handling
-        cohort_data = st.session_state.customers.copy()
-        
-        # Ensure date columns are properly formatted
-        cohort_data['first_order_date'] = pd.to_datetime(cohort_data['first_order_date'], errors='coerce')
-        
-        # Remove rows with invalid dates
-        cohort_data = cohort_data[cohort_data['first_order_date'].notna()]
-        
-        if len(cohort_data) == 0:
-            st.warning("No valid customer data available for cohort analysis.")
-            return
-        
-        cohort_data['acquisition_year'] = cohort_data['first_order_date'].dt.year
-        
-        # Cohort performance by acquisition year
-        yearly_cohorts = cohort_data.groupby('acquisition_year').agg({
-            'customer_id': 'count',
-            'total_spent': 'mean',
-            'total_orders': 'mean',
-            'customer_lifetime_days': 'mean'
+            st.info("📊 Delivery type data not available")
+    
+    # Geographic Performance Variations - FIXED: Better state data handling
+    st.subheader("🗺️ Geographic Delivery Performance")
+    
+    # Delivery performance by state - FIXED: Check state column
+    if 'customer_state' in delivery_data.columns:
+        state_delivery = delivery_data.groupby('customer_state').agg({
+            'delivery_days': 'mean',
+            'customer_rating': 'mean',
+            'transaction_id': 'count'
         }).reset_index()
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(yearly_cohorts, x='acquisition_year', y='customer_id',
-                        title='Customer Acquisition by Year',
-                        color='customer_id')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.line(yearly_cohorts, x='acquisition_year', y='total_spent',
-                        title='Average Lifetime Value by Cohort',
-                        markers=True)
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
+        state_delivery.columns = ['state', 'avg_delivery_days', 'avg_rating', 'order_count']
         
-        # Retention Curve Analysis - FIXED VERSION
-        st.subheader("📈 Customer Retention Analysis")
+        # Filter states with sufficient data
+        state_delivery = state_delivery[state_delivery['order_count'] > 10]
         
-        try:
-            # Use transactions data for retention analysis
-            retention_data = st.session_state.transactions.copy()
-            retention_data['order_date'] = pd.to_datetime(retention_data['order_date'], errors='coerce')
+        if not state_delivery.empty:
+            col1, col2 = st.columns(2)
             
-            # Remove rows with invalid dates
-            retention_data = retention_data[retention_data['order_date'].notna()]
-            retention_data = retention_data[retention_data['customer_id'].notna()]
+            with col1:
+                # Best performing states
+                best_states = state_delivery.nsmallest(10, 'avg_delivery_days')
+                fig = px.bar(best_states, x='state', y='avg_delivery_days',
+                            title='Top 10 States - Fastest Delivery',
+                            color='avg_delivery_days',
+                            color_continuous_scale='Greens_r')
+                st.plotly_chart(fig, use_container_width=True)
             
-            if len(retention_data) == 0:
-                st.warning("No valid transaction data available for retention analysis.")
-            else:
-                # Get first purchase date for each customer
-                first_purchase = retention_data.groupby('customer_id')['order_date'].min().reset_index()
-                first_purchase.columns = ['customer_id', 'first_purchase_date']
-                
-                # Merge cohort information
-                retention_with_cohort = retention_data.merge(first_purchase, on='customer_id')
-                
-                # Calculate months since first purchase - FIXED METHOD
-                retention_with_cohort['months_since_first_purchase'] = (
-                    (retention_with_cohort['order_date'].dt.year - retention_with_cohort['first_purchase_date'].dt.year) * 12 +
-                    (retention_with_cohort['order_date'].dt.month - retention_with_cohort['first_purchase_date'].dt.month)
-                )
-                
-                # Create cohort groups by acquisition month
-                retention_with_cohort['cohort_month'] = retention_with_cohort['first_purchase_date'].dt.to_period('M')
-                
-                # Create simplified retention matrix
-                retention_matrix = retention_with_cohort.groupby(['cohort_month', 'months_since_first_purchase']).agg({
-                    'customer_id': 'nunique'
-                }).reset_index()
-                
-                # Pivot to create retention matrix
-                retention_pivot = retention_matrix.pivot_table(
-                    index='cohort_month',
-                    columns='months_since_first_purchase',
-                    values='customer_id',
-                    aggfunc='sum'
-                ).fillna(0)
-                
-                # Calculate retention rates
-                cohort_sizes = retention_pivot.iloc[:, 0]  # Month 0 (first month)
-                retention_rates = retention_pivot.divide(cohort_sizes, axis=0) * 100
-                
-                # Plot retention heatmap
-                fig = px.imshow(retention_rates, 
-                            title='Customer Retention Rates by Cohort',
-                            color_continuous_scale='Blues',
-                            aspect='auto',
-                            labels=dict(x="Months Since First Purchase", y="Cohort Month", color="Retention Rate (%)"))
+            with col2:
+                # Worst performing states
+                worst_states = state_delivery.nlargest(10, 'avg_delivery_days')
+                fig = px.bar(worst_states, x='state', y='avg_delivery_days',
+                            title='Top 10 States - Slowest Delivery',
+                            color='avg_delivery_days',
+                            color_continuous_scale='Reds')
                 st.plotly_chart(fig, use_container_width=True)
-                
-        except Exception as e:
-            st.error(f"Error in retention analysis: {str(e)}")
-            st.info("Showing simplified retention analysis instead...")
+        else:
+            st.info("📊 Insufficient state-level delivery data")
+    else:
+        st.info("📊 State information not available for geographic analysis")
+    
+    # Customer Satisfaction vs Delivery Performance - FIXED: Better correlation analysis
+    st.subheader("⭐ Delivery Impact on Customer Satisfaction")
+    
+    try:
+        # Correlation between delivery days and customer rating
+        # Ensure customer_rating exists and is numeric
+        if 'customer_rating' in delivery_data.columns:
+            delivery_data['customer_rating'] = pd.to_numeric(delivery_data['customer_rating'], errors='coerce')
+            delivery_data = delivery_data.dropna(subset=['customer_rating'])
+            
+            # Create bins for delivery days
+            delivery_rating_data = delivery_data.copy()
+            delivery_rating_data['delivery_bin'] = pd.cut(
+                delivery_rating_data['delivery_days'], 
+                bins=[0, 2, 4, 7, 10, 15, 30],
+                labels=['0-2', '3-4', '5-7', '8-10', '11-15', '16+']
+            )
             
-            # Simplified retention analysis as fallback
-            simplified_retention = cohort_data.groupby('acquisition_year').agg({
-                'customer_lifetime_days': 'mean',
-                'total_orders': 'mean'
+            delivery_rating_corr = delivery_rating_data.groupby('delivery_bin').agg({
+                'customer_rating': 'mean',
+                'transaction_id': 'count'
             }).reset_index()
             
-            col1, col2 = st.columns(2)
-            with col1:
-                fig = px.line(simplified_retention, x='acquisition_year', y='customer_lifetime_days',
-                            title='Average Customer Lifetime by Cohort',
-                            markers=True)
-                st.plotly_chart(fig, use_container_width=True)
+            delivery_rating_corr.columns = ['delivery_days_range', 'avg_rating', 'order_count']
             
-            with col2:
-                fig = px.line(simplified_retention, x='acquisition_year', y='total_orders',
-                            title='Average Orders per Customer by Cohort',
-                            markers=True)
+            if not delivery_rating_corr.empty:
+                fig = px.scatter(delivery_rating_corr, 
+                               x='delivery_days_range', 
+                               y='avg_rating',
+                               size='order_count', 
+                               title='Delivery Speed vs Customer Rating',
+                               labels={
+                                   'delivery_days_range': 'Delivery Days Range', 
+                                   'avg_rating': 'Average Customer Rating'
+                               })
                 st.plotly_chart(fig, use_container_width=True)
-        
-        # Churn Analysis - FIXED
-        st.subheader("🚨 Churn Prediction & Analysis")
-        
-        # Define churn (90+ days since last order) with proper handling
-        churn_data = st.session_state.customers.copy()
-        
-        # Ensure numeric type for days_since_last_order
-        churn_data['days_since_last_order'] = pd.to_numeric(churn_data['days_since_last_order'], errors='coerce').fillna(365)
-        churn_data['is_churned'] = churn_data['days_since_last_order'] > 90
-        
-        # Churn statistics
-        churn_rate = churn_data['is_churned'].mean() * 100
-        active_customers = len(churn_data[~churn_data['is_churned']])
-        churned_customers = len(churn_data[churn_data['is_churned']])
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Overall Churn Rate", f"{churn_rate:.1f}%")
-        
-        with col2:
-            st.metric("Active Customers", f"{active_customers:,}")
-        
-        with col3:
-            st.metric("Churned Customers", f"{churned_customers:,}")
-        
-        # Churn factors analysis
-        st.subheader("🔍 Churn Risk Factors")
-        
-        # Analyze factors correlated with churn
-        churn_factors = churn_data.groupby('is_churned').agg({
-            'total_orders': 'mean',
-            'avg_order_value': 'mean',
-            'customer_lifetime_days': 'mean',
-            'avg_rating': 'mean'
+                
+                # Calculate correlation coefficient
+                correlation = delivery_data['delivery_days'].corr(delivery_data['customer_rating'])
+                st.metric("Delivery-Rating Correlation", f"{correlation:.3f}")
+            else:
+                st.info("📊 Insufficient data for delivery-rating correlation")
+        else:
+            st.info("📊 Customer rating data not available")
+            
+    except Exception as e:
+        st.error(f"❌ Error in satisfaction analysis: {str(e)}")
+    
+    # Operational Efficiency Insights
+    st.subheader("💡 Operational Efficiency Recommendations")
+    
+    insights = [
+        "🚀 **Fastest Regions**: Metro cities achieve 2.8-day average delivery - replicate successful practices",
+        "📦 **Delivery Optimization**: Target 85% on-time delivery rate for next quarter",
+        "⭐ **Quality Impact**: Each additional delivery day reduces customer rating by 0.15 points on average",
+        "🏙️ **Infrastructure Gaps**: Tier 2 cities need logistics improvement - 45% longer delivery times",
+        "💰 **Cost-Benefit**: Express delivery (≤3 days) increases customer satisfaction by 22%",
+        "🔄 **Process Improvement**: Implement real-time tracking for delayed deliveries",
+        "📊 **Performance Monitoring**: Set state-wise delivery time targets"
+    ]
+    
+    for insight in insights:
+        st.info(insight)
+
+# Q22: Payment Analytics Dashboard
+def render_q22():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("💳 Q22: Payment Analytics Dashboard")
+    st.markdown("Payment method preferences, transaction success rates, payment trends evolution, and financial partnership insights")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Payment Method Overview
+    st.subheader("📊 Payment Method Performance")
+    
+    # Payment method analysis
+    payment_data = st.session_state.transactions.copy()
+    
+    # Payment method distribution
+    payment_distribution = payment_data['payment_method'].value_counts().reset_index()
+    payment_distribution.columns = ['payment_method', 'transaction_count']
+    payment_distribution['market_share'] = (payment_distribution['transaction_count'] / payment_distribution['transaction_count'].sum()) * 100
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Payment method pie chart
+        fig = px.pie(payment_distribution, values='transaction_count', names='payment_method',
+                    title='Payment Method Distribution')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Payment method performance
+        payment_performance = payment_data.groupby('payment_method').agg({
+            'final_amount_inr': 'sum',
+            'transaction_id': 'count',
+            'customer_rating': 'mean'
         }).reset_index()
         
-        churn_factors['status'] = churn_factors['is_churned'].map({True: 'Churned', False: 'Active'})
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(churn_factors, x='status', y='total_orders',
-                        title='Average Orders: Active vs Churned')
-            st.plotly_chart(fig, use_container_width=True)
+        payment_performance.columns = ['payment_method', 'total_revenue', 'transaction_count', 'avg_rating']
+        payment_performance['avg_order_value'] = payment_performance['total_revenue'] / payment_performance['transaction_count']
         
-        with col2:
-            fig = px.bar(churn_factors, x='status', y='avg_order_value',
-                        title='Average Order Value: Active vs Churned')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Customer Lifecycle Management - FIXED
-        st.subheader("🔄 Customer Lifecycle Management")
-        
-        # Segment customers by lifecycle stage with proper handling
-        lifecycle_data = st.session_state.customers.copy()
-        lifecycle_data['days_since_last_order'] = pd.to_numeric(lifecycle_data['days_since_last_order'], errors='coerce').fillna(365)
-        
-        def get_lifecycle_stage(row):
-            days = row['days_since_last_order']
-            if pd.isna(days):
-                return 'Unknown'
-            elif days <= 30:
-                return 'Active'
-            elif days <= 90:
-                return 'Warm'
-            elif days <= 180:
-                return 'Cooling'
-            else:
-                return 'Dormant'
-        
-        lifecycle_data['lifecycle_stage'] = lifecycle_data.apply(get_lifecycle_stage, axis=1)
-        
-        # Lifecycle stage distribution
-        lifecycle_counts = lifecycle_data['lifecycle_stage'].value_counts()
-        fig = px.pie(lifecycle_counts, values=lifecycle_counts.values, names=lifecycle_counts.index,
-                    title='Customer Lifecycle Stage Distribution')
+        fig = px.bar(payment_performance, x='payment_method', y='avg_order_value',
+                    title='Average Order Value by Payment Method',
+                    color='avg_order_value',
+                    hover_data=['avg_rating'])
+        fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Retention Strategy Recommendations
-        st.subheader("💡 Retention Strategy Recommendations")
-        
-        strategies = {
-            'Active': [
-                "🎯 **Upsell Opportunities**: Recommend premium products and bundles",
-                "⭐ **Loyalty Rewards**: Implement points-based reward system",
-                "📱 **Engagement**: Push notifications for new arrivals and deals"
-            ],
-            'Warm': [
-                "📧 **Re-engagement Emails**: Personalized recommendations based on purchase history",
-                "💝 **Special Offers**: Limited-time discounts to encourage purchase",
-                "🔔 **Abandoned Cart Reminders**: Remind about saved items"
-            ],
-            'Cooling': [
-                "📞 **Win-back Campaigns**: Significant discounts for returning customers",
-                "❓ **Feedback Surveys**: Understand reasons for decreased engagement",
-                "🎪 **Event Invitations**: Exclusive webinars or product launches"
-            ],
-            'Dormant': [
-                "🔄 **Reactivation Programs**: Special welcome-back offers",
-                "📢 **Lookalike Campaigns**: Target similar new customers",
-                "💰 **Loyalty Recognition**: Acknowledge past loyalty with special benefits"
-            ]
-        }
-        
-        for stage, tips in strategies.items():
-            stage_count = len(lifecycle_data[lifecycle_data['lifecycle_stage'] == stage])
-            if stage_count > 0:
-                with st.expander(f"{stage} Customers - {stage_count:,} users"):
-                    for tip in tips:
-                        st.write(f"• {tip}")
-
-    # Q15: Demographics & Behavior Dashboard
-    elif dashboard_id == "Q15":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("👨‍👩‍👧‍👦 Q15: Demographics & Behavior Dashboard")
-        st.markdown("Age group preferences, spending patterns, geographic behaviors, and targeted marketing opportunities")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Age Group Analysis
-        st.subheader("📊 Age Group Demographics")
-        
-        # Check if age group data exists
-        if 'customer_age_group' in st.session_state.transactions.columns:
-            age_analysis = st.session_state.transactions.groupby('customer_age_group').agg({
-                'customer_id': 'nunique',
-                'final_amount_inr': 'sum',
-                'transaction_id': 'count',
-                'customer_rating': 'mean'
-            }).reset_index()
-            
-            age_analysis.columns = ['age_group', 'unique_customers', 'total_revenue', 'total_orders', 'avg_rating']
-            
-            # Remove unknown/empty age groups
-            age_analysis = age_analysis[age_analysis['age_group'].notna() & (age_analysis['age_group'] != '')]
-            
-            if not age_analysis.empty:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Customer distribution by age
-                    fig = px.pie(age_analysis, values='unique_customers', names='age_group',
-                                title='Customer Distribution by Age Group')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Revenue by age group
-                    fig = px.bar(age_analysis, x='age_group', y='total_revenue',
-                                title='Total Revenue by Age Group',
-                                color='total_revenue')
-                    fig.update_yaxes(tickprefix='₹')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                # Age Group Behavior Patterns
-                st.subheader("📈 Age Group Behavior Patterns")
-                
-                # Calculate additional metrics
-                age_analysis['avg_order_value'] = age_analysis['total_revenue'] / age_analysis['total_orders']
-                age_analysis['revenue_per_customer'] = age_analysis['total_revenue'] / age_analysis['unique_customers']
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    fig = px.bar(age_analysis, x='age_group', y='avg_order_value',
-                                title='Average Order Value by Age Group',
-                                color='avg_order_value')
-                    fig.update_yaxes(tickprefix='₹')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    fig = px.bar(age_analysis, x='age_group', y='avg_rating',
-                                title='Customer Satisfaction by Age Group',
-                                color='avg_rating')
-                    st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.warning("No age group data available for analysis.")
-        else:
-            st.warning("Age group data not available in the dataset.")
-        
-        # Geographic Behavior Analysis
-        st.subheader("🗺️ Geographic Behavior Patterns")
-        
-        # State-wise spending patterns
-        state_behavior = st.session_state.transactions.groupby('customer_state').agg({
-            'final_amount_inr': 'sum',
-            'customer_id': 'nunique',
-            'transaction_id': 'count',
-            'customer_rating': 'mean'
-        }).reset_index()
-        
-        state_behavior.columns = ['state', 'total_revenue', 'unique_customers', 'total_orders', 'avg_rating']
-        state_behavior['revenue_per_customer'] = state_behavior['total_revenue'] / state_behavior['unique_customers']
-        state_behavior['orders_per_customer'] = state_behavior['total_orders'] / state_behavior['unique_customers']
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            top_states_revenue = state_behavior.nlargest(10, 'total_revenue')
-            fig = px.bar(top_states_revenue, x='state', y='total_revenue',
-                        title='Top 10 States by Revenue',
-                        color='total_revenue')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            top_states_engagement = state_behavior.nlargest(10, 'orders_per_customer')
-            fig = px.bar(top_states_engagement, x='state', y='orders_per_customer',
-                        title='Top 10 States by Engagement (Orders/Customer)',
-                        color='orders_per_customer')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Category Preferences by Demographics
-        st.subheader("🏪 Category Preferences Analysis")
-        
-        if 'customer_age_group' in st.session_state.transactions.columns:
-            # Category preferences by age group
-            age_category_pref = st.session_state.transactions.groupby(['customer_age_group', 'category']).agg({
-                'final_amount_inr': 'sum',
-                'transaction_id': 'count'
-            }).reset_index()
-            
-            age_category_pref = age_category_pref[age_category_pref['customer_age_group'].notna()]
-            
-            # Let user select age group for detailed view
-            age_groups = age_category_pref['customer_age_group'].unique()
-            selected_age_group = st.selectbox("Select Age Group for Category Analysis", age_groups)
-            
-            age_group_data = age_category_pref[age_category_pref['customer_age_group'] == selected_age_group].nlargest(8, 'final_amount_inr')
-            
-            fig = px.bar(age_group_data, x='category', y='final_amount_inr',
-                        title=f'Top Categories for {selected_age_group} Age Group',
-                        color='final_amount_inr')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Spending Patterns Analysis
-        st.subheader("💰 Spending Patterns Analysis")
-        
-        # Create spending segments
-        spending_data = st.session_state.customers.copy()
-        spending_data['spending_segment'] = pd.cut(spending_data['total_spent'],
-                                                 bins=[0, 1000, 5000, 20000, float('inf')],
-                                                 labels=['Budget', 'Value', 'Premium', 'Elite'])
-        
-        spending_segment_dist = spending_data['spending_segment'].value_counts()
-        fig = px.pie(spending_segment_dist, values=spending_segment_dist.values, names=spending_segment_dist.index,
-                    title='Customer Spending Segment Distribution')
+    
+    # Payment Trends Evolution
+    st.subheader("📈 Payment Method Trends Over Time")
+    
+    # Payment method evolution by year
+    payment_trends = payment_data.groupby(['order_year', 'payment_method']).agg({
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    # Calculate percentage share each year
+    yearly_totals = payment_trends.groupby('order_year')['transaction_id'].transform('sum')
+    payment_trends['percentage_share'] = (payment_trends['transaction_id'] / yearly_totals) * 100
+    
+    fig = px.line(payment_trends, x='order_year', y='percentage_share', color='payment_method',
+                 title='Payment Method Market Share Evolution',
+                 markers=True)
+    fig.update_layout(xaxis_title='Year', yaxis_title='Market Share (%)')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Transaction Success Analysis
+    st.subheader("✅ Transaction Success & Failure Analysis")
+    
+    # Simulate transaction success rates (in real scenario, this would come from payment gateway data)
+    payment_success_rates = {
+        'UPI': 98.5,
+        'Credit Card': 97.2,
+        'Debit Card': 96.8,
+        'Net Banking': 95.4,
+        'Cash on Delivery': 99.9,  # COD always "succeeds"
+        'Wallet': 97.8,
+        'EMI': 96.5
+    }
+    
+    # Create success rate dataframe
+    success_df = pd.DataFrame({
+        'payment_method': list(payment_success_rates.keys()),
+        'success_rate': list(payment_success_rates.values())
+    })
+    
+    # Merge with actual payment data
+    payment_analysis = payment_performance.merge(success_df, on='payment_method', how='left')
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(payment_analysis, x='payment_method', y='success_rate',
+                    title='Transaction Success Rates by Payment Method',
+                    color='success_rate',
+                    color_continuous_scale='RdYlGn')
+        fig.update_layout(yaxis_title='Success Rate (%)')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Targeted Marketing Opportunities
-        st.subheader("🎯 Targeted Marketing Opportunities")
-        
-        marketing_insights = [
-            "🎯 **Young Adults (18-25)**: High engagement with Electronics and Fashion - focus on social media campaigns",
-            "💼 **Professionals (26-40)**: Highest spending power - target with premium products and subscription services",
-            "🏠 **Family Focus (41-60)**: Prefer Home & Kitchen categories - bundle offers work best",
-            "👵 **Seniors (60+)**: Value convenience and customer service - emphasize easy returns and support",
-            "🗺️ **Regional Strategy**: Tier 2 cities show highest growth potential - expand localized marketing",
-            "📱 **Mobile-First**: Younger demographics prefer mobile shopping - optimize app experience",
-            "💰 **Value Segments**: Budget shoppers respond well to flash sales and limited-time offers"
-        ]
-        
-        for insight in marketing_insights:
-            st.success(insight)
-
-    # Q16: Product Performance Dashboard
-    elif dashboard_id == "Q16":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("📦 Q16: Product Performance Dashboard")
-        st.markdown("Product ranking by revenue, units sold, ratings, return rates with category-wise analysis")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Product Performance Overview
-        st.subheader("📊 Top Performing Products")
-        
-        # Product performance analysis
-        product_performance = st.session_state.transactions.groupby(['product_id', 'product_name', 'category']).agg({
-            'final_amount_inr': 'sum',
-            'quantity': 'sum',
-            'customer_rating': 'mean',
-            'transaction_id': 'count',
-            'return_status': lambda x: (x == 'Returned').sum()
-        }).reset_index()
-        
-        product_performance.columns = ['product_id', 'product_name', 'category', 'total_revenue', 'total_quantity', 'avg_rating', 'total_orders', 'return_count']
-        
-        # Calculate return rate
-        product_performance['return_rate'] = (product_performance['return_count'] / product_performance['total_orders']) * 100
-        product_performance['avg_order_value'] = product_performance['total_revenue'] / product_performance['total_orders']
-        
-        # Top Products by Revenue
-        st.subheader("💰 Top Products by Revenue")
-        top_revenue_products = product_performance.nlargest(10, 'total_revenue')
-        
-        fig = px.bar(top_revenue_products, x='product_name', y='total_revenue',
-                    title='Top 10 Products by Revenue',
-                    hover_data=['category', 'avg_rating', 'return_rate'],
-                    color='total_revenue')
-        fig.update_layout(xaxis_title='Product Name', yaxis_title='Total Revenue (₹)')
+    
+    with col2:
+        # Revenue impact of payment methods
+        fig = px.scatter(payment_analysis, x='success_rate', y='avg_order_value',
+                       size='transaction_count', color='payment_method',
+                       title='Payment Method Efficiency: Success Rate vs Order Value',
+                       labels={'success_rate': 'Success Rate (%)', 'avg_order_value': 'Avg Order Value (₹)'})
         fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Product Performance Metrics
-        st.subheader("📈 Product Performance Metrics")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            best_selling_product = top_revenue_products.iloc[0]['product_name']
-            st.metric("Best Selling Product", best_selling_product)
-        
-        with col2:
-            highest_rated = product_performance.nlargest(1, 'avg_rating')
-            st.metric("Highest Rated Product", f"{highest_rated['avg_rating'].iloc[0]:.1f} ⭐")
-        
-        with col3:
-            most_units_sold = product_performance.nlargest(1, 'total_quantity')
-            st.metric("Most Units Sold", f"{most_units_sold['total_quantity'].iloc[0]:,}")
-        
-        with col4:
-            lowest_return = product_performance[product_performance['total_orders'] > 10].nsmallest(1, 'return_rate')
-            st.metric("Lowest Return Rate", f"{lowest_return['return_rate'].iloc[0]:.1f}%")
-        
-        # Category-wise Product Analysis
-        st.subheader("🏪 Category-wise Product Performance")
-        
-        category_select = st.selectbox("Select Category for Detailed Analysis", 
-                                     product_performance['category'].unique())
-        
-        category_products = product_performance[product_performance['category'] == category_select]
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Top products in category by revenue
-            top_category_products = category_products.nlargest(8, 'total_revenue')
-            fig = px.bar(top_category_products, x='product_name', y='total_revenue',
-                        title=f'Top Products in {category_select}',
-                        color='total_revenue')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Rating vs Return Rate scatter
-            fig = px.scatter(category_products, x='avg_rating', y='return_rate',
-                           size='total_revenue', color='total_quantity',
-                           title=f'Product Quality Analysis: {category_select}',
-                           hover_data=['product_name'],
-                           labels={
-                               'avg_rating': 'Average Rating',
-                               'return_rate': 'Return Rate (%)',
-                               'total_revenue': 'Total Revenue',
-                               'total_quantity': 'Units Sold'
-                           })
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Return Analysis
-        st.subheader("🔄 Product Return Analysis")
-        
-        return_analysis = product_performance[product_performance['total_orders'] > 10]  # Filter for meaningful analysis
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            high_return_products = return_analysis.nlargest(10, 'return_rate')
-            fig = px.bar(high_return_products, x='product_name', y='return_rate',
-                        title='Products with Highest Return Rates',
-                        color='return_rate',
-                        color_continuous_scale='Reds_r')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Return rate distribution
-            fig = px.histogram(return_analysis, x='return_rate', 
-                             title='Distribution of Product Return Rates',
-                             nbins=20)
-            fig.update_layout(xaxis_title='Return Rate (%)', yaxis_title='Number of Products')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Product Lifecycle Tracking
-        st.subheader("📅 Product Lifecycle Analysis")
-        
-        # Merge with product catalog for launch year
-        if hasattr(st.session_state, 'products'):
-            lifecycle_data = product_performance.merge(
-                st.session_state.products[['product_id', 'launch_year']], 
-                on='product_id', 
-                how='left'
-            )
-            
-            # Analyze performance by product age
-            current_year = datetime.now().year
-            lifecycle_data['product_age'] = current_year - lifecycle_data['launch_year']
-            
-            # Performance by product age
-            age_performance = lifecycle_data.groupby('product_age').agg({
-                'total_revenue': 'mean',
-                'avg_rating': 'mean',
-                'return_rate': 'mean'
-            }).reset_index()
-            
-            fig = px.line(age_performance, x='product_age', y='total_revenue',
-                         title='Average Revenue by Product Age',
-                         markers=True)
-            fig.update_layout(xaxis_title='Product Age (Years)', yaxis_title='Average Revenue (₹)')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
+    
+    # Financial Partnership Insights
+    st.subheader("🤝 Financial Partnership Opportunities")
+    
+    # Payment method growth analysis
+    current_year = payment_data['order_year'].max()
+    previous_year = current_year - 1
+    
+    current_year_data = payment_trends[payment_trends['order_year'] == current_year]
+    previous_year_data = payment_trends[payment_trends['order_year'] == previous_year]
+    
+    growth_analysis = current_year_data.merge(previous_year_data, on='payment_method', suffixes=('_current', '_previous'))
+    growth_analysis['growth_rate'] = ((growth_analysis['transaction_id_current'] - growth_analysis['transaction_id_previous']) / growth_analysis['transaction_id_previous']) * 100
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    # Find fastest growing payment methods
+    fastest_growing = growth_analysis.nlargest(1, 'growth_rate')
+    highest_volume = payment_analysis.nlargest(1, 'transaction_count')
+    highest_value = payment_analysis.nlargest(1, 'avg_order_value')
+    most_reliable = payment_analysis.nlargest(1, 'success_rate')
+    
+    with col1:
+        st.metric("Fastest Growing", fastest_growing['payment_method'].iloc[0], f"{fastest_growing['growth_rate'].iloc[0]:.1f}%")
+    
+    with col2:
+        st.metric("Most Popular", highest_volume['payment_method'].iloc[0], f"{highest_volume['transaction_count'].iloc[0]:,}")
+    
+    with col3:
+        st.metric("Highest Value", highest_value['payment_method'].iloc[0], f"₹{highest_value['avg_order_value'].iloc[0]:.0f}")
+    
+    with col4:
+        st.metric("Most Reliable", most_reliable['payment_method'].iloc[0], f"{most_reliable['success_rate'].iloc[0]:.1f}%")
+    
+    # Partnership Recommendations
+    st.subheader("💡 Financial Partnership Strategy")
+    
+    recommendations = [
+        "🎯 **UPI Dominance**: UPI captures 42% market share with 98.5% success rate - strengthen UPI partnerships",
+        "📈 **Digital Growth**: Digital payments growing at 35% YoY - focus on wallet and UPI integrations",
+        "💰 **High-Value Payments**: Credit card users spend 45% more on average - premium payment experience",
+        "🔄 **COD Optimization**: COD still 18% of transactions - implement pre-paid incentives",
+        "🌐 **Regional Variations**: Payment preferences vary by region - localized payment options",
+        "🔒 **Security Focus**: Implement tokenization for card payments to improve success rates",
+        "📱 **Mobile First**: 67% of transactions via mobile - optimize mobile payment experience"
+    ]
+    
+    for rec in recommendations:
+        st.success(rec)
 
-    # Q17: Brand Analytics Dashboard
-    elif dashboard_id == "Q17":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🏷️ Q17: Brand Analytics Dashboard")
-        st.markdown("Brand performance comparison, market share evolution, customer preferences, and competitive positioning")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Brand Performance Overview
-        st.subheader("📊 Top Performing Brands")
-        
-        # Brand performance analysis
-        brand_performance = st.session_state.transactions.groupby('brand').agg({
-            'final_amount_inr': 'sum',
-            'quantity': 'sum',
-            'transaction_id': 'count',
-            'customer_rating': 'mean',
-            'customer_id': 'nunique',
-            'discount_percent': 'mean'
-        }).reset_index()
-        
-        brand_performance.columns = ['brand', 'total_revenue', 'total_quantity', 'total_orders', 'avg_rating', 'unique_customers', 'avg_discount']
-        
-        # Calculate additional metrics
-        brand_performance['revenue_per_order'] = brand_performance['total_revenue'] / brand_performance['total_orders']
-        brand_performance['market_share'] = (brand_performance['total_revenue'] / brand_performance['total_revenue'].sum()) * 100
-        
-        # Top Brands by Revenue
-        st.subheader("💰 Top Brands by Revenue")
-        top_brands_revenue = brand_performance.nlargest(15, 'total_revenue')
-        
-        fig = px.bar(top_brands_revenue, x='brand', y='total_revenue',
-                    title='Top 15 Brands by Revenue',
-                    hover_data=['market_share', 'avg_rating'],
-                    color='total_revenue')
-        fig.update_layout(xaxis_title='Brand', yaxis_title='Total Revenue (₹)')
+# Q23: Return & Cancellation Dashboard
+def render_q23():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🔄 Q23: Return & Cancellation Dashboard")
+    st.markdown("Return rates, return reasons, cost impact, and quality improvement opportunities")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Returns & Cancellations Overview
+    st.subheader("📊 Returns & Cancellations Analysis")
+    
+    returns_data = st.session_state.transactions.copy()
+    
+    # Calculate return and cancellation rates
+    total_orders = len(returns_data)
+    returned_orders = (returns_data['return_status'] == 'Returned').sum()
+    cancelled_orders = (returns_data['return_status'] == 'Cancelled').sum() if 'Cancelled' in returns_data['return_status'].values else 0
+    
+    return_rate = (returned_orders / total_orders) * 100
+    cancellation_rate = (cancelled_orders / total_orders) * 100 if cancelled_orders > 0 else 0
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Orders", f"{total_orders:,}")
+    
+    with col2:
+        st.metric("Returned Orders", f"{returned_orders:,}", f"{return_rate:.1f}%")
+    
+    with col3:
+        st.metric("Cancelled Orders", f"{cancelled_orders:,}", f"{cancellation_rate:.1f}%")
+    
+    with col4:
+        successful_orders = total_orders - returned_orders - cancelled_orders
+        success_rate = (successful_orders / total_orders) * 100
+        st.metric("Successful Orders", f"{successful_orders:,}", f"{success_rate:.1f}%")
+    
+    # Return Analysis by Category
+    st.subheader("🏪 Return Rates by Category")
+    
+    category_returns = returns_data.groupby('category').agg({
+        'transaction_id': 'count',
+        'return_status': lambda x: (x == 'Returned').sum(),
+        'final_amount_inr': 'sum'
+    }).reset_index()
+    
+    category_returns.columns = ['category', 'total_orders', 'returned_orders', 'total_revenue']
+    category_returns['return_rate'] = (category_returns['returned_orders'] / category_returns['total_orders']) * 100
+    category_returns['revenue_loss'] = (category_returns['returned_orders'] / category_returns['total_orders']) * category_returns['total_revenue']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Highest return rate categories
+        high_return_categories = category_returns.nlargest(10, 'return_rate')
+        fig = px.bar(high_return_categories, x='category', y='return_rate',
+                    title='Categories with Highest Return Rates',
+                    color='return_rate',
+                    color_continuous_scale='Reds')
+        fig.update_layout(yaxis_title='Return Rate (%)')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Revenue impact of returns
+        high_revenue_loss = category_returns.nlargest(10, 'revenue_loss')
+        fig = px.bar(high_revenue_loss, x='category', y='revenue_loss',
+                    title='Revenue Loss Due to Returns by Category',
+                    color='revenue_loss',
+                    color_continuous_scale='Oranges')
         fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Brand Market Share
-        st.subheader("📈 Brand Market Share Analysis")
-        
-        top_10_brands = brand_performance.nlargest(10, 'market_share')
-        others_market_share = 100 - top_10_brands['market_share'].sum()
-        
-        market_share_data = pd.concat([
-            top_10_brands[['brand', 'market_share']],
-            pd.DataFrame({'brand': ['Others'], 'market_share': [others_market_share]})
-        ])
-        
-        fig = px.pie(market_share_data, values='market_share', names='brand',
-                    title='Market Share Distribution - Top 10 Brands vs Others')
+    
+    # Return Reasons Analysis (Simulated - in real scenario would come from returns database)
+    st.subheader("🔍 Return Reasons Analysis")
+    
+    # Simulated return reasons data
+    return_reasons = {
+        'Size Issues': 35,
+        'Product Damage': 20,
+        'Wrong Item': 15,
+        'Not as Described': 12,
+        'Changed Mind': 10,
+        'Quality Issues': 8
+    }
+    
+    reasons_df = pd.DataFrame({
+        'reason': list(return_reasons.keys()),
+        'percentage': list(return_reasons.values())
+    })
+    
+    fig = px.pie(reasons_df, values='percentage', names='reason',
+                title='Distribution of Return Reasons')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Product Quality vs Returns
+    st.subheader("⭐ Product Quality & Return Correlation")
+    
+    # Analyze relationship between product ratings and return rates
+    quality_returns_data = returns_data.groupby('product_rating').agg({
+        'transaction_id': 'count',
+        'return_status': lambda x: (x == 'Returned').sum()
+    }).reset_index()
+    
+    quality_returns_data.columns = ['product_rating', 'total_orders', 'returned_orders']
+    quality_returns_data['return_rate'] = (quality_returns_data['returned_orders'] / quality_returns_data['total_orders']) * 100
+    
+    fig = px.scatter(quality_returns_data, x='product_rating', y='return_rate',
+                    size='total_orders', title='Product Rating vs Return Rate',
+                    labels={'product_rating': 'Product Rating', 'return_rate': 'Return Rate (%)'})
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Cost Impact Analysis
+    st.subheader("💰 Financial Impact of Returns")
+    
+    # Calculate cost impact
+    avg_order_value = returns_data['final_amount_inr'].mean()
+    total_return_cost = returned_orders * avg_order_value * 0.3  # Assuming 30% cost of returns
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Estimated Return Cost", f"₹{total_return_cost:,.0f}")
+    
+    with col2:
+        potential_savings = total_return_cost * 0.2  # 20% reduction target
+        st.metric("Potential Savings (20% reduction)", f"₹{potential_savings:,.0f}")
+    
+    with col3:
+        avg_processing_cost = total_return_cost / returned_orders if returned_orders > 0 else 0
+        st.metric("Avg Cost per Return", f"₹{avg_processing_cost:.0f}")
+    
+    # Quality Improvement Opportunities
+    st.subheader("🔧 Quality Improvement Strategies")
+    
+    improvement_areas = [
+        "📏 **Size Standardization**: 35% returns due to size issues - implement virtual try-on and better size charts",
+        "📦 **Packaging Improvement**: 20% returns due to damage - enhance packaging quality standards",
+        "📝 **Product Descriptions**: 12% returns for 'not as described' - improve product photography and descriptions",
+        "🔍 **Quality Control**: 8% returns for quality issues - strengthen pre-shipment quality checks",
+        "🔄 **Return Process**: Streamline return process to reduce processing costs by 15%",
+        "📊 **Predictive Analytics**: Identify high-risk products before launch using historical return data",
+        "🎯 **Customer Education**: Provide better product information to reduce 'changed mind' returns"
+    ]
+    
+    for area in improvement_areas:
+        st.info(area)
+
+# Q24: Customer Service Dashboard
+def render_q24():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("📞 Q24: Customer Service Dashboard")
+    st.markdown("Customer satisfaction scores, complaint categories, resolution times, and service quality improvements")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Customer Service Overview
+    st.subheader("📊 Customer Service Performance")
+    
+    # Using customer ratings as proxy for satisfaction (in real scenario, would have CSAT data)
+    service_data = st.session_state.transactions.copy()
+    
+    # Calculate service metrics
+    avg_rating = service_data['customer_rating'].mean()
+    rating_distribution = service_data['customer_rating'].value_counts().sort_index()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Average Customer Rating", f"{avg_rating:.2f} ⭐")
+    
+    with col2:
+        high_ratings = (service_data['customer_rating'] >= 4).sum()
+        high_rating_percent = (high_ratings / len(service_data)) * 100
+        st.metric("High Ratings (4+ stars)", f"{high_rating_percent:.1f}%")
+    
+    with col3:
+        low_ratings = (service_data['customer_rating'] <= 2).sum()
+        low_rating_percent = (low_ratings / len(service_data)) * 100
+        st.metric("Low Ratings (≤2 stars)", f"{low_rating_percent:.1f}%")
+    
+    with col4:
+        response_rate = 89.5  # Simulated data
+        st.metric("Customer Query Response Rate", f"{response_rate}%")
+    
+    # Rating Distribution
+    st.subheader("📈 Customer Rating Distribution")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(rating_distribution, x=rating_distribution.index, y=rating_distribution.values,
+                    title='Customer Rating Distribution',
+                    labels={'x': 'Rating', 'y': 'Number of Ratings'},
+                    color=rating_distribution.values)
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Brand Performance Metrics
-        st.subheader("📊 Brand Performance Comparison")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            top_revenue_brand = top_brands_revenue.iloc[0]['brand']
-            st.metric("Highest Revenue Brand", top_revenue_brand)
-        
-        with col2:
-            highest_rated_brand = brand_performance.nlargest(1, 'avg_rating')
-            st.metric("Highest Rated Brand", f"{highest_rated_brand['avg_rating'].iloc[0]:.1f} ⭐")
-        
-        with col3:
-            most_popular_brand = brand_performance.nlargest(1, 'unique_customers')
-            st.metric("Most Popular Brand", f"{most_popular_brand['unique_customers'].iloc[0]:,} customers")
-        
-        with col4:
-            best_value_brand = brand_performance.nlargest(1, 'revenue_per_order')
-            st.metric("Highest Value/Order", f"₹{best_value_brand['revenue_per_order'].iloc[0]:.0f}")
-        
-        # Brand Evolution Over Time
-        st.subheader("📅 Brand Performance Trends")
-        
-        # Brand performance over years
-        brand_trends = st.session_state.transactions.groupby(['order_year', 'brand']).agg({
-            'final_amount_inr': 'sum',
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        # Get top 5 brands for trend analysis
-        top_5_brands = brand_performance.nlargest(5, 'total_revenue')['brand'].tolist()
-        brand_trends_filtered = brand_trends[brand_trends['brand'].isin(top_5_brands)]
-        
-        fig = px.line(brand_trends_filtered, x='order_year', y='final_amount_inr', color='brand',
-                     title='Revenue Trends for Top 5 Brands',
+    
+    with col2:
+        # Rating trends over time
+        rating_trends = service_data.groupby('order_year')['customer_rating'].mean().reset_index()
+        fig = px.line(rating_trends, x='order_year', y='customer_rating',
+                     title='Customer Rating Trend Over Time',
                      markers=True)
-        fig.update_layout(xaxis_title='Year', yaxis_title='Revenue (₹)')
-        fig.update_yaxes(tickprefix='₹')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Competitive Positioning Analysis
-        st.subheader("⚔️ Brand Competitive Positioning")
-        
-        # Brand positioning: Price vs Rating vs Popularity
-        positioning_data = brand_performance[brand_performance['total_orders'] > 100]  # Meaningful brands
-        
-        fig = px.scatter(positioning_data, x='avg_rating', y='revenue_per_order',
-                        size='unique_customers', color='market_share',
-                        hover_name='brand',
-                        title='Brand Positioning: Quality vs Value vs Popularity',
-                        labels={
-                            'avg_rating': 'Customer Rating (Quality)',
-                            'revenue_per_order': 'Revenue per Order (Value)',
-                            'unique_customers': 'Customer Base Size',
-                            'market_share': 'Market Share (%)'
-                        })
-        fig.update_yaxes(tickprefix='₹')
+        fig.update_layout(xaxis_title='Year', yaxis_title='Average Rating')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Category-wise Brand Performance
-        st.subheader("🏪 Category-wise Brand Leadership")
-        
-        # Brand performance by category
-        category_brand_perf = st.session_state.transactions.groupby(['category', 'brand']).agg({
-            'final_amount_inr': 'sum',
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        # Find leading brand in each category
-        category_leaders = category_brand_perf.loc[category_brand_perf.groupby('category')['final_amount_inr'].idxmax()]
-        
-        fig = px.bar(category_leaders, x='category', y='final_amount_inr', color='brand',
-                    title='Leading Brands by Category',
-                    hover_data=['transaction_id'])
-        fig.update_layout(xaxis_title='Category', yaxis_title='Revenue (₹)')
-        fig.update_yaxes(tickprefix='₹')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Brand Strategy Insights
-        st.subheader("💡 Brand Strategy Recommendations")
-        
-        brand_insights = [
-            "🎯 **Market Leadership**: Identify brands with consistent growth and high customer satisfaction",
-            "📈 **Emerging Brands**: Monitor new brands with rapid market share growth",
-            "💰 **Premium Positioning**: Focus on brands with high revenue per order and strong ratings",
-            "👥 **Mass Market**: Leverage popular brands with large customer base for volume growth",
-            "🔄 **Partnership Opportunities**: Identify underperforming brands with potential for collaboration",
-            "📊 **Category Gaps**: Spot categories where no single brand dominates for expansion opportunities"
-        ]
-        
-        for insight in brand_insights:
-            st.info(insight)
-
-    # Q18: Inventory Optimization Dashboard
-    elif dashboard_id == "Q18":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("📦 Q18: Inventory Optimization Dashboard")
-        st.markdown("Product demand patterns, seasonal trends, inventory turnover, and demand forecasting")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Demand Patterns Analysis
-        st.subheader("📊 Product Demand Patterns")
-        
-        # Analyze sales trends over time
-        demand_data = st.session_state.transactions.copy()
-        demand_data['order_date'] = pd.to_datetime(demand_data['order_date'])
-        demand_data['order_month'] = demand_data['order_date'].dt.to_period('M').astype(str)
-        
-        # Monthly sales trend
-        monthly_demand = demand_data.groupby('order_month').agg({
-            'final_amount_inr': 'sum',
-            'quantity': 'sum',
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.line(monthly_demand, x='order_month', y='quantity',
-                         title='Monthly Sales Volume Trend',
-                         markers=True)
-            fig.update_layout(xaxis_title='Month', yaxis_title='Units Sold')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.line(monthly_demand, x='order_month', y='final_amount_inr',
-                         title='Monthly Revenue Trend',
-                         markers=True)
-            fig.update_layout(xaxis_title='Month', yaxis_title='Revenue (₹)')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Seasonal Trends Analysis
-        st.subheader("🌞 Seasonal Demand Patterns")
-        
-        # Analyze seasonal patterns
-        seasonal_data = demand_data.copy()
-        seasonal_data['month'] = seasonal_data['order_date'].dt.month
-        seasonal_data['year'] = seasonal_data['order_date'].dt.year
-        
-        seasonal_pattern = seasonal_data.groupby('month').agg({
-            'quantity': 'mean',
-            'final_amount_inr': 'mean'
-        }).reset_index()
-        
-        fig = px.line(seasonal_pattern, x='month', y='quantity',
-                     title='Average Monthly Sales Pattern',
-                     markers=True)
-        fig.update_layout(xaxis_title='Month', yaxis_title='Average Units Sold')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Inventory Turnover Analysis
-        st.subheader("🔄 Inventory Turnover Analysis")
-        
-        # Calculate inventory turnover (simplified)
-        product_turnover = st.session_state.transactions.groupby(['product_id', 'product_name', 'category']).agg({
-            'quantity': 'sum',
-            'transaction_id': 'count',
-            'final_amount_inr': 'sum'
-        }).reset_index()
-        
-        product_turnover.columns = ['product_id', 'product_name', 'category', 'total_quantity', 'total_orders', 'total_revenue']
-        
-        # Assuming inventory data (simplified)
-        # In real scenario, this would come from inventory database
-        product_turnover['avg_inventory'] = product_turnover['total_quantity'] / 6  # Simplified assumption
-        product_turnover['turnover_ratio'] = product_turnover['total_quantity'] / product_turnover['avg_inventory']
-        
-        # High and low turnover products
-        high_turnover = product_turnover.nlargest(10, 'turnover_ratio')
-        low_turnover = product_turnover[product_turnover['total_orders'] > 10].nsmallest(10, 'turnover_ratio')
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(high_turnover, x='product_name', y='turnover_ratio',
-                        title='Top 10 High Turnover Products',
-                        color='turnover_ratio',
-                        hover_data=['category', 'total_quantity'])
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.bar(low_turnover, x='product_name', y='turnover_ratio',
-                        title='Top 10 Low Turnover Products',
-                        color='turnover_ratio',
-                        color_continuous_scale='Reds',
-                        hover_data=['category', 'total_quantity'])
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Demand Forecasting
-        st.subheader("🔮 Demand Forecasting")
-        
-        # Simple demand forecasting using moving averages
-        forecast_data = monthly_demand.copy()
-        forecast_data['order_month'] = pd.to_datetime(forecast_data['order_month'])
-        forecast_data = forecast_data.sort_values('order_month')
-        
-        # Calculate moving averages
-        forecast_data['ma_3month'] = forecast_data['quantity'].rolling(window=3).mean()
-        forecast_data['ma_6month'] = forecast_data['quantity'].rolling(window=6).mean()
-        
-        fig = px.line(forecast_data, x='order_month', y=['quantity', 'ma_3month', 'ma_6month'],
-                     title='Demand Forecasting with Moving Averages',
-                     labels={'value': 'Units Sold', 'variable': 'Metric'})
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Stock-out Risk Analysis
-        st.subheader("🚨 Stock-out Risk Analysis")
-        
-        # Identify products with high demand variability
-        product_variability = st.session_state.transactions.groupby(['product_id', 'product_name']).agg({
-            'quantity': ['sum', 'std', 'mean'],
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        product_variability.columns = ['product_id', 'product_name', 'total_quantity', 'demand_std', 'demand_mean', 'order_count']
-        
-        # Calculate coefficient of variation
-        product_variability['cv'] = (product_variability['demand_std'] / product_variability['demand_mean']).fillna(0)
-        product_variability['stock_out_risk'] = product_variability['cv'] * product_variability['total_quantity']
-        
-        high_risk_products = product_variability.nlargest(10, 'stock_out_risk')
-        
-        fig = px.bar(high_risk_products, x='product_name', y='stock_out_risk',
-                    title='Products with Highest Stock-out Risk',
-                    color='stock_out_risk',
-                    color_continuous_scale='Reds',
-                    hover_data=['total_quantity', 'cv'])
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Inventory Optimization Recommendations
-        st.subheader("💡 Inventory Optimization Strategies")
-        
-        strategies = [
-            "🎯 **Fast Movers**: Increase safety stock for high-turnover products with seasonal peaks",
-            "📦 **Slow Movers**: Reduce inventory levels for low-turnover items, implement just-in-time ordering",
-            "🔄 **Seasonal Planning**: Build inventory before festival seasons and major sales events",
-            "📊 **Demand Forecasting**: Use 3-month moving averages for stable products, 6-month for seasonal items",
-            "🚨 **Risk Management**: Monitor high-variability products closely, implement buffer stock",
-            "💰 **ABC Analysis**: Classify products by revenue contribution for prioritized inventory management",
-            "📱 **Automation**: Implement automated reordering for consistent high-demand products"
-        ]
-        
-        for strategy in strategies:
-            st.success(strategy)
-
-    # Q19: Product Rating & Review Dashboard
-    elif dashboard_id == "Q19":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("⭐ Q19: Product Rating & Review Dashboard")
-        st.markdown("Rating distributions, review sentiment, correlation with sales, and product quality insights")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Rating Distribution Analysis
-        st.subheader("📊 Rating Distribution Analysis")
-        
-        # Product rating distribution
-        rating_data = st.session_state.transactions.copy()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Product rating distribution
-            product_rating_dist = rating_data['product_rating'].value_counts().sort_index()
-            fig = px.bar(product_rating_dist, x=product_rating_dist.index, y=product_rating_dist.values,
-                        title='Product Rating Distribution',
-                        labels={'x': 'Rating', 'y': 'Number of Ratings'})
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Customer rating distribution
-            customer_rating_dist = rating_data['customer_rating'].value_counts().sort_index()
-            fig = px.bar(customer_rating_dist, x=customer_rating_dist.index, y=customer_rating_dist.values,
-                        title='Customer Rating Distribution',
-                        labels={'x': 'Rating', 'y': 'Number of Ratings'})
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Rating vs Sales Correlation
-        st.subheader("📈 Rating Impact on Sales Performance")
-        
-        # Analyze correlation between ratings and sales
-        rating_sales_corr = rating_data.groupby('product_rating').agg({
-            'final_amount_inr': 'sum',
-            'quantity': 'sum',
-            'transaction_id': 'count',
-            'return_status': lambda x: (x == 'Returned').sum()
-        }).reset_index()
-        
-        rating_sales_corr.columns = ['product_rating', 'total_revenue', 'total_quantity', 'total_orders', 'return_count']
-        rating_sales_corr['return_rate'] = (rating_sales_corr['return_count'] / rating_sales_corr['total_orders']) * 100
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.scatter(rating_sales_corr, x='product_rating', y='total_revenue',
-                           size='total_orders', title='Rating vs Total Revenue',
-                           labels={'product_rating': 'Product Rating', 'total_revenue': 'Total Revenue'})
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.scatter(rating_sales_corr, x='product_rating', y='return_rate',
-                           size='total_orders', title='Rating vs Return Rate',
-                           labels={'product_rating': 'Product Rating', 'return_rate': 'Return Rate (%)'})
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Category-wise Rating Analysis
-        st.subheader("🏪 Category-wise Rating Performance")
-        
-        category_ratings = rating_data.groupby('category').agg({
-            'product_rating': 'mean',
-            'customer_rating': 'mean',
-            'final_amount_inr': 'sum',
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        category_ratings.columns = ['category', 'avg_product_rating', 'avg_customer_rating', 'total_revenue', 'total_orders']
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(category_ratings.nlargest(10, 'avg_product_rating'), 
-                        x='category', y='avg_product_rating',
-                        title='Top 10 Categories by Product Rating',
-                        color='avg_product_rating')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.bar(category_ratings.nlargest(10, 'avg_customer_rating'), 
-                        x='category', y='avg_customer_rating',
-                        title='Top 10 Categories by Customer Rating',
-                        color='avg_customer_rating')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Price vs Rating Analysis
-        st.subheader("💰 Price vs Rating Relationship")
-        
-        price_rating_data = rating_data.groupby(['category', 'original_price_inr']).agg({
-            'product_rating': 'mean',
-            'customer_rating': 'mean',
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        price_rating_data = price_rating_data[price_rating_data['transaction_id'] > 10]  # Meaningful samples
-        
-        fig = px.scatter(price_rating_data, x='original_price_inr', y='product_rating',
-                        size='transaction_id', color='category',
-                        title='Price vs Product Rating Relationship',
-                        labels={
-                            'original_price_inr': 'Price (₹)',
-                            'product_rating': 'Average Product Rating'
-                        })
-        fig.update_xaxes(tickprefix='₹')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Review Sentiment Insights
-        st.subheader("😊 Review Sentiment & Quality Insights")
-        
-        # Calculate rating metrics
-        rating_metrics = {
-            'Average Product Rating': f"{rating_data['product_rating'].mean():.2f} ⭐",
-            'Average Customer Rating': f"{rating_data['customer_rating'].mean():.2f} ⭐",
-            'Rating Correlation': f"{rating_data['product_rating'].corr(rating_data['customer_rating']):.3f}",
-            'High-Rated Products (>4.5)': f"{(rating_data['product_rating'] > 4.5).sum():,}",
-            'Low-Rated Products (<3.0)': f"{(rating_data['product_rating'] < 3.0).sum():,}"
-        }
-        
-        col1, col2, col3, col4, col5 = st.columns(5)
-        metrics_cols = [col1, col2, col3, col4, col5]
-        
-        for (metric, value), col in zip(rating_metrics.items(), metrics_cols):
-            with col:
-                st.metric(metric, value)
-        
-        # Product Quality Recommendations
-        st.subheader("💡 Product Quality & Improvement Insights")
-        
-        quality_insights = [
-            "🎯 **High Performers**: Products with ratings >4.5 have 3.2x higher sales conversion",
-            "⚠️ **Improvement Areas**: Products with ratings <3.0 show 45% higher return rates",
-            "💰 **Premium Perception**: Higher-priced products maintain better ratings with proper quality",
-            "🔄 **Feedback Loop**: Implement systematic review analysis for product improvement",
-            "⭐ **Rating Targets**: Aim for minimum 4.0 rating across all product categories",
-            "📊 **Quality Monitoring**: Track rating trends for early detection of quality issues",
-            "🎁 **Incentivize Reviews**: Encourage reviews for better product visibility and trust"
-        ]
-        
-        for insight in quality_insights:
-            st.info(insight)
-
-    # Q20: New Product Launch Dashboard - FIXED
-    elif dashboard_id == "Q20":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🚀 Q20: New Product Launch Dashboard")
-        st.markdown("Launch performance tracking, market acceptance, competitive analysis, and success metrics")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Check if required data is available
-        if not hasattr(st.session_state, 'products') or st.session_state.products.empty:
-            st.warning("⚠️ Product data not available for launch analysis")
-            return
-        
-        # New Product Launch Performance
-        st.subheader("📊 New Product Launch Overview")
-        
-        # Analyze product launches by year - FIXED: Handle missing launch_year
-        launch_analysis = st.session_state.products.copy()
-        
-        # Ensure launch_year exists and is valid
-        if 'launch_year' not in launch_analysis.columns:
-            st.warning("⚠️ Launch year data not available in products dataset")
-            return
-            
-        # Filter out invalid launch years
-        launch_analysis = launch_analysis[launch_analysis['launch_year'].notna()]
-        launch_analysis = launch_analysis[launch_analysis['launch_year'].between(2015, 2025)]
-        
-        if launch_analysis.empty:
-            st.warning("⚠️ No valid launch year data available")
-            return
-            
-        launch_analysis = launch_analysis.groupby('launch_year').agg({
-            'product_id': 'count',
-            'rating': 'mean'
-        }).reset_index()
-        
-        launch_analysis.columns = ['launch_year', 'products_launched', 'avg_rating']
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(launch_analysis, x='launch_year', y='products_launched',
-                        title='New Product Launches by Year',
-                        color='products_launched')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.line(launch_analysis, x='launch_year', y='avg_rating',
-                         title='Average Rating of Launched Products by Year',
-                         markers=True)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Launch Success Metrics - FIXED: Better error handling
-        st.subheader("📈 Product Launch Success Metrics")
-        
-        try:
-            # Merge product data with sales data for performance analysis
-            product_performance = st.session_state.transactions.groupby('product_id').agg({
-                'final_amount_inr': 'sum',
-                'quantity': 'sum',
-                'transaction_id': 'count',
-                'customer_rating': 'mean'
-            }).reset_index()
-            
-            # Ensure we have product data to merge
-            if hasattr(st.session_state, 'products'):
-                launch_performance = product_performance.merge(
-                    st.session_state.products[['product_id', 'product_name', 'launch_year', 'category']],
-                    on='product_id',
-                    how='inner'  # Use inner join to only include products with launch data
-                )
-                
-                # Filter out products without launch year
-                launch_performance = launch_performance[launch_performance['launch_year'].notna()]
-                
-                if not launch_performance.empty:
-                    # Calculate launch success metrics
-                    launch_success = launch_performance.groupby('launch_year').agg({
-                        'final_amount_inr': 'sum',
-                        'quantity': 'sum',
-                        'transaction_id': 'count',
-                        'customer_rating': 'mean',
-                        'product_id': 'nunique'
-                    }).reset_index()
-                    
-                    launch_success.columns = ['launch_year', 'total_revenue', 'total_quantity', 'total_orders', 'avg_rating', 'unique_products']
-                    launch_success['revenue_per_product'] = launch_success['total_revenue'] / launch_success['unique_products']
-                    
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        best_launch_year = launch_success.nlargest(1, 'total_revenue')
-                        if not best_launch_year.empty:
-                            st.metric("Most Successful Launch Year", f"{best_launch_year['launch_year'].iloc[0]}")
-                    
-                    with col2:
-                        if not best_launch_year.empty:
-                            st.metric("Highest Revenue Year", f"₹{best_launch_year['total_revenue'].iloc[0]/1e6:.1f}M")
-                    
-                    with col3:
-                        highest_rated_launch = launch_success.nlargest(1, 'avg_rating')
-                        if not highest_rated_launch.empty:
-                            st.metric("Highest Rated Launch Year", f"{highest_rated_launch['avg_rating'].iloc[0]:.1f} ⭐")
-                    
-                    with col4:
-                        most_products_launch = launch_success.nlargest(1, 'unique_products')
-                        if not most_products_launch.empty:
-                            st.metric("Most Products Launched", f"{most_products_launch['unique_products'].iloc[0]}")
-                else:
-                    st.info("📊 No product launch performance data available")
-            else:
-                st.warning("⚠️ Product catalog data not available")
-                
-        except Exception as e:
-            st.error(f"❌ Error calculating launch metrics: {str(e)}")
-        
-        # Market Acceptance Analysis - FIXED: Better date handling
-        st.subheader("🎯 Market Acceptance Analysis")
-        
-        try:
-            if hasattr(st.session_state, 'products') and hasattr(st.session_state, 'transactions'):
-                # Get first purchase date for each product
-                product_first_sale = st.session_state.transactions.groupby('product_id')['order_date'].min().reset_index()
-                product_first_sale.columns = ['product_id', 'first_sale_date']
-                
-                # Ensure dates are properly formatted
-                product_first_sale['first_sale_date'] = pd.to_datetime(product_first_sale['first_sale_date'], errors='coerce')
-                product_first_sale = product_first_sale.dropna(subset=['first_sale_date'])
-                
-                # Merge with product launch data
-                product_adoption = product_performance.merge(product_first_sale, on='product_id', how='inner')
-                
-                # Ensure we have launch year data
-                if 'launch_year' in st.session_state.products.columns:
-                    product_adoption = product_adoption.merge(
-                        st.session_state.products[['product_id', 'launch_year']], 
-                        on='product_id', 
-                        how='inner'
-                    )
-                    
-                    # Filter valid data
-                    product_adoption = product_adoption[product_adoption['launch_year'].notna()]
-                    product_adoption['launch_date'] = pd.to_datetime(
-                        product_adoption['launch_year'].astype(int).astype(str) + '-01-01', 
-                        errors='coerce'
-                    )
-                    
-                    product_adoption = product_adoption.dropna(subset=['launch_date', 'first_sale_date'])
-                    
-                    # Calculate days to first sale
-                    product_adoption['days_to_first_sale'] = (
-                        product_adoption['first_sale_date'] - product_adoption['launch_date']
-                    ).dt.days
-                    
-                    # Filter reasonable values
-                    product_adoption = product_adoption[
-                        (product_adoption['days_to_first_sale'] >= 0) & 
-                        (product_adoption['days_to_first_sale'] <= 365)
-                    ]
-                    
-                    if not product_adoption.empty:
-                        # Adoption speed analysis
-                        adoption_speed = product_adoption.groupby('launch_year')['days_to_first_sale'].mean().reset_index()
-                        
-                        fig = px.bar(adoption_speed, x='launch_year', y='days_to_first_sale',
-                                    title='Average Days to First Sale by Launch Year',
-                                    color='days_to_first_sale',
-                                    color_continuous_scale='RdYlGn_r')
-                        fig.update_layout(xaxis_title='Launch Year', yaxis_title='Average Days to First Sale')
-                        st.plotly_chart(fig, use_container_width=True)
-                    else:
-                        st.info("📊 No adoption speed data available")
-                else:
-                    st.warning("⚠️ Launch year data not available")
-            else:
-                st.warning("⚠️ Required data not available for market acceptance analysis")
-                
-        except Exception as e:
-            st.error(f"❌ Error in market acceptance analysis: {str(e)}")
-        
-        # Competitive Analysis for New Launches - FIXED: Better data validation
-        st.subheader("⚔️ Competitive Launch Analysis")
-        
-        try:
-            if hasattr(st.session_state, 'products'):
-                # Ensure we have the merged data
-                if 'launch_performance' in locals() and not launch_performance.empty:
-                    category_launch_perf = launch_performance.groupby('category').agg({
-                        'final_amount_inr': 'sum',
-                        'quantity': 'sum',
-                        'customer_rating': 'mean',
-                        'product_id': 'nunique'
-                    }).reset_index()
-                    
-                    category_launch_perf.columns = ['category', 'total_revenue', 'total_quantity', 'avg_rating', 'products_launched']
-                    category_launch_perf['success_rate'] = (category_launch_perf['total_revenue'] / category_launch_perf['products_launched'])
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        fig = px.bar(category_launch_perf.nlargest(10, 'total_revenue'), 
-                                    x='category', y='total_revenue',
-                                    title='Top Categories for New Product Revenue',
-                                    color='total_revenue')
-                        fig.update_yaxes(tickprefix='₹')
-                        st.plotly_chart(fig, use_container_width=True)
-                    
-                    with col2:
-                        fig = px.bar(category_launch_perf.nlargest(10, 'success_rate'), 
-                                    x='category', y='success_rate',
-                                    title='Most Successful Categories (Revenue per Product)',
-                                    color='success_rate')
-                        fig.update_yaxes(tickprefix='₹')
-                        st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("📊 No category launch performance data available")
-            else:
-                st.warning("⚠️ Product data not available")
-                
-        except Exception as e:
-            st.error(f"❌ Error in competitive analysis: {str(e)}")
-        
-        # Launch Success Factors - FIXED: Better error handling
-        st.subheader("🔍 Launch Success Factors Analysis")
-        
-        try:
-            if 'launch_performance' in locals() and not launch_performance.empty:
-                # Analyze what makes a successful launch
-                success_factors = launch_performance.copy()
-                success_factors['launch_success'] = success_factors['final_amount_inr'] > success_factors['final_amount_inr'].median()
-                
-                success_comparison = success_factors.groupby('launch_success').agg({
-                    'customer_rating': 'mean',
-                    'quantity': 'mean',
-                    'final_amount_inr': 'mean'
-                }).reset_index()
-                
-                success_comparison['status'] = success_comparison['launch_success'].map({True: 'Successful', False: 'Less Successful'})
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    if len(success_comparison) >= 2:
-                        rating_diff = (success_comparison[success_comparison['status'] == 'Successful']['customer_rating'].iloc[0] - 
-                                     success_comparison[success_comparison['status'] == 'Less Successful']['customer_rating'].iloc[0])
-                        st.metric("Rating Impact", f"+{rating_diff:.2f} ⭐")
-                
-                with col2:
-                    if len(success_comparison) >= 2:
-                        quantity_diff = (success_comparison[success_comparison['status'] == 'Successful']['quantity'].iloc[0] / 
-                                       success_comparison[success_comparison['status'] == 'Less Successful']['quantity'].iloc[0])
-                        st.metric("Sales Volume Multiplier", f"{quantity_diff:.1f}x")
-                
-                with col3:
-                    if len(success_comparison) >= 2:
-                        revenue_diff = (success_comparison[success_comparison['status'] == 'Successful']['final_amount_inr'].iloc[0] / 
-                                      success_comparison[success_comparison['status'] == 'Less Successful']['final_amount_inr'].iloc[0])
-                        st.metric("Revenue Multiplier", f"{revenue_diff:.1f}x")
-            else:
-                st.info("📊 No success factors data available")
-                
-        except Exception as e:
-            st.error(f"❌ Error in success factors analysis: {str(e)}")
-        
-        # Product Launch Recommendations
-        st.subheader("💡 New Product Launch Strategy")
-        
-        launch_strategies = [
-            "🎯 **Category Focus**: Prioritize Electronics and Fashion categories showing highest success rates",
-            "⭐ **Quality First**: Ensure minimum 4.0 rating target before major marketing push",
-            "📅 **Timing Strategy**: Plan launches before major festival seasons for maximum impact",
-            "📊 **Pre-launch Testing**: Implement limited market testing before full-scale launch",
-            "👥 **Influencer Marketing**: Leverage social media influencers for new product categories",
-            "💰 **Pricing Strategy**: Competitive pricing with initial promotional discounts",
-            "🔄 **Feedback Integration**: Rapid iteration based on early customer feedback",
-            "📈 **Performance Monitoring**: Track key metrics for first 90 days post-launch"
-        ]
-        
-        for strategy in launch_strategies:
-            st.success(strategy)
-
-    # Q21: Delivery Performance Dashboard - FIXED
-    elif dashboard_id == "Q21":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🚚 Q21: Delivery Performance Dashboard")
-        st.markdown("Delivery times, on-time delivery rates, geographic performance variations, and operational efficiency")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Delivery Performance Overview - FIXED: Better data validation
-        st.subheader("📊 Delivery Performance Metrics")
-        
-        delivery_data = st.session_state.transactions.copy()
-        
-        # Filter valid delivery data - FIXED: Better outlier handling
-        if 'delivery_days' not in delivery_data.columns:
-            st.error("❌ Delivery days data not available in the dataset")
-            return
-            
-        # Convert to numeric and handle errors
-        delivery_data['delivery_days'] = pd.to_numeric(delivery_data['delivery_days'], errors='coerce')
-        
-        # Remove invalid and extreme outliers
-        delivery_data = delivery_data[
-            (delivery_data['delivery_days'] > 0) & 
-            (delivery_data['delivery_days'] < 30)  # Reasonable delivery window
-        ].dropna(subset=['delivery_days'])
-        
-        if delivery_data.empty:
-            st.warning("⚠️ No valid delivery data available for analysis")
-            return
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            avg_delivery_days = delivery_data['delivery_days'].mean()
-            st.metric("Average Delivery Days", f"{avg_delivery_days:.1f} days")
-        
-        with col2:
-            on_time_rate = (delivery_data['delivery_days'] <= 7).mean() * 100
-            st.metric("On-time Delivery Rate", f"{on_time_rate:.1f}%")
-        
-        with col3:
-            express_delivery = (delivery_data['delivery_days'] <= 3).sum()
-            st.metric("Express Deliveries (≤3 days)", f"{express_delivery:,}")
-        
-        with col4:
-            delayed_delivery = (delivery_data['delivery_days'] > 7).sum()
-            st.metric("Delayed Deliveries (>7 days)", f"{delayed_delivery:,}")
-        
-        # Delivery Performance Distribution - FIXED: Better visualization
-        st.subheader("📈 Delivery Days Distribution")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Delivery days histogram with better binning
-            fig = px.histogram(delivery_data, x='delivery_days', 
-                             title='Distribution of Delivery Days',
-                             nbins=15,
-                             color_discrete_sequence=['#FF9900'])
-            fig.update_layout(xaxis_title='Delivery Days', yaxis_title='Number of Orders')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Delivery performance by delivery type - FIXED: Check column existence
-            if 'delivery_type' in delivery_data.columns:
-                delivery_type_perf = delivery_data.groupby('delivery_type').agg({
-                    'delivery_days': 'mean',
-                    'customer_rating': 'mean',
-                    'transaction_id': 'count'
-                }).reset_index()
-                
-                # Filter out delivery types with insufficient data
-                delivery_type_perf = delivery_type_perf[delivery_type_perf['transaction_id'] > 10]
-                
-                if not delivery_type_perf.empty:
-                    fig = px.bar(delivery_type_perf, x='delivery_type', y='delivery_days',
-                                title='Average Delivery Days by Delivery Type',
-                                color='delivery_days',
-                                hover_data=['customer_rating'])
-                    fig.update_layout(xaxis_title='Delivery Type', yaxis_title='Average Delivery Days')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("📊 Insufficient data for delivery type analysis")
-            else:
-                st.info("📊 Delivery type data not available")
-        
-        # Geographic Performance Variations - FIXED: Better state data handling
-        st.subheader("🗺️ Geographic Delivery Performance")
-        
-        # Delivery performance by state - FIXED: Check state column
-        if 'customer_state' in delivery_data.columns:
-            state_delivery = delivery_data.groupby('customer_state').agg({
-                'delivery_days': 'mean',
-                'customer_rating': 'mean',
-                'transaction_id': 'count'
-            }).reset_index()
-            
-            state_delivery.columns = ['state', 'avg_delivery_days', 'avg_rating', 'order_count']
-            
-            # Filter states with sufficient data
-            state_delivery = state_delivery[state_delivery['order_count'] > 10]
-            
-            if not state_delivery.empty:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Best performing states
-                    best_states = state_delivery.nsmallest(10, 'avg_delivery_days')
-                    fig = px.bar(best_states, x='state', y='avg_delivery_days',
-                                title='Top 10 States - Fastest Delivery',
-                                color='avg_delivery_days',
-                                color_continuous_scale='Greens_r')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Worst performing states
-                    worst_states = state_delivery.nlargest(10, 'avg_delivery_days')
-                    fig = px.bar(worst_states, x='state', y='avg_delivery_days',
-                                title='Top 10 States - Slowest Delivery',
-                                color='avg_delivery_days',
-                                color_continuous_scale='Reds')
-                    st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("📊 Insufficient state-level delivery data")
-        else:
-            st.info("📊 State information not available for geographic analysis")
-        
-        # Customer Satisfaction vs Delivery Performance - FIXED: Better correlation analysis
-        st.subheader("⭐ Delivery Impact on Customer Satisfaction")
-        
-        try:
-            # Correlation between delivery days and customer rating
-            # Ensure customer_rating exists and is numeric
-            if 'customer_rating' in delivery_data.columns:
-                delivery_data['customer_rating'] = pd.to_numeric(delivery_data['customer_rating'], errors='coerce')
-                delivery_data = delivery_data.dropna(subset=['customer_rating'])
-                
-                # Create bins for delivery days
-                delivery_rating_data = delivery_data.copy()
-                delivery_rating_data['delivery_bin'] = pd.cut(
-                    delivery_rating_data['delivery_days'], 
-                    bins=[0, 2, 4, 7, 10, 15, 30],
-                    labels=['0-2', '3-4', '5-7', '8-10', '11-15', '16+']
-                )
-                
-                delivery_rating_corr = delivery_rating_data.groupby('delivery_bin').agg({
-                    'customer_rating': 'mean',
-                    'transaction_id': 'count'
-                }).reset_index()
-                
-                delivery_rating_corr.columns = ['delivery_days_range', 'avg_rating', 'order_count']
-                
-                if not delivery_rating_corr.empty:
-                    fig = px.scatter(delivery_rating_corr, 
-                                   x='delivery_days_range', 
-                                   y='avg_rating',
-                                   size='order_count', 
-                                   title='Delivery Speed vs Customer Rating',
-                                   labels={
-                                       'delivery_days_range': 'Delivery Days Range', 
-                                       'avg_rating': 'Average Customer Rating'
-                                   })
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Calculate correlation coefficient
-                    correlation = delivery_data['delivery_days'].corr(delivery_data['customer_rating'])
-                    st.metric("Delivery-Rating Correlation", f"{correlation:.3f}")
-                else:
-                    st.info("📊 Insufficient data for delivery-rating correlation")
-            else:
-                st.info("📊 Customer rating data not available")
-                
-        except Exception as e:
-            st.error(f"❌ Error in satisfaction analysis: {str(e)}")
-        
-        # Operational Efficiency Insights
-        st.subheader("💡 Operational Efficiency Recommendations")
-        
-        insights = [
-            "🚀 **Fastest Regions**: Metro cities achieve 2.8-day average delivery - replicate successful practices",
-            "📦 **Delivery Optimization**: Target 85% on-time delivery rate for next quarter",
-            "⭐ **Quality Impact**: Each additional delivery day reduces customer rating by 0.15 points on average",
-            "🏙️ **Infrastructure Gaps**: Tier 2 cities need logistics improvement - 45% longer delivery times",
-            "💰 **Cost-Benefit**: Express delivery (≤3 days) increases customer satisfaction by 22%",
-            "🔄 **Process Improvement**: Implement real-time tracking for delayed deliveries",
-            "📊 **Performance Monitoring**: Set state-wise delivery time targets"
-        ]
-        
-        for insight in insights:
-            st.info(insight)
-
-    # Q22: Payment Analytics Dashboard
-    elif dashboard_id == "Q22":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("💳 Q22: Payment Analytics Dashboard")
-        st.markdown("Payment method preferences, transaction success rates, payment trends evolution, and financial partnership insights")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Payment Method Overview
-        st.subheader("📊 Payment Method Performance")
-        
-        # Payment method analysis
-        payment_data = st.session_state.transactions.copy()
-        
-        # Payment method distribution
-        payment_distribution = payment_data['payment_method'].value_counts().reset_index()
-        payment_distribution.columns = ['payment_method', 'transaction_count']
-        payment_distribution['market_share'] = (payment_distribution['transaction_count'] / payment_distribution['transaction_count'].sum()) * 100
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Payment method pie chart
-            fig = px.pie(payment_distribution, values='transaction_count', names='payment_method',
-                        title='Payment Method Distribution')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Payment method performance
-            payment_performance = payment_data.groupby('payment_method').agg({
-                'final_amount_inr': 'sum',
-                'transaction_id': 'count',
-                'customer_rating': 'mean'
-            }).reset_index()
-            
-            payment_performance.columns = ['payment_method', 'total_revenue', 'transaction_count', 'avg_rating']
-            payment_performance['avg_order_value'] = payment_performance['total_revenue'] / payment_performance['transaction_count']
-            
-            fig = px.bar(payment_performance, x='payment_method', y='avg_order_value',
-                        title='Average Order Value by Payment Method',
-                        color='avg_order_value',
-                        hover_data=['avg_rating'])
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Payment Trends Evolution
-        st.subheader("📈 Payment Method Trends Over Time")
-        
-        # Payment method evolution by year
-        payment_trends = payment_data.groupby(['order_year', 'payment_method']).agg({
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        # Calculate percentage share each year
-        yearly_totals = payment_trends.groupby('order_year')['transaction_id'].transform('sum')
-        payment_trends['percentage_share'] = (payment_trends['transaction_id'] / yearly_totals) * 100
-        
-        fig = px.line(payment_trends, x='order_year', y='percentage_share', color='payment_method',
-                     title='Payment Method Market Share Evolution',
-                     markers=True)
-        fig.update_layout(xaxis_title='Year', yaxis_title='Market Share (%)')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Transaction Success Analysis
-        st.subheader("✅ Transaction Success & Failure Analysis")
-        
-        # Simulate transaction success rates (in real scenario, this would come from payment gateway data)
-        payment_success_rates = {
-            'UPI': 98.5,
-            'Credit Card': 97.2,
-            'Debit Card': 96.8,
-            'Net Banking': 95.4,
-            'Cash on Delivery': 99.9,  # COD always "succeeds"
-            'Wallet': 97.8,
-            'EMI': 96.5
-        }
-        
-        # Create success rate dataframe
-        success_df = pd.DataFrame({
-            'payment_method': list(payment_success_rates.keys()),
-            'success_rate': list(payment_success_rates.values())
-        })
-        
-        # Merge with actual payment data
-        payment_analysis = payment_performance.merge(success_df, on='payment_method', how='left')
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(payment_analysis, x='payment_method', y='success_rate',
-                        title='Transaction Success Rates by Payment Method',
-                        color='success_rate',
-                        color_continuous_scale='RdYlGn')
-            fig.update_layout(yaxis_title='Success Rate (%)')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Revenue impact of payment methods
-            fig = px.scatter(payment_analysis, x='success_rate', y='avg_order_value',
-                           size='transaction_count', color='payment_method',
-                           title='Payment Method Efficiency: Success Rate vs Order Value',
-                           labels={'success_rate': 'Success Rate (%)', 'avg_order_value': 'Avg Order Value (₹)'})
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Financial Partnership Insights
-        st.subheader("🤝 Financial Partnership Opportunities")
-        
-        # Payment method growth analysis
-        current_year = payment_data['order_year'].max()
-        previous_year = current_year - 1
-        
-        current_year_data = payment_trends[payment_trends['order_year'] == current_year]
-        previous_year_data = payment_trends[payment_trends['order_year'] == previous_year]
-        
-        growth_analysis = current_year_data.merge(previous_year_data, on='payment_method', suffixes=('_current', '_previous'))
-        growth_analysis['growth_rate'] = ((growth_analysis['transaction_id_current'] - growth_analysis['transaction_id_previous']) / growth_analysis['transaction_id_previous']) * 100
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        # Find fastest growing payment methods
-        fastest_growing = growth_analysis.nlargest(1, 'growth_rate')
-        highest_volume = payment_analysis.nlargest(1, 'transaction_count')
-        highest_value = payment_analysis.nlargest(1, 'avg_order_value')
-        most_reliable = payment_analysis.nlargest(1, 'success_rate')
-        
-        with col1:
-            st.metric("Fastest Growing", fastest_growing['payment_method'].iloc[0], f"{fastest_growing['growth_rate'].iloc[0]:.1f}%")
-        
-        with col2:
-            st.metric("Most Popular", highest_volume['payment_method'].iloc[0], f"{highest_volume['transaction_count'].iloc[0]:,}")
-        
-        with col3:
-            st.metric("Highest Value", highest_value['payment_method'].iloc[0], f"₹{highest_value['avg_order_value'].iloc[0]:.0f}")
-        
-        with col4:
-            st.metric("Most Reliable", most_reliable['payment_method'].iloc[0], f"{most_reliable['success_rate'].iloc[0]:.1f}%")
-        
-        # Partnership Recommendations
-        st.subheader("💡 Financial Partnership Strategy")
-        
-        recommendations = [
-            "🎯 **UPI Dominance**: UPI captures 42% market share with 98.5% success rate - strengthen UPI partnerships",
-            "📈 **Digital Growth**: Digital payments growing at 35% YoY - focus on wallet and UPI integrations",
-            "💰 **High-Value Payments**: Credit card users spend 45% more on average - premium payment experience",
-            "🔄 **COD Optimization**: COD still 18% of transactions - implement pre-paid incentives",
-            "🌐 **Regional Variations**: Payment preferences vary by region - localized payment options",
-            "🔒 **Security Focus**: Implement tokenization for card payments to improve success rates",
-            "📱 **Mobile First**: 67% of transactions via mobile - optimize mobile payment experience"
-        ]
-        
-        for rec in recommendations:
-            st.success(rec)
-
-    # Q23: Return & Cancellation Dashboard
-    elif dashboard_id == "Q23":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🔄 Q23: Return & Cancellation Dashboard")
-        st.markdown("Return rates, return reasons, cost impact, and quality improvement opportunities")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Returns & Cancellations Overview
-        st.subheader("📊 Returns & Cancellations Analysis")
-        
-        returns_data = st.session_state.transactions.copy()
-        
-        # Calculate return and cancellation rates
-        total_orders = len(returns_data)
-        returned_orders = (returns_data['return_status'] == 'Returned').sum()
-        cancelled_orders = (returns_data['return_status'] == 'Cancelled').sum() if 'Cancelled' in returns_data['return_status'].values else 0
-        
-        return_rate = (returned_orders / total_orders) * 100
-        cancellation_rate = (cancelled_orders / total_orders) * 100 if cancelled_orders > 0 else 0
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Total Orders", f"{total_orders:,}")
-        
-        with col2:
-            st.metric("Returned Orders", f"{returned_orders:,}", f"{return_rate:.1f}%")
-        
-        with col3:
-            st.metric("Cancelled Orders", f"{cancelled_orders:,}", f"{cancellation_rate:.1f}%")
-        
-        with col4:
-            successful_orders = total_orders - returned_orders - cancelled_orders
-            success_rate = (successful_orders / total_orders) * 100
-            st.metric("Successful Orders", f"{successful_orders:,}", f"{success_rate:.1f}%")
-        
-        # Return Analysis by Category
-        st.subheader("🏪 Return Rates by Category")
-        
-        category_returns = returns_data.groupby('category').agg({
-            'transaction_id': 'count',
-            'return_status': lambda x: (x == 'Returned').sum(),
-            'final_amount_inr': 'sum'
-        }).reset_index()
-        
-        category_returns.columns = ['category', 'total_orders', 'returned_orders', 'total_revenue']
-        category_returns['return_rate'] = (category_returns['returned_orders'] / category_returns['total_orders']) * 100
-        category_returns['revenue_loss'] = (category_returns['returned_orders'] / category_returns['total_orders']) * category_returns['total_revenue']
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Highest return rate categories
-            high_return_categories = category_returns.nlargest(10, 'return_rate')
-            fig = px.bar(high_return_categories, x='category', y='return_rate',
-                        title='Categories with Highest Return Rates',
-                        color='return_rate',
-                        color_continuous_scale='Reds')
-            fig.update_layout(yaxis_title='Return Rate (%)')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Revenue impact of returns
-            high_revenue_loss = category_returns.nlargest(10, 'revenue_loss')
-            fig = px.bar(high_revenue_loss, x='category', y='revenue_loss',
-                        title='Revenue Loss Due to Returns by Category',
-                        color='revenue_loss',
-                        color_continuous_scale='Oranges')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Return Reasons Analysis (Simulated - in real scenario would come from returns database)
-        st.subheader("🔍 Return Reasons Analysis")
-        
-        # Simulated return reasons data
-        return_reasons = {
-            'Size Issues': 35,
-            'Product Damage': 20,
-            'Wrong Item': 15,
-            'Not as Described': 12,
-            'Changed Mind': 10,
-            'Quality Issues': 8
-        }
-        
-        reasons_df = pd.DataFrame({
-            'reason': list(return_reasons.keys()),
-            'percentage': list(return_reasons.values())
-        })
-        
-        fig = px.pie(reasons_df, values='percentage', names='reason',
-                    title='Distribution of Return Reasons')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Product Quality vs Returns
-        st.subheader("⭐ Product Quality & Return Correlation")
-        
-        # Analyze relationship between product ratings and return rates
-        quality_returns_data = returns_data.groupby('product_rating').agg({
-            'transaction_id': 'count',
-            'return_status': lambda x: (x == 'Returned').sum()
-        }).reset_index()
-        
-        quality_returns_data.columns = ['product_rating', 'total_orders', 'returned_orders']
-        quality_returns_data['return_rate'] = (quality_returns_data['returned_orders'] / quality_returns_data['total_orders']) * 100
-        
-        fig = px.scatter(quality_returns_data, x='product_rating', y='return_rate',
-                        size='total_orders', title='Product Rating vs Return Rate',
-                        labels={'product_rating': 'Product Rating', 'return_rate': 'Return Rate (%)'})
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Cost Impact Analysis
-        st.subheader("💰 Financial Impact of Returns")
-        
-        # Calculate cost impact
-        avg_order_value = returns_data['final_amount_inr'].mean()
-        total_return_cost = returned_orders * avg_order_value * 0.3  # Assuming 30% cost of returns
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Estimated Return Cost", f"₹{total_return_cost:,.0f}")
-        
-        with col2:
-            potential_savings = total_return_cost * 0.2  # 20% reduction target
-            st.metric("Potential Savings (20% reduction)", f"₹{potential_savings:,.0f}")
-        
-        with col3:
-            avg_processing_cost = total_return_cost / returned_orders if returned_orders > 0 else 0
-            st.metric("Avg Cost per Return", f"₹{avg_processing_cost:.0f}")
-        
-        # Quality Improvement Opportunities
-        st.subheader("🔧 Quality Improvement Strategies")
-        
-        improvement_areas = [
-            "📏 **Size Standardization**: 35% returns due to size issues - implement virtual try-on and better size charts",
-            "📦 **Packaging Improvement**: 20% returns due to damage - enhance packaging quality standards",
-            "📝 **Product Descriptions**: 12% returns for 'not as described' - improve product photography and descriptions",
-            "🔍 **Quality Control**: 8% returns for quality issues - strengthen pre-shipment quality checks",
-            "🔄 **Return Process**: Streamline return process to reduce processing costs by 15%",
-            "📊 **Predictive Analytics**: Identify high-risk products before launch using historical return data",
-            "🎯 **Customer Education**: Provide better product information to reduce 'changed mind' returns"
-        ]
-        
-        for area in improvement_areas:
-            st.info(area)
-
-    # Q24: Customer Service Dashboard
-    elif dashboard_id == "Q24":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("📞 Q24: Customer Service Dashboard")
-        st.markdown("Customer satisfaction scores, complaint categories, resolution times, and service quality improvements")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Customer Service Overview
-        st.subheader("📊 Customer Service Performance")
-        
-        # Using customer ratings as proxy for satisfaction (in real scenario, would have CSAT data)
-        service_data = st.session_state.transactions.copy()
-        
-        # Calculate service metrics
-        avg_rating = service_data['customer_rating'].mean()
-        rating_distribution = service_data['customer_rating'].value_counts().sort_index()
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Average Customer Rating", f"{avg_rating:.2f} ⭐")
-        
-        with col2:
-            high_ratings = (service_data['customer_rating'] >= 4).sum()
-            high_rating_percent = (high_ratings / len(service_data)) * 100
-            st.metric("High Ratings (4+ stars)", f"{high_rating_percent:.1f}%")
-        
-        with col3:
-            low_ratings = (service_data['customer_rating'] <= 2).sum()
-            low_rating_percent = (low_ratings / len(service_data)) * 100
-            st.metric("Low Ratings (≤2 stars)", f"{low_rating_percent:.1f}%")
-        
-        with col4:
-            response_rate = 89.5  # Simulated data
-            st.metric("Customer Query Response Rate", f"{response_rate}%")
-        
-        # Rating Distribution
-        st.subheader("📈 Customer Rating Distribution")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(rating_distribution, x=rating_distribution.index, y=rating_distribution.values,
-                        title='Customer Rating Distribution',
-                        labels={'x': 'Rating', 'y': 'Number of Ratings'},
-                        color=rating_distribution.values)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Rating trends over time
-            rating_trends = service_data.groupby('order_year')['customer_rating'].mean().reset_index()
-            fig = px.line(rating_trends, x='order_year', y='customer_rating',
-                         title='Customer Rating Trend Over Time',
-                         markers=True)
-            fig.update_layout(xaxis_title='Year', yaxis_title='Average Rating')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Complaint Categories Analysis (Simulated)
-        st.subheader("📋 Complaint Categories Analysis")
-        
-        # Simulated complaint categories
-        complaint_categories = {
-            'Delivery Issues': 32,
-            'Product Quality': 28,
-            'Payment Problems': 15,
-            'Return Process': 12,
-            'Website/App Issues': 8,
-            'Customer Support': 5
-        }
-        
-        complaints_df = pd.DataFrame({
-            'category': list(complaint_categories.keys()),
-            'percentage': list(complaint_categories.values())
-        })
-        
-        fig = px.pie(complaints_df, values='percentage', names='category',
-                    title='Distribution of Customer Complaints by Category')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Resolution Time Analysis (Simulated)
-        st.subheader("⏱️ Service Resolution Times")
-        
-        # Simulated resolution time data
-        resolution_times = {
-            'Delivery Issues': 24,
-            'Product Quality': 48,
-            'Payment Problems': 6,
-            'Return Process': 72,
-            'Website/App Issues': 12,
-            'Customer Support': 4
-        }
-        
-        resolution_df = pd.DataFrame({
-            'category': list(resolution_times.keys()),
-            'hours': list(resolution_times.values())
-        })
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(resolution_df, x='category', y='hours',
-                        title='Average Resolution Time by Complaint Category',
-                        color='hours',
-                        color_continuous_scale='Viridis')
-            fig.update_layout(yaxis_title='Resolution Time (Hours)')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Customer satisfaction by resolution time
-            satisfaction_vs_time = pd.DataFrame({
-                'resolution_time': [2, 8, 24, 48, 72],
-                'satisfaction_score': [95, 88, 75, 60, 45]
-            })
-            
-            fig = px.line(satisfaction_vs_time, x='resolution_time', y='satisfaction_score',
-                         title='Customer Satisfaction vs Resolution Time',
-                         markers=True)
-            fig.update_layout(xaxis_title='Resolution Time (Hours)', yaxis_title='Satisfaction Score')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Service Quality Improvement
-        st.subheader("🚀 Service Quality Improvement Initiatives")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            current_resolution_time = 28  # hours
-            target_resolution_time = 20
-            st.metric("Avg Resolution Time", f"{current_resolution_time}h", f"-{current_resolution_time - target_resolution_time}h")
-        
-        with col2:
-            current_satisfaction = 82  # %
-            target_satisfaction = 88
-            st.metric("Customer Satisfaction", f"{current_satisfaction}%", f"+{target_satisfaction - current_satisfaction}%")
-        
-        with col3:
-            first_contact_resolution = 68  # %
-            target_fcr = 75
-            st.metric("First Contact Resolution", f"{first_contact_resolution}%", f"+{target_fcr - first_contact_resolution}%")
-        
-        # Improvement Recommendations
-        st.subheader("💡 Customer Service Enhancement Strategies")
-        
-        strategies = [
-            "🎯 **Quick Response**: Aim for 2-hour response time for critical issues to improve satisfaction by 15%",
-            "📞 **24/7 Support**: Implement round-the-clock support for premium customers",
-            "🤖 **Chatbot Integration**: Handle 40% of common queries automatically to reduce resolution time",
-            "📊 **Proactive Support**: Identify potential issues before customers report them",
-            "🎓 **Agent Training**: Specialized training for complex product categories",
-            "📱 **Mobile Optimization**: Improve mobile app support experience",
-            "🔍 **Root Cause Analysis**: Systematic analysis of recurring complaint categories"
-        ]
-        
-        for strategy in strategies:
-            st.success(strategy)
-
-    # Q25: Supply Chain Dashboard - FIXED
-    elif dashboard_id == "Q25":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🏭 Q25: Supply Chain Dashboard")
-        st.markdown("Supplier performance, delivery reliability, cost analysis, and vendor management insights")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Supply Chain Overview - FIXED: Better data validation
-        st.subheader("📊 Supply Chain Performance Metrics")
-        
-        supply_data = st.session_state.transactions.copy()
-        
-        # Check if brand data is available
-        if 'brand' not in supply_data.columns:
-            st.error("❌ Brand/supplier data not available in the dataset")
-            return
-            
-        # Supplier/Brand performance analysis - FIXED: Handle missing columns
-        supplier_performance = supply_data.groupby('brand').agg({
-            'final_amount_inr': 'sum',
-            'quantity': 'sum',
-            'transaction_id': 'count',
-            'customer_rating': 'mean'
-        }).reset_index()
-        
-        # Add delivery days if available
-        if 'delivery_days' in supply_data.columns:
-            supplier_performance['avg_delivery_days'] = supply_data.groupby('brand')['delivery_days'].mean().values
-        else:
-            supplier_performance['avg_delivery_days'] = 5.0  # Default value
-        
-        # Add return data if available
-        if 'return_status' in supply_data.columns:
-            supplier_performance['return_count'] = supply_data.groupby('brand')['return_status'].apply(
-                lambda x: (x == 'Returned').sum()
-            ).values
-        else:
-            supplier_performance['return_count'] = 0
-        
-        supplier_performance.columns = ['brand', 'total_revenue', 'total_quantity', 'total_orders', 'avg_rating', 'avg_delivery_days', 'return_count']
-        supplier_performance['return_rate'] = (supplier_performance['return_count'] / supplier_performance['total_orders']) * 100
-        
-        # Filter out brands with insufficient data
-        supplier_performance = supplier_performance[supplier_performance['total_orders'] > 10]
-        
-        if supplier_performance.empty:
-            st.warning("⚠️ No sufficient supplier data available for analysis")
-            return
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            top_supplier = supplier_performance.nlargest(1, 'total_revenue')
-            if not top_supplier.empty:
-                st.metric("Top Performing Brand", top_supplier['brand'].iloc[0])
-        
-        with col2:
-            fastest_delivery = supplier_performance.nsmallest(1, 'avg_delivery_days')
-            if not fastest_delivery.empty:
-                st.metric("Fastest Delivery", fastest_delivery['brand'].iloc[0], 
-                         f"{fastest_delivery['avg_delivery_days'].iloc[0]:.1f} days")
-        
-        with col3:
-            highest_quality = supplier_performance.nlargest(1, 'avg_rating')
-            if not highest_quality.empty:
-                st.metric("Highest Quality", highest_quality['brand'].iloc[0], 
-                         f"{highest_quality['avg_rating'].iloc[0]:.1f} ⭐")
-        
-        with col4:
-            lowest_returns = supplier_performance.nsmallest(1, 'return_rate')
-            if not lowest_returns.empty:
-                st.metric("Lowest Returns", lowest_returns['brand'].iloc[0], 
-                         f"{lowest_returns['return_rate'].iloc[0]:.1f}%")
-        
-        # Supplier Performance Matrix - FIXED: Better data validation
-        st.subheader("📈 Supplier Performance Analysis")
-        
-        # Create supplier performance matrix
-        performance_matrix = supplier_performance.copy()
-        
-        # Calculate delivery reliability score
-        performance_matrix['on_time_rate'] = 100 - (
-            performance_matrix['avg_delivery_days'] / performance_matrix['avg_delivery_days'].max() * 100
-        )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Delivery reliability vs Quality - FIXED: Handle empty data
-            if not performance_matrix.empty:
-                fig = px.scatter(performance_matrix, x='avg_delivery_days', y='avg_rating',
-                               size='total_revenue', color='return_rate',
-                               hover_name='brand',
-                               title='Supplier Performance: Delivery vs Quality',
-                               labels={
-                                   'avg_delivery_days': 'Average Delivery Days',
-                                   'avg_rating': 'Average Customer Rating',
-                                   'return_rate': 'Return Rate (%)',
-                                   'total_revenue': 'Total Revenue'
-                               })
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("📊 No data available for performance matrix")
-        
-        with col2:
-            # Revenue contribution vs Return rate - FIXED: Better scaling
-            if not performance_matrix.empty:
-                fig = px.scatter(performance_matrix, x='total_revenue', y='return_rate',
-                               size='total_orders', color='avg_delivery_days',
-                               hover_name='brand',
-                               title='Supplier Value vs Risk: Revenue vs Returns',
-                               labels={
-                                   'total_revenue': 'Total Revenue (₹)',
-                                   'return_rate': 'Return Rate (%)',
-                                   'total_orders': 'Total Orders',
-                                   'avg_delivery_days': 'Avg Delivery Days'
-                               })
-                fig.update_xaxes(tickprefix='₹')
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("📊 No data available for value-risk analysis")
-        
-        # Delivery Reliability Analysis - FIXED: Better calculations
-        st.subheader("🚚 Delivery Reliability Metrics")
-        
-        delivery_reliability = supplier_performance.copy()
-        
-        # Calculate more accurate on-time rate
-        if 'avg_delivery_days' in delivery_reliability.columns:
-            # Assume delivery within 7 days is on-time
-            delivery_reliability['on_time_percentage'] = (
-                (7 - delivery_reliability['avg_delivery_days']).clip(lower=0) / 7 * 100
-            )
-        else:
-            delivery_reliability['on_time_percentage'] = 80  # Default value
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            most_reliable = delivery_reliability.nlargest(10, 'on_time_percentage')
-            if not most_reliable.empty:
-                fig = px.bar(most_reliable, x='brand', y='on_time_percentage',
-                            title='Top 10 Most Reliable Suppliers',
-                            color='on_time_percentage',
-                            color_continuous_scale='Greens')
-                fig.update_layout(yaxis_title='On-time Delivery Rate (%)')
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("📊 No reliable supplier data available")
-        
-        with col2:
-            least_reliable = delivery_reliability.nsmallest(10, 'on_time_percentage')
-            if not least_reliable.empty:
-                fig = px.bar(least_reliable, x='brand', y='on_time_percentage',
-                            title='Top 10 Least Reliable Suppliers',
-                            color='on_time_percentage',
-                            color_continuous_scale='Reds')
-                fig.update_layout(yaxis_title='On-time Delivery Rate (%)')
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("📊 No unreliable supplier data available")
-        
-        # Cost Analysis - FIXED: Better cost calculations
-        st.subheader("💰 Supply Chain Cost Analysis")
-        
-        cost_analysis = supplier_performance.copy()
-        
-        # Calculate cost efficiency (revenue per unit)
-        cost_analysis['cost_efficiency'] = (
-            cost_analysis['total_revenue'] / cost_analysis['total_quantity']
-        ).fillna(0)
-        
-        # Remove infinite values
-        cost_analysis = cost_analysis[cost_analysis['cost_efficiency'] != float('inf')]
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            most_efficient = cost_analysis.nlargest(10, 'cost_efficiency')
-            if not most_efficient.empty:
-                fig = px.bar(most_efficient, x='brand', y='cost_efficiency',
-                            title='Top 10 Cost-Efficient Suppliers',
-                            color='cost_efficiency',
-                            color_continuous_scale='Blues')
-                fig.update_layout(yaxis_title='Revenue per Unit (₹)')
-                fig.update_yaxes(tickprefix='₹')
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("📊 No cost efficiency data available")
-        
-        with col2:
-            # Supplier risk assessment - FIXED: Better risk scoring
-            if not cost_analysis.empty:
-                # Normalize metrics for risk calculation
-                cost_analysis['return_rate_norm'] = (
-                    cost_analysis['return_rate'] / cost_analysis['return_rate'].max()
-                )
-                cost_analysis['delivery_time_norm'] = (
-                    cost_analysis['avg_delivery_days'] / cost_analysis['avg_delivery_days'].max()
-                )
-                cost_analysis['rating_risk_norm'] = (
-                    (5 - cost_analysis['avg_rating']) / 5  # Lower rating = higher risk
-                )
-                
-                # Calculate weighted risk score
-                cost_analysis['risk_score'] = (
-                    cost_analysis['return_rate_norm'] * 0.4 + 
-                    cost_analysis['delivery_time_norm'] * 0.3 +
-                    cost_analysis['rating_risk_norm'] * 0.3
-                ) * 100
-                
-                high_risk_suppliers = cost_analysis.nlargest(10, 'risk_score')
-                if not high_risk_suppliers.empty:
-                    fig = px.bar(high_risk_suppliers, x='brand', y='risk_score',
-                                title='Top 10 High-Risk Suppliers',
-                                color='risk_score',
-                                color_continuous_scale='Reds')
-                    fig.update_layout(yaxis_title='Risk Score')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("📊 No high-risk supplier data available")
-            else:
-                st.info("📊 No data available for risk assessment")
-        
-        # Vendor Management Insights
-        st.subheader("💡 Vendor Management Strategy")
-        
-        insights = [
-            "🎯 **Strategic Partners**: Identify top 20% suppliers contributing 80% of revenue for preferential treatment",
-            "📈 **Performance Monitoring**: Implement quarterly supplier performance reviews with clear KPIs",
-            "🔄 **Diversification**: Reduce dependency on single suppliers for critical product categories",
-            "💰 **Cost Optimization**: Negotiate better terms with high-volume, reliable suppliers",
-            "📊 **Risk Management**: Develop contingency plans for high-risk suppliers",
-            "🤝 **Partnership Development**: Collaborate with top suppliers on product development and exclusives",
-            "🔍 **Quality Assurance**: Implement joint quality control programs with key suppliers"
-        ]
-        
-        for insight in insights:
-            st.info(insight)
-            
-        # Additional: Supplier Performance Table
-        st.subheader("📋 Supplier Performance Summary")
-        
-        if not supplier_performance.empty:
-            # Create summary table with key metrics
-            summary_table = supplier_performance[[
-                'brand', 'total_revenue', 'total_orders', 'avg_rating', 
-                'avg_delivery_days', 'return_rate'
-            ]].copy()
-            
-            summary_table = summary_table.round({
-                'avg_rating': 2,
-                'avg_delivery_days': 1,
-                'return_rate': 2
-            })
-            
-            summary_table = summary_table.sort_values('total_revenue', ascending=False)
-            
-            st.dataframe(
-                summary_table.style.format({
-                    'total_revenue': '₹{:,.0f}',
-                    'return_rate': '{:.2f}%'
-                }),
-                use_container_width=True,
-                height=400
-            )
-
-    # Q26: Predictive Analytics Dashboard
-    elif dashboard_id == "Q26":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🔮 Q26: Predictive Analytics Dashboard")
-        st.markdown("Sales forecasting, customer churn prediction, demand planning, and business scenario analysis")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Sales Forecasting
-        st.subheader("📈 Sales Forecasting")
-        
-        # Time series data for forecasting
-        forecast_data = st.session_state.transactions.copy()
-        forecast_data['order_date'] = pd.to_datetime(forecast_data['order_date'])
-        monthly_sales = forecast_data.groupby(pd.Grouper(key='order_date', freq='M'))['final_amount_inr'].sum().reset_index()
-        monthly_sales.columns = ['month', 'revenue']
-        
-        # Simple forecasting using moving averages
-        monthly_sales['ma_3'] = monthly_sales['revenue'].rolling(window=3).mean()
-        monthly_sales['ma_6'] = monthly_sales['revenue'].rolling(window=6).mean()
-        
-        # Forecast next 6 months (simplified)
-        last_date = monthly_sales['month'].max()
-        future_dates = pd.date_range(start=last_date + pd.DateOffset(months=1), periods=6, freq='M')
-        
-        # Simple trend-based forecast
-        recent_trend = monthly_sales['revenue'].tail(6).mean()
-        growth_rate = 0.08  # 8% assumed growth
-        forecast_values = [recent_trend * (1 + growth_rate) ** (i+1) for i in range(6)]
-        
-        forecast_df = pd.DataFrame({
-            'month': future_dates,
-            'revenue': forecast_values,
-            'type': 'Forecast'
-        })
-        
-        historical_df = monthly_sales[['month', 'revenue']].copy()
-        historical_df['type'] = 'Historical'
-        
-        combined_data = pd.concat([historical_df, forecast_df])
-        
-        fig = px.line(combined_data, x='month', y='revenue', color='type',
-                     title='Sales Forecast - Next 6 Months',
-                     markers=True)
-        fig.update_layout(xaxis_title='Month', yaxis_title='Revenue (₹)')
-        fig.update_yaxes(tickprefix='₹')
+    
+    # Complaint Categories Analysis (Simulated)
+    st.subheader("📋 Complaint Categories Analysis")
+    
+    # Simulated complaint categories
+    complaint_categories = {
+        'Delivery Issues': 32,
+        'Product Quality': 28,
+        'Payment Problems': 15,
+        'Return Process': 12,
+        'Website/App Issues': 8,
+        'Customer Support': 5
+    }
+    
+    complaints_df = pd.DataFrame({
+        'category': list(complaint_categories.keys()),
+        'percentage': list(complaint_categories.values())
+    })
+    
+    fig = px.pie(complaints_df, values='percentage', names='category',
+                title='Distribution of Customer Complaints by Category')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Resolution Time Analysis (Simulated)
+    st.subheader("⏱️ Service Resolution Times")
+    
+    # Simulated resolution time data
+    resolution_times = {
+        'Delivery Issues': 24,
+        'Product Quality': 48,
+        'Payment Problems': 6,
+        'Return Process': 72,
+        'Website/App Issues': 12,
+        'Customer Support': 4
+    }
+    
+    resolution_df = pd.DataFrame({
+        'category': list(resolution_times.keys()),
+        'hours': list(resolution_times.values())
+    })
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(resolution_df, x='category', y='hours',
+                    title='Average Resolution Time by Complaint Category',
+                    color='hours',
+                    color_continuous_scale='Viridis')
+        fig.update_layout(yaxis_title='Resolution Time (Hours)')
         st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Customer satisfaction by resolution time
+        satisfaction_vs_time = pd.DataFrame({
+            'resolution_time': [2, 8, 24, 48, 72],
+            'satisfaction_score': [95, 88, 75, 60, 45]
+        })
         
-        # Customer Churn Prediction
-        st.subheader("👥 Customer Churn Prediction")
-        
-        # Churn analysis based on recency
-        churn_data = st.session_state.customers.copy()
-        churn_data['churn_risk'] = pd.cut(churn_data['days_since_last_order'],
-                                        bins=[0, 30, 60, 90, 180, float('inf')],
-                                        labels=['Very Low', 'Low', 'Medium', 'High', 'Very High'])
-        
-        churn_distribution = churn_data['churn_risk'].value_counts()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.pie(churn_distribution, values=churn_distribution.values, names=churn_distribution.index,
-                        title='Customer Churn Risk Distribution')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Churn risk by customer value
-            churn_value_analysis = churn_data.groupby('churn_risk').agg({
-                'total_spent': 'sum',
-                'customer_id': 'count'
-            }).reset_index()
-            
-            churn_value_analysis['avg_value'] = churn_value_analysis['total_spent'] / churn_value_analysis['customer_id']
-            
-            fig = px.bar(churn_value_analysis, x='churn_risk', y='avg_value',
-                        title='Average Customer Value by Churn Risk',
-                        color='avg_value')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Demand Planning
-        st.subheader("📦 Product Demand Forecasting")
-        
-        # Product demand trends
-        product_demand = st.session_state.transactions.groupby(['product_id', 'product_name']).agg({
-            'quantity': ['sum', 'mean', 'std'],
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        product_demand.columns = ['product_id', 'product_name', 'total_quantity', 'avg_daily_demand', 'demand_std', 'order_count']
-        
-        # Calculate demand variability and forecast
-        product_demand['cv'] = (product_demand['demand_std'] / product_demand['avg_daily_demand']).fillna(0)
-        product_demand['forecast_category'] = pd.cut(product_demand['cv'],
-                                                   bins=[0, 0.3, 0.6, 1.0, float('inf')],
-                                                   labels=['Stable', 'Moderate', 'Variable', 'Highly Variable'])
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            demand_variability = product_demand['forecast_category'].value_counts()
-            fig = px.bar(demand_variability, x=demand_variability.index, y=demand_variability.values,
-                        title='Product Demand Variability',
-                        color=demand_variability.values)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # High-demand products forecast
-            high_demand_products = product_demand.nlargest(10, 'total_quantity')
-            fig = px.bar(high_demand_products, x='product_name', y='total_quantity',
-                        title='Top 10 High-Demand Products',
-                        color='total_quantity')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Business Scenario Analysis
-        st.subheader("🎯 Business Scenario Modeling")
-        
-        # Scenario analysis inputs
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            growth_scenario = st.selectbox("Growth Scenario", ["Conservative (5%)", "Moderate (10%)", "Aggressive (15%)"])
-        
-        with col2:
-            market_condition = st.selectbox("Market Condition", ["Stable", "Growth", "Recession"])
-        
-        with col3:
-            investment_level = st.selectbox("Investment Level", ["Low", "Medium", "High"])
-        
-        # Scenario results (simulated)
-        base_revenue = st.session_state.transactions['final_amount_inr'].sum()
-        
-        # Apply scenario factors
-        growth_factors = {"Conservative (5%)": 1.05, "Moderate (10%)": 1.10, "Aggressive (15%)": 1.15}
-        market_factors = {"Stable": 1.0, "Growth": 1.1, "Recession": 0.9}
-        investment_factors = {"Low": 1.0, "Medium": 1.05, "High": 1.1}
-        
-        projected_revenue = (base_revenue * 
-                           growth_factors[growth_scenario] * 
-                           market_factors[market_condition] * 
-                           investment_factors[investment_level])
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Base Revenue", f"₹{base_revenue/1e9:.2f}B")
-        
-        with col2:
-            st.metric("Projected Revenue", f"₹{projected_revenue/1e9:.2f}B")
-        
-        with col3:
-            growth_amount = projected_revenue - base_revenue
-            st.metric("Projected Growth", f"₹{growth_amount/1e9:.2f}B")
-        
-        with col4:
-            growth_percent = ((projected_revenue - base_revenue) / base_revenue) * 100
-            st.metric("Growth Percentage", f"{growth_percent:.1f}%")
-        
-        # Predictive Insights
-        st.subheader("💡 Predictive Business Insights")
-        
-        insights = [
-            "📈 **Revenue Forecast**: Expected 8-12% growth based on current trends and seasonality",
-            "👥 **Churn Management**: 15% of high-value customers at risk - implement retention campaigns",
-            "📦 **Inventory Planning**: 68% of products show stable demand patterns - optimize stock levels",
-            "🎯 **Growth Opportunities**: Electronics and Fashion categories projected to grow 18% next quarter",
-            "⚠️ **Risk Factors**: Monitor economic indicators for potential market slowdown impact",
-            "💰 **Investment ROI**: High investment scenario shows 23% higher returns than conservative approach",
-            "🔮 **Seasonal Peaks**: Plan for 35% demand increase during festival seasons"
-        ]
-        
-        for insight in insights:
-            st.success(insight)
-
-    # Q27: Market Intelligence Dashboard
-    elif dashboard_id == "Q27":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🌐 Q27: Market Intelligence Dashboard")
-        st.markdown("Competitor tracking, market trends, pricing intelligence, and strategic positioning insights")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Market Share Analysis
-        st.subheader("📊 Market Position & Share Analysis")
-        
-        # Category market share (using internal data as proxy)
-        market_data = st.session_state.transactions.copy()
-        category_share = market_data.groupby('category').agg({
-            'final_amount_inr': 'sum',
-            'transaction_id': 'count',
-            'customer_id': 'nunique'
-        }).reset_index()
-        
-        category_share.columns = ['category', 'revenue', 'orders', 'customers']
-        category_share['revenue_share'] = (category_share['revenue'] / category_share['revenue'].sum()) * 100
-        category_share['order_share'] = (category_share['orders'] / category_share['orders'].sum()) * 100
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.pie(category_share, values='revenue_share', names='category',
-                        title='Revenue Market Share by Category')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.bar(category_share.nlargest(8, 'revenue_share'), x='category', y='revenue_share',
-                        title='Top Categories by Market Share',
-                        color='revenue_share')
-            fig.update_layout(yaxis_title='Market Share (%)')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Competitive Positioning
-        st.subheader("⚔️ Competitive Landscape Analysis")
-        
-        # Brand performance as proxy for competitive analysis
-        competitive_data = market_data.groupby('brand').agg({
-            'final_amount_inr': 'sum',
-            'transaction_id': 'count',
-            'customer_rating': 'mean',
-            'discount_percent': 'mean'
-        }).reset_index()
-        
-        competitive_data.columns = ['brand', 'revenue', 'orders', 'avg_rating', 'avg_discount']
-        competitive_data['market_share'] = (competitive_data['revenue'] / competitive_data['revenue'].sum()) * 100
-        
-        # Competitive matrix: Price vs Quality
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.scatter(competitive_data, x='avg_discount', y='avg_rating',
-                           size='market_share', color='brand',
-                           title='Competitive Positioning: Discount Strategy vs Quality',
-                           labels={'avg_discount': 'Average Discount (%)', 'avg_rating': 'Average Rating'})
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Market share trends
-            brand_trends = market_data.groupby(['order_year', 'brand'])['final_amount_inr'].sum().reset_index()
-            top_brands = competitive_data.nlargest(5, 'market_share')['brand'].tolist()
-            brand_trends_filtered = brand_trends[brand_trends['brand'].isin(top_brands)]
-            
-            fig = px.line(brand_trends_filtered, x='order_year', y='final_amount_inr', color='brand',
-                         title='Market Share Evolution - Top 5 Brands',
-                         markers=True)
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Pricing Intelligence
-        st.subheader("💰 Competitive Pricing Analysis")
-        
-        # Price distribution by category and brand
-        pricing_intel = market_data.groupby(['category', 'brand']).agg({
-            'original_price_inr': ['min', 'max', 'mean', 'median'],
-            'discount_percent': 'mean',
-            'transaction_id': 'count'
-        }).reset_index()
-        
-        pricing_intel.columns = ['category', 'brand', 'min_price', 'max_price', 'avg_price', 'median_price', 'avg_discount', 'transactions']
-        
-        # Select category for detailed analysis
-        category_select = st.selectbox("Select Category for Pricing Analysis", 
-                                     pricing_intel['category'].unique())
-        
-        category_pricing = pricing_intel[pricing_intel['category'] == category_select]
-        category_pricing = category_pricing[category_pricing['transactions'] > 10]  # Meaningful brands
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.box(category_pricing, y='avg_price', 
-                        title=f'Price Distribution - {category_select}')
-            fig.update_yaxes(tickprefix='₹')
+        fig = px.line(satisfaction_vs_time, x='resolution_time', y='satisfaction_score',
+                     title='Customer Satisfaction vs Resolution Time',
+                     markers=True)
+        fig.update_layout(xaxis_title='Resolution Time (Hours)', yaxis_title='Satisfaction Score')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Service Quality Improvement
+    st.subheader("🚀 Service Quality Improvement Initiatives")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        current_resolution_time = 28  # hours
+        target_resolution_time = 20
+        st.metric("Avg Resolution Time", f"{current_resolution_time}h", f"-{current_resolution_time - target_resolution_time}h")
+    
+    with col2:
+        current_satisfaction = 82  # %
+        target_satisfaction = 88
+        st.metric("Customer Satisfaction", f"{current_satisfaction}%", f"+{target_satisfaction - current_satisfaction}%")
+    
+    with col3:
+        first_contact_resolution = 68  # %
+        target_fcr = 75
+        st.metric("First Contact Resolution", f"{first_contact_resolution}%", f"+{target_fcr - first_contact_resolution}%")
+    
+    # Improvement Recommendations
+    st.subheader("💡 Customer Service Enhancement Strategies")
+    
+    strategies = [
+        "🎯 **Quick Response**: Aim for 2-hour response time for critical issues to improve satisfaction by 15%",
+        "📞 **24/7 Support**: Implement round-the-clock support for premium customers",
+        "🤖 **Chatbot Integration**: Handle 40% of common queries automatically to reduce resolution time",
+        "📊 **Proactive Support**: Identify potential issues before customers report them",
+        "🎓 **Agent Training**: Specialized training for complex product categories",
+        "📱 **Mobile Optimization**: Improve mobile app support experience",
+        "🔍 **Root Cause Analysis**: Systematic analysis of recurring complaint categories"
+    ]
+    
+    for strategy in strategies:
+        st.success(strategy)
+
+# Q25: Supply Chain Dashboard - FIXED
+def render_q25():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🏭 Q25: Supply Chain Dashboard")
+    st.markdown("Supplier performance, delivery reliability, cost analysis, and vendor management insights")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Supply Chain Overview - FIXED: Better data validation
+    st.subheader("📊 Supply Chain Performance Metrics")
+    
+    supply_data = st.session_state.transactions.copy()
+    
+    # Check if brand data is available
+    if 'brand' not in supply_data.columns:
+        st.error("❌ Brand/supplier data not available in the dataset")
+        return
+        
+    # Supplier/Brand performance analysis - FIXED: Handle missing columns
+    supplier_performance = supply_data.groupby('brand').agg({
+        'final_amount_inr': 'sum',
+        'quantity': 'sum',
+        'transaction_id': 'count',
+        'customer_rating': 'mean'
+    }).reset_index()
+    
+    # Add delivery days if available
+    if 'delivery_days' in supply_data.columns:
+        supplier_performance['avg_delivery_days'] = supply_data.groupby('brand')['delivery_days'].mean().values
+    else:
+        supplier_performance['avg_delivery_days'] = 5.0  # Default value
+    
+    # Add return data if available
+    if 'return_status' in supply_data.columns:
+        supplier_performance['return_count'] = supply_data.groupby('brand')['return_status'].apply(
+            lambda x: (x == 'Returned').sum()
+        ).values
+    else:
+        supplier_performance['return_count'] = 0
+    
+    supplier_performance.columns = ['brand', 'total_revenue', 'total_quantity', 'total_orders', 'avg_rating', 'avg_delivery_days', 'return_count']
+    supplier_performance['return_rate'] = (supplier_performance['return_count'] / supplier_performance['total_orders']) * 100
+    
+    # Filter out brands with insufficient data
+    supplier_performance = supplier_performance[supplier_performance['total_orders'] > 10]
+    
+    if supplier_performance.empty:
+        st.warning("⚠️ No sufficient supplier data available for analysis")
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        top_supplier = supplier_performance.nlargest(1, 'total_revenue')
+        if not top_supplier.empty:
+            st.metric("Top Performing Brand", top_supplier['brand'].iloc[0])
+    
+    with col2:
+        fastest_delivery = supplier_performance.nsmallest(1, 'avg_delivery_days')
+        if not fastest_delivery.empty:
+            st.metric("Fastest Delivery", fastest_delivery['brand'].iloc[0], 
+                     f"{fastest_delivery['avg_delivery_days'].iloc[0]:.1f} days")
+    
+    with col3:
+        highest_quality = supplier_performance.nlargest(1, 'avg_rating')
+        if not highest_quality.empty:
+            st.metric("Highest Quality", highest_quality['brand'].iloc[0], 
+                     f"{highest_quality['avg_rating'].iloc[0]:.1f} ⭐")
+    
+    with col4:
+        lowest_returns = supplier_performance.nsmallest(1, 'return_rate')
+        if not lowest_returns.empty:
+            st.metric("Lowest Returns", lowest_returns['brand'].iloc[0], 
+                     f"{lowest_returns['return_rate'].iloc[0]:.1f}%")
+    
+    # Supplier Performance Matrix - FIXED: Better data validation
+    st.subheader("📈 Supplier Performance Analysis")
+    
+    # Create supplier performance matrix
+    performance_matrix = supplier_performance.copy()
+    
+    # Calculate delivery reliability score
+    performance_matrix['on_time_rate'] = 100 - (
+        performance_matrix['avg_delivery_days'] / performance_matrix['avg_delivery_days'].max() * 100
+    )
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Delivery reliability vs Quality - FIXED: Handle empty data
+        if not performance_matrix.empty:
+            fig = px.scatter(performance_matrix, x='avg_delivery_days', y='avg_rating',
+                           size='total_revenue', color='return_rate',
+                           hover_name='brand',
+                           title='Supplier Performance: Delivery vs Quality',
+                           labels={
+                               'avg_delivery_days': 'Average Delivery Days',
+                               'avg_rating': 'Average Customer Rating',
+                               'return_rate': 'Return Rate (%)',
+                               'total_revenue': 'Total Revenue'
+                           })
             st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Price vs Discount strategy
-            fig = px.scatter(category_pricing, x='avg_discount', y='avg_price',
-                           size='transactions', color='brand',
-                           title=f'Pricing Strategy: Discount vs Price - {category_select}',
-                           labels={'avg_discount': 'Average Discount (%)', 'avg_price': 'Average Price (₹)'})
-            fig.update_yaxes(tickprefix='₹')
+        else:
+            st.info("📊 No data available for performance matrix")
+    
+    with col2:
+        # Revenue contribution vs Return rate - FIXED: Better scaling
+        if not performance_matrix.empty:
+            fig = px.scatter(performance_matrix, x='total_revenue', y='return_rate',
+                           size='total_orders', color='avg_delivery_days',
+                           hover_name='brand',
+                           title='Supplier Value vs Risk: Revenue vs Returns',
+                           labels={
+                               'total_revenue': 'Total Revenue (₹)',
+                               'return_rate': 'Return Rate (%)',
+                               'total_orders': 'Total Orders',
+                               'avg_delivery_days': 'Avg Delivery Days'
+                           })
+            fig.update_xaxes(tickprefix='₹')
             st.plotly_chart(fig, use_container_width=True)
-        
-        # Market Trends Analysis
-        st.subheader("📈 Market Trends & Opportunities")
-        
-        # Growth categories analysis
-        growth_analysis = market_data.groupby(['order_year', 'category'])['final_amount_inr'].sum().reset_index()
-        
-        # Calculate growth rates
-        growth_pivot = growth_analysis.pivot(index='order_year', columns='category', values='final_amount_inr')
-        growth_rates = growth_pivot.pct_change().mean() * 100
-        
-        growth_df = pd.DataFrame({
-            'category': growth_rates.index,
-            'growth_rate': growth_rates.values
-        }).dropna()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fastest_growing = growth_df.nlargest(8, 'growth_rate')
-            fig = px.bar(fastest_growing, x='category', y='growth_rate',
-                        title='Fastest Growing Categories',
-                        color='growth_rate',
+        else:
+            st.info("📊 No data available for value-risk analysis")
+    
+    # Delivery Reliability Analysis - FIXED: Better calculations
+    st.subheader("🚚 Delivery Reliability Metrics")
+    
+    delivery_reliability = supplier_performance.copy()
+    
+    # Calculate more accurate on-time rate
+    if 'avg_delivery_days' in delivery_reliability.columns:
+        # Assume delivery within 7 days is on-time
+        delivery_reliability['on_time_percentage'] = (
+            (7 - delivery_reliability['avg_delivery_days']).clip(lower=0) / 7 * 100
+        )
+    else:
+        delivery_reliability['on_time_percentage'] = 80  # Default value
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        most_reliable = delivery_reliability.nlargest(10, 'on_time_percentage')
+        if not most_reliable.empty:
+            fig = px.bar(most_reliable, x='brand', y='on_time_percentage',
+                        title='Top 10 Most Reliable Suppliers',
+                        color='on_time_percentage',
                         color_continuous_scale='Greens')
-            fig.update_layout(yaxis_title='Average Annual Growth Rate (%)')
+            fig.update_layout(yaxis_title='On-time Delivery Rate (%)')
             st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Market maturity analysis
-            maturity_analysis = category_share.copy()
-            maturity_analysis['growth_rate'] = maturity_analysis['category'].map(growth_df.set_index('category')['growth_rate'])
-            maturity_analysis = maturity_analysis.dropna()
-            
-            fig = px.scatter(maturity_analysis, x='revenue_share', y='growth_rate',
-                           size='customers', color='category',
-                           title='Market Maturity Analysis: Share vs Growth',
-                           labels={'revenue_share': 'Market Share (%)', 'growth_rate': 'Growth Rate (%)'})
+        else:
+            st.info("📊 No reliable supplier data available")
+    
+    with col2:
+        least_reliable = delivery_reliability.nsmallest(10, 'on_time_percentage')
+        if not least_reliable.empty:
+            fig = px.bar(least_reliable, x='brand', y='on_time_percentage',
+                        title='Top 10 Least Reliable Suppliers',
+                        color='on_time_percentage',
+                        color_continuous_scale='Reds')
+            fig.update_layout(yaxis_title='On-time Delivery Rate (%)')
             st.plotly_chart(fig, use_container_width=True)
-        
-        # Strategic Insights
-        st.subheader("🎯 Strategic Market Intelligence")
-        
-        intelligence_insights = [
-            "🏆 **Market Leadership**: Dominant position in Electronics (28% share) with 15% YoY growth",
-            "🚀 **Growth Categories**: Fashion and Home categories showing 22%+ growth - expansion opportunities",
-            "💰 **Pricing Strategy**: Premium pricing in Electronics delivering 35% higher margins",
-            "📱 **Digital Disruption**: Mobile commerce growing 3x faster than desktop - mobile-first strategy",
-            "🌍 **Regional Expansion**: Tier 2 cities represent 45% growth potential - geographic expansion focus",
-            "⚡ **Competitive Moves**: Monitor key competitors' discount strategies in high-growth categories",
-            "🔮 **Future Trends**: AI and IoT products projected to grow 40% annually - early positioning advantage"
-        ]
-        
-        for insight in intelligence_insights:
-            st.info(insight)
-
-    # Q28: Cross-selling & Upselling Dashboard - FIXED
-    elif dashboard_id == "Q28":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🔄 Q28: Cross-selling & Upselling Dashboard")
-        st.markdown("Product associations, recommendation effectiveness, bundle opportunities, and revenue optimization")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Product Association Analysis - FIXED: Better data processing
-        st.subheader("📊 Product Association Patterns")
-        
-        association_data = st.session_state.transactions.copy()
-        
-        # Check if required columns exist
-        required_cols = ['customer_id', 'order_date', 'category']
-        if not all(col in association_data.columns for col in required_cols):
-            st.error("❌ Required columns missing for association analysis")
-            return
-            
-        # Customer purchase patterns - FIXED: Handle large datasets
-        try:
-            # Sample data if too large for processing
-            if len(association_data) > 10000:
-                association_data = association_data.sample(n=10000, random_state=42)
-                st.info(f"📊 Analyzing sample of 10,000 transactions for performance")
-            
-            # Group by customer and order date to find multi-category purchases
-            customer_categories = association_data.groupby(['customer_id', 'order_date']).agg({
-                'category': lambda x: list(x.unique()),  # Get unique categories per order
-                'final_amount_inr': 'sum'
-            }).reset_index()
+        else:
+            st.info("📊 No unreliable supplier data available")
+    
+    # Cost Analysis - FIXED: Better cost calculations
+    st.subheader("💰 Supply Chain Cost Analysis")
+    
+    cost_analysis = supplier_performance.copy()
+    
+    # Calculate cost efficiency (revenue per unit)
+    cost_analysis['cost_efficiency'] = (
+        cost_analysis['total_revenue'] / cost_analysis['total_quantity']
+    ).fillna(0)
+    
+    # Remove infinite values
+    cost_analysis = cost_analysis[cost_analysis['cost_efficiency'] != float('inf')]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        most_efficient = cost_analysis.nlargest(10, 'cost_efficiency')
+        if not most_efficient.empty:
+            fig = px.bar(most_efficient, x='brand', y='cost_efficiency',
+                        title='Top 10 Cost-Efficient Suppliers',
+                        color='cost_efficiency',
+                        color_continuous_scale='Blues')
+            fig.update_layout(yaxis_title='Revenue per Unit (₹)')
+            fig.update_yaxes(tickprefix='₹')
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("📊 No cost efficiency data available")
+    
+    with col2:
+        # Supplier risk assessment - FIXED: Better risk scoring
+        if not cost_analysis.empty:
+            # Normalize metrics for risk calculation
+            cost_analysis['return_rate_norm'] = (
+                cost_analysis['return_rate'] / cost_analysis['return_rate'].max()
+            )
+            cost_analysis['delivery_time_norm'] = (
+                cost_analysis['avg_delivery_days'] / cost_analysis['avg_delivery_days'].max()
+            )
+            cost_analysis['rating_risk_norm'] = (
+                (5 - cost_analysis['avg_rating']) / 5  # Lower rating = higher risk
+            )
             
-            # Find category combinations
-            category_combinations = []
-            for _, row in customer_categories.iterrows():
-                categories = row['category']
-                if len(categories) > 1:
-                    # Create pairs of categories purchased together
-                    for i in range(len(categories)):
-                        for j in range(i+1, len(categories)):
-                            # Sort to avoid duplicate pairs
-                            pair = tuple(sorted([categories[i], categories[j]]))
-                            category_combinations.append(pair)
+            # Calculate weighted risk score
+            cost_analysis['risk_score'] = (
+                cost_analysis['return_rate_norm'] * 0.4 + 
+                cost_analysis['delivery_time_norm'] * 0.3 +
+                cost_analysis['rating_risk_norm'] * 0.3
+            ) * 100
             
-            # Count frequency of category pairs
-            if category_combinations:
-                combination_df = pd.DataFrame(category_combinations, columns=['category1', 'category2'])
-                combination_counts = combination_df.groupby(['category1', 'category2']).size().reset_index(name='frequency')
-                combination_counts = combination_counts.sort_values('frequency', ascending=False)
-                
-                # Top category associations
-                top_associations = combination_counts.head(15)
-                
-                fig = px.bar(top_associations, x='frequency', y='category1',
-                            title='Top Product Category Associations',
-                            orientation='h',
-                            color='frequency',
-                            hover_data=['category2'])
+            high_risk_suppliers = cost_analysis.nlargest(10, 'risk_score')
+            if not high_risk_suppliers.empty:
+                fig = px.bar(high_risk_suppliers, x='brand', y='risk_score',
+                            title='Top 10 High-Risk Suppliers',
+                            color='risk_score',
+                            color_continuous_scale='Reds')
+                fig.update_layout(yaxis_title='Risk Score')
                 st.plotly_chart(fig, use_container_width=True)
-                
-                # Display association table
-                with st.expander("📋 View Detailed Association Table"):
-                    st.dataframe(
-                        combination_counts.head(20),
-                        use_container_width=True
-                    )
             else:
-                st.info("📊 No multi-category purchase patterns found in the data")
-                
-        except Exception as e:
-            st.error(f"❌ Error in association analysis: {str(e)}")
-            st.info("Try reducing the dataset size or check data quality")
+                st.info("📊 No high-risk supplier data available")
+        else:
+            st.info("📊 No data available for risk assessment")
+    
+    # Vendor Management Insights
+    st.subheader("💡 Vendor Management Strategy")
+    
+    insights = [
+        "🎯 **Strategic Partners**: Identify top 20% suppliers contributing 80% of revenue for preferential treatment",
+        "📈 **Performance Monitoring**: Implement quarterly supplier performance reviews with clear KPIs",
+        "🔄 **Diversification**: Reduce dependency on single suppliers for critical product categories",
+        "💰 **Cost Optimization**: Negotiate better terms with high-volume, reliable suppliers",
+        "📊 **Risk Management**: Develop contingency plans for high-risk suppliers",
+        "🤝 **Partnership Development**: Collaborate with top suppliers on product development and exclusives",
+        "🔍 **Quality Assurance**: Implement joint quality control programs with key suppliers"
+    ]
+    
+    for insight in insights:
+        st.info(insight)
         
-        # Upselling Performance - FIXED: Better customer analysis
-        st.subheader("💰 Upselling Effectiveness")
+    # Additional: Supplier Performance Table
+    st.subheader("📋 Supplier Performance Summary")
+    
+    if not supplier_performance.empty:
+        # Create summary table with key metrics
+        summary_table = supplier_performance[[
+            'brand', 'total_revenue', 'total_orders', 'avg_rating', 
+            'avg_delivery_days', 'return_rate'
+        ]].copy()
         
-        try:
-            # Analyze order value growth opportunities
-            upselling_data = association_data.groupby('customer_id').agg({
-                'final_amount_inr': ['max', 'mean', 'count'],
-                'category': 'nunique'
-            }).reset_index()
-            
-            # Flatten column names
-            upselling_data.columns = ['customer_id', 'max_order_value', 'avg_order_value', 'order_count', 'unique_categories']
-            
-            # Remove customers with only one order (no upselling history)
-            upselling_data = upselling_data[upselling_data['order_count'] > 1]
-            
-            if not upselling_data.empty:
-                # Upselling potential analysis
-                upselling_data['upselling_potential'] = upselling_data['max_order_value'] - upselling_data['avg_order_value']
-                upselling_data['potential_percent'] = (upselling_data['upselling_potential'] / upselling_data['avg_order_value']) * 100
-                
-                # Filter reasonable values (remove negative potentials)
-                upselling_data = upselling_data[upselling_data['upselling_potential'] > 0]
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Upselling potential distribution
-                    fig = px.histogram(upselling_data, x='potential_percent',
-                                     title='Upselling Potential Distribution',
-                                     nbins=20,
-                                     color_discrete_sequence=['#00CC96'])
-                    fig.update_layout(xaxis_title='Upselling Potential (%)', yaxis_title='Number of Customers')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # High upselling potential customers
-                    high_potential = upselling_data.nlargest(10, 'upselling_potential')
-                    if not high_potential.empty:
-                        fig = px.bar(high_potential, x='customer_id', y='upselling_potential',
-                                    title='Top 10 Customers with Highest Upselling Potential',
-                                    color='upselling_potential',
-                                    color_continuous_scale='Viridis')
-                        fig.update_yaxes(tickprefix='₹')
-                        fig.update_layout(showlegend=False)
-                        st.plotly_chart(fig, use_container_width=True)
-                    else:
-                        st.info("📊 No high upselling potential customers found")
-                
-                # Upselling metrics summary
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    avg_potential = upselling_data['upselling_potential'].mean()
-                    st.metric("Avg Upselling Potential", f"₹{avg_potential:.0f}")
-                
-                with col2:
-                    high_potential_count = len(upselling_data[upselling_data['potential_percent'] > 50])
-                    st.metric("High Potential Customers", f"{high_potential_count}")
-                
-                with col3:
-                    total_upselling_opportunity = upselling_data['upselling_potential'].sum()
-                    st.metric("Total Opportunity", f"₹{total_upselling_opportunity:,.0f}")
-                        
-            else:
-                st.info("📊 No upselling data available (need customers with multiple orders)")
-                
-        except Exception as e:
-            st.error(f"❌ Error in upselling analysis: {str(e)}")
+        summary_table = summary_table.round({
+            'avg_rating': 2,
+            'avg_delivery_days': 1,
+            'return_rate': 2
+        })
         
-        # Bundle Opportunity Analysis - FIXED: Better bundle detection
-        st.subheader("🎁 Product Bundle Opportunities")
+        summary_table = summary_table.sort_values('total_revenue', ascending=False)
         
-        try:
-            # Analyze potential bundle combinations within same orders
-            bundle_data = association_data.copy()
-            
-            # Find orders with multiple products
-            order_products = bundle_data.groupby(['transaction_id', 'order_date']).agg({
-                'product_id': 'count',
-                'category': 'nunique',
-                'final_amount_inr': 'sum'
-            }).reset_index()
-            
-            order_products.columns = ['transaction_id', 'order_date', 'product_count', 'category_count', 'order_value']
-            
-            # Identify multi-product orders (potential bundles)
-            multi_product_orders = order_products[order_products['product_count'] > 1]
-            
-            if not multi_product_orders.empty:
-                # Bundle performance metrics
-                avg_bundle_value = multi_product_orders['order_value'].mean()
-                avg_single_order_value = order_products[order_products['product_count'] == 1]['order_value'].mean()
-                
-                if avg_single_order_value > 0:  # Avoid division by zero
-                    bundle_premium = ((avg_bundle_value - avg_single_order_value) / avg_single_order_value) * 100
-                else:
-                    bundle_premium = 0
-                
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric("Avg Bundle Order Value", f"₹{avg_bundle_value:.0f}")
-                
-                with col2:
-                    st.metric("Avg Single Order Value", f"₹{avg_single_order_value:.0f}")
-                
-                with col3:
-                    st.metric("Bundle Value Premium", f"{bundle_premium:.1f}%")
-                
-                with col4:
-                    bundle_orders_pct = (len(multi_product_orders) / len(order_products)) * 100
-                    st.metric("Bundle Orders", f"{bundle_orders_pct:.1f}%")
-                
-                # Bundle frequency by product count
-                bundle_frequency = order_products[order_products['product_count'] > 1]['product_count'].value_counts().sort_index()
-                
-                fig = px.bar(bundle_frequency, x=bundle_frequency.index, y=bundle_frequency.values,
-                            title='Bundle Frequency by Number of Products',
-                            labels={'x': 'Products per Order', 'y': 'Number of Orders'})
-                st.plotly_chart(fig, use_container_width=True)
-                    
-            else:
-                st.info("📊 No multi-product orders found for bundle analysis")
-                
-        except Exception as e:
-            st.error(f"❌ Error in bundle analysis: {str(e)}")
+        st.dataframe(
+            summary_table.style.format({
+                'total_revenue': '₹{:,.0f}',
+                'return_rate': '{:.2f}%'
+            }),
+            use_container_width=True,
+            height=400
+        )
+
+# Q26: Predictive Analytics Dashboard
+def render_q26():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🔮 Q26: Predictive Analytics Dashboard")
+    st.markdown("Sales forecasting, customer churn prediction, demand planning, and business scenario analysis")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Sales Forecasting
+    st.subheader("📈 Sales Forecasting")
+    
+    # Time series data for forecasting
+    forecast_data = st.session_state.transactions.copy()
+    forecast_data['order_date'] = pd.to_datetime(forecast_data['order_date'])
+    monthly_sales = forecast_data.groupby(pd.Grouper(key='order_date', freq='M'))['final_amount_inr'].sum().reset_index()
+    monthly_sales.columns = ['month', 'revenue']
+    
+    # Simple forecasting using moving averages
+    monthly_sales['ma_3'] = monthly_sales['revenue'].rolling(window=3).mean()
+    monthly_sales['ma_6'] = monthly_sales['revenue'].rolling(window=6).mean()
+    
+    # Forecast next 6 months (simplified)
+    last_date = monthly_sales['month'].max()
+    future_dates = pd.date_range(start=last_date + pd.DateOffset(months=1), periods=6, freq='M')
+    
+    # Simple trend-based forecast
+    recent_trend = monthly_sales['revenue'].tail(6).mean()
+    growth_rate = 0.08  # 8% assumed growth
+    forecast_values = [recent_trend * (1 + growth_rate) ** (i+1) for i in range(6)]
+    
+    forecast_df = pd.DataFrame({
+        'month': future_dates,
+        'revenue': forecast_values,
+        'type': 'Forecast'
+    })
+    
+    historical_df = monthly_sales[['month', 'revenue']].copy()
+    historical_df['type'] = 'Historical'
+    
+    combined_data = pd.concat([historical_df, forecast_df])
+    
+    fig = px.line(combined_data, x='month', y='revenue', color='type',
+                 title='Sales Forecast - Next 6 Months',
+                 markers=True)
+    fig.update_layout(xaxis_title='Month', yaxis_title='Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Customer Churn Prediction
+    st.subheader("👥 Customer Churn Prediction")
+    
+    # Churn analysis based on recency
+    churn_data = st.session_state.customers.copy()
+    churn_data['churn_risk'] = pd.cut(churn_data['days_since_last_order'],
+                                    bins=[0, 30, 60, 90, 180, float('inf')],
+                                    labels=['Very Low', 'Low', 'Medium', 'High', 'Very High'])
+    
+    churn_distribution = churn_data['churn_risk'].value_counts()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.pie(churn_distribution, values=churn_distribution.values, names=churn_distribution.index,
+                    title='Customer Churn Risk Distribution')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Churn risk by customer value
+        churn_value_analysis = churn_data.groupby('churn_risk').agg({
+            'total_spent': 'sum',
+            'customer_id': 'count'
+        }).reset_index()
         
-        # Recommendation Effectiveness - FIXED: Better simulation
-        st.subheader("🎯 Recommendation Performance")
+        churn_value_analysis['avg_value'] = churn_value_analysis['total_spent'] / churn_value_analysis['customer_id']
         
-        # Simulated recommendation performance (in real scenario, would come from A/B testing data)
-        try:
-            recommendation_metrics = {
-                'Cross-sell Recommendations': 12.5,
-                'Upsell Suggestions': 8.3,
-                'Bundle Offers': 15.2,
-                'Frequently Bought Together': 18.7,
-                'Similar Products': 6.8,
-                'Customer History Based': 11.4,
-                'Trending Products': 9.6
-            }
-            
-            rec_df = pd.DataFrame({
-                'recommendation_type': list(recommendation_metrics.keys()),
-                'conversion_rate': list(recommendation_metrics.values())
-            })
-            
-            fig = px.bar(rec_df, x='recommendation_type', y='conversion_rate',
-                        title='Recommendation Type Conversion Rates',
-                        color='conversion_rate',
-                        color_continuous_scale='Viridis')
-            fig.update_layout(
-                yaxis_title='Conversion Rate (%)',
-                xaxis_tickangle=-45
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Recommendation impact summary
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                best_recommendation = rec_df.nlargest(1, 'conversion_rate')
-                st.metric("Most Effective", best_recommendation['recommendation_type'].iloc[0])
-            
-            with col2:
-                avg_conversion = rec_df['conversion_rate'].mean()
-                st.metric("Avg Conversion Rate", f"{avg_conversion:.1f}%")
-            
-            with col3:
-                total_impact = avg_conversion * 1000  # Simulated impact
-                st.metric("Estimated Monthly Impact", f"+{total_impact:,.0f} orders")
-                
-        except Exception as e:
-            st.error(f"❌ Error in recommendation analysis: {str(e)}")
+        fig = px.bar(churn_value_analysis, x='churn_risk', y='avg_value',
+                    title='Average Customer Value by Churn Risk',
+                    color='avg_value')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Demand Planning
+    st.subheader("📦 Product Demand Forecasting")
+    
+    # Product demand trends
+    product_demand = st.session_state.transactions.groupby(['product_id', 'product_name']).agg({
+        'quantity': ['sum', 'mean', 'std'],
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    product_demand.columns = ['product_id', 'product_name', 'total_quantity', 'avg_daily_demand', 'demand_std', 'order_count']
+    
+    # Calculate demand variability and forecast
+    product_demand['cv'] = (product_demand['demand_std'] / product_demand['avg_daily_demand']).fillna(0)
+    product_demand['forecast_category'] = pd.cut(product_demand['cv'],
+                                               bins=[0, 0.3, 0.6, 1.0, float('inf')],
+                                               labels=['Stable', 'Moderate', 'Variable', 'Highly Variable'])
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        demand_variability = product_demand['forecast_category'].value_counts()
+        fig = px.bar(demand_variability, x=demand_variability.index, y=demand_variability.values,
+                    title='Product Demand Variability',
+                    color=demand_variability.values)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # High-demand products forecast
+        high_demand_products = product_demand.nlargest(10, 'total_quantity')
+        fig = px.bar(high_demand_products, x='product_name', y='total_quantity',
+                    title='Top 10 High-Demand Products',
+                    color='total_quantity')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Business Scenario Analysis
+    st.subheader("🎯 Business Scenario Modeling")
+    
+    # Scenario analysis inputs
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        growth_scenario = st.selectbox("Growth Scenario", ["Conservative (5%)", "Moderate (10%)", "Aggressive (15%)"])
+    
+    with col2:
+        market_condition = st.selectbox("Market Condition", ["Stable", "Growth", "Recession"])
+    
+    with col3:
+        investment_level = st.selectbox("Investment Level", ["Low", "Medium", "High"])
+    
+    # Scenario results (simulated)
+    base_revenue = st.session_state.transactions['final_amount_inr'].sum()
+    
+    # Apply scenario factors
+    growth_factors = {"Conservative (5%)": 1.05, "Moderate (10%)": 1.10, "Aggressive (15%)": 1.15}
+    market_factors = {"Stable": 1.0, "Growth": 1.1, "Recession": 0.9}
+    investment_factors = {"Low": 1.0, "Medium": 1.05, "High": 1.1}
+    
+    projected_revenue = (base_revenue * 
+                       growth_factors[growth_scenario] * 
+                       market_factors[market_condition] * 
+                       investment_factors[investment_level])
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Base Revenue", f"₹{base_revenue/1e9:.2f}B")
+    
+    with col2:
+        st.metric("Projected Revenue", f"₹{projected_revenue/1e9:.2f}B")
+    
+    with col3:
+        growth_amount = projected_revenue - base_revenue
+        st.metric("Projected Growth", f"₹{growth_amount/1e9:.2f}B")
+    
+    with col4:
+        growth_percent = ((projected_revenue - base_revenue) / base_revenue) * 100
+        st.metric("Growth Percentage", f"{growth_percent:.1f}%")
+    
+    # Predictive Insights
+    st.subheader("💡 Predictive Business Insights")
+    
+    insights = [
+        "📈 **Revenue Forecast**: Expected 8-12% growth based on current trends and seasonality",
+        "👥 **Churn Management**: 15% of high-value customers at risk - implement retention campaigns",
+        "📦 **Inventory Planning**: 68% of products show stable demand patterns - optimize stock levels",
+        "🎯 **Growth Opportunities**: Electronics and Fashion categories projected to grow 18% next quarter",
+        "⚠️ **Risk Factors**: Monitor economic indicators for potential market slowdown impact",
+        "💰 **Investment ROI**: High investment scenario shows 23% higher returns than conservative approach",
+        "🔮 **Seasonal Peaks**: Plan for 35% demand increase during festival seasons"
+    ]
+    
+    for insight in insights:
+        st.success(insight)
+
+# Q27: Market Intelligence Dashboard
+def render_q27():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🌐 Q27: Market Intelligence Dashboard")
+    st.markdown("Competitor tracking, market trends, pricing intelligence, and strategic positioning insights")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Market Share Analysis
+    st.subheader("📊 Market Position & Share Analysis")
+    
+    # Category market share (using internal data as proxy)
+    market_data = st.session_state.transactions.copy()
+    category_share = market_data.groupby('category', observed=True, sort=False).agg({
+        'final_amount_inr': 'sum',
+        'transaction_id': 'count',
+        'customer_id': 'nunique'
+    }).reset_index()
+    
+    category_share.columns = ['category', 'revenue', 'orders', 'customers']
+    category_share['revenue_share'] = (category_share['revenue'] / category_share['revenue'].sum()) * 100
+    category_share['order_share'] = (category_share['orders'] / category_share['orders'].sum()) * 100
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.pie(category_share, values='revenue_share', names='category',
+                    title='Revenue Market Share by Category')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.bar(category_share.nlargest(8, 'revenue_share'), x='category', y='revenue_share',
+                    title='Top Categories by Market Share',
+                    color='revenue_share')
+        fig.update_layout(yaxis_title='Market Share (%)')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Competitive Positioning
+    st.subheader("⚔️ Competitive Landscape Analysis")
+    
+    # Brand performance as proxy for competitive analysis
+    competitive_data = market_data.groupby('brand').agg({
+        'final_amount_inr': 'sum',
+        'transaction_id': 'count',
+        'customer_rating': 'mean',
+        'discount_percent': 'mean'
+    }).reset_index()
+    
+    competitive_data.columns = ['brand', 'revenue', 'orders', 'avg_rating', 'avg_discount']
+    competitive_data['market_share'] = (competitive_data['revenue'] / competitive_data['revenue'].sum()) * 100
+    
+    # Competitive matrix: Price vs Quality
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.scatter(competitive_data, x='avg_discount', y='avg_rating',
+                       size='market_share', color='brand',
+                       title='Competitive Positioning: Discount Strategy vs Quality',
+                       labels={'avg_discount': 'Average Discount (%)', 'avg_rating': 'Average Rating'})
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Market share trends
+        brand_trends = market_data.groupby(['order_year', 'brand'])['final_amount_inr'].sum().reset_index()
+        top_brands = competitive_data.nlargest(5, 'market_share')['brand'].tolist()
+        brand_trends_filtered = brand_trends[brand_trends['brand'].isin(top_brands)]
         
-        # Revenue Optimization Strategies
-        st.subheader("💡 Cross-selling & Upselling Strategies")
+        fig = px.line(brand_trends_filtered, x='order_year', y='final_amount_inr', color='brand',
+                     title='Market Share Evolution - Top 5 Brands',
+                     markers=True)
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Pricing Intelligence
+    st.subheader("💰 Competitive Pricing Analysis")
+    
+    # Price distribution by category and brand
+    pricing_intel = market_data.groupby(['category', 'brand']).agg({
+        'original_price_inr': ['min', 'max', 'mean', 'median'],
+        'discount_percent': 'mean',
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    pricing_intel.columns = ['category', 'brand', 'min_price', 'max_price', 'avg_price', 'median_price', 'avg_discount', 'transactions']
+    
+    # Select category for detailed analysis
+    category_select = st.selectbox("Select Category for Pricing Analysis", 
+                                 pricing_intel['category'].unique())
+    
+    category_pricing = pricing_intel[pricing_intel['category'] == category_select]
+    category_pricing = category_pricing[category_pricing['transactions'] > 10]  # Meaningful brands
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.box(category_pricing, y='avg_price', 
+                    title=f'Price Distribution - {category_select}')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Price vs Discount strategy
+        fig = px.scatter(category_pricing, x='avg_discount', y='avg_price',
+                       size='transactions', color='brand',
+                       title=f'Pricing Strategy: Discount vs Price - {category_select}',
+                       labels={'avg_discount': 'Average Discount (%)', 'avg_price': 'Average Price (₹)'})
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Market Trends Analysis
+    st.subheader("📈 Market Trends & Opportunities")
+    
+    # Growth categories analysis
+    growth_analysis = market_data.groupby(['order_year', 'category'])['final_amount_inr'].sum().reset_index()
+    
+    # Calculate growth rates
+    growth_pivot = growth_analysis.pivot(index='order_year', columns='category', values='final_amount_inr')
+    growth_rates = growth_pivot.pct_change().mean() * 100
+    
+    growth_df = pd.DataFrame({
+        'category': growth_rates.index,
+        'growth_rate': growth_rates.values
+    }).dropna()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fastest_growing = growth_df.nlargest(8, 'growth_rate')
+        fig = px.bar(fastest_growing, x='category', y='growth_rate',
+                    title='Fastest Growing Categories',
+                    color='growth_rate',
+                    color_continuous_scale='Greens')
+        fig.update_layout(yaxis_title='Average Annual Growth Rate (%)')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Market maturity analysis
+        maturity_analysis = category_share.copy()
+        maturity_analysis['growth_rate'] = maturity_analysis['category'].map(growth_df.set_index('category')['growth_rate'])
+        maturity_analysis = maturity_analysis.dropna()
+        
+        fig = px.scatter(maturity_analysis, x='revenue_share', y='growth_rate',
+                       size='customers', color='category',
+                       title='Market Maturity Analysis: Share vs Growth',
+                       labels={'revenue_share': 'Market Share (%)', 'growth_rate': 'Growth Rate (%)'})
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Strategic Insights
+    st.subheader("🎯 Strategic Market Intelligence")
+    
+    intelligence_insights = [
+        "🏆 **Market Leadership**: Dominant position in Electronics (28% share) with 15% YoY growth",
+        "🚀 **Growth Categories**: Fashion and Home categories showing 22%+ growth - expansion opportunities",
+        "💰 **Pricing Strategy**: Premium pricing in Electronics delivering 35% higher margins",
+        "📱 **Digital Disruption**: Mobile commerce growing 3x faster than desktop - mobile-first strategy",
+        "🌍 **Regional Expansion**: Tier 2 cities represent 45% growth potential - geographic expansion focus",
+        "⚡ **Competitive Moves**: Monitor key competitors' discount strategies in high-growth categories",
+        "🔮 **Future Trends**: AI and IoT products projected to grow 40% annually - early positioning advantage"
+    ]
+    
+    for insight in intelligence_insights:
+        st.info(insight)
+
+# Q28: Cross-selling & Upselling Dashboard - FIXED
+def render_q28():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🔄 Q28: Cross-selling & Upselling Dashboard")
+    st.markdown("Product associations, recommendation effectiveness, bundle opportunities, and revenue optimization")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Product Association Analysis - FIXED: Better data processing
+    st.subheader("📊 Product Association Patterns")
+    
+    association_data = st.session_state.transactions.copy()
+    
+    # Check if required columns exist
+    required_cols = ['customer_id', 'order_date', 'category']
+    if not all(col in association_data.columns for col in required_cols):
+        st.error("❌ Required columns missing for association analysis")
+        return
         
-        strategies = [
-            "🔄 **Category Pairs**: Focus on frequently bought together categories for bundled offers",
-            "💰 **Upselling Targets**: Identify customers with high upselling potential for premium products",
-            "🎁 **Bundle Creation**: Create strategic bundles based on purchase patterns",
-            "📱 **Personalization**: Implement AI-driven personalized recommendations",
-            "⏰ **Timing Optimization**: Trigger cross-sell offers during checkout process",
-            "📊 **Performance Tracking**: Monitor recommendation conversion rates by category",
-            "🎯 **Segment-specific**: Develop different strategies for new vs loyal customers",
-            "🚀 **A/B Testing**: Continuously test and optimize recommendation algorithms"
-        ]
+    # Customer purchase patterns - FIXED: Handle large datasets
+    try:
+        # Sample data if too large for processing
+        if len(association_data) > 10000:
+            association_data = association_data.sample(n=10000, random_state=42)
+            st.info(f"📊 Analyzing sample of 10,000 transactions for performance")
+        
+        # Group by customer and order date to find multi-category purchases
+        customer_categories = association_data.groupby(['customer_id', 'order_date']).agg({
+            'category': lambda x: list(x.unique()),  # Get unique categories per order
+            'final_amount_inr': 'sum'
+        }).reset_index()
         
-        for strategy in strategies:
-            st.success(strategy)
+        # Find category combinations
+        category_combinations = []
+        for _, row in customer_categories.iterrows():
+            categories = row['category']
+            if len(categories) > 1:
+                # Create pairs of categories purchased together
+                for i in range(len(categories)):
+                    for j in range(i+1, len(categories)):
+                        # Sort to avoid duplicate pairs
+                        pair = tuple(sorted([categories[i], categories[j]]))
+                        category_combinations.append(pair)
+        
+        # Count frequency of category pairs
+        if category_combinations:
+            combination_df = pd.DataFrame(category_combinations, columns=['category1', 'category2'])
+            combination_counts = combination_df.groupby(['category1', 'category2']).size().reset_index(name='frequency')
+            combination_counts = combination_counts.sort_values('frequency', ascending=False)
             
-        # Additional: Implementation Roadmap
-        with st.expander("🛠️ Implementation Roadmap"):
-            st.markdown("""
-            **Phase 1 (Month 1-2):**
-            - Implement basic recommendation engine
-            - Set up A/B testing framework
-            - Train team on new tools
+            # Top category associations
+            top_associations = combination_counts.head(15)
             
-            **Phase 2 (Month 3-4):**
-            - Launch personalized recommendations
-            - Implement bundle offers
-            - Monitor initial performance
+            fig = px.bar(top_associations, x='frequency', y='category1',
+                        title='Top Product Category Associations',
+                        orientation='h',
+                        color='frequency',
+                        hover_data=['category2'])
+            st.plotly_chart(fig, use_container_width=True)
             
-            **Phase 3 (Month 5-6):**
-            - Optimize based on performance data
-            - Scale successful strategies
-            - Advanced segmentation
-            """)
+            # Display association table
+            with st.expander("📋 View Detailed Association Table"):
+                st.dataframe(
+                    combination_counts.head(20),
+                    use_container_width=True
+                )
+        else:
+            st.info("📊 No multi-category purchase patterns found in the data")
             
-    # Q29: Seasonal Planning Dashboard
-    elif dashboard_id == "Q29":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("📅 Q29: Seasonal Planning Dashboard")
-        st.markdown("Inventory planning, promotional calendar, resource allocation, and seasonal business optimization")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Seasonal Sales Patterns
-        st.subheader("🌞 Seasonal Sales Analysis")
-        
-        seasonal_data = st.session_state.transactions.copy()
-        seasonal_data['order_date'] = pd.to_datetime(seasonal_data['order_date'])
-        seasonal_data['month'] = seasonal_data['order_date'].dt.month
-        seasonal_data['year'] = seasonal_data['order_date'].dt.year
-        
-        # Monthly sales patterns
-        monthly_pattern = seasonal_data.groupby('month').agg({
-            'final_amount_inr': 'mean',
-            'quantity': 'mean',
-            'transaction_id': 'count'
+    except Exception as e:
+        st.error(f"❌ Error in association analysis: {str(e)}")
+        st.info("Try reducing the dataset size or check data quality")
+    
+    # Upselling Performance - FIXED: Better customer analysis
+    st.subheader("💰 Upselling Effectiveness")
+    
+    try:
+        # Analyze order value growth opportunities
+        upselling_data = association_data.groupby('customer_id').agg({
+            'final_amount_inr': ['max', 'mean', 'count'],
+            'category': 'nunique'
         }).reset_index()
         
-        monthly_pattern.columns = ['month', 'avg_revenue', 'avg_quantity', 'order_count']
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.line(monthly_pattern, x='month', y='avg_revenue',
-                         title='Average Monthly Revenue Pattern',
-                         markers=True)
-            fig.update_layout(xaxis_title='Month', yaxis_title='Average Revenue (₹)')
-            fig.update_yaxes(tickprefix='₹')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.line(monthly_pattern, x='month', y='order_count',
-                         title='Average Monthly Order Volume',
-                         markers=True)
-            fig.update_layout(xaxis_title='Month', yaxis_title='Average Orders')
-            st.plotly_chart(fig, use_container_width=True)
+        # Flatten column names
+        upselling_data.columns = ['customer_id', 'max_order_value', 'avg_order_value', 'order_count', 'unique_categories']
         
-        # Festival Season Impact
-        st.subheader("🎪 Festival Season Performance")
+        # Remove customers with only one order (no upselling history)
+        upselling_data = upselling_data[upselling_data['order_count'] > 1]
         
-        # Analyze festival sales impact
-        festival_data = seasonal_data[seasonal_data['is_festival_sale'] == 'Yes']
-        
-        if not festival_data.empty:
-            festival_performance = festival_data.groupby('festival_name').agg({
-                'final_amount_inr': 'sum',
-                'transaction_id': 'count',
-                'customer_id': 'nunique'
-            }).reset_index()
+        if not upselling_data.empty:
+            # Upselling potential analysis
+            upselling_data['upselling_potential'] = upselling_data['max_order_value'] - upselling_data['avg_order_value']
+            upselling_data['potential_percent'] = (upselling_data['upselling_potential'] / upselling_data['avg_order_value']) * 100
             
-            festival_performance.columns = ['festival', 'total_revenue', 'total_orders', 'unique_customers']
+            # Filter reasonable values (remove negative potentials)
+            upselling_data = upselling_data[upselling_data['upselling_potential'] > 0]
             
             col1, col2 = st.columns(2)
             
             with col1:
-                fig = px.bar(festival_performance, x='festival', y='total_revenue',
-                            title='Revenue by Festival Season',
-                            color='total_revenue')
-                fig.update_yaxes(tickprefix='₹')
+                # Upselling potential distribution
+                fig = px.histogram(upselling_data, x='potential_percent',
+                                 title='Upselling Potential Distribution',
+                                 nbins=20,
+                                 color_discrete_sequence=['#00CC96'])
+                fig.update_layout(xaxis_title='Upselling Potential (%)', yaxis_title='Number of Customers')
                 st.plotly_chart(fig, use_container_width=True)
             
             with col2:
-                fig = px.bar(festival_performance, x='festival', y='total_orders',
-                            title='Orders by Festival Season',
-                            color='total_orders')
-                st.plotly_chart(fig, use_container_width=True)
+                # High upselling potential customers
+                high_potential = upselling_data.nlargest(10, 'upselling_potential')
+                if not high_potential.empty:
+                    fig = px.bar(high_potential, x='customer_id', y='upselling_potential',
+                                title='Top 10 Customers with Highest Upselling Potential',
+                                color='upselling_potential',
+                                color_continuous_scale='Viridis')
+                    fig.update_yaxes(tickprefix='₹')
+                    fig.update_layout(showlegend=False)
+                    st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.info("📊 No high upselling potential customers found")
+            
+            # Upselling metrics summary
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                avg_potential = upselling_data['upselling_potential'].mean()
+                st.metric("Avg Upselling Potential", f"₹{avg_potential:.0f}")
+            
+            with col2:
+                high_potential_count = len(upselling_data[upselling_data['potential_percent'] > 50])
+                st.metric("High Potential Customers", f"{high_potential_count}")
+            
+            with col3:
+                total_upselling_opportunity = upselling_data['upselling_potential'].sum()
+                st.metric("Total Opportunity", f"₹{total_upselling_opportunity:,.0f}")
+                    
         else:
-            st.info("No festival data available in current sample.")
-        
-        # Category-wise Seasonal Patterns
-        st.subheader("🏪 Seasonal Category Performance")
+            st.info("📊 No upselling data available (need customers with multiple orders)")
+            
+    except Exception as e:
+        st.error(f"❌ Error in upselling analysis: {str(e)}")
+    
+    # Bundle Opportunity Analysis - FIXED: Better bundle detection
+    st.subheader("🎁 Product Bundle Opportunities")
+    
+    try:
+        # Analyze potential bundle combinations within same orders
+        bundle_data = association_data.copy()
         
-        # Category performance by month
-        category_seasonal = seasonal_data.groupby(['month', 'category']).agg({
-            'final_amount_inr': 'sum',
-            'quantity': 'sum'
+        # Find orders with multiple products
+        order_products = bundle_data.groupby(['transaction_id', 'order_date']).agg({
+            'product_id': 'count',
+            'category': 'nunique',
+            'final_amount_inr': 'sum'
         }).reset_index()
         
-        # Find top categories for each month
-        top_monthly_categories = category_seasonal.loc[category_seasonal.groupby('month')['final_amount_inr'].idxmax()]
-        
-        fig = px.bar(top_monthly_categories, x='month', y='final_amount_inr', color='category',
-                    title='Top Performing Categories by Month',
-                    hover_data=['quantity'])
-        fig.update_layout(xaxis_title='Month', yaxis_title='Total Revenue (₹)')
-        fig.update_yaxes(tickprefix='₹')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Inventory Planning
-        st.subheader("📦 Seasonal Inventory Planning")
-        
-        # Demand forecasting by season
-        seasonal_forecast = monthly_pattern.copy()
+        order_products.columns = ['transaction_id', 'order_date', 'product_count', 'category_count', 'order_value']
         
-        # Calculate seasonal indices
-        annual_avg = seasonal_forecast['avg_quantity'].mean()
-        seasonal_forecast['seasonal_index'] = seasonal_forecast['avg_quantity'] / annual_avg
+        # Identify multi-product orders (potential bundles)
+        multi_product_orders = order_products[order_products['product_count'] > 1]
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(seasonal_forecast, x='month', y='seasonal_index',
-                        title='Seasonal Demand Index by Month',
-                        color='seasonal_index',
-                        color_continuous_scale='RdYlGn')
-            fig.update_layout(xaxis_title='Month', yaxis_title='Seasonal Index')
+        if not multi_product_orders.empty:
+            # Bundle performance metrics
+            avg_bundle_value = multi_product_orders['order_value'].mean()
+            avg_single_order_value = order_products[order_products['product_count'] == 1]['order_value'].mean()
+            
+            if avg_single_order_value > 0:  # Avoid division by zero
+                bundle_premium = ((avg_bundle_value - avg_single_order_value) / avg_single_order_value) * 100
+            else:
+                bundle_premium = 0
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("Avg Bundle Order Value", f"₹{avg_bundle_value:.0f}")
+            
+            with col2:
+                st.metric("Avg Single Order Value", f"₹{avg_single_order_value:.0f}")
+            
+            with col3:
+                st.metric("Bundle Value Premium", f"{bundle_premium:.1f}%")
+            
+            with col4:
+                bundle_orders_pct = (len(multi_product_orders) / len(order_products)) * 100
+                st.metric("Bundle Orders", f"{bundle_orders_pct:.1f}%")
+            
+            # Bundle frequency by product count
+            bundle_frequency = order_products[order_products['product_count'] > 1]['product_count'].value_counts().sort_index()
+            
+            fig = px.bar(bundle_frequency, x=bundle_frequency.index, y=bundle_frequency.values,
+                        title='Bundle Frequency by Number of Products',
+                        labels={'x': 'Products per Order', 'y': 'Number of Orders'})
             st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Inventory recommendations
-            high_season_months = seasonal_forecast[seasonal_forecast['seasonal_index'] > 1.2]['month'].tolist()
-            low_season_months = seasonal_forecast[seasonal_forecast['seasonal_index'] < 0.8]['month'].tolist()
+                
+        else:
+            st.info("📊 No multi-product orders found for bundle analysis")
             
-            st.write("**📊 Seasonal Inventory Recommendations:**")
-            st.write(f"🔼 **High Season Months**: {', '.join(map(str, high_season_months))} - Increase inventory by 30-50%")
-            st.write(f"🔽 **Low Season Months**: {', '.join(map(str, low_season_months))} - Reduce inventory by 20-30%")
-            st.write(f"⚖️ **Moderate Months**: Maintain standard inventory levels")
-        
-        # Promotional Calendar
-        st.subheader("🎯 Seasonal Promotional Calendar")
+    except Exception as e:
+        st.error(f"❌ Error in bundle analysis: {str(e)}")
+    
+    # Recommendation Effectiveness - FIXED: Better simulation
+    st.subheader("🎯 Recommendation Performance")
+    
+    # Simulated recommendation performance (in real scenario, would come from A/B testing data)
+    try:
+        recommendation_metrics = {
+            'Cross-sell Recommendations': 12.5,
+            'Upsell Suggestions': 8.3,
+            'Bundle Offers': 15.2,
+            'Frequently Bought Together': 18.7,
+            'Similar Products': 6.8,
+            'Customer History Based': 11.4,
+            'Trending Products': 9.6
+        }
         
-        # Create promotional calendar
-        promotional_calendar = pd.DataFrame({
-            'Month': ['January', 'February', 'March', 'April', 'May', 'June', 
-                     'July', 'August', 'September', 'October', 'November', 'December'],
-            'Key Events': ['Republic Day Sales', 'No Major Events', 'Holi Sales', 'No Major Events', 
-                          'Summer Sales', 'No Major Events', 'Monsoon Sales', 'Independence Day',
-                          'No Major Events', 'Diwali Preparation', 'Diwali & Festival Sales', 'Christmas & New Year'],
-            'Focus Categories': ['Electronics, Fashion', 'Home, Kitchen', 'Fashion, Beauty', 'Sports, Fitness',
-                               'AC, Coolers, Summer Fashion', 'Monsoon Essentials', 'Rainwear, Home', 
-                               'Electronics, Fashion', 'No Major Focus', 'Electronics, Home', 'All Categories', 'Fashion, Gifts'],
-            'Discount Range': ['20-40%', '10-20%', '25-35%', '15-25%', '20-30%', '15-25%',
-                              '20-35%', '25-40%', '10-20%', '15-30%', '30-50%', '25-45%']
+        rec_df = pd.DataFrame({
+            'recommendation_type': list(recommendation_metrics.keys()),
+            'conversion_rate': list(recommendation_metrics.values())
         })
         
-        st.dataframe(promotional_calendar, use_container_width=True)
-        
-        # Resource Allocation
-        st.subheader("👥 Seasonal Resource Planning")
-        
-        # Resource allocation recommendations
-        peak_months = seasonal_forecast.nlargest(3, 'avg_quantity')['month'].tolist()
-        trough_months = seasonal_forecast.nsmallest(3, 'avg_quantity')['month'].tolist()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write("**🚀 Peak Season Planning (Months: " + ", ".join(map(str, peak_months)) + ")**")
-            peak_recommendations = [
-                "• Increase customer support staff by 40%",
-                "• Extend warehouse working hours",
-                "• Pre-stock high-demand categories",
-                "• Implement surge pricing for delivery",
-                "• Launch targeted marketing campaigns"
-            ]
-            for rec in peak_recommendations:
-                st.write(rec)
-        
-        with col2:
-            st.write("**💤 Low Season Planning (Months: " + ", ".join(map(str, trough_months)) + ")**")
-            low_recommendations = [
-                "• Focus on maintenance and training",
-                "• Plan inventory clearance sales",
-                "• Conduct market research",
-                "• Optimize operational processes",
-                "• Prepare for next peak season"
-            ]
-            for rec in low_recommendations:
-                st.write(rec)
-
-    # Q30: Business Intelligence Command Center
-    elif dashboard_id == "Q30":
-        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
-        st.header("🎛️ Q30: Business Intelligence Command Center")
-        st.markdown("Integrated key metrics, automated alerts, performance monitoring, and strategic decision support")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Executive Summary Dashboard
-        st.subheader("📊 Executive Overview - Key Business Metrics")
-        
-        # Calculate key business metrics
-        business_data = st.session_state.transactions.copy()
-        customers_data = st.session_state.customers.copy()
-        
-        # Key Performance Indicators
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            total_revenue = business_data['final_amount_inr'].sum()
-            st.metric("Total Revenue", f"₹{total_revenue/1e9:.2f}B")
-        
-        with col2:
-            total_customers = len(customers_data)
-            st.metric("Total Customers", f"{total_customers:,}")
-        
-        with col3:
-            total_orders = len(business_data)
-            st.metric("Total Orders", f"{total_orders:,}")
-        
-        with col4:
-            avg_order_value = business_data['final_amount_inr'].mean()
-            st.metric("Average Order Value", f"₹{avg_order_value:.0f}")
-        
-        # Second row of KPIs
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            customer_growth = 12.3  # Simulated
-            st.metric("Customer Growth Rate", f"{customer_growth}%")
-        
-        with col2:
-            revenue_growth = 15.8  # Simulated
-            st.metric("Revenue Growth Rate", f"{revenue_growth}%")
-        
-        with col3:
-            retention_rate = 67.2  # Simulated
-            st.metric("Customer Retention Rate", f"{retention_rate}%")
-        
-        with col4:
-            avg_rating = business_data['customer_rating'].mean()
-            st.metric("Customer Satisfaction", f"{avg_rating:.1f} ⭐")
-        
-        # Real-time Performance Monitoring
-        st.subheader("📈 Real-time Performance Dashboard")
-        
-        # Current month performance
-        business_data['order_date'] = pd.to_datetime(business_data['order_date'])
-        current_month = business_data[business_data['order_date'].dt.month == datetime.now().month]
+        fig = px.bar(rec_df, x='recommendation_type', y='conversion_rate',
+                    title='Recommendation Type Conversion Rates',
+                    color='conversion_rate',
+                    color_continuous_scale='Viridis')
+        fig.update_layout(
+            yaxis_title='Conversion Rate (%)',
+            xaxis_tickangle=-45
+        )
+        st.plotly_chart(fig, use_container_width=True)
         
-        col1, col2, col3, col4 = st.columns(4)
+        # Recommendation impact summary
+        col1, col2, col3 = st.columns(3)
         
         with col1:
-            month_revenue = current_month['final_amount_inr'].sum()
-            st.metric("Current Month Revenue", f"₹{month_revenue/1e6:.1f}M")
+            best_recommendation = rec_df.nlargest(1, 'conversion_rate')
+            st.metric("Most Effective", best_recommendation['recommendation_type'].iloc[0])
         
         with col2:
-            month_orders = len(current_month)
-            st.metric("Current Month Orders", f"{month_orders:,}")
+            avg_conversion = rec_df['conversion_rate'].mean()
+            st.metric("Avg Conversion Rate", f"{avg_conversion:.1f}%")
         
         with col3:
-            month_customers = current_month['customer_id'].nunique()
-            st.metric("Current Month Customers", f"{month_customers:,}")
-        
-        with col4:
-            month_aov = current_month['final_amount_inr'].mean()
-            st.metric("Current Month AOV", f"₹{month_aov:.0f}")
-        
-        # Automated Alerts System
-        st.subheader("🚨 Automated Performance Alerts")
-        
-        # Define alert thresholds
-        alerts = []
-        
-        # Revenue alert
-        if month_revenue < total_revenue / 12 * 0.8:  # 20% below monthly average
-            alerts.append(("🔴 Revenue Alert", "Current month revenue 20% below target"))
-        
-        # Customer growth alert
-        if customer_growth < 8:
-            alerts.append(("🟡 Growth Alert", "Customer growth below 8% target"))
-        
-        # Retention alert
-        if retention_rate < 70:
-            alerts.append(("🟠 Retention Alert", "Customer retention below 70% target"))
-        
-        # Delivery performance alert
-        avg_delivery = business_data['delivery_days'].mean()
-        if avg_delivery > 7:
-            alerts.append(("🔵 Delivery Alert", "Average delivery time exceeding 7 days"))
-        
-        # Display alerts
-        if alerts:
-            for alert_type, message in alerts:
-                st.error(f"{alert_type}: {message}")
-        else:
-            st.success("✅ All systems operating within normal parameters")
-        
-        # Strategic Decision Support
-        st.subheader("🎯 Strategic Insights & Recommendations")
-        
-        # Business health assessment
-        business_health = {
-            "Revenue Growth": "Excellent" if revenue_growth > 12 else "Good" if revenue_growth > 8 else "Needs Attention",
-            "Customer Acquisition": "Excellent" if customer_growth > 10 else "Good" if customer_growth > 6 else "Needs Attention",
-            "Customer Retention": "Excellent" if retention_rate > 75 else "Good" if retention_rate > 65 else "Needs Attention",
-            "Operational Efficiency": "Excellent" if avg_delivery <= 5 else "Good" if avg_delivery <= 7 else "Needs Attention",
-            "Customer Satisfaction": "Excellent" if avg_rating >= 4.2 else "Good" if avg_rating >= 3.8 else "Needs Attention"
-        }
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write("**Business Health Assessment:**")
-            for metric, status in business_health.items():
-                color = "🟢" if status == "Excellent" else "🟡" if status == "Good" else "🔴"
-                st.write(f"{color} {metric}: {status}")
-        
-        with col2:
-            st.write("**Priority Actions:**")
-            priority_actions = [
-                "📈 **Revenue Optimization**: Focus on upselling and cross-selling strategies",
-                "👥 **Customer Growth**: Implement targeted acquisition campaigns",
-                "💎 **Retention Enhancement**: Develop loyalty program and personalized engagement",
-                "🚚 **Operational Excellence**: Optimize delivery network and reduce turnaround times",
-                "⭐ **Experience Improvement**: Enhance product quality and customer service"
-            ]
-            for action in priority_actions:
-                st.write(action)
-        
-        # Performance Trends
-        st.subheader("📊 Performance Trends & Forecasting")
+            total_impact = avg_conversion * 1000  # Simulated impact
+            st.metric("Estimated Monthly Impact", f"+{total_impact:,.0f} orders")
+            
+    except Exception as e:
+        st.error(f"❌ Error in recommendation analysis: {str(e)}")
+    
+    # Revenue Optimization Strategies
+    st.subheader("💡 Cross-selling & Upselling Strategies")
+    
+    strategies = [
+        "🔄 **Category Pairs**: Focus on frequently bought together categories for bundled offers",
+        "💰 **Upselling Targets**: Identify customers with high upselling potential for premium products",
+        "🎁 **Bundle Creation**: Create strategic bundles based on purchase patterns",
+        "📱 **Personalization**: Implement AI-driven personalized recommendations",
+        "⏰ **Timing Optimization**: Trigger cross-sell offers during checkout process",
+        "📊 **Performance Tracking**: Monitor recommendation conversion rates by category",
+        "🎯 **Segment-specific**: Develop different strategies for new vs loyal customers",
+        "🚀 **A/B Testing**: Continuously test and optimize recommendation algorithms"
+    ]
+    
+    for strategy in strategies:
+        st.success(strategy)
         
-        # Revenue trend
-        revenue_trend = business_data.groupby(business_data['order_date'].dt.to_period('M'))['final_amount_inr'].sum().reset_index()
-        revenue_trend['order_date'] = revenue_trend['order_date'].astype(str)
+    # Additional: Implementation Roadmap
+    with st.expander("🛠️ Implementation Roadmap"):
+        st.markdown("""
+        **Phase 1 (Month 1-2):**
+        - Implement basic recommendation engine
+        - Set up A/B testing framework
+        - Train team on new tools
+        
+        **Phase 2 (Month 3-4):**
+        - Launch personalized recommendations
+        - Implement bundle offers
+        - Monitor initial performance
+        
+        **Phase 3 (Month 5-6):**
+        - Optimize based on performance data
+        - Scale successful strategies
+        - Advanced segmentation
+        """)
         
-        fig = px.line(revenue_trend, x='order_date', y='final_amount_inr',
-                     title='Revenue Trend - Last 12 Months',
+# Q29: Seasonal Planning Dashboard
+def render_q29():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("📅 Q29: Seasonal Planning Dashboard")
+    st.markdown("Inventory planning, promotional calendar, resource allocation, and seasonal business optimization")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Seasonal Sales Patterns
+    st.subheader("🌞 Seasonal Sales Analysis")
+    
+    seasonal_data = st.session_state.transactions.copy()
+    seasonal_data['order_date'] = pd.to_datetime(seasonal_data['order_date'])
+    seasonal_data['month'] = seasonal_data['order_date'].dt.month
+    seasonal_data['year'] = seasonal_data['order_date'].dt.year
+    
+    # Monthly sales patterns
+    monthly_pattern = seasonal_data.groupby('month').agg({
+        'final_amount_inr': 'mean',
+        'quantity': 'mean',
+        'transaction_id': 'count'
+    }).reset_index()
+    
+    monthly_pattern.columns = ['month', 'avg_revenue', 'avg_quantity', 'order_count']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.line(monthly_pattern, x='month', y='avg_revenue',
+                     title='Average Monthly Revenue Pattern',
                      markers=True)
-        fig.update_layout(xaxis_title='Month', yaxis_title='Revenue (₹)')
+        fig.update_layout(xaxis_title='Month', yaxis_title='Average Revenue (₹)')
         fig.update_yaxes(tickprefix='₹')
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Category Performance
-        st.subheader("🏪 Category Performance Overview")
-        
-        category_performance = business_data.groupby('category').agg({
+    
+    with col2:
+        fig = px.line(monthly_pattern, x='month', y='order_count',
+                     title='Average Monthly Order Volume',
+                     markers=True)
+        fig.update_layout(xaxis_title='Month', yaxis_title='Average Orders')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Festival Season Impact
+    st.subheader("🎪 Festival Season Performance")
+    
+    # Analyze festival sales impact
+    festival_data = seasonal_data[seasonal_data['is_festival_sale'] == 'Yes']
+    
+    if not festival_data.empty:
+        festival_performance = festival_data.groupby('festival_name').agg({
             'final_amount_inr': 'sum',
             'transaction_id': 'count',
             'customer_id': 'nunique'
         }).reset_index()
         
-        category_performance.columns = ['category', 'revenue', 'orders', 'customers']
+        festival_performance.columns = ['festival', 'total_revenue', 'total_orders', 'unique_customers']
         
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = px.pie(category_performance, values='revenue', names='category',
-                        title='Revenue Distribution by Category')
+            fig = px.bar(festival_performance, x='festival', y='total_revenue',
+                        title='Revenue by Festival Season',
+                        color='total_revenue')
+            fig.update_yaxes(tickprefix='₹')
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
-            fig = px.bar(category_performance.nlargest(8, 'revenue'), x='category', y='revenue',
-                        title='Top Categories by Revenue',
-                        color='revenue')
-            fig.update_yaxes(tickprefix='₹')
+            fig = px.bar(festival_performance, x='festival', y='total_orders',
+                        title='Orders by Festival Season',
+                        color='total_orders')
             st.plotly_chart(fig, use_container_width=True)
-        
-        # Executive Summary
-        st.subheader("📋 Executive Summary & Next Steps")
-        
-        summary_insights = [
-            "💰 **Financial Performance**: Strong revenue growth at 15.8% YoY, exceeding industry average",
-            "👥 **Customer Base**: Healthy customer acquisition with 12.3% growth, focus on retention improvement",
-            "🏪 **Category Leadership**: Electronics and Fashion driving 58% of total revenue",
-            "🚀 **Operational Metrics**: Delivery performance needs optimization to improve customer satisfaction",
-            "🎯 **Strategic Focus**: Priority on customer retention, operational efficiency, and category expansion",
-            "📈 **Growth Opportunities**: Tier 2 cities and new product categories represent significant potential",
-            "🔮 **Outlook**: Positive trajectory with targeted initiatives for sustainable growth"
+    else:
+        st.info("No festival data available in current sample.")
+    
+    # Category-wise Seasonal Patterns
+    st.subheader("🏪 Seasonal Category Performance")
+    
+    # Category performance by month
+    category_seasonal = seasonal_data.groupby(['month', 'category']).agg({
+        'final_amount_inr': 'sum',
+        'quantity': 'sum'
+    }).reset_index()
+    
+    # Find top categories for each month
+    top_monthly_categories = category_seasonal.loc[category_seasonal.groupby('month')['final_amount_inr'].idxmax()]
+    
+    fig = px.bar(top_monthly_categories, x='month', y='final_amount_inr', color='category',
+                title='Top Performing Categories by Month',
+                hover_data=['quantity'])
+    fig.update_layout(xaxis_title='Month', yaxis_title='Total Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Inventory Planning
+    st.subheader("📦 Seasonal Inventory Planning")
+    
+    # Demand forecasting by season
+    seasonal_forecast = monthly_pattern.copy()
+    
+    # Calculate seasonal indices
+    annual_avg = seasonal_forecast['avg_quantity'].mean()
+    seasonal_forecast['seasonal_index'] = seasonal_forecast['avg_quantity'] / annual_avg
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(seasonal_forecast, x='month', y='seasonal_index',
+                    title='Seasonal Demand Index by Month',
+                    color='seasonal_index',
+                    color_continuous_scale='RdYlGn')
+        fig.update_layout(xaxis_title='Month', yaxis_title='Seasonal Index')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Inventory recommendations
+        high_season_months = seasonal_forecast[seasonal_forecast['seasonal_index'] > 1.2]['month'].tolist()
+        low_season_months = seasonal_forecast[seasonal_forecast['seasonal_index'] < 0.8]['month'].tolist()
+        
+        st.write("**📊 Seasonal Inventory Recommendations:**")
+        st.write(f"🔼 **High Season Months**: {', '.join(map(str, high_season_months))} - Increase inventory by 30-50%")
+        st.write(f"🔽 **Low Season Months**: {', '.join(map(str, low_season_months))} - Reduce inventory by 20-30%")
+        st.write(f"⚖️ **Moderate Months**: Maintain standard inventory levels")
+    
+    # Promotional Calendar
+    st.subheader("🎯 Seasonal Promotional Calendar")
+    
+    # Create promotional calendar
+    promotional_calendar = pd.DataFrame({
+        'Month': ['January', 'February', 'March', 'April', 'May', 'June', 
+                 'July', 'August', 'September', 'October', 'November', 'December'],
+        'Key Events': ['Republic Day Sales', 'No Major Events', 'Holi Sales', 'No Major Events', 
+                      'Summer Sales', 'No Major Events', 'Monsoon Sales', 'Independence Day',
+                      'No Major Events', 'Diwali Preparation', 'Diwali & Festival Sales', 'Christmas & New Year'],
+        'Focus Categories': ['Electronics, Fashion', 'Home, Kitchen', 'Fashion, Beauty', 'Sports, Fitness',
+                           'AC, Coolers, Summer Fashion', 'Monsoon Essentials', 'Rainwear, Home', 
+                           'Electronics, Fashion', 'No Major Focus', 'Electronics, Home', 'All Categories', 'Fashion, Gifts'],
+        'Discount Range': ['20-40%', '10-20%', '25-35%', '15-25%', '20-30%', '15-25%',
+                          '20-35%', '25-40%', '10-20%', '15-30%', '30-50%', '25-45%']
+    })
+    
+    st.dataframe(promotional_calendar, use_container_width=True)
+    
+    # Resource Allocation
+    st.subheader("👥 Seasonal Resource Planning")
+    
+    # Resource allocation recommendations
+    peak_months = seasonal_forecast.nlargest(3, 'avg_quantity')['month'].tolist()
+    trough_months = seasonal_forecast.nsmallest(3, 'avg_quantity')['month'].tolist()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**🚀 Peak Season Planning (Months: " + ", ".join(map(str, peak_months)) + ")**")
+        peak_recommendations = [
+            "• Increase customer support staff by 40%",
+            "• Extend warehouse working hours",
+            "• Pre-stock high-demand categories",
+            "• Implement surge pricing for delivery",
+            "• Launch targeted marketing campaigns"
         ]
-        
-        for insight in summary_insights:
-            st.info(insight)
+        for rec in peak_recommendations:
+            st.write(rec)
+    
+    with col2:
+        st.write("**💤 Low Season Planning (Months: " + ", ".join(map(str, trough_months)) + ")**")
+        low_recommendations = [
+            "• Focus on maintenance and training",
+            "• Plan inventory clearance sales",
+            "• Conduct market research",
+            "• Optimize operational processes",
+            "• Prepare for next peak season"
+        ]
+        for rec in low_recommendations:
+            st.write(rec)
+
+# Q30: Business Intelligence Command Center
+def render_q30():
+    st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+    st.header("🎛️ Q30: Business Intelligence Command Center")
+    st.markdown("Integrated key metrics, automated alerts, performance monitoring, and strategic decision support")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Executive Summary Dashboard
+    st.subheader("📊 Executive Overview - Key Business Metrics")
+    
+    # Calculate key business metrics
+    business_data = st.session_state.transactions.copy()
+    customers_data = st.session_state.customers.copy()
+    
+    # Key Performance Indicators
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        total_revenue = st.session_state.revenue_sum
+        st.metric("Total Revenue", f"₹{total_revenue/1e9:.2f}B")
+    
+    with col2:
+        total_customers = len(customers_data)
+        st.metric("Total Customers", f"{total_customers:,}")
+    
+    with col3:
+        total_orders = len(business_data)
+        st.metric("Total Orders", f"{total_orders:,}")
+    
+    with col4:
+        avg_order_value = running_mean('revenue')
+        st.metric("Average Order Value", f"₹{avg_order_value:.0f}")
+    
+    # Second row of KPIs
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        customer_growth = 12.3  # Simulated
+        st.metric("Customer Growth Rate", f"{customer_growth}%")
+    
+    with col2:
+        revenue_growth = 15.8  # Simulated
+        st.metric("Revenue Growth Rate", f"{revenue_growth}%")
+    
+    with col3:
+        retention_rate = 67.2  # Simulated
+        st.metric("Customer Retention Rate", f"{retention_rate}%")
+    
+    with col4:
+        avg_rating = running_mean('rating')
+        st.metric("Customer Satisfaction", f"{avg_rating:.1f} ⭐")
+    
+    # Real-time Performance Monitoring
+    st.subheader("📈 Real-time Performance Dashboard")
+    
+    # Current month performance
+    business_data['order_date'] = pd.to_datetime(business_data['order_date'])
+    current_month = business_data[business_data['order_date'].dt.month == datetime.now().month]
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        month_revenue = current_month['final_amount_inr'].sum()
+        st.metric("Current Month Revenue", f"₹{month_revenue/1e6:.1f}M")
+    
+    with col2:
+        month_orders = len(current_month)
+        st.metric("Current Month Orders", f"{month_orders:,}")
+    
+    with col3:
+        month_customers = current_month['customer_id'].nunique()
+        st.metric("Current Month Customers", f"{month_customers:,}")
+    
+    with col4:
+        month_aov = current_month['final_amount_inr'].mean()
+        st.metric("Current Month AOV", f"₹{month_aov:.0f}")
+    
+    # Automated Alerts System
+    st.subheader("🚨 Automated Performance Alerts")
+    
+    # Define alert thresholds
+    alerts = []
+    
+    # Revenue alert
+    if month_revenue < total_revenue / 12 * 0.8:  # 20% below monthly average
+        alerts.append(("🔴 Revenue Alert", "Current month revenue 20% below target"))
+    
+    # Customer growth alert
+    if customer_growth < 8:
+        alerts.append(("🟡 Growth Alert", "Customer growth below 8% target"))
+    
+    # Retention alert
+    if retention_rate < 70:
+        alerts.append(("🟠 Retention Alert", "Customer retention below 70% target"))
+    
+    # Delivery performance alert
+    avg_delivery = running_mean('delivery')
+    if avg_delivery > 7:
+        alerts.append(("🔵 Delivery Alert", "Average delivery time exceeding 7 days"))
+    
+    # Display alerts
+    if alerts:
+        for alert_type, message in alerts:
+            st.error(f"{alert_type}: {message}")
+    else:
+        st.success("✅ All systems operating within normal parameters")
+    
+    # Strategic Decision Support
+    st.subheader("🎯 Strategic Insights & Recommendations")
+    
+    # Business health assessment
+    business_health = {
+        "Revenue Growth": "Excellent" if revenue_growth > 12 else "Good" if revenue_growth > 8 else "Needs Attention",
+        "Customer Acquisition": "Excellent" if customer_growth > 10 else "Good" if customer_growth > 6 else "Needs Attention",
+        "Customer Retention": "Excellent" if retention_rate > 75 else "Good" if retention_rate > 65 else "Needs Attention",
+        "Operational Efficiency": "Excellent" if avg_delivery <= 5 else "Good" if avg_delivery <= 7 else "Needs Attention",
+        "Customer Satisfaction": "Excellent" if avg_rating >= 4.2 else "Good" if avg_rating >= 3.8 else "Needs Attention"
+    }
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**Business Health Assessment:**")
+        for metric, status in business_health.items():
+            color = "🟢" if status == "Excellent" else "🟡" if status == "Good" else "🔴"
+            st.write(f"{color} {metric}: {status}")
+    
+    with col2:
+        st.write("**Priority Actions:**")
+        priority_actions = [
+            "📈 **Revenue Optimization**: Focus on upselling and cross-selling strategies",
+            "👥 **Customer Growth**: Implement targeted acquisition campaigns",
+            "💎 **Retention Enhancement**: Develop loyalty program and personalized engagement",
+            "🚚 **Operational Excellence**: Optimize delivery network and reduce turnaround times",
+            "⭐ **Experience Improvement**: Enhance product quality and customer service"
+        ]
+        for action in priority_actions:
+            st.write(action)
+    
+    # Performance Trends
+    st.subheader("📊 Performance Trends & Forecasting")
+    
+    # Revenue trend
+    revenue_trend = business_data.groupby(business_data['order_date'].dt.to_period('M'))['final_amount_inr'].sum().reset_index()
+    revenue_trend['order_date'] = revenue_trend['order_date'].astype(str)
+    
+    fig = px.line(revenue_trend, x='order_date', y='final_amount_inr',
+                 title='Revenue Trend - Last 12 Months',
+                 markers=True)
+    fig.update_layout(xaxis_title='Month', yaxis_title='Revenue (₹)')
+    fig.update_yaxes(tickprefix='₹')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Category Performance
+    st.subheader("🏪 Category Performance Overview")
+    
+    category_performance = business_data.groupby('category', observed=True, sort=False).agg({
+        'final_amount_inr': 'sum',
+        'transaction_id': 'count',
+        'customer_id': 'nunique'
+    }).reset_index()
+    
+    category_performance.columns = ['category', 'revenue', 'orders', 'customers']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.pie(category_performance, values='revenue', names='category',
+                    title='Revenue Distribution by Category')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.bar(category_performance.nlargest(8, 'revenue'), x='category', y='revenue',
+                    title='Top Categories by Revenue',
+                    color='revenue')
+        fig.update_yaxes(tickprefix='₹')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Executive Summary
+    st.subheader("📋 Executive Summary & Next Steps")
+    
+    summary_insights = [
+        "💰 **Financial Performance**: Strong revenue growth at 15.8% YoY, exceeding industry average",
+        "👥 **Customer Base**: Healthy customer acquisition with 12.3% growth, focus on retention improvement",
+        "🏪 **Category Leadership**: Electronics and Fashion driving 58% of total revenue",
+        "🚀 **Operational Metrics**: Delivery performance needs optimization to improve customer satisfaction",
+        "🎯 **Strategic Focus**: Priority on customer retention, operational efficiency, and category expansion",
+        "📈 **Growth Opportunities**: Tier 2 cities and new product categories represent significant potential",
+        "🔮 **Outlook**: Positive trajectory with targeted initiatives for sustainable growth"
+    ]
+    
+    for insight in summary_insights:
+        st.info(insight)
+
+# Dashboard dispatch table - one O(1) lookup per rerun instead of an if/elif chain
+DISPATCH = {f'Q{i}': globals()[f'render_q{i}'] for i in range(1, 31)}
+
+def render_dashboard(dashboard_id):
+    """Render individual dashboard based on selection"""
+    DISPATCH[dashboard_id]()
 
 def main():
     """Main application"""
@@ -4938,7 +4961,7 @@ def main():
         st.sidebar.markdown("---")
         st.sidebar.subheader("📈 Quick Overview")
         
-        total_revenue = st.session_state.transactions['final_amount_inr'].sum()
+        total_revenue = st.session_state.revenue_sum
         total_customers = len(st.session_state.customers)
         total_products = len(st.session_state.products)
         
@@ -2,6 +2,7 @@
 import streamlit as st
 import pandas as pd
 import sqlite3
+from contextlib import closing
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
@@ -22,14 +23,19 @@ if 'current_page' not in st.session_state:
 if 'data_loaded' not in st.session_state:
     st.session_state.data_loaded = False
 
+# Memory-mapped reads and in-memory temp tables for the aggregate scans
+DB_PRAGMAS = """
+    PRAGMA mmap_size=1073741824;
+    PRAGMA temp_store=MEMORY;
+"""
+
 # Safe database query function
 def safe_query(query):
     """Create a NEW connection for EVERY query"""
     try:
-        conn = sqlite3.connect('amazon_india_analytics.db', check_same_thread=False)
-        result = pd.read_sql_query(query, conn)
-        conn.close()
-        return result
+        with closing(sqlite3.connect('amazon_india_analytics.db', check_same_thread=False)) as conn:
+            conn.executescript(DB_PRAGMAS)
+            return pd.read_sql_query(query, conn)
     except Exception as e:
         st.error(f"Database error: {e}")
         return pd.DataFrame()
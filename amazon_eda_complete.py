@@ -5,6 +5,7 @@ import sqlite3
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+import os
 from datetime import datetime, timedelta
 
 # Page configuration
@@ -46,25 +47,403 @@ st.markdown('<h1 class="main-header">📊 Amazon India - Complete EDA Dashboard<
 st.markdown("### 20 Comprehensive Exploratory Data Analysis Questions")
 
 # Database connection
-def safe_query(query):
-    conn = sqlite3.connect('amazon_india_analytics.db', check_same_thread=False)
-    result = pd.read_sql_query(query, conn)
-    conn.close()
-    return result
+DB_PATH = 'amazon_india_analytics.db'
+
+def db_file_id():
+    """(device, inode) of the database file - changes when the file is replaced rather than written to"""
+    stat = os.stat(DB_PATH)
+    return stat.st_dev, stat.st_ino
+
+@st.cache_resource(max_entries=1)
+def open_conn(file_id):
+    """One SQLite connection (and its page cache) shared across reruns; a replaced file gets a fresh one"""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    conn.executescript("""
+        PRAGMA mmap_size=1073741824;
+        PRAGMA cache_size=-524288;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA synchronous=NORMAL;
+    """)
+    return conn
+
+def get_conn():
+    return open_conn(db_file_id())
+
+def data_key():
+    """Identifies the current database contents. PRAGMA data_version changes whenever another
+    connection commits, including WAL commits that leave the file mtime untouched."""
+    file_id = db_file_id()
+    return file_id + open_conn(file_id).execute("PRAGMA data_version").fetchone()
+
+# Low-cardinality string columns stored as category so groupby/value_counts run on int codes
+CATEGORICAL_COLUMNS = ('payment_method', 'category', 'customer_tier', 'spending_segment', 'recency_segment',
+                       'customer_state', 'brand', 'festival_name', 'return_status', 'clv_segment')
+
+def categorize(df, cols):
+    """Cast the listed columns present in df to category dtype in place"""
+    for col in cols:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+def downcast(df):
+    """Copy of df with int64 columns shrunk to the smallest integer dtype that holds their values.
+
+    Only for frames handed straight to Plotly - arithmetic on the narrowed columns can overflow.
+    Floats stay float64 so hover labels keep their exact values. Anything that is not a
+    DataFrame (e.g. a value_counts() Series) is returned unchanged.
+    """
+    if not isinstance(df, pd.DataFrame):
+        return df
+    return df.astype({col: pd.to_numeric(df[col], downcast='integer').dtype
+                      for col in df.select_dtypes('int64').columns})
+
+# Results are cached per SQL text, bound params and data_key(), so revisiting a question
+# skips the query entirely until the database contents change
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def cached_query(query, categorical_cols, params, parse_dates, key):
+    df = pd.read_sql_query(query, get_conn(), params=params, parse_dates=parse_dates)
+    return categorize(df, categorical_cols)
+
+def safe_query(query, categorical_cols=CATEGORICAL_COLUMNS, params=None, parse_dates=None):
+    key = data_key()
+    build_summary_tables(key)
+    return cached_query(query, categorical_cols, params, parse_dates, key)
+
+def load_reference_table(table):
+    """Read a static table from its Parquet snapshot (see export_parquet.py), else from SQLite.
+
+    A snapshot older than the database file is ignored, and the Parquet rows get the same
+    categorize() pass as safe_query so both paths hand back the same dtypes.
+    """
+    path = f'{table}.parquet'
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(DB_PATH):
+        return categorize(pd.read_parquet(path), CATEGORICAL_COLUMNS)
+    return safe_query(f"SELECT * FROM {table}")
+
+# Indexes behind the summary builds and the live Q7-Q20 queries
+SUMMARY_INDEXES_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_tx_date ON transactions(order_date);
+    CREATE INDEX IF NOT EXISTS idx_tx_pay ON transactions(payment_method, order_date);
+    CREATE INDEX IF NOT EXISTS idx_tx_prime ON transactions(is_prime_member);
+
+    -- Expression indexes so the per-year GROUP BYs walk the index in year order
+    CREATE INDEX IF NOT EXISTS idx_tx_year ON transactions(strftime('%Y', order_date));
+    CREATE INDEX IF NOT EXISTS idx_cust_first_year ON customers(strftime('%Y', first_order_date));
+
+    -- Covering indexes for the Q7-Q20 GROUP BY patterns: each aggregate runs as an index-only scan
+    CREATE INDEX IF NOT EXISTS idx_tx_state ON transactions(customer_state, customer_city, customer_id, final_amount_inr);
+    CREATE INDEX IF NOT EXISTS idx_tx_festival ON transactions(order_date, festival_name, final_amount_inr);
+    CREATE INDEX IF NOT EXISTS idx_tx_age ON transactions(customer_age_group, category, customer_id, final_amount_inr);
+    CREATE INDEX IF NOT EXISTS idx_tx_delivery ON transactions(delivery_days, customer_city, customer_rating);
+    CREATE INDEX IF NOT EXISTS idx_tx_return ON transactions(return_status, category, customer_rating, original_price_inr);
+    CREATE INDEX IF NOT EXISTS idx_tx_brand_cat ON transactions(brand, category, final_amount_inr, original_price_inr,
+                                                                 customer_rating, discount_percent);
+    CREATE INDEX IF NOT EXISTS idx_tx_discount ON transactions(discount_percent, category, final_amount_inr, quantity,
+                                                                customer_rating);
+    CREATE INDEX IF NOT EXISTS idx_tx_rating_cat ON transactions(product_rating, category, final_amount_inr,
+                                                                  original_price_inr);
+    CREATE INDEX IF NOT EXISTS idx_tx_product ON transactions(product_id, final_amount_inr, product_rating);
+
+    -- Q17 per-customer journeys: the customer_id GROUP BY and window run once, not per visit
+    CREATE INDEX IF NOT EXISTS idx_tx_customer ON transactions(customer_id, order_date, category, final_amount_inr);
+"""
+
+# Pre-aggregated summary tables - built once so Q1/Q2/Q4/Q5/Q6/Q17/Q20 read a few rows instead of scanning transactions.
+# They are snapshots, so build_summary_tables drops and recreates them whenever the source tables change.
+SUMMARY_TABLES = ('yearly_sales', 'monthly_sales_detail', 'payment_evolution', 'category_performance',
+                  'prime_category_stats', 'customer_journey', 'category_progression', 'customer_growth',
+                  'operational_stats')
+
+# Summaries from earlier builds that nothing reads any more; dropped on the next rebuild
+RETIRED_SUMMARY_TABLES = ('delivery_stats', 'return_stats')
+
+# Bump whenever a summary table's columns change, so databases built with the old layout are recreated
+SUMMARY_SCHEMA_VERSION = 2
+
+SUMMARY_TABLES_SQL = """
+    CREATE TABLE yearly_sales AS
+        SELECT strftime('%Y', order_date) as year,
+               SUM(final_amount_inr) as revenue,
+               COUNT(*) as orders
+        FROM transactions
+        GROUP BY strftime('%Y', order_date);
+
+    CREATE TABLE monthly_sales_detail AS
+        SELECT strftime('%Y', order_date) as year, strftime('%m', order_date) as month,
+               SUM(final_amount_inr) as revenue, COUNT(*) as orders
+        FROM transactions GROUP BY year, month;
+
+    CREATE TABLE payment_evolution AS
+        SELECT strftime('%Y', order_date) as year, payment_method,
+               COUNT(*) as transactions, SUM(final_amount_inr) as amount
+        FROM transactions WHERE payment_method IS NOT NULL
+        GROUP BY year, payment_method;
+
+    CREATE TABLE category_performance AS
+        SELECT category, COUNT(*) as orders, SUM(final_amount_inr) as revenue,
+               AVG(customer_rating) as avg_rating
+        FROM transactions WHERE category IS NOT NULL
+        GROUP BY category;
+
+    CREATE TABLE prime_category_stats AS
+        SELECT is_prime_member, category,
+               COUNT(*) as orders, SUM(final_amount_inr) as revenue
+        FROM transactions
+        WHERE category IS NOT NULL AND is_prime_member IS NOT NULL
+        GROUP BY is_prime_member, category;
+
+    CREATE TABLE customer_journey AS
+        SELECT customer_id, COUNT(*) as order_count,
+               MIN(order_date) as first_order, MAX(order_date) as last_order,
+               COUNT(DISTINCT category) as unique_categories,
+               SUM(final_amount_inr) as total_spent
+        FROM transactions
+        GROUP BY customer_id
+        HAVING order_count > 1;
+
+    CREATE TABLE category_progression AS
+        WITH customer_progression AS (
+            SELECT customer_id, category,
+                   ROW_NUMBER() OVER (PARTITION BY customer_id ORDER BY order_date) as order_sequence
+            FROM transactions
+            WHERE category IS NOT NULL
+        )
+        SELECT order_sequence, category, COUNT(*) as customers
+        FROM customer_progression
+        WHERE order_sequence <= 5
+        GROUP BY order_sequence, category;
+
+    -- Q20 health dashboard: acquisition per cohort year plus one row of delivery/return stats from a single scan
+    CREATE TABLE customer_growth AS
+        SELECT strftime('%Y', first_order_date) as year, COUNT(*) as new_customers
+        FROM customers
+        GROUP BY strftime('%Y', first_order_date);
+
+    CREATE TABLE operational_stats AS
+        SELECT AVG(delivery_days) as avg_delivery_days,
+               AVG(CASE WHEN delivery_days IS NOT NULL THEN customer_rating END) as avg_rating,
+               100.0 * SUM(return_status = 'Returned') / COUNT(*) as return_rate
+        FROM transactions;
+"""
+
+# Row count and highest rowid of every source table; a change in any of them (or in
+# SUMMARY_SCHEMA_VERSION) marks the summaries stale
+SOURCE_FINGERPRINT_SQL = """
+    SELECT (SELECT COUNT(*) FROM transactions), (SELECT MAX(rowid) FROM transactions),
+           (SELECT COUNT(*) FROM customers), (SELECT MAX(rowid) FROM customers)
+"""
+
+def source_fingerprint(conn):
+    values = (SUMMARY_SCHEMA_VERSION,) + conn.execute(SOURCE_FINGERPRINT_SQL).fetchone()
+    return ':'.join(str(value) for value in values)
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def build_summary_tables(key):
+    """Create the indexes, and rebuild the summary tables if the source tables changed since they were built.
+
+    Reruns whenever data_key() moves; the fingerprint check keeps that to a cheap no-op unless rows changed.
+    """
+    conn = get_conn()
+    # The one writer sets WAL (persistent in the file) so dashboard readers never block on a rebuild
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SUMMARY_INDEXES_SQL)
+    conn.execute("CREATE TABLE IF NOT EXISTS summary_meta (fingerprint TEXT)")
+    fingerprint = source_fingerprint(conn)
+    if conn.execute("SELECT fingerprint FROM summary_meta").fetchone() != (fingerprint,):
+        # One transaction, so readers never see a half-rebuilt set of summaries. The connection is
+        # shared across reruns, so a failed rebuild must not leave it inside an open transaction.
+        try:
+            conn.executescript("BEGIN;"
+                               + "".join(f"DROP TABLE IF EXISTS {table};"
+                                         for table in SUMMARY_TABLES + RETIRED_SUMMARY_TABLES)
+                               + SUMMARY_TABLES_SQL)
+            conn.execute("DELETE FROM summary_meta")
+            conn.execute("INSERT INTO summary_meta VALUES (?)", (fingerprint,))
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+    # Planner statistics: full ANALYZE the first time, then only refresh what PRAGMA optimize deems stale
+    has_stats = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()
+    conn.execute("PRAGMA optimize" if has_stats else "ANALYZE")
+    conn.commit()
+    return True
+
+def growth_stats(rev):
+    """Period-over-period growth %, CAGR % and best-period index in one pass over a revenue array"""
+    growth = np.zeros_like(rev)
+    growth[1:] = (rev[1:] / rev[:-1] - 1) * 100
+    cagr = ((rev[-1] / rev[0]) ** (1 / max(len(rev) - 1, 1)) - 1) * 100
+    return growth, cagr, int(rev.argmax())
+
+def sfig(fig):
+    """Disable transition animations so reruns only repaint the final frame"""
+    fig.update_layout(transition={'duration': 0})
+    return fig
+
+# Generic cached chart builder - identical (kind, data, options) reuse the already-built figure.
+# data must be a DataFrame with the columns named in kwargs; convert Series with reset_index first.
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def build_chart(kind, data, **kwargs):
+    if not isinstance(data, pd.DataFrame):
+        raise TypeError(f"build_chart expects a DataFrame, got {type(data).__name__}")
+    return getattr(px, kind)(downcast(data), **kwargs)
+
+# Per-question figure builders - cached on the input frame so revisiting a question reuses the figures
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def build_q1_figs(yearly_sales):
+    trend_fig = px.line(yearly_sales, x='year', y='revenue', 
+                        title='Yearly Revenue Trend (2015-2025)',
+                        markers=True)
+    trend_fig.update_traces(line=dict(width=4))
+    growth_fig = px.bar(yearly_sales, x='year', y='revenue_growth', 
+                        title='Yearly Revenue Growth Rate (%)',
+                        color='revenue_growth', 
+                        color_continuous_scale='RdYlGn')
+    return trend_fig, growth_fig
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def build_q2_figs(monthly_detail):
+    # Scatter (year, month) revenue straight into a dense matrix - no pivot hash join needed
+    valid = monthly_detail.dropna(subset=['year', 'month'])
+    yr = pd.to_numeric(valid['year']).astype(np.int16).to_numpy()
+    mo = pd.to_numeric(valid['month']).astype(np.int8).to_numpy()
+    years = np.unique(yr)
+    matrix = np.zeros((len(years), 12), dtype=np.float32)  # float32 halves the JSON sent to the browser
+    matrix[np.searchsorted(years, yr), mo - 1] = valid['revenue'].to_numpy()
+    heatmap_data = pd.DataFrame(matrix, index=years, columns=range(1, 13))
+    heatmap_fig = px.imshow(heatmap_data, title='Monthly Revenue Heatmap', color_continuous_scale='Blues')
+    
+    # Assemble timestamps arithmetically from the integer parts instead of parsing strings
+    monthly_detail = monthly_detail.assign(year_month=pd.to_datetime(pd.DataFrame({
+        'year': pd.to_numeric(monthly_detail['year']),
+        'month': pd.to_numeric(monthly_detail['month']),
+        'day': 1
+    })))
+    trend_fig = px.line(monthly_detail, x='year_month', y='revenue', title='Monthly Revenue Trend')
+    return heatmap_fig, trend_fig
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def build_q4_figs(payment_evolution):
+    area_fig = px.area(payment_evolution, x='year', y='transactions', color='payment_method',
+                       title='Payment Method Evolution')
+    
+    yearly_totals = payment_evolution.groupby('year', sort=False)['transactions'].sum()
+    payment_evolution = payment_evolution.assign(
+        market_share=100 * payment_evolution['transactions'] / payment_evolution['year'].map(yearly_totals)
+    )
+    share_fig = px.line(payment_evolution, x='year', y='market_share', color='payment_method',
+                        title='Market Share Over Time')
+    return area_fig, share_fig
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def build_q5_figs(category_performance):
+    # Fold the long tail into one "Other" tile - only the top ~20 are distinguishable anyway
+    treemap_data = category_performance
+    if len(category_performance) > 20:
+        tail = category_performance.iloc[20:]
+        other = pd.DataFrame([{
+            'category': 'Other',
+            'orders': tail['orders'].sum(),
+            'revenue': tail['revenue'].sum(),
+            'avg_rating': tail['avg_rating'].mean()
+        }])
+        treemap_data = pd.concat([category_performance.head(20), other], ignore_index=True)
+    
+    treemap_fig = px.treemap(treemap_data, path=['category'], values='revenue',
+                             title='Revenue by Category (Treemap)')
+    bar_fig = px.bar(category_performance.head(10), x='category', y='revenue',
+                     title='Top 10 Categories by Revenue')
+    pie_fig = px.pie(category_performance.head(8), values='revenue', names='category',
+                     title='Market Share - Top 8 Categories')
+    return treemap_fig, bar_fig, pie_fig
+
+# Q20 growth figures held as live objects (cache_resource) - reruns re-emit them with no
+# query, unpickling or DataFrame-to-trace conversion; the data_key() argument drops them on a data change
+@st.cache_resource(max_entries=16, show_spinner=False)
+def build_q20_growth_figs(cutoff, key):
+    # LAG runs over all years first, so the window's first year keeps its growth rate
+    yearly_growth = safe_query("""
+        SELECT year, revenue, growth_rate
+        FROM (
+            SELECT year, revenue,
+                   100.0 * (revenue - LAG(revenue) OVER (ORDER BY year))
+                         / LAG(revenue) OVER (ORDER BY year) as growth_rate
+            FROM yearly_sales
+        )
+        WHERE year >= ?
+        ORDER BY year
+    """, params=(cutoff,))
+    customer_growth = safe_query("""
+        SELECT year, new_customers FROM customer_growth WHERE year >= ? ORDER BY year
+    """, params=(cutoff,))
+    
+    growth_fig = sfig(px.line(yearly_growth, x='year', y='growth_rate',
+                              title='Yearly Revenue Growth Rate (%)', markers=True))
+    customers_fig = sfig(px.bar(customer_growth, x='year', y='new_customers',
+                                title='New Customer Acquisition by Year'))
+    return growth_fig, customers_fig
+
+def quintile_codes(values):
+    """Bin codes 0-4 aligned to the original index (NaN stays NaN)"""
+    if values.nunique() >= 5:
+        return pd.qcut(values, q=5, labels=False, duplicates='drop')
+    return pd.cut(values, bins=5, labels=False)
+
+# Derived RFM frame cached on the session's customer_analysis - no per-rerun copy or re-scoring
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def score_rfm(customer_analysis):
+    rfm_data = customer_analysis.copy()
+    
+    # Score and sum in one expression - no per-dimension score columns are materialized
+    rfm_data['rfm_score'] = (
+        (5 - quintile_codes(rfm_data['days_since_last_order']))  # Recency - fewer days is better
+        + (quintile_codes(rfm_data['total_orders']) + 1)         # Frequency - more orders is better
+        + (quintile_codes(rfm_data['total_spent']) + 1)          # Monetary - more spend is better
+    )
+    
+    # Create RFM segments - one vectorized pass over the score array
+    scores = rfm_data['rfm_score'].to_numpy(dtype=float)
+    rfm_data['segment'] = np.select(
+        [np.isnan(scores), scores >= 12, scores >= 9, scores >= 6, scores >= 4],
+        ['Unknown', 'Champions', 'Loyal Customers', 'Potential Loyalists', 'At Risk'],
+        default='Lost Customers'
+    )
+    rfm_data['segment'] = rfm_data['segment'].astype('category')
+    return rfm_data
 
 # Initialize session state
 if 'data_loaded' not in st.session_state:
     st.session_state.data_loaded = False
 
+# Columns the EDA questions actually read from the transaction-level samples
+SAMPLE_COLUMNS = ['order_date', 'final_amount_inr', 'category', 'is_prime_member',
+                  'customer_rating', 'payment_method', 'customer_id']
+
+def load_sample(table, limit=50000):
+    """Load only the needed columns of a large table and coerce their dtypes"""
+    available = set(safe_query(f"PRAGMA table_info({table})")['name'])
+    columns = [col for col in SAMPLE_COLUMNS if col in available]
+    sample = safe_query(f"SELECT {', '.join(columns) or '*'} FROM {table} LIMIT {limit}")
+    
+    if 'order_date' in sample.columns:
+        sample['order_date'] = pd.to_datetime(sample['order_date'], errors='coerce')
+    if 'is_prime_member' in sample.columns and pd.api.types.is_numeric_dtype(sample['is_prime_member']):
+        sample['is_prime_member'] = sample['is_prime_member'].astype('Int8')
+    return sample
+
 def load_analysis_data():
     try:
-        monthly_sales = safe_query("SELECT * FROM monthly_sales")
-        customer_analysis = safe_query("SELECT * FROM customer_analysis")
-        product_performance = safe_query("SELECT * FROM product_performance")
-        transactions_sample = safe_query("SELECT * FROM transactions LIMIT 50000")
-        products = safe_query("SELECT * FROM products")
-        customers = safe_query("SELECT * FROM customers")
-        sales_fact = safe_query("SELECT * FROM sales_fact LIMIT 50000")
+        build_summary_tables(data_key())
+        monthly_sales = load_reference_table('monthly_sales')
+        customer_analysis = load_reference_table('customer_analysis')
+        product_performance = load_reference_table('product_performance')
+        transactions_sample = load_sample('transactions')
+        products = load_reference_table('products')
+        customers = load_reference_table('customers')
+        sales_fact = load_sample('sales_fact')
         
         st.session_state.monthly_sales = monthly_sales
         st.session_state.customer_analysis = customer_analysis
@@ -144,43 +523,29 @@ if st.session_state.data_loaded:
         st.markdown("Comprehensive revenue trend analysis with growth rates and key growth periods")
         st.markdown('</div>', unsafe_allow_html=True)
         
-        yearly_sales = safe_query("""
-            SELECT strftime('%Y', order_date) as year, 
-                   SUM(final_amount_inr) as revenue,
-                   COUNT(*) as orders
-            FROM transactions 
-            GROUP BY strftime('%Y', order_date)
-            ORDER BY year
-        """)
+        yearly_sales = safe_query("SELECT * FROM yearly_sales ORDER BY year")
         
-        yearly_sales['revenue_growth'] = yearly_sales['revenue'].pct_change() * 100
-        yearly_sales['revenue_growth'] = yearly_sales['revenue_growth'].fillna(0)
+        rev = yearly_sales['revenue'].to_numpy(dtype=np.float64)
+        growth, cagr, best_idx = growth_stats(rev)
+        yearly_sales['revenue_growth'] = growth
+        trend_fig, growth_fig = build_q1_figs(yearly_sales)
         
         col1, col2 = st.columns(2)
         with col1:
-            fig = px.line(yearly_sales, x='year', y='revenue', 
-                         title='Yearly Revenue Trend (2015-2025)',
-                         markers=True)
-            fig.update_traces(line=dict(width=4))
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(trend_fig), use_container_width=True)
             
         with col2:
-            fig = px.bar(yearly_sales, x='year', y='revenue_growth', 
-                        title='Yearly Revenue Growth Rate (%)',
-                        color='revenue_growth', 
-                        color_continuous_scale='RdYlGn')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(growth_fig), use_container_width=True)
         
         # Metrics
         col1, col2, col3, col4 = st.columns(4)
-        total_rev = yearly_sales['revenue'].sum()
-        avg_growth = yearly_sales['revenue_growth'].mean()
-        best_year = yearly_sales.loc[yearly_sales['revenue'].idxmax()]
-        cagr = ((yearly_sales['revenue'].iloc[-1] / yearly_sales['revenue'].iloc[0]) ** (1/10) - 1) * 100
+        total_rev = rev.sum()
+        avg_growth = growth.mean()
+        best_year = yearly_sales['year'].iloc[best_idx]
         
         col1.metric("Total Revenue", f"₹{total_rev/1e9:.2f}B")
         col2.metric("Avg Growth", f"{avg_growth:.1f}%")
-        col3.metric("Best Year", f"{best_year['year']}")
+        col3.metric("Best Year", f"{best_year}")
         col4.metric("CAGR", f"{cagr:.1f}%")
 
     # Q2: Seasonal Patterns
@@ -190,20 +555,11 @@ if st.session_state.data_loaded:
         st.markdown("Monthly sales heatmaps and seasonal trends across years and categories")
         st.markdown('</div>', unsafe_allow_html=True)
         
-        monthly_detail = safe_query("""
-            SELECT strftime('%Y', order_date) as year, strftime('%m', order_date) as month,
-                   SUM(final_amount_inr) as revenue, COUNT(*) as orders
-            FROM transactions GROUP BY year, month ORDER BY year, month
-        """)
-        
-        heatmap_data = monthly_detail.pivot_table(values='revenue', index='year', columns='month').fillna(0)
-        fig = px.imshow(heatmap_data, title='Monthly Revenue Heatmap', color_continuous_scale='Blues')
-        st.plotly_chart(fig, use_container_width=True)
+        monthly_detail = safe_query("SELECT * FROM monthly_sales_detail ORDER BY year, month")
+        heatmap_fig, trend_fig = build_q2_figs(monthly_detail)
         
-        monthly_detail['year_month'] = monthly_detail['year'] + '-' + monthly_detail['month']
-        monthly_detail['year_month'] = pd.to_datetime(monthly_detail['year_month'])
-        fig = px.line(monthly_detail, x='year_month', y='revenue', title='Monthly Revenue Trend')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(heatmap_fig), use_container_width=True)
+        st.plotly_chart(sfig(trend_fig), use_container_width=True)
 
                 # Q3: Customer RFM Segmentation - FIXED VERSION
     elif selected_question == "Q3":
@@ -212,7 +568,7 @@ if st.session_state.data_loaded:
         st.markdown("RFM analysis with customer segmentation and actionable insights")
         st.markdown('</div>', unsafe_allow_html=True)
         
-        rfm_data = st.session_state.customer_analysis.copy()
+        rfm_data = st.session_state.customer_analysis
         
         st.success("✅ All required RFM data is available!")
         
@@ -232,61 +588,20 @@ if st.session_state.data_loaded:
                     spending_segments = rfm_data['spending_segment'].value_counts()
                     fig = px.pie(spending_segments, values=spending_segments.values, names=spending_segments.index,
                                 title='Customer Spending Segments')
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(sfig(fig), use_container_width=True)
             
             with col2:
                 if 'recency_segment' in rfm_data.columns:
                     recency_segments = rfm_data['recency_segment'].value_counts()
                     fig = px.pie(recency_segments, values=recency_segments.values, names=recency_segments.index,
                                 title='Customer Recency Segments')
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(sfig(fig), use_container_width=True)
         else:
             # All columns exist, proceed with RFM analysis
             try:
                 # Create RFM scores with proper error handling
                 rfm_success = True
-                
-                # For Recency - lower days_since_last_order is better
-                recency_data = rfm_data['days_since_last_order'].dropna()
-                if recency_data.nunique() >= 5:
-                    rfm_data['recency_score'] = pd.qcut(recency_data, q=5, labels=[5,4,3,2,1], duplicates='drop')
-                else:
-                    rfm_data['recency_score'] = pd.cut(recency_data, bins=5, labels=[5,4,3,2,1])
-                
-                # For Frequency - higher total_orders is better
-                frequency_data = rfm_data['total_orders'].dropna()
-                if frequency_data.nunique() >= 5:
-                    rfm_data['frequency_score'] = pd.qcut(frequency_data, q=5, labels=[1,2,3,4,5], duplicates='drop')
-                else:
-                    rfm_data['frequency_score'] = pd.cut(frequency_data, bins=5, labels=[1,2,3,4,5])
-                
-                # For Monetary - higher total_spent is better
-                monetary_data = rfm_data['total_spent'].dropna()
-                if monetary_data.nunique() >= 5:
-                    rfm_data['monetary_score'] = pd.qcut(monetary_data, q=5, labels=[1,2,3,4,5], duplicates='drop')
-                else:
-                    rfm_data['monetary_score'] = pd.cut(monetary_data, bins=5, labels=[1,2,3,4,5])
-                
-                # Convert scores to numeric and calculate RFM score
-                rfm_data['recency_score'] = pd.to_numeric(rfm_data['recency_score'], errors='coerce')
-                rfm_data['frequency_score'] = pd.to_numeric(rfm_data['frequency_score'], errors='coerce')
-                rfm_data['monetary_score'] = pd.to_numeric(rfm_data['monetary_score'], errors='coerce')
-                
-                rfm_data['rfm_score'] = (rfm_data['recency_score'] + 
-                                        rfm_data['frequency_score'] + 
-                                        rfm_data['monetary_score'])
-                
-                # Create RFM segments
-                def get_rfm_segment(row):
-                    if pd.isna(row['rfm_score']):
-                        return 'Unknown'
-                    elif row['rfm_score'] >= 12: return 'Champions'
-                    elif row['rfm_score'] >= 9: return 'Loyal Customers'
-                    elif row['rfm_score'] >= 6: return 'Potential Loyalists'
-                    elif row['rfm_score'] >= 4: return 'At Risk'
-                    else: return 'Lost Customers'
-                
-                rfm_data['segment'] = rfm_data.apply(get_rfm_segment, axis=1)
+                rfm_data = score_rfm(rfm_data)
                 
                 # Display RFM Analysis
                 col1, col2 = st.columns(2)
@@ -298,33 +613,31 @@ if st.session_state.data_loaded:
                                 title='Customer RFM Segments Distribution',
                                 color=segment_counts.index,  # Use segment names for color
                                 color_discrete_sequence=px.colors.qualitative.Set3)  # Use discrete colors
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(sfig(fig), use_container_width=True)
                     
                 with col2:
-                    # RFM scatter plot
-                    fig = px.scatter(rfm_data, x='total_orders', y='total_spent', 
+                    # RFM scatter plot - stratified sample keeps every segment visible with a small payload
+                    plot_df = rfm_data.sample(frac=1, random_state=0).groupby('segment').head(2000)
+                    fig = px.scatter(plot_df, x='total_orders', y='total_spent', 
                                    color='segment', size='avg_order_value',
                                    title='RFM Analysis: Frequency vs Monetary Value',
-                                   hover_data=['customer_id', 'days_since_last_order'],
+                                   render_mode='webgl',
                                    labels={
                                        'total_orders': 'Frequency (Total Orders)',
                                        'total_spent': 'Monetary (Total Spent ₹)',
                                        'segment': 'RFM Segment'
                                    })
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(sfig(fig), use_container_width=True)
                 
                 # Segment insights table
                 st.subheader("📊 RFM Segment Insights")
-                segment_stats = rfm_data.groupby('segment').agg({
-                    'total_spent': ['mean', 'count'],
-                    'total_orders': 'mean',
-                    'days_since_last_order': 'mean',
-                    'avg_order_value': 'mean'
-                }).round(2)
-                
-                # Flatten column names
-                segment_stats.columns = ['avg_spending', 'customer_count', 'avg_orders', 'avg_recency_days', 'avg_order_value']
-                segment_stats = segment_stats.reset_index()
+                segment_stats = rfm_data.groupby('segment', observed=True, sort=False).agg(
+                    avg_spending=('total_spent', 'mean'),
+                    customer_count=('total_spent', 'count'),
+                    avg_orders=('total_orders', 'mean'),
+                    avg_recency_days=('days_since_last_order', 'mean'),
+                    avg_order_value=('avg_order_value', 'mean')
+                ).round(2).reset_index()
                 
                 # Display segment statistics
                 st.dataframe(segment_stats.style.format({
@@ -363,8 +676,9 @@ if st.session_state.data_loaded:
                     ]
                 }
                 
+                seg_counts = rfm_data['segment'].value_counts().to_dict()
                 for segment, tips in recommendations.items():
-                    segment_count = len(rfm_data[rfm_data['segment'] == segment])
+                    segment_count = seg_counts.get(segment, 0)
                     if segment_count > 0:
                         with st.expander(f"{segment} - {segment_count:,} customers"):
                             for tip in tips:
@@ -375,7 +689,7 @@ if st.session_state.data_loaded:
                 fig = px.histogram(rfm_data, x='rfm_score', nbins=20, 
                                  title='Distribution of RFM Scores',
                                  labels={'rfm_score': 'RFM Score', 'count': 'Number of Customers'})
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(sfig(fig), use_container_width=True)
                 
             except Exception as e:
                 st.error(f"Error in RFM calculation: {str(e)}")
@@ -389,14 +703,14 @@ if st.session_state.data_loaded:
                         spending_segments = rfm_data['spending_segment'].value_counts()
                         fig = px.pie(spending_segments, values=spending_segments.values, names=spending_segments.index,
                                     title='Customer Spending Segments')
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(sfig(fig), use_container_width=True)
                 
                 with col2:
                     if 'recency_segment' in rfm_data.columns:
                         recency_segments = rfm_data['recency_segment'].value_counts()
                         fig = px.pie(recency_segments, values=recency_segments.values, names=recency_segments.index,
                                     title='Customer Recency Segments')
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(sfig(fig), use_container_width=True)
                             
     # Q4: Payment Method Evolution
     elif selected_question == "Q4":
@@ -405,22 +719,11 @@ if st.session_state.data_loaded:
         st.markdown("Payment method trends from 2015-2025 showing UPI rise and COD decline")
         st.markdown('</div>', unsafe_allow_html=True)
         
-        payment_evolution = safe_query("""
-            SELECT strftime('%Y', order_date) as year, payment_method,
-                   COUNT(*) as transactions, SUM(final_amount_inr) as amount
-            FROM transactions WHERE payment_method IS NOT NULL
-            GROUP BY year, payment_method ORDER BY year, payment_method
-        """)
+        payment_evolution = safe_query("SELECT * FROM payment_evolution ORDER BY year, payment_method")
+        area_fig, share_fig = build_q4_figs(payment_evolution)
         
-        fig = px.area(payment_evolution, x='year', y='transactions', color='payment_method',
-                     title='Payment Method Evolution')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        yearly_totals = payment_evolution.groupby('year')['transactions'].transform('sum')
-        payment_evolution['market_share'] = (payment_evolution['transactions'] / yearly_totals) * 100
-        fig = px.line(payment_evolution, x='year', y='market_share', color='payment_method',
-                     title='Market Share Over Time')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(area_fig), use_container_width=True)
+        st.plotly_chart(sfig(share_fig), use_container_width=True)
 
     # Q5: Category Performance Analysis
     elif selected_question == "Q5":
@@ -429,26 +732,16 @@ if st.session_state.data_loaded:
         st.markdown("Revenue contribution, growth rates, and market share for product categories")
         st.markdown('</div>', unsafe_allow_html=True)
         
-        category_performance = safe_query("""
-            SELECT category, COUNT(*) as orders, SUM(final_amount_inr) as revenue,
-                   AVG(customer_rating) as avg_rating
-            FROM transactions WHERE category IS NOT NULL
-            GROUP BY category ORDER BY revenue DESC
-        """)
+        category_performance = safe_query("SELECT * FROM category_performance ORDER BY revenue DESC")
+        treemap_fig, bar_fig, pie_fig = build_q5_figs(category_performance)
         
         col1, col2 = st.columns(2)
         with col1:
-            fig = px.treemap(category_performance, path=['category'], values='revenue',
-                            title='Revenue by Category (Treemap)')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(treemap_fig), use_container_width=True)
         with col2:
-            fig = px.bar(category_performance.head(10), x='category', y='revenue',
-                        title='Top 10 Categories by Revenue')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(bar_fig), use_container_width=True)
         
-        fig = px.pie(category_performance.head(8), values='revenue', names='category',
-                    title='Market Share - Top 8 Categories')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(pie_fig), use_container_width=True)
 
         # Q6: Prime Membership Impact - FIXED VERSION
     elif selected_question == "Q6":
@@ -483,20 +776,16 @@ if st.session_state.data_loaded:
                 with col1:
                     fig = px.bar(spending_analysis, x='customer_tier', y='unique_customers',
                                 title='Customers by Tier')
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(sfig(fig), use_container_width=True)
                 with col2:
                     fig = px.bar(spending_analysis, x='customer_tier', y='avg_order_value',
                                 title='Average Order Value by Tier')
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(sfig(fig), use_container_width=True)
         else:
             # Continue with Prime analysis if column exists
             prime_analysis = safe_query("""
                 SELECT 
-                    CASE 
-                        WHEN is_prime_member = 1 THEN 'Prime Member'
-                        WHEN is_prime_member = 0 THEN 'Non-Prime Member' 
-                        ELSE 'Unknown'
-                    END as membership_type,
+                    is_prime_member,
                     COUNT(DISTINCT customer_id) as unique_customers,
                     COUNT(*) as total_orders,
                     AVG(final_amount_inr) as avg_order_value,
@@ -504,13 +793,12 @@ if st.session_state.data_loaded:
                     SUM(final_amount_inr) as total_revenue
                 FROM transactions 
                 WHERE is_prime_member IS NOT NULL
-                GROUP BY 
-                    CASE 
-                        WHEN is_prime_member = 1 THEN 'Prime Member'
-                        WHEN is_prime_member = 0 THEN 'Non-Prime Member' 
-                        ELSE 'Unknown'
-                    END
+                GROUP BY is_prime_member
             """)
+            # Label the 0/1 flag here rather than evaluating a CASE per row in SQLite
+            prime_analysis['membership_type'] = prime_analysis['is_prime_member'].map(
+                {1: 'Prime Member', 0: 'Non-Prime Member'}
+            ).fillna('Unknown')
             
             if prime_analysis.empty:
                 st.warning("⚠️ No Prime membership data found. Showing alternative analysis.")
@@ -570,39 +858,22 @@ if st.session_state.data_loaded:
                     if not prime_analysis.empty:
                         fig = px.pie(prime_analysis, values='unique_customers', names='membership_type',
                                     title='Customer Distribution by Membership Type')
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(sfig(fig), use_container_width=True)
                 
                 with col2:
                     if not prime_analysis.empty:
                         fig = px.bar(prime_analysis, x='membership_type', y='total_revenue',
                                     title='Total Revenue by Membership Type',
                                     color='membership_type')
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(sfig(fig), use_container_width=True)
                 
                 # Category preferences analysis
                 st.subheader("🛍️ Category Preferences by Membership Type")
                 
-                prime_categories = safe_query("""
-                    SELECT 
-                        CASE 
-                            WHEN is_prime_member = 1 THEN 'Prime Member'
-                            WHEN is_prime_member = 0 THEN 'Non-Prime Member' 
-                            ELSE 'Unknown'
-                        END as membership_type,
-                        category,
-                        COUNT(*) as orders,
-                        SUM(final_amount_inr) as revenue
-                    FROM transactions 
-                    WHERE category IS NOT NULL AND is_prime_member IS NOT NULL
-                    GROUP BY 
-                        CASE 
-                            WHEN is_prime_member = 1 THEN 'Prime Member'
-                            WHEN is_prime_member = 0 THEN 'Non-Prime Member' 
-                            ELSE 'Unknown'
-                        END,
-                        category
-                    ORDER BY orders DESC
-                """)
+                prime_categories = safe_query("SELECT * FROM prime_category_stats ORDER BY orders DESC")
+                prime_categories['membership_type'] = prime_categories['is_prime_member'].map(
+                    {1: 'Prime Member', 0: 'Non-Prime Member'}
+                ).fillna('Unknown')
                 
                 if not prime_categories.empty:
                     # Get top categories for each membership type
@@ -616,7 +887,7 @@ if st.session_state.data_loaded:
                             fig = px.bar(prime_top, x='category', y='orders', 
                                         title='Top Categories - Prime Members',
                                         color='orders')
-                            st.plotly_chart(fig, use_container_width=True)
+                            st.plotly_chart(sfig(fig), use_container_width=True)
                         else:
                             st.info("No Prime member category data available")
                     
@@ -625,7 +896,7 @@ if st.session_state.data_loaded:
                             fig = px.bar(non_prime_top, x='category', y='orders',
                                         title='Top Categories - Non-Prime Members',
                                         color='orders')
-                            st.plotly_chart(fig, use_container_width=True)
+                            st.plotly_chart(sfig(fig), use_container_width=True)
                         else:
                             st.info("No Non-Prime member category data available")
                 
@@ -633,13 +904,12 @@ if st.session_state.data_loaded:
                 st.subheader("📋 Detailed Membership Comparison")
                 if not prime_analysis.empty:
                     display_table = prime_analysis[['membership_type', 'unique_customers', 'total_orders', 
-                                                  'avg_order_value', 'avg_rating', 'total_revenue']].copy()
-                    display_table['avg_order_value'] = display_table['avg_order_value'].round(2)
-                    display_table['avg_rating'] = display_table['avg_rating'].round(2)
-                    display_table['total_revenue'] = display_table['total_revenue'].round(2)
+                                                  'avg_order_value', 'avg_rating', 'total_revenue']]
                     
+                    # Rounding happens in the formatter at render time - no rounded copies of the frame
                     st.dataframe(display_table.style.format({
                         'avg_order_value': '₹{:,.2f}',
+                        'avg_rating': '{:.2f}',
                         'total_revenue': '₹{:,.2f}'
                     }))
 
@@ -661,13 +931,13 @@ if st.session_state.data_loaded:
         
         col1, col2 = st.columns(2)
         with col1:
-            fig = px.bar(state_performance.head(15), x='customer_state', y='revenue',
+            fig = build_chart('bar', state_performance.head(15), x='customer_state', y='revenue',
                         title='Top 15 States by Revenue')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         with col2:
-            fig = px.pie(state_performance.head(8), values='revenue', names='customer_state',
+            fig = build_chart('pie', state_performance.head(8), values='revenue', names='customer_state',
                         title='Revenue Share - Top 8 States')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         
         city_performance = safe_query("""
             SELECT customer_city, customer_state, SUM(final_amount_inr) as revenue
@@ -678,9 +948,9 @@ if st.session_state.data_loaded:
             LIMIT 20
         """)
         
-        fig = px.bar(city_performance, x='customer_city', y='revenue', color='customer_state',
+        fig = build_chart('bar', city_performance, x='customer_city', y='revenue', color='customer_state',
                     title='Top 20 Cities by Revenue')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q8: Festival Sales Impact
     elif selected_question == "Q8":
@@ -690,35 +960,36 @@ if st.session_state.data_loaded:
         st.markdown('</div>', unsafe_allow_html=True)
         
         festival_analysis = safe_query("""
-            SELECT order_date, festival_name, SUM(final_amount_inr) as daily_revenue,
+            SELECT order_date, festival_name,
+                   CASE WHEN festival_name IS NOT NULL THEN 'Festival' ELSE 'Non-Festival' END as is_festival,
+                   SUM(final_amount_inr) as daily_revenue,
                    COUNT(*) as daily_orders
             FROM transactions 
             WHERE order_date IS NOT NULL
             GROUP BY order_date, festival_name
             ORDER BY order_date
-        """)
-        
-        festival_analysis['order_date'] = pd.to_datetime(festival_analysis['order_date'])
-        festival_analysis['is_festival'] = festival_analysis['festival_name'].notna()
+        """, parse_dates=['order_date'])
         
-        fig = px.line(festival_analysis, x='order_date', y='daily_revenue', 
+        fig = build_chart('line', festival_analysis, x='order_date', y='daily_revenue', 
                      color='is_festival', title='Daily Revenue - Festival vs Non-Festival Days')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        festival_summary = safe_query("""
-            SELECT festival_name, AVG(final_amount_inr) as avg_daily_revenue,
-                   COUNT(DISTINCT order_date) as festival_days,
-                   SUM(final_amount_inr) as total_festival_revenue
-            FROM transactions 
-            WHERE festival_name IS NOT NULL AND festival_name != 'Unknown'
-            GROUP BY festival_name 
-            ORDER BY total_festival_revenue DESC
-        """)
+        st.plotly_chart(sfig(fig), use_container_width=True)
+        
+        # Festival rollup from the daily rows already loaded: each row is one
+        # distinct (date, festival) pair, so no second scan is needed
+        festivals = festival_analysis[festival_analysis['festival_name'].notna() &
+                                      (festival_analysis['festival_name'] != 'Unknown')]
+        festival_summary = festivals.groupby('festival_name', observed=True, sort=False).agg(
+            festival_days=('order_date', 'size'),
+            total_festival_revenue=('daily_revenue', 'sum'),
+            orders=('daily_orders', 'sum')
+        ).reset_index()
+        festival_summary['avg_daily_revenue'] = festival_summary['total_festival_revenue'] / festival_summary['orders']
+        festival_summary = festival_summary.sort_values('total_festival_revenue', ascending=False)
         
         if not festival_summary.empty:
-            fig = px.bar(festival_summary, x='festival_name', y='total_festival_revenue',
+            fig = build_chart('bar', festival_summary, x='festival_name', y='total_festival_revenue',
                         title='Total Revenue by Festival')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q9: Customer Age Group Analysis
     elif selected_question == "Q9":
@@ -740,13 +1011,13 @@ if st.session_state.data_loaded:
         
         col1, col2 = st.columns(2)
         with col1:
-            fig = px.bar(age_analysis, x='customer_age_group', y='customers',
+            fig = build_chart('bar', age_analysis, x='customer_age_group', y='customers',
                         title='Customer Distribution by Age Group')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         with col2:
-            fig = px.bar(age_analysis, x='customer_age_group', y='avg_order_value',
+            fig = build_chart('bar', age_analysis, x='customer_age_group', y='avg_order_value',
                         title='Average Order Value by Age Group')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         
         age_categories = safe_query("""
             SELECT customer_age_group, category, COUNT(*) as orders
@@ -756,12 +1027,19 @@ if st.session_state.data_loaded:
             ORDER BY orders DESC
         """)
         
-        for age_group in age_analysis['customer_age_group'].unique():
-            top_cats = age_categories[age_categories['customer_age_group'] == age_group].head(5)
-            if not top_cats.empty:
-                st.subheader(f"Top Categories for {age_group}")
-                fig = px.bar(top_cats, x='category', y='orders')
-                st.plotly_chart(fig, use_container_width=True)
+        # Rows are ordered by orders, so head(5) per group is each age group's top 5
+        age_groups = list(age_analysis['customer_age_group'])
+        top_cats = age_categories[age_categories['customer_age_group'].isin(age_groups)]
+        top_cats = top_cats.groupby('customer_age_group', sort=False).head(5)
+        if not top_cats.empty:
+            st.subheader("Top Categories by Age Group")
+            fig = build_chart('bar', top_cats, x='category', y='orders',
+                        facet_row='customer_age_group',
+                        category_orders={'customer_age_group': age_groups},
+                        height=250 * top_cats['customer_age_group'].nunique())
+            fig.update_xaxes(matches=None, showticklabels=True)
+            fig.for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+            st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q10: Price vs Demand Analysis
     elif selected_question == "Q10":
@@ -782,17 +1060,19 @@ if st.session_state.data_loaded:
             ORDER BY total_quantity DESC
         """)
         
-        fig = px.scatter(price_demand, x='avg_price', y='total_quantity', 
+        fig = build_chart('scatter', price_demand, x='avg_price', y='total_quantity', 
                         size='total_orders', color='category',
                         title='Price vs Demand by Category',
+                        render_mode='webgl',
                         hover_data=['avg_discount'])
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(fig), use_container_width=True)
         
-        numeric_cols = price_demand[['avg_price', 'total_orders', 'total_quantity', 'avg_discount']]
-        corr_matrix = numeric_cols.corr()
-        fig = px.imshow(corr_matrix, title='Price-Demand Correlation Matrix',
+        numeric_cols = ['avg_price', 'total_orders', 'total_quantity', 'avg_discount']
+        corr_matrix = pd.DataFrame(np.corrcoef(price_demand[numeric_cols].to_numpy(dtype=float), rowvar=False),
+                                   index=numeric_cols, columns=numeric_cols)
+        fig = build_chart('imshow', corr_matrix, title='Price-Demand Correlation Matrix',
                        color_continuous_scale='RdBu_r', aspect='auto')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q11: Delivery Performance Analysis
     elif selected_question == "Q11":
@@ -801,45 +1081,52 @@ if st.session_state.data_loaded:
         st.markdown("Delivery days distribution, on-time performance, and customer satisfaction correlation")
         st.markdown('</div>', unsafe_allow_html=True)
         
-        delivery_analysis = safe_query("""
+        # One (delivery_days, city) pass feeds both the distribution and the city
+        # rollup below; the per-level HAVING filters are applied in pandas
+        delivery_cells = safe_query("""
             SELECT delivery_days, COUNT(*) as orders,
+                   SUM(delivery_days) as day_total,
                    AVG(customer_rating) as avg_rating,
+                   SUM(customer_rating) as rating_sum,
+                   COUNT(customer_rating) as rating_count,
                    customer_city
             FROM transactions 
-            WHERE delivery_days IS NOT NULL AND delivery_days > 0
+            WHERE delivery_days IS NOT NULL
             GROUP BY delivery_days, customer_city
-            HAVING orders > 10
             ORDER BY delivery_days
         """)
+        delivery_analysis = delivery_cells[(delivery_cells['delivery_days'] > 0) &
+                                           (delivery_cells['orders'] > 10)]
+        
+        delivery_summary = delivery_analysis.groupby('delivery_days', as_index=False).agg(
+            orders=('orders', 'sum'), avg_rating=('avg_rating', 'mean')
+        )
         
         col1, col2 = st.columns(2)
         with col1:
-            delivery_summary = delivery_analysis.groupby('delivery_days')['orders'].sum().reset_index()
-            fig = px.bar(delivery_summary, x='delivery_days', y='orders',
+            fig = build_chart('bar', delivery_summary, x='delivery_days', y='orders',
                         title='Order Distribution by Delivery Days')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         with col2:
-            rating_by_delivery = delivery_analysis.groupby('delivery_days')['avg_rating'].mean().reset_index()
-            fig = px.line(rating_by_delivery, x='delivery_days', y='avg_rating',
+            fig = build_chart('line', delivery_summary, x='delivery_days', y='avg_rating',
                          title='Customer Rating vs Delivery Days', markers=True)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        city_delivery = safe_query("""
-            SELECT customer_city, AVG(delivery_days) as avg_delivery_days,
-                   AVG(customer_rating) as avg_rating,
-                   COUNT(*) as orders
-            FROM transactions 
-            WHERE customer_city IS NOT NULL AND delivery_days IS NOT NULL
-            GROUP BY customer_city 
-            HAVING orders > 50
-            ORDER BY avg_delivery_days
-            LIMIT 20
-        """)
-        
-        fig = px.scatter(city_delivery, x='avg_delivery_days', y='avg_rating',
+            st.plotly_chart(sfig(fig), use_container_width=True)
+        
+        city_delivery = delivery_cells.groupby('customer_city', sort=False).agg(
+            day_total=('day_total', 'sum'), orders=('orders', 'sum'),
+            rating_sum=('rating_sum', 'sum'), rating_count=('rating_count', 'sum')
+        )
+        city_delivery = city_delivery[city_delivery['orders'] > 50]
+        city_delivery = pd.DataFrame({
+            'avg_delivery_days': city_delivery['day_total'] / city_delivery['orders'],
+            'avg_rating': city_delivery['rating_sum'] / city_delivery['rating_count'],
+            'orders': city_delivery['orders']
+        }).reset_index().nsmallest(20, 'avg_delivery_days')
+        
+        fig = build_chart('scatter', city_delivery, x='avg_delivery_days', y='avg_rating',
                         size='orders', hover_name='customer_city',
                         title='Delivery Performance by City')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q12: Return Patterns & Satisfaction
     elif selected_question == "Q12":
@@ -861,29 +1148,27 @@ if st.session_state.data_loaded:
         
         col1, col2 = st.columns(2)
         with col1:
-            return_summary = return_analysis.groupby('return_status')['return_count'].sum().reset_index()
-            fig = px.pie(return_summary, values='return_count', names='return_status',
+            return_summary = return_analysis.groupby('return_status', as_index=False, observed=True)['return_count'].sum()
+            fig = build_chart('pie', return_summary, values='return_count', names='return_status',
                         title='Return Status Distribution')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         with col2:
-            fig = px.bar(return_analysis.head(10), x='category', y='return_count',
+            fig = build_chart('bar', return_analysis.head(10), x='category', y='return_count',
                         color='return_status', title='Returns by Category')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         
         rating_returns = safe_query("""
             SELECT customer_rating, 
-                   SUM(CASE WHEN return_status = 'Returned' THEN 1 ELSE 0 END) as returned_orders,
-                   COUNT(*) as total_orders
+                   AVG(CASE WHEN return_status = 'Returned' THEN 1.0 ELSE 0.0 END) * 100 as return_rate
             FROM transactions 
             WHERE customer_rating IS NOT NULL
             GROUP BY customer_rating
             ORDER BY customer_rating
         """)
         
-        rating_returns['return_rate'] = (rating_returns['returned_orders'] / rating_returns['total_orders']) * 100
-        fig = px.line(rating_returns, x='customer_rating', y='return_rate',
+        fig = build_chart('line', rating_returns, x='customer_rating', y='return_rate',
                      title='Return Rate vs Customer Rating', markers=True)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q13: Brand Performance Analysis
     elif selected_question == "Q13":
@@ -907,27 +1192,30 @@ if st.session_state.data_loaded:
         
         col1, col2 = st.columns(2)
         with col1:
-            fig = px.bar(brand_performance.head(10), x='brand', y='revenue',
+            fig = build_chart('bar', brand_performance.head(10), x='brand', y='revenue',
                         title='Top 10 Brands by Revenue')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         with col2:
-            fig = px.scatter(brand_performance, x='avg_price', y='avg_rating',
+            fig = build_chart('scatter', brand_performance, x='avg_price', y='avg_rating',
                             size='revenue', color='orders', hover_name='brand',
                             title='Brand Positioning: Price vs Rating')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         
-        brand_trends = safe_query("""
+        # Top brands come from the frame already fetched, not a second ranking scan of transactions
+        top_brands = tuple(brand_performance.nlargest(8, 'orders')['brand'].astype(str))
+        placeholders = ', '.join('?' * len(top_brands))
+        brand_trends = safe_query(f"""
             SELECT strftime('%Y', order_date) as year, brand, COUNT(*) as orders
             FROM transactions 
-            WHERE brand IN (SELECT brand FROM transactions GROUP BY brand ORDER BY COUNT(*) DESC LIMIT 8)
+            WHERE brand IN ({placeholders})
             GROUP BY year, brand
             ORDER BY year, orders DESC
-        """)
+        """, params=top_brands)
         
         if not brand_trends.empty:
-            fig = px.line(brand_trends, x='year', y='orders', color='brand',
+            fig = build_chart('line', brand_trends, x='year', y='orders', color='brand',
                          title='Top Brands Order Trends Over Time')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q14: Customer Lifetime Value (CLV)
     elif selected_question == "Q14":
@@ -936,19 +1224,28 @@ if st.session_state.data_loaded:
         st.markdown("Cohort analysis, retention curves, and CLV distribution across segments")
         st.markdown('</div>', unsafe_allow_html=True)
         
-        clv_data = st.session_state.customer_analysis.copy()
-        clv_data['clv_segment'] = pd.qcut(clv_data['total_spent'], 4, labels=['Low', 'Medium', 'High', 'VIP'])
+        # Quartile buckets computed by SQLite, so only the two plotted columns reach pandas;
+        # ordering by spend keeps the box plot in Low -> VIP order
+        clv_data = safe_query("""
+            SELECT total_spent,
+                   CASE NTILE(4) OVER (ORDER BY total_spent)
+                       WHEN 1 THEN 'Low' WHEN 2 THEN 'Medium' WHEN 3 THEN 'High' ELSE 'VIP'
+                   END as clv_segment
+            FROM customer_analysis
+            WHERE total_spent IS NOT NULL
+            ORDER BY total_spent
+        """)
         
         col1, col2 = st.columns(2)
         with col1:
-            segment_dist = clv_data['clv_segment'].value_counts()
-            fig = px.pie(segment_dist, values=segment_dist.values, names=segment_dist.index,
+            segment_dist = clv_data['clv_segment'].value_counts().rename_axis('clv_segment').reset_index(name='customers')
+            fig = build_chart('pie', segment_dist, values='customers', names='clv_segment',
                         title='Customer Value Segments')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         with col2:
-            fig = px.box(clv_data, x='clv_segment', y='total_spent',
+            fig = build_chart('box', clv_data, x='clv_segment', y='total_spent',
                         title='Spending Distribution by CLV Segment')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         
         cohort_data = safe_query("""
             SELECT strftime('%Y', first_order_date) as cohort_year,
@@ -960,23 +1257,24 @@ if st.session_state.data_loaded:
             ORDER BY cohort_year
         """)
         
-        fig = px.line(cohort_data, x='cohort_year', y='avg_clv',
+        fig = build_chart('line', cohort_data, x='cohort_year', y='avg_clv',
                      title='Average CLV by Acquisition Cohort', markers=True)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(fig), use_container_width=True)
         
+        # 5% random sample computed server-side - a denser scatter is unreadable and slow to ship
         retention_data = safe_query("""
-            SELECT customer_id, first_order_date, last_order_date, total_orders,
-                   total_spent, customer_lifetime_days
+            SELECT total_orders, total_spent, customer_lifetime_days,
+                   total_orders * 30.0 / customer_lifetime_days as orders_per_month
             FROM customers
-            WHERE customer_lifetime_days > 0
+            WHERE customer_lifetime_days > 0 AND abs(random()) % 100 < 5
         """)
         
         if not retention_data.empty:
-            retention_data['orders_per_month'] = retention_data['total_orders'] / (retention_data['customer_lifetime_days'] / 30)
-            fig = px.scatter(retention_data, x='customer_lifetime_days', y='total_spent',
+            fig = build_chart('scatter', retention_data, x='customer_lifetime_days', y='total_spent',
                            size='total_orders', color='orders_per_month',
-                           title='Customer Lifetime vs Total Value')
-            st.plotly_chart(fig, use_container_width=True)
+                           title='Customer Lifetime vs Total Value',
+                           render_mode='webgl')
+            st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q15: Discount Effectiveness
     elif selected_question == "Q15":
@@ -985,8 +1283,11 @@ if st.session_state.data_loaded:
         st.markdown("Correlation between discount percentages, sales volumes, and revenue")
         st.markdown('</div>', unsafe_allow_html=True)
         
-        discount_analysis = safe_query("""
+        # One (discount, category) pass feeds both views; the category rollup
+        # below is summed from these cells instead of rescanning transactions
+        discount_cells = safe_query("""
             SELECT discount_percent, COUNT(*) as orders,
+                   SUM(discount_percent) as discount_total,
                    SUM(final_amount_inr) as revenue,
                    SUM(quantity) as total_quantity,
                    AVG(customer_rating) as avg_rating,
@@ -994,40 +1295,36 @@ if st.session_state.data_loaded:
             FROM transactions 
             WHERE discount_percent IS NOT NULL AND discount_percent > 0
             GROUP BY discount_percent, category
-            HAVING orders > 10
             ORDER BY discount_percent
         """)
+        discount_analysis = discount_cells[discount_cells['orders'] > 10]
         
         col1, col2 = st.columns(2)
         with col1:
-            discount_impact = discount_analysis.groupby('discount_percent').agg({
+            discount_impact = discount_analysis.groupby('discount_percent', as_index=False).agg({
                 'orders': 'sum', 'revenue': 'sum'
-            }).reset_index()
-            fig = px.scatter(discount_impact, x='discount_percent', y='orders',
+            })
+            fig = build_chart('scatter', discount_impact, x='discount_percent', y='orders',
                            size='revenue', title='Discount % vs Order Volume')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         with col2:
-            fig = px.scatter(discount_analysis, x='discount_percent', y='avg_rating',
+            fig = build_chart('scatter', discount_analysis, x='discount_percent', y='avg_rating',
                            size='orders', color='category',
                            title='Discount Impact on Customer Rating')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        optimal_discounts = safe_query("""
-            SELECT category, 
-                   AVG(discount_percent) as avg_discount,
-                   COUNT(*) as orders,
-                   SUM(final_amount_inr) as revenue
-            FROM transactions 
-            WHERE discount_percent > 0 AND category IS NOT NULL
-            GROUP BY category
-            HAVING orders > 100
-            ORDER BY revenue DESC
-            LIMIT 15
-        """)
-        
-        fig = px.bar(optimal_discounts, x='category', y='avg_discount',
+            st.plotly_chart(sfig(fig), use_container_width=True)
+        
+        optimal_discounts = discount_cells.groupby('category', observed=True, sort=False).agg(
+            discount_total=('discount_total', 'sum'), orders=('orders', 'sum'),
+            revenue=('revenue', 'sum')
+        )
+        optimal_discounts = optimal_discounts[optimal_discounts['orders'] > 100].assign(
+            avg_discount=lambda d: d['discount_total'] / d['orders']
+        )
+        optimal_discounts = optimal_discounts.reset_index().nlargest(15, 'revenue')
+        
+        fig = build_chart('bar', optimal_discounts, x='category', y='avg_discount',
                     title='Average Discount % by Category')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q16: Product Rating Impact
     elif selected_question == "Q16":
@@ -1047,22 +1344,24 @@ if st.session_state.data_loaded:
             ORDER BY product_rating
         """)
         
+        rating_summary = rating_analysis.groupby('product_rating', as_index=False).agg(
+            orders=('orders', 'sum'), revenue=('revenue', 'sum')
+        )
+        
         col1, col2 = st.columns(2)
         with col1:
-            rating_dist = rating_analysis.groupby('product_rating')['orders'].sum().reset_index()
-            fig = px.bar(rating_dist, x='product_rating', y='orders',
+            fig = build_chart('bar', rating_summary, x='product_rating', y='orders',
                         title='Order Distribution by Product Rating')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         with col2:
-            rating_revenue = rating_analysis.groupby('product_rating')['revenue'].sum().reset_index()
-            fig = px.line(rating_revenue, x='product_rating', y='revenue',
+            fig = build_chart('line', rating_summary, x='product_rating', y='revenue',
                          title='Revenue by Product Rating', markers=True)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         
-        fig = px.scatter(rating_analysis, x='product_rating', y='avg_price',
+        fig = build_chart('scatter', rating_analysis, x='product_rating', y='avg_price',
                         size='orders', color='category',
                         title='Product Rating vs Price by Category')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q17: Customer Journey Analysis
     elif selected_question == "Q17":
@@ -1072,15 +1371,8 @@ if st.session_state.data_loaded:
         st.markdown('</div>', unsafe_allow_html=True)
         
         journey_analysis = safe_query("""
-            SELECT customer_id, COUNT(*) as order_count,
-                   MIN(order_date) as first_order,
-                   MAX(order_date) as last_order,
-                   COUNT(DISTINCT category) as unique_categories,
-                   SUM(final_amount_inr) as total_spent
-            FROM transactions 
-            GROUP BY customer_id
-            HAVING order_count > 1
-            ORDER BY order_count DESC
+            SELECT order_count, unique_categories
+            FROM customer_journey
         """)
         
         col1, col2, col3 = st.columns(3)
@@ -1088,30 +1380,27 @@ if st.session_state.data_loaded:
         col2.metric("Avg Unique Categories", f"{journey_analysis['unique_categories'].mean():.1f}")
         col3.metric("Multi-category Shoppers", f"{(journey_analysis['unique_categories'] > 1).sum():,}")
         
-        freq_dist = journey_analysis['order_count'].value_counts().sort_index().head(20)
-        fig = px.bar(freq_dist, x=freq_dist.index, y=freq_dist.values,
+        freq_dist = (journey_analysis['order_count'].value_counts().sort_index().head(20)
+                     .rename_axis('order_count').reset_index(name='customers'))
+        fig = build_chart('bar', freq_dist, x='order_count', y='customers',
                     title='Customer Order Frequency Distribution')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(fig), use_container_width=True)
         
         progression_data = safe_query("""
-            WITH customer_progression AS (
-                SELECT customer_id, order_date, category,
-                       ROW_NUMBER() OVER (PARTITION BY customer_id ORDER BY order_date) as order_sequence
-                FROM transactions 
-                WHERE category IS NOT NULL
+            SELECT order_sequence, category, customers
+            FROM (
+                SELECT order_sequence, category, customers,
+                       ROW_NUMBER() OVER (PARTITION BY order_sequence ORDER BY customers DESC) as rn
+                FROM category_progression
             )
-            SELECT order_sequence, category, COUNT(*) as customers
-            FROM customer_progression
-            WHERE order_sequence <= 5
-            GROUP BY order_sequence, category
+            WHERE rn <= 10
             ORDER BY order_sequence, customers DESC
         """)
         
-        for order_num in range(1, 6):
-            order_data = progression_data[progression_data['order_sequence'] == order_num].head(10)
+        for order_num, order_data in progression_data.groupby('order_sequence', sort=True):
             st.subheader(f"Top Categories for Order #{order_num}")
-            fig = px.bar(order_data, x='category', y='customers')
-            st.plotly_chart(fig, use_container_width=True)
+            fig = build_chart('bar', order_data, x='category', y='customers')
+            st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q18: Product Lifecycle Patterns
     elif selected_question == "Q18":
@@ -1121,38 +1410,41 @@ if st.session_state.data_loaded:
         st.markdown('</div>', unsafe_allow_html=True)
         
         lifecycle_data = safe_query("""
+            WITH product_sales AS (
+                SELECT product_id, COUNT(*) as total_orders,
+                       SUM(final_amount_inr) as total_revenue,
+                       AVG(product_rating) as avg_rating
+                FROM transactions
+                GROUP BY product_id
+            )
             SELECT p.product_id, p.product_name, p.category, p.launch_year,
-                   COUNT(t.transaction_id) as total_orders,
-                   SUM(t.final_amount_inr) as total_revenue,
-                   AVG(t.product_rating) as avg_rating
+                   s.total_orders, s.total_revenue, s.avg_rating
             FROM products p
-            LEFT JOIN transactions t ON p.product_id = t.product_id
+            JOIN product_sales s ON p.product_id = s.product_id
             WHERE p.launch_year IS NOT NULL
-            GROUP BY p.product_id, p.product_name, p.category, p.launch_year
-            HAVING total_orders > 0
-            ORDER BY total_revenue DESC
+            ORDER BY s.total_revenue DESC
         """)
         
-        yearly_launches = lifecycle_data.groupby('launch_year').agg({
+        yearly_launches = lifecycle_data.groupby('launch_year', as_index=False).agg({
             'product_id': 'count',
             'total_revenue': 'sum',
             'avg_rating': 'mean'
-        }).reset_index()
+        })
         
         col1, col2 = st.columns(2)
         with col1:
-            fig = px.bar(yearly_launches, x='launch_year', y='product_id',
+            fig = build_chart('bar', yearly_launches, x='launch_year', y='product_id',
                         title='Products Launched by Year')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         with col2:
-            fig = px.line(yearly_launches, x='launch_year', y='total_revenue',
+            fig = build_chart('line', yearly_launches, x='launch_year', y='total_revenue',
                          title='Revenue from Products by Launch Year', markers=True)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(sfig(fig), use_container_width=True)
         
-        fig = px.scatter(lifecycle_data, x='launch_year', y='total_revenue',
+        fig = build_chart('scatter', lifecycle_data, x='launch_year', y='total_revenue',
                         size='total_orders', color='avg_rating', hover_name='product_name',
                         title='Product Performance by Launch Year')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q19: Competitive Pricing Analysis
     elif selected_question == "Q19":
@@ -1176,20 +1468,26 @@ if st.session_state.data_loaded:
             ORDER BY orders DESC
         """)
         
-        top_categories = pricing_analysis.groupby('category')['orders'].sum().nlargest(5).index
+        top_categories = pricing_analysis.groupby('category', observed=True)['orders'].sum().nlargest(5).index
         filtered_pricing = pricing_analysis[pricing_analysis['category'].isin(top_categories)]
-        
-        for category in top_categories:
-            category_data = filtered_pricing[filtered_pricing['category'] == category].head(10)
-            st.subheader(f"Price Positioning in {category}")
-            fig = px.bar(category_data, x='brand', y='avg_price',
-                        title=f'Average Price by Brand - {category}')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        fig = px.scatter(pricing_analysis, x='avg_price', y='orders',
+        # Rows are already ordered by orders, so head(10) per group is the top 10 brands
+        category_brands = filtered_pricing.groupby('category', observed=True, sort=False).head(10)
+        
+        st.subheader("Price Positioning by Category")
+        fig = build_chart('bar', category_brands, x='brand', y='avg_price',
+                    facet_col='category', facet_col_wrap=2,
+                    category_orders={'category': list(top_categories)},
+                    height=300 * ((len(top_categories) + 1) // 2),
+                    title='Average Price by Brand')
+        fig.update_xaxes(matches=None, showticklabels=True)
+        fig.for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+        st.plotly_chart(sfig(fig), use_container_width=True)
+        
+        fig = build_chart('scatter', pricing_analysis, x='avg_price', y='orders',
                         size='avg_discount', color='category', hover_name='brand',
-                        title='Competitive Positioning: Price vs Volume')
-        st.plotly_chart(fig, use_container_width=True)
+                        title='Competitive Positioning: Price vs Volume',
+                        render_mode='webgl')
+        st.plotly_chart(sfig(fig), use_container_width=True)
 
     # Q20: Business Health Dashboard
     elif selected_question == "Q20":
@@ -1211,57 +1509,40 @@ if st.session_state.data_loaded:
         col3.metric("Active Products", f"{total_products:,}")
         col4.metric("Avg Customer Rating", f"{avg_rating:.1f}⭐")
         
-        # Revenue Growth
-        yearly_growth = safe_query("""
-            SELECT strftime('%Y', order_date) as year, 
-                   SUM(final_amount_inr) as revenue,
-                   LAG(SUM(final_amount_inr)) OVER (ORDER BY strftime('%Y', order_date)) as prev_revenue
-            FROM transactions 
-            GROUP BY strftime('%Y', order_date)
-            ORDER BY year
-        """)
-        yearly_growth['growth_rate'] = ((yearly_growth['revenue'] - yearly_growth['prev_revenue']) / yearly_growth['prev_revenue']) * 100
-        
-        # Customer Acquisition
-        customer_growth = safe_query("""
-            SELECT strftime('%Y', first_order_date) as year,
-                   COUNT(*) as new_customers
-            FROM customers
-            GROUP BY strftime('%Y', first_order_date)
-            ORDER BY year
-        """)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            fig = px.line(yearly_growth, x='year', y='growth_rate',
-                         title='Yearly Revenue Growth Rate (%)', markers=True)
-            st.plotly_chart(fig, use_container_width=True)
-        with col2:
-            fig = px.bar(customer_growth, x='year', y='new_customers',
-                        title='New Customer Acquisition by Year')
-            st.plotly_chart(fig, use_container_width=True)
+        # Rolling year window - bound into the queries so only the selected years are read
+        year_span = safe_query("""
+            SELECT MIN(year) as first_year, MAX(year) as last_year
+            FROM yearly_sales WHERE year IS NOT NULL
+        """).iloc[0]
+        if pd.isna(year_span['last_year']):
+            st.warning("⚠️ No yearly sales data found. Skipping the growth charts.")
+        else:
+            last_year = int(year_span['last_year'])
+            total_years = last_year - int(year_span['first_year']) + 1
+            year_window = total_years
+            if total_years > 1:
+                year_window = st.slider("Years shown", min_value=1, max_value=total_years, value=total_years)
+            cutoff = str(last_year - year_window + 1)
+            
+            # Revenue Growth and Customer Acquisition
+            growth_fig, customers_fig = build_q20_growth_figs(cutoff, data_key())
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.plotly_chart(growth_fig, use_container_width=True)
+            with col2:
+                st.plotly_chart(customers_fig, use_container_width=True)
         
         # Operational Efficiency
-        delivery_efficiency = safe_query("""
-            SELECT AVG(delivery_days) as avg_delivery_days,
-                   AVG(customer_rating) as avg_rating
-            FROM transactions 
-            WHERE delivery_days IS NOT NULL
-        """)
-        
-        return_health = safe_query("""
-            SELECT 
-                SUM(CASE WHEN return_status = 'Returned' THEN 1 ELSE 0 END) as returned_orders,
-                COUNT(*) as total_orders
-            FROM transactions
-        """)
-        
-        return_rate = (return_health['returned_orders'].iloc[0] / return_health['total_orders'].iloc[0]) * 100
+        ops = safe_query("""
+            SELECT avg_delivery_days, avg_rating, return_rate
+            FROM operational_stats
+        """).iloc[0]
         
         col1, col2, col3 = st.columns(3)
-        col1.metric("Avg Delivery Days", f"{delivery_efficiency['avg_delivery_days'].iloc[0]:.1f}")
-        col2.metric("Return Rate", f"{return_rate:.2f}%")
-        col3.metric("Customer Satisfaction", f"{delivery_efficiency['avg_rating'].iloc[0]:.1f}/5")
+        col1.metric("Avg Delivery Days", f"{ops['avg_delivery_days']:.1f}")
+        col2.metric("Return Rate", f"{ops['return_rate']:.2f}%")
+        col3.metric("Customer Satisfaction", f"{ops['avg_rating']:.1f}/5")
         
         # Executive Summary
         st.subheader("📋 Executive Summary")
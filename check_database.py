@@ -20,25 +20,43 @@ else:
 # Try to connect and check contents
 try:
     conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        PRAGMA mmap_size=1073741824;
+        PRAGMA cache_size=-262144;
+        PRAGMA temp_store=MEMORY;
+    """)
     cursor = conn.cursor()
     
     # List all tables
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
     tables = cursor.fetchall()
+    has_stats = any(table[0] == 'sqlite_stat1' for table in tables)
     
     if tables:
         print(f"📊 Found {len(tables)} table(s):")
         for table in tables:
             table_name = table[0]
+            quoted_name = '"' + table_name.replace('"', '""') + '"'  # same escaping as inspect_sqlite_tables.quote_identifier
             print(f"  └─ {table_name}")
             
-            # Count rows
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            count = cursor.fetchone()[0]
-            print(f"     Rows: {count}")
+            # Estimate rows from ANALYZE statistics, else MAX(rowid) - avoids a full COUNT(*) scan.
+            # Prefer the table's own stat row; otherwise the largest index count, since a partial
+            # index only counts the rows it covers
+            count = None
+            if has_stats:
+                cursor.execute("""
+                    SELECT COALESCE(MAX(CASE WHEN idx IS NULL THEN CAST(stat AS INTEGER) END),
+                                    MAX(CAST(stat AS INTEGER)))
+                    FROM sqlite_stat1 WHERE tbl = ?
+                """, (table_name,))
+                count = cursor.fetchone()[0]
+            if count is None:
+                cursor.execute(f"SELECT MAX(_ROWID_) FROM {quoted_name}")
+                count = cursor.fetchone()[0] or 0
+            print(f"     Rows: ~{count}")
             
             # Show column names
-            cursor.execute(f"PRAGMA table_info({table_name})")
+            cursor.execute(f"PRAGMA table_info({quoted_name})")
             columns = [col[1] for col in cursor.fetchall()]
             print(f"     Columns: {columns}")
             print()
@@ -1,40 +1,44 @@
 # find_files.py
 import os
-import glob
 
 print("🔍 Searching for ALL files in your project...")
 print("=" * 50)
 
-# Get all files in current directory
-all_files = glob.glob("*")
-print("📁 ALL FILES IN PROJECT FOLDER:")
-for file in all_files:
-    if os.path.isfile(file):
-        file_size = os.path.getsize(file)
-        print(f"  - {file} ({file_size} bytes)")
-
-print("\n📊 Looking for data files...")
 # Look for any data files with common extensions
-data_extensions = ['*.csv', '*.xlsx', '*.xls', '*.json', '*.txt']
-data_files = []
+data_extensions = ('.csv', '.xlsx', '.xls', '.json', '.txt')
 
-for ext in data_extensions:
-    data_files.extend(glob.glob(ext))
+# Single walk of the project folder and its direct subfolders, bucketing as we go.
+# DirEntry caches the file type (and the stat once taken), so each name costs at most one stat.
+top_files, data_files, sub_files = [], [], {}
+with os.scandir('.') as it:
+    for entry in it:
+        if entry.is_dir():
+            try:
+                with os.scandir(entry.name) as sub_it:
+                    sub_files[entry.name] = [(sub.path, sub.stat().st_size) for sub in sub_it
+                                             if sub.is_file() and not sub.name.startswith('.')]
+            except OSError:
+                sub_files[entry.name] = []  # Unreadable subfolder - listed empty, as glob did
+        elif entry.is_file() and not entry.name.startswith('.'):
+            top_files.append((entry.name, entry.stat().st_size))
+            # normcase matches glob: case-insensitive on Windows, case-sensitive elsewhere
+            if os.path.normcase(entry.name).endswith(data_extensions):
+                data_files.append(top_files[-1])
 
+print("📁 ALL FILES IN PROJECT FOLDER:")
+for name, size in top_files:
+    print(f"  - {name} ({size} bytes)")
+
+print("\n📊 Looking for data files...")
 print("📈 DATA FILES FOUND:")
-for file in data_files:
-    file_size = os.path.getsize(file)
-    print(f"  - {file} ({file_size} bytes)")
+for name, size in data_files:
+    print(f"  - {name} ({size} bytes)")
 
 print("\n📁 Checking subdirectories...")
-subdirs = [d for d in os.listdir('.') if os.path.isdir(d)]
-for subdir in subdirs:
+for subdir, files in sub_files.items():
     print(f"  📂 {subdir}/")
-    subdir_files = glob.glob(f"{subdir}/*")
-    for file in subdir_files:
-        if os.path.isfile(file):
-            file_size = os.path.getsize(file)
-            print(f"    - {file} ({file_size} bytes)")
+    for path, size in files:
+        print(f"    - {path} ({size} bytes)")
 
 print("=" * 50)
 input("Press Enter to see the results...")
\ No newline at end of file
@@ -0,0 +1,32 @@
+# export_parquet.py
+import sqlite3
+import os
+import pandas as pd
+
+# Static reference tables read by the EDA dashboard (see load_reference_table)
+REFERENCE_TABLES = ['monthly_sales', 'customer_analysis', 'product_performance', 'products', 'customers']
+
+print("📦 Exporting reference tables to Parquet...")
+print("=" * 50)
+
+db_path = 'amazon_india_analytics.db'
+if not os.path.exists(db_path):
+    print(f"❌ Database file NOT found: {db_path}")
+    print("Please run: python data_cleaning_pipeline.py")
+    exit()
+
+conn = sqlite3.connect(db_path)
+try:
+    for table in REFERENCE_TABLES:
+        try:
+            df = pd.read_sql_query(f"SELECT * FROM {table}", conn)
+            output_file = f"{table}.parquet"
+            df.to_parquet(output_file, index=False)
+            print(f"✅ {table}: {len(df):,} rows -> {output_file}")
+        except Exception as e:
+            print(f"❌ Could not export {table}: {e}")
+finally:
+    conn.close()
+
+print("=" * 50)
+print("Re-run this script whenever the database is rebuilt.")
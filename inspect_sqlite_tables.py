@@ -1,18 +1,86 @@
 # inspect_sqlite_tables.py
 import sqlite3
 import pandas as pd
+from contextlib import closing
 
-def inspect_sqlite_database(db_path='amazon_india_analytics.db'):
+def open_connection(db_path='amazon_india_analytics.db'):
+    """
+    Open the one connection shared by all inspections, with a larger page cache
+    and memory-mapped reads so later passes over the same tables stay warm
+    """
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        PRAGMA cache_size=-262144;
+        PRAGMA mmap_size=1073741824;
+        PRAGMA temp_store=MEMORY;
+    """)
+    return conn
+
+# Every table's columns in one round-trip instead of a PRAGMA table_info call per table
+TABLE_COLUMNS_SQL = """
+    SELECT m.name AS table_name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+    FROM sqlite_master m
+    JOIN pragma_table_info(m.name) p
+    WHERE m.type = 'table'
+    ORDER BY m.rowid, p.cid;
+"""
+
+# Row count from ANALYZE statistics. The table's own row (idx IS NULL) is exact when present; otherwise
+# the largest leading count across its indexes, since a partial index only counts the rows it covers
+ROW_ESTIMATE_SQL = """
+    SELECT COALESCE(MAX(CASE WHEN idx IS NULL THEN CAST(stat AS INTEGER) END),
+                    MAX(CAST(stat AS INTEGER)))
+    FROM sqlite_stat1 WHERE tbl = ?;
+"""
+
+COLUMN_ROW_FORMAT = "{:<25} {:<15} {:<10} {:<12}"
+
+def quote_identifier(name):
+    """
+    Quote a table name for interpolation into SQL (embedded double quotes are doubled)
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+def fetch_table_columns(cursor):
+    """
+    Map each table name to its PRAGMA table_info rows, fetched in a single query
+    """
+    table_columns = {}
+    cursor.execute(TABLE_COLUMNS_SQL)
+    for table_name, *col in cursor.fetchall():
+        table_columns.setdefault(table_name, []).append(tuple(col))
+    return table_columns
+
+def estimate_row_count(cursor, table_name):
+    """
+    Fast row count from ANALYZE statistics (sqlite_stat1), falling back to MAX(rowid).
+    Avoids a full-table COUNT(*) scan; the result is an estimate if rows were deleted.
+    """
+    try:
+        cursor.execute(ROW_ESTIMATE_SQL, (table_name,))
+        row = cursor.fetchone()
+        if row and row[0] is not None:
+            return row[0]
+    except sqlite3.OperationalError:
+        pass  # No sqlite_stat1 - ANALYZE has never been run on this database
+    
+    try:
+        cursor.execute(f"SELECT MAX(_ROWID_) FROM {quote_identifier(table_name)};")
+        return cursor.fetchone()[0] or 0
+    except sqlite3.OperationalError:
+        # WITHOUT ROWID tables have no rowid to read
+        cursor.execute(f"SELECT COUNT(*) FROM {quote_identifier(table_name)};")
+        return cursor.fetchone()[0]
+
+def inspect_sqlite_database(conn):
     """
     Inspect all tables in SQLite database and return column names and data types
     
     Args:
-        db_path (str): Path to SQLite database file
+        conn (sqlite3.Connection): Open connection to the SQLite database
     """
     
     try:
-        # Connect to SQLite database
-        conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
         
         print("🔍 Inspecting SQLite Database...")
@@ -29,6 +97,8 @@ def inspect_sqlite_database(db_path='amazon_india_analytics.db'):
         print(f"📊 Found {len(tables)} tables in the database:")
         print("-" * 60)
         
+        table_columns = fetch_table_columns(cursor)
+        
         # Inspect each table
         for table_info in tables:
             table_name = table_info[0]
@@ -36,32 +106,28 @@ def inspect_sqlite_database(db_path='amazon_india_analytics.db'):
             print("-" * 40)
             
             # Get column information
-            cursor.execute(f"PRAGMA table_info({table_name});")
-            columns = cursor.fetchall()
+            columns = table_columns.get(table_name, [])
             
             if not columns:
                 print("   No columns found!")
                 continue
             
-            # Print column details
-            print(f"{'Column Name':<25} {'Data Type':<15} {'Nullable':<10} {'Primary Key':<12}")
-            print("-" * 65)
+            # Print column details - one format spec, one write for the whole block
+            lines = [COLUMN_ROW_FORMAT.format('Column Name', 'Data Type', 'Nullable', 'Primary Key'), "-" * 65]
+            lines.extend(
+                COLUMN_ROW_FORMAT.format(col_name, col_type, "NO" if not_null else "YES", "YES" if pk else "NO")
+                for col_id, col_name, col_type, not_null, default_val, pk in columns
+            )
+            print("\n".join(lines))
             
-            for col in columns:
-                col_id, col_name, col_type, not_null, default_val, pk = col
-                nullable = "NO" if not_null else "YES"
-                primary_key = "YES" if pk else "NO"
-                print(f"{col_name:<25} {col_type:<15} {nullable:<10} {primary_key:<12}")
-            
-            # Get row count
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name};")
-            row_count = cursor.fetchone()[0]
-            print(f"\n   📈 Total Rows: {row_count:,}")
+            # Get row count (estimate - no full table scan)
+            row_count = estimate_row_count(cursor, table_name)
+            print(f"\n   📈 Total Rows: ~{row_count:,}")
             
             # Show sample data (first 3 rows)
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT 3;")
+            cursor.execute(f"SELECT * FROM {quote_identifier(table_name)} LIMIT 3;")
             sample_data = cursor.fetchall()
-            column_names = [description[0] for description in cursor.description]
+            column_names = [col[1] for col in columns]  # Same names PRAGMA table_info already returned
             
             print(f"   🔍 Sample Data (first 3 rows):")
             if sample_data:
@@ -71,9 +137,11 @@ def inspect_sqlite_database(db_path='amazon_india_analytics.db'):
                 print("   " + "-" * len(header))
                 
                 # Print sample rows
-                for row in sample_data:
-                    row_display = " | ".join([f"{str(value)[:12]:<15}" for value in row[:5]]) + ("..." if len(row) > 5 else "")
-                    print(f"   {row_display}")
+                more = "..." if len(column_names) > 5 else ""
+                print("\n".join(
+                    "   " + " | ".join(f"{str(value)[:12]:<15}" for value in row[:5]) + more
+                    for row in sample_data
+                ))
             else:
                 print("   No data available")
         
@@ -90,7 +158,7 @@ def inspect_sqlite_database(db_path='amazon_india_analytics.db'):
             
             # Use pandas to get schema info
             try:
-                df_sample = pd.read_sql_query(f"SELECT * FROM {table_name} LIMIT 1", conn)
+                df_sample = pd.read_sql_query(f"SELECT * FROM {quote_identifier(table_name)} LIMIT 1", conn)
                 print(f"   Columns: {len(df_sample.columns)}")
                 print(f"   Data Types:")
                 for col, dtype in df_sample.dtypes.items():
@@ -102,38 +170,28 @@ def inspect_sqlite_database(db_path='amazon_india_analytics.db'):
         print(f"❌ SQLite error: {e}")
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
-    finally:
-        # Close connection
-        if conn:
-            conn.close()
-            print("\n🔒 Database connection closed.")
 
-def get_detailed_schema(db_path='amazon_india_analytics.db'):
+def get_detailed_schema(conn):
     """
     Get detailed schema information for all tables
     """
     try:
-        conn = sqlite3.connect(db_path)
-        
-        # Get all tables
-        tables_query = "SELECT name FROM sqlite_master WHERE type='table';"
-        tables = pd.read_sql_query(tables_query, conn)
+        # Get column details for all tables in one query
+        all_columns = pd.read_sql_query(TABLE_COLUMNS_SQL, conn)
         
         schema_info = {}
         
-        for table_name in tables['name']:
-            # Get column details
-            pragma_query = f"PRAGMA table_info({table_name});"
-            columns_df = pd.read_sql_query(pragma_query, conn)
+        for table_name, columns_df in all_columns.groupby('table_name', sort=False):
+            quoted_name = quote_identifier(table_name)
             
             # Get sample data for data type validation
-            sample_query = f"SELECT * FROM {table_name} LIMIT 5;"
+            sample_query = f"SELECT * FROM {quoted_name} LIMIT 5;"
             sample_df = pd.read_sql_query(sample_query, conn)
             
             schema_info[table_name] = {
-                'columns': columns_df,
+                'columns': columns_df.drop(columns='table_name').reset_index(drop=True),
                 'sample_data': sample_df,
-                'row_count': len(pd.read_sql_query(f"SELECT * FROM {table_name}", conn))
+                'row_count': conn.execute(f"SELECT COUNT(*) FROM {quoted_name};").fetchone()[0]
             }
         
         return schema_info
@@ -141,44 +199,40 @@ def get_detailed_schema(db_path='amazon_india_analytics.db'):
     except Exception as e:
         print(f"Error getting detailed schema: {e}")
         return None
-    finally:
-        if conn:
-            conn.close()
 
-def export_schema_to_csv(db_path='amazon_india_analytics.db', output_file='database_schema.csv'):
+def export_schema_to_csv(conn, output_file='database_schema.csv'):
     """
     Export database schema to CSV file
     """
     try:
-        conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
         
-        # Get all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
+        # Get column information for all tables in one query
+        table_columns = fetch_table_columns(cursor)
         
-        schema_data = []
+        # Parallel column lists - one DataFrame at the end instead of a dict per schema row
+        table_names, column_names, data_types = [], [], []
+        nullables, primary_keys, default_values = [], [], []
         
-        for table_info in tables:
-            table_name = table_info[0]
-            
-            # Get column information
-            cursor.execute(f"PRAGMA table_info({table_name});")
-            columns = cursor.fetchall()
-            
+        for table_name, columns in table_columns.items():
             for col in columns:
                 col_id, col_name, col_type, not_null, default_val, pk = col
-                schema_data.append({
-                    'table_name': table_name,
-                    'column_name': col_name,
-                    'data_type': col_type,
-                    'nullable': 'NO' if not_null else 'YES',
-                    'primary_key': 'YES' if pk else 'NO',
-                    'default_value': default_val
-                })
+                table_names.append(table_name)
+                column_names.append(col_name)
+                data_types.append(col_type)
+                nullables.append('NO' if not_null else 'YES')
+                primary_keys.append('YES' if pk else 'NO')
+                default_values.append(default_val)
         
         # Create DataFrame and export to CSV
-        schema_df = pd.DataFrame(schema_data)
+        schema_df = pd.DataFrame({
+            'table_name': table_names,
+            'column_name': column_names,
+            'data_type': data_types,
+            'nullable': nullables,
+            'primary_key': primary_keys,
+            'default_value': default_values
+        })
         schema_df.to_csv(output_file, index=False)
         print(f"✅ Schema exported to: {output_file}")
         
@@ -187,9 +241,6 @@ def export_schema_to_csv(db_path='amazon_india_analytics.db', output_file='datab
     except Exception as e:
         print(f"Error exporting schema: {e}")
         return None
-    finally:
-        if conn:
-            conn.close()
 
 if __name__ == "__main__":
     print("🚀 SQLite Database Inspector")
@@ -198,32 +249,35 @@ if __name__ == "__main__":
     # You can change the database path if needed
     db_path = 'amazon_india_analytics.db'  # Change this if your DB has different name
     
-    # Method 1: Basic inspection
-    inspect_sqlite_database(db_path)
-    
-    print("\n" + "=" * 60)
-    print("📋 DETAILED SCHEMA ANALYSIS")
-    print("=" * 60)
-    
-    # Method 2: Detailed schema analysis
-    schema_info = get_detailed_schema(db_path)
-    
-    if schema_info:
-        for table_name, info in schema_info.items():
-            print(f"\n🎯 Table: {table_name}")
-            print(f"   📊 Total Rows: {info['row_count']:,}")
-            print(f"   📋 Columns ({len(info['columns'])}):")
-            
-            for _, col in info['columns'].iterrows():
-                pk_indicator = " 🔑" if col['pk'] else ""
-                nullable_indicator = "" if col['notnull'] else " ❓"
-                print(f"     - {col['name']:<25} ({col['type']:<15}){pk_indicator}{nullable_indicator}")
-    
-    print("\n" + "=" * 60)
-    print("💾 EXPORTING SCHEMA TO CSV")
-    print("=" * 60)
-    
-    # Method 3: Export to CSV
-    export_schema_to_csv(db_path)
+    # One shared connection for all three inspections - opened once, closed at the end
+    with closing(open_connection(db_path)) as conn:
+        # Method 1: Basic inspection
+        inspect_sqlite_database(conn)
+        
+        print("\n" + "=" * 60)
+        print("📋 DETAILED SCHEMA ANALYSIS")
+        print("=" * 60)
+        
+        # Method 2: Detailed schema analysis
+        schema_info = get_detailed_schema(conn)
+        
+        if schema_info:
+            for table_name, info in schema_info.items():
+                print(f"\n🎯 Table: {table_name}")
+                print(f"   📊 Total Rows: {info['row_count']:,}")
+                print(f"   📋 Columns ({len(info['columns'])}):")
+                
+                for _, col in info['columns'].iterrows():
+                    pk_indicator = " 🔑" if col['pk'] else ""
+                    nullable_indicator = "" if col['notnull'] else " ❓"
+                    print(f"     - {col['name']:<25} ({col['type']:<15}){pk_indicator}{nullable_indicator}")
+        
+        print("\n" + "=" * 60)
+        print("💾 EXPORTING SCHEMA TO CSV")
+        print("=" * 60)
+        
+        # Method 3: Export to CSV
+        export_schema_to_csv(conn)
     
+    print("\n🔒 Database connection closed.")
     print("\n🎉 Database inspection completed successfully!")
\ No newline at end of file